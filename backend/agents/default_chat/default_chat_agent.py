@@ -3,7 +3,9 @@ from __future__ import annotations
 import os
 import json
 from typing import Any, Dict, List, Optional, Tuple
-from openai import AsyncOpenAI
+from backend.infrastructure.llm_admission import AdmissionRejected
+from backend.infrastructure.llm_client_registry import UPSTAGE_SOLAR_BASE_URL, get_async_openai
+from backend.infrastructure.llm_streaming import complete_chat
 from backend.agents.base import BaseAgent
 from backend.config import get_settings
 
@@ -19,10 +21,7 @@ class DefaultChatAgent(BaseAgent):
         self.settings = get_settings()
         self.client = None
         if self.settings.upstage_api_key:
-            self.client = AsyncOpenAI(
-                api_key=self.settings.upstage_api_key,
-                base_url="https://api.upstage.ai/v1/solar"
-            )
+            self.client = get_async_openai(UPSTAGE_SOLAR_BASE_URL, self.settings.upstage_api_key)
         self.system_prompt = self._load_system_prompt()
 
     def _load_system_prompt(self) -> str:
@@ -54,8 +53,14 @@ class DefaultChatAgent(BaseAgent):
         # Prepare messages including history
         messages = [{"role": "system", "content": self.system_prompt}]
         
+        # Rolling summary of older turns (provided by the orchestrator) goes in as system context
+        summary_turns = [turn for turn in conversation_history if turn.get("role") == "System"]
+        for turn in summary_turns:
+            messages.append({"role": "system", "content": turn.get("content", "")})
+
         # Add filtered history (last N turns)
-        for turn in conversation_history[-10:]:
+        recent_turns = [turn for turn in conversation_history if turn.get("role") != "System"]
+        for turn in recent_turns[-10:]:
             # Map history roles to LLM roles
             role = "assistant" if turn.get("role") in ["Agent", "assistant"] else "user"
             messages.append({"role": role, "content": turn.get("content", "")})
@@ -67,14 +72,18 @@ class DefaultChatAgent(BaseAgent):
             if not self.client:
                 raise ValueError("LLM client not initialized (check API key)")
 
-            response = await self.client.chat.completions.create(
+            response_content = await complete_chat(
+                self.client,
+                source=self.agent_type,
                 model="solar-pro",
                 messages=messages,
                 temperature=0.7
             )
             
-            response_message = response.choices[0].message.content.strip()
+            response_message = response_content.strip()
             
+        except AdmissionRejected:
+            raise
         except Exception as e:
             print(f"DefaultChatAgent Error: {e}")
             response_message = "죄송합니다. 현재 대화 시스템에 일시적인 문제가 발생했습니다. 무역 실무 관련 작업(리스크 분석, 이메일, 퀴즈)은 상단 메뉴를 통해 계속 이용하실 수 있습니다."
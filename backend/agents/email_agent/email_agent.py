@@ -17,6 +17,9 @@ from .graph import email_agent_graph
 # Compile the graph globally once
 compiled_email_agent_app = email_agent_graph.compile()
 
+# agent_specific_state key holding the incremental history facts (see nodes.prepare_llm_messages_node)
+EXTRACTION_CACHE_KEY = "email_extraction"
+
 class EmailAgent(BaseAgent):
     """
     Email Agent, now implemented as a thin wrapper around a LangGraph workflow.
@@ -48,6 +51,8 @@ class EmailAgent(BaseAgent):
         """
         if context is None:
             context = {}
+        context = dict(context)
+        agent_state = context.pop("_agent_specific_state", None) or {}
 
         # Initialize the state for the email agent graph
         initial_state: EmailGraphState = {
@@ -74,6 +79,7 @@ class EmailAgent(BaseAgent):
             "extracted_recipient_country": None,
             "extracted_purpose": None,
             "final_metadata": None,
+            "extraction_cache": agent_state.get(EXTRACTION_CACHE_KEY),
             "agent_output_for_orchestrator": None,
         }
         # In this simple case, EmailAgentComponents are initialized globally
@@ -99,7 +105,10 @@ class EmailAgent(BaseAgent):
                 },
                 "conversation_history": final_state.get("conversation_history", conversation_history),
                 "analysis_in_progress": final_state.get("analysis_in_progress", False),
-                "agent_specific_state": {"awaiting_follow_up": False},
+                "agent_specific_state": {
+                    "awaiting_follow_up": False,
+                    EXTRACTION_CACHE_KEY: final_state.get("extraction_cache"),
+                },
             }
         
         response_text = str(final_output.get("response", ""))
@@ -126,5 +135,8 @@ class EmailAgent(BaseAgent):
             "response": final_output,
             "conversation_history": updated_history,
             "analysis_in_progress": final_state.get("analysis_in_progress", False),
-            "agent_specific_state": {"awaiting_follow_up": awaiting_follow_up},
+            "agent_specific_state": {
+                "awaiting_follow_up": awaiting_follow_up,
+                EXTRACTION_CACHE_KEY: final_state.get("extraction_cache"),
+            },
         }
@@ -6,7 +6,9 @@ import json
 import re
 from typing import Dict, Any, List, Optional, cast
 import openai
-from openai import AsyncOpenAI
+from backend.infrastructure.llm_admission import AdmissionRejected
+from backend.infrastructure.llm_client_registry import UPSTAGE_BASE_URL, get_async_openai
+from backend.infrastructure.llm_streaming import complete_chat
 
 # Ensure backend directory is in path for imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -16,6 +18,8 @@ sys.path.append(project_root)
 # Local imports
 from backend.config import get_settings
 from backend.utils.logger import get_logger
+from backend.utils.json_stream import extract_json
+from backend.utils.incremental_scan import scan_new_turns
 # RAG and validation functionality now provided by tools.py
 from backend.agents.email_agent.state import EmailGraphState
 
@@ -52,44 +56,6 @@ def _contains_any(text: str, keywords: List[str]) -> bool:
     return any(keyword in text for keyword in keywords)
 
 
-def _parse_json_flexible(text: str) -> Optional[Any]:
-    if not isinstance(text, str):
-        return None
-
-    stripped = text.strip()
-    if not stripped:
-        return None
-
-    candidates: List[str] = [stripped]
-
-    fenced_blocks = re.findall(r"```(?:json)?\s*([\s\S]*?)```", stripped, flags=re.IGNORECASE)
-    candidates.extend(block.strip() for block in fenced_blocks if block.strip())
-
-    array_start = stripped.find("[")
-    array_end = stripped.rfind("]")
-    if array_start >= 0 and array_end > array_start:
-        candidates.append(stripped[array_start:array_end + 1].strip())
-
-    object_start = stripped.find("{")
-    object_end = stripped.rfind("}")
-    if object_start >= 0 and object_end > object_start:
-        candidates.append(stripped[object_start:object_end + 1].strip())
-
-    seen = set()
-    unique_candidates: List[str] = []
-    for candidate in candidates:
-        if candidate not in seen:
-            seen.add(candidate)
-            unique_candidates.append(candidate)
-
-    for candidate in unique_candidates:
-        try:
-            return json.loads(candidate)
-        except json.JSONDecodeError:
-            continue
-    return None
-
-
 def _detect_email_task_type(user_input: str, context: Dict[str, Any]) -> str:
     explicit_task = str(context.get("email_task", "")).strip().lower()
     if explicit_task in {"draft", "review"}:
@@ -129,6 +95,7 @@ def _detect_output_language(
     user_input: str,
     context: Dict[str, Any],
     conversation_history: List[Dict[str, str]],
+    history_facts: Optional[Dict[str, Any]] = None,
 ) -> str:
     explicit_language = str(context.get("language", "")).strip().lower()
     if explicit_language in {"ko", "korean", "kr", "한국어"}:
@@ -146,8 +113,9 @@ def _detect_output_language(
         return "ko"
 
     # If recent conversation is mostly Korean, keep Korean output.
-    recent_text = "\n".join(str(turn.get("content", "")) for turn in conversation_history[-4:])
-    if re.search(r"[가-힣]", recent_text):
+    if history_facts is None:
+        history_facts = _scan_history_facts(conversation_history[-4:])
+    if any(history_facts.get("recent_korean") or []):
         return "ko"
     return "en"
 
@@ -252,46 +220,60 @@ def _is_assistant_email_draft_candidate(text: str) -> bool:
     return has_greeting and (has_signoff or has_trade_fields)
 
 
+_USER_ROLES = {"user", "human"}
+_ASSISTANT_ROLES = {"assistant", "agent", "ai"}
+
+
+def _empty_history_facts() -> Dict[str, Any]:
+    return {"user_email": None, "assistant_email": None, "any_email": None, "recent_korean": []}
+
+
+def _fold_history_turn(facts: Dict[str, Any], turn: Dict[str, Any]) -> Dict[str, Any]:
+    """Update the per-conversation email facts with one more history turn."""
+    role = str(turn.get("role", "")).strip().lower()
+    content = str(turn.get("content", "")).strip()
+
+    candidate = _extract_email_body_from_text(content)
+    if candidate:
+        facts["any_email"] = candidate
+        if role in _USER_ROLES:
+            facts["user_email"] = candidate
+        elif role in _ASSISTANT_ROLES and _is_assistant_email_draft_candidate(content):
+            facts["assistant_email"] = candidate
+
+    recent = list(facts.get("recent_korean") or [])
+    recent.append(bool(re.search(r"[가-힣]", content)))
+    facts["recent_korean"] = recent[-4:]
+    return facts
+
+
+def _scan_history_facts(conversation_history: List[Dict[str, str]]) -> Dict[str, Any]:
+    facts = _empty_history_facts()
+    for turn in conversation_history or []:
+        facts = _fold_history_turn(facts, turn)
+    return facts
+
+
 def _extract_email_content(
     user_input: str,
     conversation_history: List[Dict[str, str]],
     task_type: str = "draft",
+    history_facts: Optional[Dict[str, Any]] = None,
 ) -> Optional[str]:
     current_turn_email = _extract_email_body_from_text(user_input)
     if current_turn_email:
         return current_turn_email
 
+    if history_facts is None:
+        history_facts = _scan_history_facts(conversation_history)
+
     if task_type == "review":
         # 1) Prefer user-provided email text for review.
-        for turn in reversed(conversation_history or []):
-            role = str(turn.get("role", "")).strip().lower()
-            if role not in {"user", "human"}:
-                continue
-            content = str(turn.get("content", "")).strip()
-            candidate = _extract_email_body_from_text(content)
-            if candidate:
-                return candidate
-
         # 2) If user text is unavailable, allow assistant drafts only when they
         # clearly look like actual email content (avoid generic assistant messages).
-        for turn in reversed(conversation_history or []):
-            role = str(turn.get("role", "")).strip().lower()
-            if role not in {"assistant", "agent", "ai"}:
-                continue
-            content = str(turn.get("content", "")).strip()
-            if not _is_assistant_email_draft_candidate(content):
-                continue
-            candidate = _extract_email_body_from_text(content)
-            if candidate:
-                return candidate
-        return None
+        return history_facts.get("user_email") or history_facts.get("assistant_email")
 
-    for turn in reversed(conversation_history or []):
-        content = str(turn.get("content", "")).strip()
-        candidate = _extract_email_body_from_text(content)
-        if candidate:
-            return candidate
-    return None
+    return history_facts.get("any_email")
 
 
 def _extract_country(user_input: str, context: Dict[str, Any]) -> str:
@@ -425,10 +407,7 @@ class EmailAgentComponents:
 
         self.llm = None
         if self.settings.upstage_api_key:
-            self.llm = AsyncOpenAI(
-                base_url="https://api.upstage.ai/v1",
-                api_key=self.settings.upstage_api_key
-            )
+            self.llm = get_async_openai(UPSTAGE_BASE_URL, self.settings.upstage_api_key)
         else:
             logger.warning("UPSTAGE_API_KEY is not set for EmailAgent. LLM calls will fail.")
         
@@ -444,12 +423,8 @@ EMAIL_AGENT_COMPONENTS = EmailAgentComponents()
 
 # --- Node Functions ---
 
-def perform_rag_search_node(state: EmailGraphState) -> Dict[str, Any]:
-    state_dict = cast(Dict[str, Any], state)
-
-    user_input = state_dict["user_input"]
-    context = state_dict.get("context") or {}
-
+def rag_search_args(user_input: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    """Arguments of the `search_email_references` call for this turn (also used for prefetching)."""
     # Build search query
     rag_query = user_input
     if context.get("email_subject"):
@@ -457,21 +432,24 @@ def perform_rag_search_node(state: EmailGraphState) -> Dict[str, Any]:
     if context.get("recipient_type"):
         rag_query += f" {context['recipient_type']}"
 
-    # Use tool: search_email_references
+    # Determine search type from mode
+    task_type = _detect_email_task_type(user_input, context)
+    search_type = "mistakes" if task_type == "review" else "all"
+    return {"query": rag_query, "k": 3, "search_type": search_type}
+
+
+def perform_rag_search_node(state: EmailGraphState) -> Dict[str, Any]:
+    state_dict = cast(Dict[str, Any], state)
+
+    user_input = state_dict["user_input"]
+    context = state_dict.get("context") or {}
+
+    # Use tool: search_email_references (prefetched during routing when possible)
     from backend.agents.email_agent.tools import search_email_references
+    from backend.rag.prefetch import RAG_PREFETCH
 
     try:
-        # Determine search type from mode
-        task_type = _detect_email_task_type(user_input, context)
-        search_type = "mistakes" if task_type == "review" else "all"
-
-        retrieved_documents = search_email_references.invoke(
-            {
-                "query": rag_query,
-                "k": 3,
-                "search_type": search_type,
-            }
-        )
+        retrieved_documents = RAG_PREFETCH.invoke(search_email_references, rag_search_args(user_input, context))
         used_rag = len(retrieved_documents) > 0
     except Exception as e:
         logger.warning("Error during email RAG search: %s", e)
@@ -503,10 +481,20 @@ def prepare_llm_messages_node(state: EmailGraphState) -> Dict[str, Any]:
     conversation_history = state_dict.get("conversation_history") or []
     retrieved_documents = state_dict.get("retrieved_documents") or []
 
+    # Only turns appended since the previous email turn are scanned.
+    extraction_cache, _ = scan_new_turns(
+        state_dict.get("extraction_cache"),
+        conversation_history,
+        _fold_history_turn,
+        _empty_history_facts,
+    )
+    state_dict["extraction_cache"] = extraction_cache
+    history_facts = extraction_cache["facts"]
+
     task_type = _detect_email_task_type(user_input, context)
-    extracted_email_content = _extract_email_content(user_input, conversation_history, task_type)
+    extracted_email_content = _extract_email_content(user_input, conversation_history, task_type, history_facts)
     recipient_country = _extract_country(user_input, context)
-    output_language = _detect_output_language(user_input, context, conversation_history)
+    output_language = _detect_output_language(user_input, context, conversation_history, history_facts)
     language_instruction = _build_language_instruction(output_language, task_type)
     purpose = str(
         context.get("purpose")
@@ -617,15 +605,17 @@ async def call_llm_and_parse_response_node(state: EmailGraphState) -> Dict[str,
     
     if llm and llm_messages:
         try:
-            chat_completion = await llm.chat.completions.create(
+            llm_response_content = await complete_chat(
+                llm,
+                source="email",
+                structured=True,
                 model=model_used,
                 messages=llm_messages,
                 temperature=0.3
             )
-            llm_response_content = chat_completion.choices[0].message.content
             state_dict["llm_raw_response_content"] = llm_response_content
             
-            parsed_llm_response = _parse_json_flexible(llm_response_content)
+            parsed_llm_response = extract_json(llm_response_content)
             try:
                 if parsed_llm_response is None:
                     raise json.JSONDecodeError("Unable to parse JSON payload", llm_response_content, 0)
@@ -712,6 +702,8 @@ async def call_llm_and_parse_response_node(state: EmailGraphState) -> Dict[str,
             else:
                 final_response_content = f"LLM API 호출 중 오류가 발생했습니다: {e}"
             llm_output_details = {"error": str(e)}
+        except AdmissionRejected:
+            raise
         except Exception as e:
             logger.warning("EmailAgent unexpected LLM error: %s", e)
             if task_type == "review" and extracted_email_content:
@@ -32,6 +32,7 @@ class EmailGraphState(TypedDict):
     extracted_recipient_country: Optional[str]
     extracted_purpose: Optional[str]
     final_metadata: Optional[Dict[str, Any]] # The metadata to be returned
+    extraction_cache: Optional[Dict[str, Any]] # Incremental history facts + turn cursor (agent_specific_state)
 
     # Output for Orchestrator
     agent_output_for_orchestrator: Optional[Dict[str, Any]]
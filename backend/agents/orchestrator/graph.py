@@ -4,6 +4,8 @@ from typing import Callable, Literal
 # Assuming langchain_core.graph is used for StateGraph based on LangGraph principles
 from langgraph.graph import StateGraph, END
 
+from backend.infrastructure.request_deadline import deadline_checked
+
 # Internal imports
 from .state import OrchestratorGraphState
 from .nodes import (
@@ -20,11 +22,11 @@ def create_orchestrator_graph() -> StateGraph:
     workflow = StateGraph(OrchestratorGraphState)
 
     # Define nodes
-    workflow.add_node("load_session_state", load_session_state_node)
-    workflow.add_node("detect_intent", detect_intent_and_route_node)
-    workflow.add_node("call_agent", call_agent_node)
-    workflow.add_node("finalize_and_save", finalize_and_save_state_node)
-    workflow.add_node("normalize_response", normalize_response_node)
+    workflow.add_node("load_session_state", deadline_checked(load_session_state_node))
+    workflow.add_node("detect_intent", deadline_checked(detect_intent_and_route_node))
+    workflow.add_node("call_agent", deadline_checked(call_agent_node))
+    workflow.add_node("finalize_and_save", deadline_checked(finalize_and_save_state_node))
+    workflow.add_node("normalize_response", deadline_checked(normalize_response_node))
 
     # Define edges
     workflow.set_entry_point("load_session_state")
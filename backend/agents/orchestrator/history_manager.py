@@ -0,0 +1,230 @@
+# backend/agents/orchestrator/history_manager.py
+
+"""
+Bounded conversation history with a rolling summary.
+
+Only the last `max_turns` raw turns stay in `conversation_history`. Older
+turns are moved to `pending_summary_turns` when finalizing a turn and are
+folded into `history_summary` by a background task that runs after the
+HTTP response has been sent. Agents receive a view made of the summary,
+any not-yet-folded turns and the recent raw turns, so prompt size stays
+bounded no matter how long the session runs.
+"""
+
+import asyncio
+import os
+import re
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from backend.infrastructure.llm_admission import llm_caller
+from backend.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SUMMARY_ROLE = "System"
+SUMMARY_PREFIX = "[이전 대화 요약]"
+SUMMARY_PROMPT_FILE = "history_summary_prompt.txt"
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _load_summary_prompt() -> str:
+    prompt_path = os.path.abspath(
+        os.path.join(os.path.dirname(__file__), "..", "..", "prompts", SUMMARY_PROMPT_FILE)
+    )
+    with open(prompt_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _format_turns(turns: List[Dict[str, Any]]) -> str:
+    return "\n".join(f"{turn.get('role', 'User')}: {turn.get('content', '')}" for turn in turns)
+
+
+class ConversationHistoryManager:
+    """
+    Keeps session history bounded and maintains a running summary.
+
+    Args:
+        llm: AsyncOpenAI-compatible client used for summarization. When None
+            (or when the call fails) an extractive fallback summary is used.
+        max_turns: Number of raw history entries kept verbatim. 0 disables trimming.
+        summary_batch: Overflow entries collected before a trim happens, so the
+            stored history is rewritten (and summarized) once per batch rather
+            than on every turn.
+        summary_max_chars: Upper bound for the stored summary text.
+        model: Chat model used for summarization.
+    """
+
+    def __init__(
+        self,
+        llm: Any = None,
+        max_turns: int = 20,
+        summary_batch: int = 10,
+        summary_max_chars: int = 2000,
+        model: str = "solar-pro2",
+    ):
+        self.llm = llm
+        self.max_turns = max(0, int(max_turns))
+        self.summary_batch = max(1, int(summary_batch))
+        self.summary_max_chars = max(200, int(summary_max_chars))
+        self.model = model
+        self._prompt: Optional[str] = None
+        self._inflight: Set[str] = set()
+
+    @classmethod
+    def from_settings(cls, settings, llm: Any = None) -> "ConversationHistoryManager":
+        return cls(
+            llm=llm,
+            max_turns=getattr(settings, "history_max_turns", 20),
+            summary_batch=getattr(settings, "history_summary_batch", 10),
+            summary_max_chars=getattr(settings, "history_summary_max_chars", 2000),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_turns > 0
+
+    # --- Turn-time helpers (synchronous, no I/O) ---
+
+    def build_agent_history(
+        self,
+        conversation_history: List[Dict[str, Any]],
+        history_summary: str = "",
+        pending_turns: Optional[List[Dict[str, Any]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """History view handed to agents: summary turn + unfolded turns + recent turns."""
+        view: List[Dict[str, Any]] = []
+        if history_summary:
+            view.append({"role": SUMMARY_ROLE, "content": f"{SUMMARY_PREFIX}\n{history_summary}"})
+        if pending_turns:
+            view.extend(pending_turns)
+        view.extend(conversation_history)
+        return view
+
+    def merge_agent_history(
+        self,
+        conversation_history: List[Dict[str, Any]],
+        agent_history: List[Dict[str, Any]],
+        agent_output_history: Any,
+    ) -> List[Dict[str, Any]]:
+        """Append only the turns an agent added on top of the view it was given."""
+        if not isinstance(agent_output_history, list) or len(agent_output_history) < len(agent_history):
+            return list(conversation_history)
+        return list(conversation_history) + list(agent_output_history[len(agent_history):])
+
+    def trim(self, state: Dict[str, Any]) -> bool:
+        """
+        Move overflow turns into `pending_summary_turns`.
+
+        Returns True when the session has turns waiting to be folded into
+        the summary.
+        """
+        history = list(state.get("conversation_history") or [])
+        pending = list(state.get("pending_summary_turns") or [])
+
+        if self.enabled and len(history) > self.max_turns + self.summary_batch:
+            cut = len(history) - self.max_turns
+            pending.extend(history[:cut])
+            history = history[cut:]
+            logger.debug("Trimmed %s history entries into pending summary turns", cut)
+
+        state["conversation_history"] = history
+        state["pending_summary_turns"] = pending
+        state.setdefault("history_summary", "")
+        return bool(pending)
+
+    # --- Background summarization ---
+
+    async def summarize(self, history_summary: str, turns: List[Dict[str, Any]]) -> str:
+        """Fold `turns` into `history_summary`, using the LLM when available."""
+        if self.llm is not None:
+            try:
+                if self._prompt is None:
+                    self._prompt = _load_summary_prompt()
+                user_content = (
+                    f"기존 요약:\n{history_summary or '(없음)'}\n\n"
+                    f"새 대화:\n{_format_turns(turns)}"
+                )
+                with llm_caller("history", "batch"):
+                    completion = await self.llm.chat.completions.create(
+                        model=self.model,
+                        messages=[
+                            {"role": "system", "content": self._prompt},
+                            {"role": "user", "content": user_content},
+                        ],
+                        temperature=0.2,
+                    )
+                text = (completion.choices[0].message.content or "").strip()
+                if text:
+                    return self._clip(text)
+            except Exception as e:
+                logger.warning("History summarization failed (%s). Using extractive fallback.", e)
+
+        return self._fallback_summary(history_summary, turns)
+
+    async def fold_pending(
+        self,
+        session_id: str,
+        conversation_store,
+        serialized: Optional[Callable[[str, Callable[[], Awaitable[bool]]], Awaitable[bool]]] = None,
+    ) -> bool:
+        """
+        Summarize the session's pending turns and persist the new summary.
+
+        The store is re-read after the LLM call and the update is skipped if
+        another fold already consumed the same turns. With `serialized` (e.g.
+        `CHAT_SINGLE_FLIGHT.serialized`) that re-read and save run under the
+        session's turn lock, so a concurrent chat turn neither overwrites the
+        fold nor is overwritten by it.
+        """
+        if session_id in self._inflight:
+            return False
+        self._inflight.add(session_id)
+        try:
+            session = conversation_store.get_state(session_id)
+            pending = list((session or {}).get("pending_summary_turns") or [])
+            if not pending:
+                return False
+
+            summary = await self.summarize(session.get("history_summary") or "", pending)
+
+            async def apply() -> bool:
+                latest = conversation_store.get_state(session_id)
+                if not latest:
+                    return False
+                latest_pending = list(latest.get("pending_summary_turns") or [])
+                if latest_pending[: len(pending)] != pending:
+                    logger.debug("Pending turns changed for session %s; skipping summary update", session_id)
+                    return False
+
+                latest["history_summary"] = summary
+                latest["pending_summary_turns"] = latest_pending[len(pending):]
+                conversation_store.save_state(session_id, latest)
+                logger.debug("Folded %s turns into summary for session %s", len(pending), session_id)
+                return True
+
+            return await (serialized(session_id, apply) if serialized is not None else apply())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Failed to fold history for session %s: %s", session_id, e)
+            return False
+        finally:
+            self._inflight.discard(session_id)
+
+    def _fallback_summary(self, history_summary: str, turns: List[Dict[str, Any]]) -> str:
+        lines = [history_summary] if history_summary else []
+        for turn in turns:
+            content = _WHITESPACE_RE.sub(" ", str(turn.get("content", ""))).strip()
+            if not content:
+                continue
+            if len(content) > 160:
+                content = content[:160] + "…"
+            lines.append(f"- {turn.get('role', 'User')}: {content}")
+        return self._clip("\n".join(lines))
+
+    def _clip(self, text: str) -> str:
+        # Keep the most recent part; older context is the least useful.
+        if len(text) <= self.summary_max_chars:
+            return text
+        return "…" + text[-(self.summary_max_chars - 1):]
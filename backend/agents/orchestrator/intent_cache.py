@@ -0,0 +1,216 @@
+# backend/agents/orchestrator/intent_cache.py
+
+"""
+Cache of routing-LLM intent results.
+
+Users repeat the same kinds of requests ("FOB가 뭐야", "이메일 검토해줘"),
+and every message that reaches `_classify_intent_with_llm` costs an LLM round
+trip. Two layers sit in front of that call:
+
+- exact: keyed on normalized text (NFKC, lower case, collapsed whitespace,
+  trailing punctuation stripped)
+- semantic: reuses a cached label when the new message embeds within
+  `semantic_threshold` cosine similarity of a cached one
+
+Both layers are bounded TTL/LRU caches. `metrics()` reports hits per layer
+and the hit rate.
+"""
+
+import re
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from backend.utils.ttl_cache import TTLCache
+
+Embedder = Callable[[str], Optional[List[float]]]
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING = re.compile(r"[\s?!.,~…？！。]+$")
+
+
+def normalize_intent_text(text: str) -> str:
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    return _TRAILING.sub("", _WHITESPACE.sub(" ", text).strip())
+
+
+@dataclass
+class IntentLookup:
+    """Result of `IntentCache.lookup`; keeps the embedding for a later `store`."""
+
+    label: Optional[str]
+    layer: Optional[str]  # "exact" | "semantic" | None (miss)
+    key: str
+    embedding: Optional[np.ndarray] = None
+
+
+class IntentCache:
+    """
+    Args:
+        embed: Text -> embedding; None disables the semantic layer.
+        ttl: Seconds a cached label stays valid.
+        max_entries: Entries per layer.
+        semantic_threshold: Minimum cosine similarity for a semantic hit.
+        clock: Time source, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        embed: Optional[Embedder] = None,
+        ttl: float = 3600.0,
+        max_entries: int = 2048,
+        semantic_threshold: float = 0.95,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.embed = embed
+        self.semantic_threshold = float(semantic_threshold)
+        self._exact = TTLCache(maxsize=max_entries, ttl=ttl, clock=clock)
+        self._semantic = TTLCache(maxsize=max_entries, ttl=ttl, clock=clock)
+        self._lock = threading.Lock()
+        # Semantic rows: embeddings are appended in place instead of re-stacking
+        # every live vector after each store. `_semantic` (key -> label) stays
+        # the source of truth for TTL/LRU; rows of keys it dropped are skipped
+        # on lookup and reclaimed by `_compact` once the matrix is full.
+        self._max_rows = max(16, self._semantic.maxsize + self._semantic.maxsize // 2)
+        self._matrix = np.empty((0, 0), dtype=np.float32)
+        self._rows = 0
+        self._row_of: Dict[str, int] = {}
+        self._row_keys: List[Optional[str]] = []
+        self._stats: Dict[str, int] = {"exact_hits": 0, "semantic_hits": 0, "misses": 0, "stores": 0}
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _embedding(self, text: str) -> Optional[np.ndarray]:
+        if self.embed is None:
+            return None
+        vector = self.embed(text)
+        if not vector:
+            return None
+        array = np.asarray(vector, dtype=float)
+        length = np.linalg.norm(array)
+        return array / length if length > 0 else None
+
+    def lookup(self, text: str) -> IntentLookup:
+        key = normalize_intent_text(text)
+        if not key:
+            self._count("misses")
+            return IntentLookup(label=None, layer=None, key=key)
+
+        label = self._exact.get(key)
+        if label is not None:
+            self._count("exact_hits")
+            return IntentLookup(label=label, layer="exact", key=key)
+
+        embedding = self._embedding(key)
+        if embedding is not None:
+            label = self._semantic_match(embedding)
+            if label is not None:
+                self._count("semantic_hits")
+                return IntentLookup(label=label, layer="semantic", key=key, embedding=embedding)
+
+        self._count("misses")
+        return IntentLookup(label=None, layer=None, key=key, embedding=embedding)
+
+    def _semantic_match(self, embedding: np.ndarray) -> Optional[str]:
+        """Label of the most similar live row at or above the threshold."""
+        with self._lock:
+            if not self._rows or self._matrix.shape[1] != embedding.shape[0]:
+                return None
+            similarities = self._matrix[: self._rows] @ embedding.astype(np.float32)
+            candidates = np.flatnonzero(similarities >= self.semantic_threshold)
+            for row in candidates[np.argsort(similarities[candidates])[::-1]]:
+                key = self._row_keys[row]
+                label = self._semantic.get(key) if key is not None else None
+                if label is not None:
+                    return label
+                self._drop_row(int(row))  # expired or evicted from the semantic layer
+        return None
+
+    def _add_row(self, key: str, embedding: np.ndarray) -> None:
+        """Write `key`'s embedding into its row, appending one if needed (lock held)."""
+        row = self._row_of.get(key)
+        if row is None:
+            if self._matrix.shape[1] != embedding.shape[0]:
+                self._reset_rows(embedding.shape[0])
+            if self._rows == self._matrix.shape[0]:
+                if self._rows >= self._max_rows:
+                    self._compact()
+                if self._rows == self._matrix.shape[0]:
+                    capacity = min(self._max_rows, max(16, 2 * self._matrix.shape[0]))
+                    grown = np.zeros((capacity, self._matrix.shape[1]), dtype=np.float32)
+                    grown[: self._rows] = self._matrix[: self._rows]
+                    self._matrix = grown
+            row = self._rows
+            self._rows += 1
+            self._row_of[key] = row
+            self._row_keys.append(key)
+        self._matrix[row] = embedding
+
+    def _drop_row(self, row: int) -> None:
+        key = self._row_keys[row]
+        if key is not None:
+            self._row_of.pop(key, None)
+            self._row_keys[row] = None
+        self._matrix[row] = 0.0
+
+    def _compact(self) -> None:
+        """Keep only rows whose key is still live in the semantic layer."""
+        live = {key for key, _ in self._semantic.items()}
+        rows = [row for row, key in enumerate(self._row_keys) if key in live]
+        self._matrix[: len(rows)] = self._matrix[rows]
+        self._matrix[len(rows): self._rows] = 0.0
+        self._row_keys = [self._row_keys[row] for row in rows]
+        self._row_of = {key: row for row, key in enumerate(self._row_keys)}
+        self._rows = len(rows)
+
+    def _reset_rows(self, dimension: int) -> None:
+        self._matrix = np.zeros((0, dimension), dtype=np.float32)
+        self._rows = 0
+        self._row_of = {}
+        self._row_keys = []
+
+    def store(self, lookup: IntentLookup, label: str) -> None:
+        if not lookup.key:
+            return
+        self._exact.set(lookup.key, label)
+        embedding = lookup.embedding if lookup.embedding is not None else self._embedding(lookup.key)
+        if embedding is not None:
+            with self._lock:
+                self._add_row(lookup.key, embedding)
+                self._semantic.set(lookup.key, label)
+        self._count("stores")
+
+    def clear(self) -> None:
+        self._exact.clear()
+        with self._lock:
+            self._semantic.clear()
+            self._reset_rows(0)
+
+    def metrics(self) -> Dict[str, float]:
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["exact_hits"] + stats["semantic_hits"] + stats["misses"]
+        hits = stats["exact_hits"] + stats["semantic_hits"]
+        stats["hit_rate"] = round(hits / lookups, 4) if lookups else 0.0
+        stats["exact_size"] = len(self._exact)
+        stats["semantic_size"] = len(self._semantic)
+        return stats
+
+
+def create_intent_cache(settings, embed: Optional[Embedder] = None) -> Optional[IntentCache]:
+    if not getattr(settings, "intent_cache", True):
+        return None
+    if embed is None and getattr(settings, "intent_cache_semantic", True):
+        from backend.rag.embedder import get_embedding as embed
+    return IntentCache(
+        embed=embed,
+        ttl=getattr(settings, "intent_cache_ttl", 3600.0),
+        max_entries=getattr(settings, "intent_cache_max_entries", 2048),
+        semantic_threshold=getattr(settings, "intent_cache_semantic_threshold", 0.95),
+    )
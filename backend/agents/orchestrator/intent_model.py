@@ -0,0 +1,315 @@
+# backend/agents/orchestrator/intent_model.py
+
+"""
+Local intent classifier that runs before the routing LLM.
+
+A nearest-centroid model over the project's own embeddings
+(`backend.rag.embedder.get_embedding`): each agent type is the normalized
+mean embedding of its labelled examples, and a message goes to the closest
+centroid. Confidence is the softmax of the cosine similarities, so a message
+that sits between two centroids gets a low score and is left to the LLM; a
+message that is not close to any centroid (best cosine below
+`min_similarity`, e.g. one shared word) gets confidence 0.
+
+Training data:
+- the few-shot examples of `orchestrator_intent_prompt.txt`
+- `dataset/scenarios_master.json` (all risk situations -> riskmanaging)
+- `SEED_EXAMPLES` below for the labels the two sources barely cover
+
+Train and persist with `scripts/train_intent_classifier.py`; the artifact
+records the embedding provider/dimension it was built with and is ignored
+when they no longer match.
+"""
+
+import json
+import os
+import re
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+Embedder = Callable[[str], Optional[List[float]]]
+Example = Tuple[str, str]  # (text, agent_type)
+
+ARTIFACT_VERSION = 1
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+INTENT_PROMPT_PATH = os.path.join(PROJECT_ROOT, "backend", "prompts", "orchestrator_intent_prompt.txt")
+SCENARIOS_PATH = os.path.join(PROJECT_ROOT, "dataset", "scenarios_master.json")
+
+SEED_EXAMPLES: Tuple[Example, ...] = (
+    ("바이어가 품질 문제로 클레임을 걸었어요. 어떻게 대응하죠?", "riskmanaging"),
+    ("결제가 30일째 안 들어오고 있는데 어떻게 해야 할까요", "riskmanaging"),
+    ("통관에서 HS 코드 문제로 물건이 묶였어요", "riskmanaging"),
+    ("이 상황 리스크 분석 보고서로 정리해줘", "riskmanaging"),
+    ("무역 용어 문제 5개 내줘", "quiz"),
+    ("인코텀즈 객관식 문제 풀어보고 싶어", "quiz"),
+    ("OX 문제로 테스트해줘", "quiz"),
+    ("신입용 무역 퀴즈 난이도 쉽게 만들어줘", "quiz"),
+    ("바이어에게 보낼 영문 메일 써줘", "email"),
+    ("이 이메일 문장 자연스럽게 고쳐줘", "email"),
+    ("견적 요청 회신 메일 초안 작성해줘", "email"),
+    ("공급사에 납기 확인 요청 메일 좀 써줘", "email"),
+    ("FOB가 뭐야", "default_chat"),
+    ("인코텀즈 뜻 알려줘", "default_chat"),
+    ("CIF와 FOB 차이가 뭐야", "default_chat"),
+    ("신용장이 뭔지 설명해줘", "default_chat"),
+    ("고마워요", "default_chat"),
+    ("너는 뭘 할 수 있어?", "default_chat"),
+    ("오늘 점심 뭐 먹지", "out_of_scope"),
+    ("주말에 볼만한 영화 추천해줘", "out_of_scope"),
+    ("비트코인 지금 사도 될까", "out_of_scope"),
+    ("내일 서울 날씨 알려줘", "out_of_scope"),
+)
+
+_FEW_SHOT = re.compile(r'사용자 요청:\s*"([^"{}]+)"\s*```json\s*\{\s*"agent_type":\s*"(\w+)"')
+_INLINE_EXAMPLE = re.compile(r'"([^"{}]+)"')
+
+
+def load_training_examples(
+    prompt_path: str = INTENT_PROMPT_PATH,
+    scenarios_path: str = SCENARIOS_PATH,
+) -> List[Example]:
+    """Labelled examples from the intent prompt, the scenario dataset and the seeds."""
+    examples: List[Example] = []
+    if os.path.exists(prompt_path):
+        with open(prompt_path, "r", encoding="utf-8") as file:
+            prompt = file.read()
+        examples.extend(_FEW_SHOT.findall(prompt))
+        # "그 외 무역 관련 개념 설명 질문은 default_chat" followed by inline examples.
+        for line in prompt.splitlines():
+            if line.strip().startswith("- 예:"):
+                examples.extend((text, "default_chat") for text in _INLINE_EXAMPLE.findall(line))
+    if os.path.exists(scenarios_path):
+        with open(scenarios_path, "r", encoding="utf-8") as file:
+            scenarios = json.load(file)
+        for scenario in scenarios if isinstance(scenarios, list) else []:
+            text = (scenario or {}).get("input_text") or (scenario or {}).get("content")
+            if text:
+                examples.append((text, "riskmanaging"))
+    examples.extend(SEED_EXAMPLES)
+    return examples
+
+
+def _unit(vector: Sequence[float]) -> Optional[np.ndarray]:
+    array = np.asarray(vector, dtype=float)
+    length = np.linalg.norm(array)
+    return array / length if length > 0 else None
+
+
+class NearestCentroidIntentModel:
+    """
+    Args:
+        labels: Agent types, one per centroid row.
+        centroids: (n_labels, dim) unit vectors.
+        temperature: Softmax temperature over cosine similarities.
+        min_similarity: Best cosine below this means "unknown" (confidence 0).
+        embedding_info: Provider/dimension the centroids were built with.
+    """
+
+    def __init__(
+        self,
+        labels: Sequence[str],
+        centroids: np.ndarray,
+        temperature: float = 0.05,
+        embedding_info: Optional[Dict[str, object]] = None,
+        metrics: Optional[Dict[str, object]] = None,
+        min_similarity: float = 0.0,
+    ):
+        self.labels = list(labels)
+        self.centroids = np.asarray(centroids, dtype=float)
+        self.temperature = float(temperature)
+        self.min_similarity = float(min_similarity)
+        self.embedding_info = dict(embedding_info or {})
+        self.metrics = dict(metrics or {})
+
+    @classmethod
+    def fit(
+        cls,
+        examples: Sequence[Example],
+        embed: Embedder,
+        temperature: float = 0.05,
+        embedding_info: Optional[Dict[str, object]] = None,
+    ) -> "NearestCentroidIntentModel":
+        sums: Dict[str, np.ndarray] = {}
+        for text, label in examples:
+            vector = embed(text)
+            unit = _unit(vector) if vector else None
+            if unit is None:
+                continue
+            sums[label] = sums[label] + unit if label in sums else unit
+        if not sums:
+            raise ValueError("no embeddable training examples")
+        labels = sorted(sums)
+        centroids = np.vstack([_unit(sums[label]) for label in labels])
+        return cls(labels, centroids, temperature=temperature, embedding_info=embedding_info)
+
+    def predict_vector(self, vector: Sequence[float]) -> Tuple[str, float]:
+        unit = _unit(vector)
+        if unit is None or unit.shape[0] != self.centroids.shape[1]:
+            return self.labels[0], 0.0
+        similarities = self.centroids @ unit
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.min_similarity:
+            return self.labels[best], 0.0
+        scores = similarities / self.temperature
+        probabilities = np.exp(scores - scores.max())
+        probabilities /= probabilities.sum()
+        return self.labels[best], float(probabilities[best])
+
+    def predict(self, text: str, embed: Embedder) -> Tuple[str, float]:
+        """(agent_type, confidence); confidence 0.0 when the text cannot be embedded."""
+        vector = embed(text) if text and text.strip() else None
+        if not vector:
+            return self.labels[0], 0.0
+        return self.predict_vector(vector)
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "version": ARTIFACT_VERSION,
+            "labels": self.labels,
+            "centroids": np.round(self.centroids, 6).tolist(),
+            "temperature": self.temperature,
+            "embedding": self.embedding_info,
+            "metrics": self.metrics,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "NearestCentroidIntentModel":
+        if data.get("version") != ARTIFACT_VERSION:
+            raise ValueError(f"unsupported intent model version: {data.get('version')}")
+        return cls(
+            labels=data["labels"],
+            centroids=np.asarray(data["centroids"], dtype=float),
+            temperature=float(data.get("temperature", 0.05)),
+            embedding_info=data.get("embedding") or {},
+            metrics=data.get("metrics") or {},
+        )
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str) -> "NearestCentroidIntentModel":
+        with open(path, "r", encoding="utf-8") as file:
+            return cls.from_dict(json.load(file))
+
+
+def current_embedding_info(settings) -> Dict[str, object]:
+    provider = str(getattr(settings, "embedding_provider", "local") or "local").strip().lower()
+    info: Dict[str, object] = {"provider": provider}
+    if provider == "local":
+        info["dim"] = int(getattr(settings, "local_embedding_dim", 4096) or 4096)
+    return info
+
+
+def evaluate(
+    examples: Sequence[Example],
+    embed: Embedder,
+    min_confidence: float,
+    temperature: float = 0.05,
+    min_similarity: float = 0.0,
+) -> Dict[str, object]:
+    """
+    Leave-one-out accuracy and latency of the nearest-centroid model.
+
+    Reports overall accuracy, how many messages clear `min_confidence`
+    (coverage), the accuracy on those, and prediction latency percentiles.
+    """
+    vectors = [(text, label, _unit(embed(text) or [])) for text, label in examples]
+    vectors = [(text, label, unit) for text, label, unit in vectors if unit is not None]
+    labels = sorted({label for _, label, _ in vectors})
+    sums = {label: sum(unit for _, l, unit in vectors if l == label) for label in labels}
+    counts = {label: sum(1 for _, l, _ in vectors if l == label) for label in labels}
+
+    correct = confident = confident_correct = 0
+    per_label: Dict[str, Dict[str, int]] = {label: {"total": 0, "correct": 0} for label in labels}
+    for _, label, unit in vectors:
+        rows = []
+        for candidate in labels:
+            total = sums[candidate] - (unit if candidate == label else 0)
+            if candidate == label and counts[candidate] == 1:
+                total = np.zeros_like(unit)  # nothing left to represent the label
+            rows.append(_unit(total) if np.linalg.norm(total) > 0 else np.zeros_like(unit))
+        model = NearestCentroidIntentModel(
+            labels, np.vstack(rows), temperature=temperature, min_similarity=min_similarity
+        )
+        predicted, confidence = model.predict_vector(unit)
+        hit = predicted == label
+        correct += hit
+        per_label[label]["total"] += 1
+        per_label[label]["correct"] += hit
+        if confidence >= min_confidence:
+            confident += 1
+            confident_correct += hit
+
+    model = NearestCentroidIntentModel.fit(examples, embed, temperature=temperature)
+    timings = []
+    for text, _ in examples:
+        start = time.perf_counter()
+        model.predict(text, embed)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    total = max(len(vectors), 1)
+    return {
+        "examples": len(vectors),
+        "labels": counts,
+        "loo_accuracy": round(correct / total, 4),
+        "min_confidence": min_confidence,
+        "min_similarity": min_similarity,
+        "coverage": round(confident / total, 4),
+        "accuracy_when_confident": round(confident_correct / confident, 4) if confident else None,
+        "per_label_accuracy": {
+            label: round(stats["correct"] / stats["total"], 4) for label, stats in per_label.items() if stats["total"]
+        },
+        "latency_ms": {
+            "p50": round(timings[len(timings) // 2], 3) if timings else None,
+            "p95": round(timings[int(len(timings) * 0.95)], 3) if timings else None,
+        },
+    }
+
+
+def load_intent_model(settings, embed: Optional[Embedder] = None) -> Optional[NearestCentroidIntentModel]:
+    """
+    Persisted model if it matches the current embedding setup, else None.
+
+    With the local hash embedding a missing artifact is trained in memory
+    from the bundled examples (milliseconds); remote providers require the
+    artifact built by `scripts/train_intent_classifier.py`.
+    """
+    if not getattr(settings, "intent_local_classifier", True):
+        return None
+    path = getattr(settings, "intent_model_path", "") or ""
+    if path and not os.path.isabs(path):
+        path = os.path.join(PROJECT_ROOT, path)
+    info = current_embedding_info(settings)
+    min_similarity = float(getattr(settings, "intent_local_min_similarity", 0.25))
+
+    if path and os.path.exists(path):
+        try:
+            model = NearestCentroidIntentModel.load(path)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("Intent model at %s could not be loaded: %s", path, e)
+        else:
+            if model.embedding_info == info:
+                model.min_similarity = min_similarity
+                return model
+            logger.warning(
+                "Intent model at %s was built for %s, current embedding is %s; retrain it",
+                path, model.embedding_info, info,
+            )
+
+    if info["provider"] != "local":
+        logger.info("No usable intent model for provider %s; routing falls back to the LLM", info["provider"])
+        return None
+    if embed is None:
+        from backend.rag.embedder import get_embedding as embed
+    model = NearestCentroidIntentModel.fit(load_training_examples(), embed, embedding_info=info)
+    model.min_similarity = min_similarity
+    return model
@@ -0,0 +1,221 @@
+# backend/agents/orchestrator/keyword_router.py
+
+"""
+Keyword fast path of intent routing.
+
+All keyword sets are compiled once into a single trie-shaped regex. One scan
+of the input yields every matched keyword with its category and position
+(overlapping matches included), and the routing priorities are plain data:
+
+- `KEYWORD_ROUTES`: category -> agent, checked in order before anything else
+- `FOLLOW_UP_RULES`: keep the active agent for follow-up turns
+
+`detect_intent_and_route_node` falls back to the LLM when no rule applies.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+KEYWORD_SETS: Dict[str, Tuple[str, ...]] = {
+    "risk": ("클레임", "선적 지연", "리스크", "손해배상", "대처 방안", "유사 사례", "패널티", "지연"),
+    "quiz": ("퀴즈", "학습"),
+    "email": ("이메일", "메일", "회신", "답장", "초안", "mail", "리뷰", "검토", "첨삭", "교정"),
+    "clarification": (
+        "어떤정보", "어떤 정보", "무슨정보", "무슨 정보", "뭐가 필요", "뭐가 필요한", "필요한 정보", "추가 정보",
+    ),
+    "email_followup": (
+        "한국어", "영어", "번역", "다시", "수정", "고쳐", "톤", "제목", "간단", "짧게", "길게", "공손",
+    ),
+    "quiz_followup": (
+        "정답", "해설", "힌트", "다음 문제", "다음문제", "한문제", "난이도", "쉽게", "어렵게", "더 문제",
+        "문제 더", "퀴즈 더", "더 내줘", "더줘", "더 달라고", "더 만들어", "추가 문제", "추가 퀴즈",
+    ),
+}
+
+# Unconditional keyword routes, highest priority first.
+KEYWORD_ROUTES: Tuple[Tuple[str, str], ...] = (
+    ("risk", "riskmanaging"),
+    ("quiz", "quiz"),
+    ("email", "email"),
+)
+
+
+@dataclass(frozen=True)
+class FollowUpRule:
+    """
+    Keep `active_agent` when it is one of `agents` and the turn looks like a follow-up.
+
+    The rule applies when every given condition holds:
+    - `requires_state`: this key is truthy in the agent-specific state
+    - `max_length`: stripped input is at most this long
+    and at least one trigger fires (no triggers = always):
+    - `category`: a keyword of this category occurs in the input
+    - `multiline_min_length`: input has a newline and is longer than this
+    - `answer_pattern`: input fully matches it while `answer_state` is truthy
+    """
+
+    agents: Tuple[str, ...]
+    reason: str
+    category: Optional[str] = None
+    requires_state: Optional[str] = None
+    max_length: Optional[int] = None
+    multiline_min_length: Optional[int] = None
+    answer_pattern: Optional[str] = None
+    answer_state: Optional[str] = None
+
+
+FOLLOW_UP_RULES: Tuple[FollowUpRule, ...] = (
+    FollowUpRule(
+        agents=("riskmanaging",),
+        reason="analysis in progress",
+        requires_state="analysis_in_progress",
+    ),
+    FollowUpRule(
+        agents=("quiz", "email"),
+        reason="awaiting follow-up details",
+        category="clarification",
+        requires_state="awaiting_follow_up",
+        multiline_min_length=40,
+    ),
+    FollowUpRule(
+        agents=("email",),
+        reason="short follow-up edit request",
+        category="email_followup",
+        max_length=80,
+    ),
+    FollowUpRule(
+        agents=("quiz",),
+        reason="short follow-up quiz request",
+        category="quiz_followup",
+        max_length=80,
+        answer_pattern=r"\s*([1-4])\s*번?\s*",
+        answer_state="pending_quiz",
+    ),
+)
+
+
+@dataclass(frozen=True)
+class RouteDecision:
+    agent: str
+    reason: str
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Regex alternation shaped as a prefix trie; greedy, so the longest keyword wins."""
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            return f"(?:{body})?"
+        return body
+
+    return build(trie)
+
+
+class KeywordRouter:
+    """
+    Single-pass keyword matcher plus data-driven routing rules.
+
+    `scan` runs one compiled regex over the input. The regex reports the
+    longest keyword at a position; shorter keywords that are prefixes of it
+    are added from a precomputed table, and the next search starts one
+    character later so overlapping keywords are found too.
+    """
+
+    def __init__(
+        self,
+        keyword_sets: Mapping[str, Sequence[str]] = KEYWORD_SETS,
+        routes: Sequence[Tuple[str, str]] = KEYWORD_ROUTES,
+        follow_up_rules: Sequence[FollowUpRule] = FOLLOW_UP_RULES,
+    ):
+        self.routes = tuple(routes)
+        self.follow_up_rules = tuple(follow_up_rules)
+        self._answer_patterns = {
+            rule: re.compile(rule.answer_pattern) for rule in self.follow_up_rules if rule.answer_pattern
+        }
+
+        categories_by_keyword: Dict[str, set] = {}
+        for category, keywords in keyword_sets.items():
+            for keyword in keywords:
+                categories_by_keyword.setdefault(keyword, set()).add(category)
+        # Every keyword matched at a position is a prefix of the longest one there.
+        self._hits: Dict[str, Tuple[Tuple[str, str], ...]] = {
+            keyword: tuple(
+                (category, prefix)
+                for prefix, categories in categories_by_keyword.items()
+                if keyword.startswith(prefix)
+                for category in sorted(categories)
+            )
+            for keyword in categories_by_keyword
+        }
+        self._pattern = re.compile(_trie_pattern(categories_by_keyword))
+
+    def scan(self, text: str) -> Dict[str, List[Tuple[int, str]]]:
+        """{category: [(position, keyword), ...]} for every keyword occurrence in `text`."""
+        matches: Dict[str, List[Tuple[int, str]]] = {}
+        search = self._pattern.search
+        match = search(text)
+        while match:
+            start = match.start()
+            for category, keyword in self._hits[match.group()]:
+                matches.setdefault(category, []).append((start, keyword))
+            match = search(text, start + 1)
+        return matches
+
+    def route(
+        self,
+        text: str,
+        active_agent: Optional[str] = None,
+        agent_specific_state: Optional[Mapping[str, Any]] = None,
+    ) -> Optional[RouteDecision]:
+        """Agent chosen by keywords or follow-up rules, or None to ask the LLM."""
+        matches = self.scan(text)
+        for category, agent in self.routes:
+            if category in matches:
+                return RouteDecision(agent=agent, reason=f"keyword:{category}")
+
+        if not active_agent:
+            return None
+        agent_state = agent_specific_state or {}
+        length = len(text.strip())
+        for rule in self.follow_up_rules:
+            if active_agent not in rule.agents:
+                continue
+            if rule.requires_state and not agent_state.get(rule.requires_state):
+                continue
+            if rule.max_length is not None and length > rule.max_length:
+                continue
+            if self._triggered(rule, text, matches, agent_state):
+                return RouteDecision(agent=active_agent, reason=rule.reason)
+        return None
+
+    def _triggered(
+        self,
+        rule: FollowUpRule,
+        text: str,
+        matches: Mapping[str, Any],
+        agent_state: Mapping[str, Any],
+    ) -> bool:
+        triggers = (rule.category, rule.multiline_min_length, rule.answer_pattern)
+        if all(trigger is None for trigger in triggers):
+            return True
+        if rule.category is not None and rule.category in matches:
+            return True
+        if rule.multiline_min_length is not None and "\n" in text and len(text.strip()) > rule.multiline_min_length:
+            return True
+        if rule.answer_pattern is not None and agent_state.get(rule.answer_state or ""):
+            return self._answer_patterns[rule].fullmatch(text) is not None
+        return False
+
+
+KEYWORD_ROUTER = KeywordRouter()
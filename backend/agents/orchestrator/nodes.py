@@ -1,15 +1,16 @@
 # backend/agents/orchestrator/nodes.py
 
+import asyncio
 import os
 import sys
 import json
 import time
-import re
 import inspect
 from typing import Dict, Any, List, Optional, Type, cast
 
 import openai
-from openai import AsyncOpenAI
+from backend.infrastructure.llm_admission import AdmissionRejected, llm_caller
+from backend.infrastructure.llm_client_registry import UPSTAGE_BASE_URL, get_async_openai
 from langsmith import traceable # traceable will be applied at graph level or individual agent level if needed
 
 # External imports
@@ -20,11 +21,23 @@ from backend.utils.logger import get_logger
 # Internal imports for Orchestrator package
 from .state import OrchestratorGraphState
 from .session_store import create_conversation_store
+from .history_manager import ConversationHistoryManager
+from .keyword_router import KEYWORD_ROUTER
+from .intent_model import load_intent_model
+from .intent_cache import create_intent_cache
 
 from backend.agents.default_chat.default_chat_agent import DefaultChatAgent # Actual DefaultChatAgent import
-from backend.agents.riskmanaging.graph import RiskManagingAgent # Actual RiskManagingAgent import
+from backend.agents.riskmanaging.graph import REPORT_JOB_KEY, RiskManagingAgent # Actual RiskManagingAgent import
+from backend.agents.riskmanaging.report_jobs import REPORT_JOBS, ReportJob
 from backend.agents.quiz_agent.quiz_agent import QuizAgent                   # Actual QuizAgent import
 from backend.agents.email_agent.email_agent import EmailAgent               # Actual EmailAgent import
+from backend.agents.riskmanaging.nodes import RAGConnector
+from backend.agents.riskmanaging.tools import search_risk_cases
+from backend.agents.quiz_agent.nodes import rag_search_args as quiz_rag_search_args
+from backend.agents.quiz_agent.tools import search_trade_documents
+from backend.agents.email_agent.nodes import rag_search_args as email_rag_search_args
+from backend.agents.email_agent.tools import search_email_references
+from backend.rag.prefetch import RAG_PREFETCH
 
 
 # --- Prompt Loader Function (from old orchestrator.py) ---
@@ -63,16 +76,16 @@ class OrchestratorComponents:
         
         self.llm = None
         if self.settings.upstage_api_key:
-            self.llm = AsyncOpenAI(
-                base_url="https://api.upstage.ai/v1",
-                api_key=self.settings.upstage_api_key
-            )
+            self.llm = get_async_openai(UPSTAGE_BASE_URL, self.settings.upstage_api_key)
         else:
             logger.warning(
                 "UPSTAGE_API_KEY is not set; orchestrator LLM intent classification will fallback."
             )
         
         self.orchestrator_intent_prompt = _load_prompt("orchestrator_intent_prompt.txt")
+        self.intent_model = load_intent_model(self.settings)
+        self.intent_cache = create_intent_cache(self.settings)
+        self.history_manager = ConversationHistoryManager.from_settings(self.settings, llm=self.llm)
 
         # Configure Langsmith tracing
         if self.settings.langsmith_tracing and self.settings.langsmith_api_key:
@@ -119,11 +132,30 @@ def load_session_state_node(state: OrchestratorGraphState) -> Dict[str, Any]:
     state_dict["conversation_history"] = session_data["conversation_history"]
     state_dict["active_agent"] = session_data["active_agent"]
     state_dict["agent_specific_state"] = session_data["agent_specific_state"]
+    state_dict["history_summary"] = session_data.get("history_summary", "")
+    state_dict["pending_summary_turns"] = session_data.get("pending_summary_turns", [])
     # state_dict["last_interaction_timestamp"] = session_data["last_interaction_timestamp"] # Handled by update node
 
     return state_dict
 
 
+def _classify_intent_locally(user_input: str) -> Optional[tuple]:
+    """(agent_type, confidence) when the local classifier is confident enough, else None."""
+    model = ORCHESTRATOR_COMPONENTS.intent_model
+    if model is None:
+        return None
+    try:
+        from backend.rag.embedder import get_embedding
+        agent_type, confidence = model.predict(user_input, get_embedding)
+    except Exception as e:
+        logger.warning("Local intent classification failed (%s). Using LLM.", e)
+        return None
+    min_confidence = getattr(ORCHESTRATOR_COMPONENTS.settings, "intent_local_min_confidence", 0.8)
+    if confidence < min_confidence or agent_type not in set(AGENT_CLASS_MAPPING) | {"out_of_scope"}:
+        return None
+    return agent_type, confidence
+
+
 async def _classify_intent_with_llm(user_input: str) -> str:
     llm = ORCHESTRATOR_COMPONENTS.llm
     orchestrator_intent_prompt = ORCHESTRATOR_COMPONENTS.orchestrator_intent_prompt
@@ -131,6 +163,20 @@ async def _classify_intent_with_llm(user_input: str) -> str:
     if not llm:
         logger.debug("LLM client not initialized. Falling back to default.")
         return DEFAULT_AGENT_NAME
+
+    # Repeated (or near-identical) requests reuse the earlier LLM label.
+    # The semantic layer embeds the text (possibly a blocking HTTP call), so
+    # lookups and stores run off the event loop.
+    intent_cache = ORCHESTRATOR_COMPONENTS.intent_cache
+    cache_lookup = await asyncio.to_thread(intent_cache.lookup, user_input) if intent_cache else None
+    if cache_lookup and cache_lookup.label:
+        logger.debug(
+            "Intent cache %s hit: %s (hit_rate=%s)",
+            cache_lookup.layer,
+            cache_lookup.label,
+            intent_cache.metrics()["hit_rate"],
+        )
+        return cache_lookup.label
     
     try:
         system_message_content = orchestrator_intent_prompt.split('---')[0].strip()
@@ -147,12 +193,13 @@ async def _classify_intent_with_llm(user_input: str) -> str:
             len(user_input),
         )
 
-        response_completion = await llm.chat.completions.create(
-            model="solar-pro2",
-            messages=messages,
-            temperature=0.1,
-            response_format={"type": "json_object"}
-        )
+        with llm_caller("orchestrator", "routing"):
+            response_completion = await llm.chat.completions.create(
+                model="solar-pro2",
+                messages=messages,
+                temperature=0.1,
+                response_format={"type": "json_object"}
+            )
         response = response_completion.choices[0].message.content
         
         logger.debug(
@@ -164,13 +211,61 @@ async def _classify_intent_with_llm(user_input: str) -> str:
         agent_type = parsed_response.get("agent_type", DEFAULT_AGENT_NAME)
         reason = parsed_response.get("reason", "LLM based classification.")
         logger.info("LLM classified intent: %s (reason=%s)", agent_type, reason)
+        if cache_lookup and (agent_type in AGENT_CLASS_MAPPING or agent_type == "out_of_scope"):
+            await asyncio.to_thread(intent_cache.store, cache_lookup, agent_type)
         return agent_type
 
+    except AdmissionRejected:  # the API answers 429 instead of a degraded turn
+        raise
     except Exception as e:
         logger.warning("Intent classification failed (%s). Falling back to default.", e)
         return DEFAULT_AGENT_NAME
 
 
+def _prefetch_agent_retrievals(state_dict: Dict[str, Any]) -> List[str]:
+    """
+    Start the retrieval each candidate agent would run for this turn so it
+    overlaps the routing LLM call. The agent picks it up via RAG_PREFETCH.
+    """
+    if not RAG_PREFETCH.enabled or ORCHESTRATOR_COMPONENTS.llm is None:
+        return []
+
+    user_input = state_dict["user_input"]
+    context = state_dict.get("context") or {}
+    settings = ORCHESTRATOR_COMPONENTS.settings
+    candidates = getattr(settings, "rag_prefetch_agents", ["riskmanaging", "quiz", "email"])
+    plans = {
+        # Same history view call_agent_node hands to the risk agent.
+        "riskmanaging": lambda: (
+            search_risk_cases,
+            RAGConnector.search_args(
+                user_input,
+                ORCHESTRATOR_COMPONENTS.history_manager.build_agent_history(
+                    state_dict.get("conversation_history") or [],
+                    state_dict.get("history_summary", ""),
+                    state_dict.get("pending_summary_turns"),
+                ),
+            ),
+        ),
+        "quiz": lambda: (search_trade_documents, quiz_rag_search_args(user_input, context)),
+        "email": lambda: (search_email_references, email_rag_search_args(user_input, context)),
+    }
+
+    started = []
+    for agent_name in candidates:
+        if agent_name not in plans or agent_name not in ORCHESTRATOR_COMPONENTS.agents_instances:
+            continue
+        try:
+            tool, args = plans[agent_name]()
+            if RAG_PREFETCH.start(tool, args):
+                started.append(agent_name)
+        except Exception as e:
+            logger.warning("RAG prefetch for %s failed to start (%s).", agent_name, e)
+    if started:
+        logger.debug("RAG prefetch started for %s", started)
+    return started
+
+
 async def detect_intent_and_route_node(state: OrchestratorGraphState) -> Dict[str, Any]:
     state_dict = cast(Dict[str, Any], state)
 
@@ -184,133 +279,40 @@ async def detect_intent_and_route_node(state: OrchestratorGraphState) -> Dict[st
         state_dict["selected_agent_name"] = context["mode"]
         return state_dict
 
-    # 2. 강력한 키워드 기반 우선 라우팅
-    risk_keywords = ["클레임", "선적 지연", "리스크", "손해배상", "대처 방안", "유사 사례", "패널티", "지연"]
-    if any(keyword in user_input for keyword in risk_keywords):
-        logger.debug("Keyword routing to riskmanaging")
-        state_dict["selected_agent_name"] = "riskmanaging"
-        return state_dict
-
-    quiz_keywords = ["퀴즈", "학습"]
-    if any(keyword in user_input for keyword in quiz_keywords):
-        logger.debug("Keyword routing to quiz")
-        state_dict["selected_agent_name"] = "quiz"
+    # 2. Keyword routes, then follow-up turns that keep the active agent.
+    # Priorities live in keyword_router.KEYWORD_ROUTES / FOLLOW_UP_RULES.
+    active_agent_name = state_dict.get("active_agent")
+    if active_agent_name not in agents_instances:
+        active_agent_name = None
+    decision = KEYWORD_ROUTER.route(
+        user_input,
+        active_agent=active_agent_name,
+        agent_specific_state=state_dict.get("agent_specific_state") or {},
+    )
+    if decision:
+        logger.debug("Keyword routing to %s (%s)", decision.agent, decision.reason)
+        state_dict["selected_agent_name"] = decision.agent
         return state_dict
-
-    email_keywords = ["이메일", "메일", "회신", "답장", "초안", "mail", "리뷰", "검토", "첨삭", "교정"]
-    if any(keyword in user_input for keyword in email_keywords):
-        logger.debug("Keyword routing to email")
-        state_dict["selected_agent_name"] = "email"
+    if active_agent_name:
+        logger.debug("Active agent is %s; re-evaluating intent", active_agent_name)
+
+    # 3. Local intent classifier; only low-confidence messages reach the LLM.
+    # It embeds the message, which can be a blocking HTTP call: run it off the loop.
+    local_prediction = await asyncio.to_thread(_classify_intent_locally, user_input)
+    if local_prediction:
+        agent_type, confidence = local_prediction
+        state_dict["llm_intent_classification"] = {
+            "predicted_type": agent_type,
+            "source": "local",
+            "confidence": round(confidence, 4),
+        }
+        selected = DEFAULT_AGENT_NAME if agent_type == "out_of_scope" else agent_type
+        logger.debug("Local classifier routing to %s (confidence=%.3f)", selected, confidence)
+        state_dict["selected_agent_name"] = selected
         return state_dict
 
-    current_session_state = { # Reconstruct current_session_state for _detect_intent_and_route logic
-        "active_agent": state_dict["active_agent"],
-        "agent_specific_state": state_dict["agent_specific_state"],
-        "conversation_history": state_dict["conversation_history"]
-    }
-
-    # 3. Prioritize active agent in session state.
-    # Only riskmanaging stays sticky while multi-turn analysis is in progress.
-    active_agent_name = current_session_state.get("active_agent")
-    if active_agent_name and active_agent_name in agents_instances:
-        agent_specific_state = current_session_state.get("agent_specific_state", {})
-        if active_agent_name == "riskmanaging":
-            if agent_specific_state.get("analysis_in_progress"):
-                logger.debug(
-                    "Continuing with active agent %s (analysis in progress)",
-                    active_agent_name,
-                )
-                state_dict["selected_agent_name"] = active_agent_name
-                return state_dict # Return updated state to flow to call_agent_node
-        elif active_agent_name in {"quiz", "email"}:
-            normalized_user_input = user_input.strip().lower()
-            clarification_keywords = [
-                "어떤정보",
-                "어떤 정보",
-                "무슨정보",
-                "무슨 정보",
-                "뭐가 필요",
-                "뭐가 필요한",
-                "필요한 정보",
-                "추가 정보",
-            ]
-            email_followup_keywords = [
-                "한국어",
-                "영어",
-                "번역",
-                "다시",
-                "수정",
-                "고쳐",
-                "톤",
-                "제목",
-                "간단",
-                "짧게",
-                "길게",
-                "공손",
-            ]
-            quiz_followup_keywords = [
-                "정답",
-                "해설",
-                "힌트",
-                "다음 문제",
-                "다음문제",
-                "한문제",
-                "난이도",
-                "쉽게",
-                "어렵게",
-                "더 문제",
-                "문제 더",
-                "퀴즈 더",
-                "더 내줘",
-                "더줘",
-                "더 달라고",
-                "더 만들어",
-                "추가 문제",
-                "추가 퀴즈",
-            ]
-
-            if (
-                agent_specific_state.get("awaiting_follow_up")
-                and (
-                    any(keyword in user_input for keyword in clarification_keywords)
-                    or ("\n" in user_input and len(user_input.strip()) > 40)
-                )
-            ):
-                logger.debug(
-                    "Continuing with active agent %s (awaiting follow-up details)",
-                    active_agent_name,
-                )
-                state_dict["selected_agent_name"] = active_agent_name
-                return state_dict
-
-            # Keep short follow-up edits in the same active quiz/email flow.
-            # Example: "한국어로 만들어줄래?" right after email draft generation.
-            if (
-                active_agent_name == "email"
-                and len(normalized_user_input) <= 80
-                and any(keyword in user_input for keyword in email_followup_keywords)
-            ):
-                logger.debug("Continuing with active agent email (short follow-up edit request)")
-                state_dict["selected_agent_name"] = active_agent_name
-                return state_dict
-            if (
-                active_agent_name == "quiz"
-                and len(normalized_user_input) <= 80
-                and (
-                    any(keyword in user_input for keyword in quiz_followup_keywords)
-                    or (
-                        state_dict.get("agent_specific_state", {}).get("pending_quiz")
-                        and re.fullmatch(r"\s*([1-4])\s*번?\s*", user_input)
-                    )
-                )
-            ):
-                logger.debug("Continuing with active agent quiz (short follow-up quiz request)")
-                state_dict["selected_agent_name"] = active_agent_name
-                return state_dict
-        else:
-            logger.debug("Active agent is %s; re-evaluating intent", active_agent_name)
-
-    # 4. LLM-based intent classification
+    # 4. LLM-based intent classification; candidate agents' retrievals run meanwhile.
+    _prefetch_agent_retrievals(state_dict)
     llm_predicted_agent_type = await _classify_intent_with_llm(user_input)
     state_dict["llm_intent_classification"] = {"predicted_type": llm_predicted_agent_type}
     
@@ -360,18 +362,34 @@ async def call_agent_node(state: OrchestratorGraphState) -> Dict[str, Any]:
     # Ensure session_id is passed to the agent for state persistence (MemorySaver/SqliteSaver)
     agent_context["session_id"] = state_dict.get("session_id")
     
-    if selected_agent_name == "quiz":
+    # Agents that keep their own cross-turn state (pending quiz, incremental
+    # extraction caches) read it from the context and return updates.
+    if selected_agent_name in {"quiz", "email", "riskmanaging"}:
         agent_context["_agent_specific_state"] = agent_specific_state
 
-    agent_output = await agent_instance.run(
-        user_input=user_input,
-        conversation_history=conversation_history,
-        analysis_in_progress=agent_specific_state.get("analysis_in_progress", False),
-        context=agent_context
+    # Agents see the rolling summary plus recent turns instead of the full history.
+    history_manager = ORCHESTRATOR_COMPONENTS.history_manager
+    agent_history = history_manager.build_agent_history(
+        conversation_history,
+        state_dict.get("history_summary", ""),
+        state_dict.get("pending_summary_turns"),
     )
 
+    # LLM calls of the run count against the agent's admission bulkhead and priority class.
+    with llm_caller(selected_agent_name):
+        agent_output = await agent_instance.run(
+            user_input=user_input,
+            conversation_history=agent_history,
+            analysis_in_progress=agent_specific_state.get("analysis_in_progress", False),
+            context=agent_context
+        )
+
     state_dict["orchestrator_response"] = agent_output.get("response", {"response": "에이전트 응답 오류", "agent_type": "orchestrator", "metadata": {}})
-    state_dict["conversation_history"] = agent_output.get("conversation_history", conversation_history)
+    state_dict["conversation_history"] = history_manager.merge_agent_history(
+        conversation_history,
+        agent_history,
+        agent_output.get("conversation_history", agent_history),
+    )
     
     if "analysis_in_progress" in agent_output:
         state_dict["agent_specific_state"]["analysis_in_progress"] = agent_output["analysis_in_progress"]
@@ -397,12 +415,24 @@ def finalize_and_save_state_node(state: OrchestratorGraphState) -> Dict[str, Any
 
     session_id = state_dict["session_id"]
     conversation_store = ORCHESTRATOR_COMPONENTS.conversation_store
+
+    # Keep the stored history bounded; overflow is summarized after the response.
+    state_dict["history_fold_pending"] = ORCHESTRATOR_COMPONENTS.history_manager.trim(state_dict)
+
+    # A report job may have finished before this turn saved its reference.
+    report_job = state_dict["agent_specific_state"].get(REPORT_JOB_KEY)
+    if report_job and report_job.get("status") in ("queued", "running"):
+        job = REPORT_JOBS.get(report_job.get("job_id"))
+        if job is not None and job.finished:
+            state_dict["agent_specific_state"][REPORT_JOB_KEY] = _report_job_entry(job)
     
     # Save session state after agent interaction
     session_state_to_save = {
         "active_agent": state_dict["active_agent"],
         "conversation_history": state_dict["conversation_history"],
         "agent_specific_state": state_dict["agent_specific_state"],
+        "history_summary": state_dict["history_summary"],
+        "pending_summary_turns": state_dict["pending_summary_turns"],
         "last_interaction_timestamp": time.time(), # Update timestamp
     }
     conversation_store.save_state(session_id, session_state_to_save)
@@ -423,3 +453,36 @@ def normalize_response_node(state: OrchestratorGraphState) -> Dict[str, Any]:
     state_dict["report"] = final_response["report"]
     state_dict["meta"] = final_response.get("meta", {})
     return state_dict
+
+
+async def fold_conversation_history(session_id: str, serialized=None) -> bool:
+    """
+    Background task: fold trimmed turns of a session into its rolling summary.
+    `serialized` is the API's per-session turn lock (see `ConversationHistoryManager.fold_pending`).
+    """
+    return await ORCHESTRATOR_COMPONENTS.history_manager.fold_pending(
+        session_id, ORCHESTRATOR_COMPONENTS.conversation_store, serialized=serialized
+    )
+
+
+def _report_job_entry(job: ReportJob) -> Dict[str, Any]:
+    return {"job_id": job.job_id, "status": job.status, "result": job.result, "error": job.error}
+
+
+def persist_report_job(job: ReportJob) -> bool:
+    """REPORT_JOBS completion hook: store a finished risk report in the session that started it."""
+    if not job.session_id:
+        return False
+    conversation_store = ORCHESTRATOR_COMPONENTS.conversation_store
+    session = conversation_store.get_state(job.session_id)
+    report_job = ((session or {}).get("agent_specific_state") or {}).get(REPORT_JOB_KEY)
+    if not report_job or report_job.get("job_id") != job.job_id:
+        # Turn not saved yet (finalize_and_save_state_node fills it in) or superseded by a newer job.
+        return False
+    session["agent_specific_state"][REPORT_JOB_KEY] = _report_job_entry(job)
+    conversation_store.save_state(job.session_id, session)
+    logger.debug("Stored risk report job %s (%s) in session %s", job.job_id, job.status, job.session_id)
+    return True
+
+
+REPORT_JOBS.completion_hooks.append(persist_report_job)
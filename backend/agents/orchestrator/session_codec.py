@@ -0,0 +1,191 @@
+# backend/agents/orchestrator/session_codec.py
+
+"""
+Binary codecs for persisted session state.
+
+Encoded payload layout:
+
+    b"TS" | version (1 byte) | flags (1 byte) | body
+
+- flags low nibble: serializer (1 = json, 2 = orjson)
+- flags high nibble: compression (0 = none, 1 = zlib, 2 = zstd)
+
+Payloads that do not start with the magic header are treated as legacy
+UTF-8 JSON written by earlier versions of RedisConversationStore, so
+existing sessions keep loading after the codec is switched on.
+"""
+
+import json
+import zlib
+from typing import Any, Dict, Union
+
+from backend.utils.logger import get_logger
+
+try:  # Optional accelerators; both ship transitively with langsmith.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+logger = get_logger(__name__)
+
+MAGIC = b"TS"
+CODEC_VERSION = 1
+HEADER_SIZE = len(MAGIC) + 2
+
+SERIALIZER_IDS = {"json": 0x01, "orjson": 0x02}
+COMPRESSION_IDS = {"none": 0x00, "zlib": 0x10, "zstd": 0x20}
+
+
+class SessionCodecError(ValueError):
+    """Raised when a stored session payload cannot be decoded."""
+
+
+def _json_dumps(state: Dict[str, Any]) -> bytes:
+    return json.dumps(state, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(body: bytes) -> Any:
+    return json.loads(body.decode("utf-8"))
+
+
+def _orjson_dumps(state: Dict[str, Any]) -> bytes:
+    return orjson.dumps(state, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _orjson_loads(body: bytes) -> Any:
+    return orjson.loads(body)
+
+
+class SessionCodec:
+    """
+    Encodes session dicts into compact, versioned byte payloads.
+
+    Args:
+        serializer: "orjson" or "json". Falls back to json if orjson is missing.
+        compression: "zstd", "zlib" or "none". zstd falls back to zlib if missing.
+        compression_threshold: Bodies smaller than this many bytes are stored
+            uncompressed; compressing tiny sessions costs more CPU than it saves.
+        compression_level: Level passed to the compressor.
+    """
+
+    def __init__(
+        self,
+        serializer: str = "orjson",
+        compression: str = "zstd",
+        compression_threshold: int = 4096,
+        compression_level: int = 3,
+    ):
+        serializer = (serializer or "json").strip().lower()
+        compression = (compression or "none").strip().lower()
+
+        if serializer not in SERIALIZER_IDS:
+            raise ValueError(f"Unknown session serializer: {serializer}")
+        if compression not in COMPRESSION_IDS:
+            raise ValueError(f"Unknown session compression: {compression}")
+
+        if serializer == "orjson" and orjson is None:
+            logger.warning("orjson is not installed; session codec falls back to json")
+            serializer = "json"
+        if compression == "zstd" and zstandard is None:
+            logger.warning("zstandard is not installed; session codec falls back to zlib")
+            compression = "zlib"
+
+        self.serializer = serializer
+        self.compression = compression
+        self.compression_threshold = max(0, int(compression_threshold))
+        self.compression_level = compression_level
+
+        self._zstd_compressor = None
+        if compression == "zstd":
+            self._zstd_compressor = zstandard.ZstdCompressor(level=compression_level)
+
+    def __repr__(self) -> str:
+        return (
+            f"<SessionCodec serializer={self.serializer} compression={self.compression} "
+            f"threshold={self.compression_threshold}>"
+        )
+
+    def _dumps(self, state: Dict[str, Any]) -> bytes:
+        if self.serializer == "orjson":
+            return _orjson_dumps(state)
+        return _json_dumps(state)
+
+    def encode(self, state: Any) -> bytes:
+        """Serialize (and optionally compress) a session value."""
+        body = self._dumps(state)
+        compression = "none"
+
+        if self.compression != "none" and len(body) >= self.compression_threshold:
+            if self.compression == "zstd":
+                body = self._zstd_compressor.compress(body)
+            else:
+                body = zlib.compress(body, self.compression_level)
+            compression = self.compression
+
+        flags = SERIALIZER_IDS[self.serializer] | COMPRESSION_IDS[compression]
+        return MAGIC + bytes((CODEC_VERSION, flags)) + body
+
+    def decode(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """Decode a payload produced by `encode` or a legacy JSON string."""
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        data = bytes(data)
+
+        if not data.startswith(MAGIC):
+            # Legacy layout: plain json.dumps(ensure_ascii=False) text.
+            try:
+                return _json_loads(data)
+            except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                raise SessionCodecError(f"Invalid legacy session payload: {e}") from e
+
+        if len(data) < HEADER_SIZE:
+            raise SessionCodecError("Truncated session payload header")
+
+        version = data[2]
+        flags = data[3]
+        if version != CODEC_VERSION:
+            raise SessionCodecError(f"Unsupported session codec version: {version}")
+
+        body = data[HEADER_SIZE:]
+        compression_id = flags & 0xF0
+        serializer_id = flags & 0x0F
+
+        try:
+            if compression_id == COMPRESSION_IDS["zstd"]:
+                if zstandard is None:
+                    raise SessionCodecError("zstd payload but zstandard is not installed")
+                body = zstandard.ZstdDecompressor().decompress(body)
+            elif compression_id == COMPRESSION_IDS["zlib"]:
+                body = zlib.decompress(body)
+            elif compression_id != COMPRESSION_IDS["none"]:
+                raise SessionCodecError(f"Unknown compression flag: {compression_id:#x}")
+
+            if serializer_id == SERIALIZER_IDS["orjson"] and orjson is not None:
+                return _orjson_loads(body)
+            if serializer_id in SERIALIZER_IDS.values():
+                # orjson output is plain JSON, so the stdlib can always read it.
+                return _json_loads(body)
+        except SessionCodecError:
+            raise
+        except Exception as e:
+            raise SessionCodecError(f"Failed to decode session payload: {e}") from e
+
+        raise SessionCodecError(f"Unknown serializer flag: {serializer_id:#x}")
+
+
+def create_session_codec(settings=None) -> SessionCodec:
+    """Build the codec configured in Settings."""
+    if settings is None:
+        from backend.config import get_settings
+        settings = get_settings()
+
+    return SessionCodec(
+        serializer=getattr(settings, "session_codec", "orjson"),
+        compression=getattr(settings, "session_compression", "zstd"),
+        compression_threshold=getattr(settings, "session_compression_threshold", 4096),
+    )
@@ -1,18 +1,32 @@
 # backend/agents/orchestrator/session_store.py
 
-import json
+import copy
 import uuid
 import time
-from typing import Dict, Any, Optional
+import atexit
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Any, Iterator, Optional, Tuple
 from abc import ABC, abstractmethod
 
 import redis
 
 from backend.config import get_settings
+from backend.infrastructure.redis_router import RedisRouter, build_redis_router, hash_tag
 from backend.utils.logger import get_logger
 
+from .session_codec import SessionCodec, SessionCodecError, create_session_codec
+
 logger = get_logger(__name__)
 
+HISTORY_KEY_SUFFIX = ":history"
+HISTORY_LENGTH_FIELD = "__history_len__"
+VERSION_FIELD = "__version__"
+SESSION_KEY_PREFIX = "session:"
+ACTIVE_INDEX_KEY = "sessions:active"  # ZSET: session_id -> last interaction (epoch seconds)
+
 
 class ConversationStore(ABC):
     """Abstract base class for conversation storage"""
@@ -37,31 +51,195 @@ class ConversationStore(ABC):
         """Generate a new unique session ID"""
         pass
 
+    # Async front end. Stores with blocking I/O override these to keep it
+    # off the event loop; the defaults call the sync methods directly.
+    async def aget_state(self, session_id: str) -> Optional[Dict[str, Any]]:
+        return self.get_state(session_id)
+
+    async def asave_state(self, session_id: str, state: Dict[str, Any]):
+        return self.save_state(session_id, state)
+
+    async def adelete_state(self, session_id: str):
+        self.delete_state(session_id)
+
 
 class InMemoryConversationStore(ConversationStore):
     """
-    In-memory session store using Python dict.
+    In-memory session store with TTL expiry and LRU eviction.
+
+    - Sessions expire `ttl` seconds after their last save (or `extend_ttl`),
+      mirroring the Redis store; expired sessions are dropped on access and
+      by a background sweeper thread.
+    - At most `max_sessions` sessions (and, if set, `max_bytes` of encoded
+      state) are kept; the least recently used ones are evicted first.
 
     WARNING: All sessions are lost on server restart.
-    Use only for development/testing.
+    Use only for development/testing or single-node deployments.
     """
 
-    def __init__(self):
-        self._store: Dict[str, Dict[str, Any]] = {}
+    def __init__(
+        self,
+        settings=None,
+        ttl: Optional[float] = None,
+        max_sessions: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        sweep_interval: Optional[float] = None,
+    ):
+        if settings is None:
+            settings = get_settings()
+
+        self.ttl = float(settings.session_ttl if ttl is None else ttl)
+        self.max_sessions = int(settings.session_memory_max_sessions if max_sessions is None else max_sessions)
+        self.max_bytes = int(settings.session_memory_max_bytes if max_bytes is None else max_bytes)
+        self.sweep_interval = float(
+            settings.session_sweep_interval if sweep_interval is None else sweep_interval
+        )
+
+        self._store: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._expires_at: Dict[str, float] = {}
+        self._sizes: Dict[str, int] = {}
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+        self._size_codec: Optional[SessionCodec] = None
+        self._sweeper: Optional[threading.Thread] = None
+        self._stop_sweeper = threading.Event()
+        self.stats: Dict[str, int] = {"expired": 0, "evicted": 0}
+
+    # --- Internal helpers (call with self._lock held) ---
+
+    def _is_expired(self, session_id: str, now: float) -> bool:
+        expires_at = self._expires_at.get(session_id)
+        return expires_at is not None and expires_at <= now
+
+    def _remove(self, session_id: str):
+        self._store.pop(session_id, None)
+        self._expires_at.pop(session_id, None)
+        self._total_bytes -= self._sizes.pop(session_id, 0)
+
+    def _estimate_size(self, state: Dict[str, Any]) -> int:
+        if self._size_codec is None:
+            self._size_codec = SessionCodec(compression="none")
+        try:
+            return len(self._size_codec.encode(state))
+        except (TypeError, ValueError):
+            return 0
+
+    def _evict_if_needed(self, keep: str):
+        while self._store and (
+            (self.max_sessions > 0 and len(self._store) > self.max_sessions)
+            or (self.max_bytes > 0 and self._total_bytes > self.max_bytes)
+        ):
+            oldest = next(iter(self._store))
+            if oldest == keep and len(self._store) == 1:
+                break  # never evict the session that was just written
+            if oldest == keep:
+                self._store.move_to_end(keep)
+                continue
+            self._remove(oldest)
+            self.stats["evicted"] += 1
+
+    def _ensure_sweeper(self):
+        if self._sweeper is not None or self.ttl <= 0 or self.sweep_interval <= 0:
+            return
+        self._sweeper = threading.Thread(
+            target=_sweep_loop,
+            args=(weakref.ref(self), self._stop_sweeper, self.sweep_interval),
+            name="session-sweeper",
+            daemon=True,
+        )
+        self._sweeper.start()
+
+    # --- ConversationStore API ---
 
     def get_state(self, session_id: str) -> Optional[Dict[str, Any]]:
-        return self._store.get(session_id)
+        with self._lock:
+            if session_id not in self._store:
+                return None
+            if self._is_expired(session_id, time.monotonic()):
+                self._remove(session_id)
+                self.stats["expired"] += 1
+                return None
+            self._store.move_to_end(session_id)
+            return self._store[session_id]
 
     def save_state(self, session_id: str, state: Dict[str, Any]):
-        self._store[session_id] = state
+        size = self._estimate_size(state) if self.max_bytes > 0 else 0
+        with self._lock:
+            self._total_bytes -= self._sizes.pop(session_id, 0)
+            self._store[session_id] = state
+            self._store.move_to_end(session_id)
+            if self.ttl > 0:
+                self._expires_at[session_id] = time.monotonic() + self.ttl
+            if size:
+                self._sizes[session_id] = size
+                self._total_bytes += size
+            self._evict_if_needed(keep=session_id)
+            self._ensure_sweeper()
 
     def delete_state(self, session_id: str):
-        if session_id in self._store:
-            del self._store[session_id]
+        with self._lock:
+            self._remove(session_id)
 
     def create_new_session_id(self) -> str:
         return str(uuid.uuid4())
 
+    def extend_ttl(self, session_id: str):
+        """Extend the TTL of an existing session."""
+        with self._lock:
+            if session_id in self._store and self.ttl > 0:
+                self._expires_at[session_id] = time.monotonic() + self.ttl
+
+    def get_all_session_ids(self) -> list[str]:
+        """Get all non-expired session IDs (least recently used first)."""
+        now = time.monotonic()
+        with self._lock:
+            return [sid for sid in self._store if not self._is_expired(sid, now)]
+
+    def sweep_expired(self) -> int:
+        """Drop expired sessions. Returns the number removed."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [sid for sid in self._store if self._is_expired(sid, now)]
+            for sid in expired:
+                self._remove(sid)
+            self.stats["expired"] += len(expired)
+        if expired:
+            logger.debug("Swept %s expired in-memory sessions", len(expired))
+        return len(expired)
+
+    def close(self):
+        """Stop the background sweeper."""
+        self._stop_sweeper.set()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+
+def _sweep_loop(store_ref, stop_event: threading.Event, interval: float):
+    # Holds only a weak reference so an unused store can still be garbage collected.
+    while not stop_event.wait(interval):
+        store = store_ref()
+        if store is None:
+            return
+        try:
+            store.sweep_expired()
+        except Exception as e:  # keep the sweeper alive
+            logger.warning("In-memory session sweep failed: %s", e)
+        del store
+
+
+@dataclass
+class _PersistedSnapshot:
+    """What this process last read from / wrote to Redis for one session."""
+    fields: Dict[str, int] = field(default_factory=dict)  # field name -> payload fingerprint
+    history_length: Optional[int] = None
+    history_tail: Optional[int] = None  # fingerprint of the last stored turn
+    version: Optional[str] = None  # version stamp written with the session
+
 
 class RedisConversationStore(ConversationStore):
     """
@@ -70,101 +248,377 @@ class RedisConversationStore(ConversationStore):
     Features:
     - Persistent storage across server restarts
     - Automatic session TTL (time-to-live)
-    - Connection pooling for performance
-    - JSON serialization for complex state
+    - Connection pooling for performance (`redis_max_connections`)
+    - Single node, Redis Cluster or client-side consistent-hash sharding
+      (see backend/infrastructure/redis_router.py)
+    - Compact versioned binary encoding (see session_codec.py); legacy JSON
+      sessions are still readable
+    - Field-level layout so a turn writes only what changed:
+        session:{<id>}          HASH  top-level fields (active_agent, agent_specific_state, ...)
+        session:{<id>}:history  LIST  conversation_history turns, appended with RPUSH
+      The `{<id>}` hash tag keeps both keys of a session in one cluster slot.
+      Sessions stored under the untagged keys of earlier versions are read
+      as a fallback and migrated on their next save.
+    - A unique version stamp per write (`__version__` hash field) so caches in
+      other processes can detect that their copy is stale
+    - An active-session index (`sessions:active` sorted set scored by last
+      interaction) so counts, recent listings and expiry sweeps never walk
+      the keyspace; `iter_session_ids` uses incremental SCAN when a full
+      walk is really needed. With sharding each node indexes its own sessions.
     """
 
-    def __init__(self, settings=None):
+    snapshot_cache_size = 10000
+    index_sweep_every = 1000  # saves between opportunistic sweeps of the active index
+
+    def __init__(
+        self,
+        settings=None,
+        codec: Optional[SessionCodec] = None,
+        router: Optional[RedisRouter] = None,
+    ):
         if settings is None:
             settings = get_settings()
 
         self.settings = settings
         self.ttl = settings.session_ttl  # seconds
+        self.codec = codec or create_session_codec(settings)
+        self._snapshots: "OrderedDict[str, _PersistedSnapshot]" = OrderedDict()
+        self._snapshot_lock = threading.Lock()
+        self._saves_since_sweep = 0
+        self._legacy_ids: set = set()
 
-        # Initialize Redis connection
+        # Initialize Redis connection(s)
         try:
-            if settings.redis_url:
-                # Use redis_url if provided (e.g., for cloud services)
-                self.redis_client = redis.from_url(
-                    settings.redis_url,
-                    decode_responses=True,
-                    encoding='utf-8'
-                )
-            else:
-                # Use individual connection parameters.
-                # NOTE:
-                # Passing `ssl` to low-level ConnectionPool can break on 일부 redis-py
-                # connection classes. Construct Redis client directly for compatibility.
-                redis_kwargs = {
-                    "host": settings.redis_host,
-                    "port": settings.redis_port,
-                    "db": settings.redis_db,
-                    "decode_responses": True,
-                    "encoding": "utf-8",
-                    "max_connections": 10,
-                }
-                if settings.redis_password:
-                    redis_kwargs["password"] = settings.redis_password
-                if settings.redis_ssl:
-                    redis_kwargs["ssl"] = True
-
-                self.redis_client = redis.Redis(**redis_kwargs)
+            self.router = router or build_redis_router(settings)
+            self.redis_client = self.router.primary
+
+            self.hash_tag_keys = bool(getattr(settings, "redis_hash_tag_keys", True))
+            if self.router.cluster and not self.hash_tag_keys:
+                logger.warning("Redis Cluster requires hash-tagged session keys; enabling them")
+                self.hash_tag_keys = True
+            self.legacy_key_fallback = self.hash_tag_keys and bool(
+                getattr(settings, "redis_legacy_key_fallback", True)
+            )
 
             # Test connection
-            self.redis_client.ping()
-            logger.info("Redis connection established (TTL=%ss)", self.ttl)
+            self.router.ping()
+            logger.info(
+                "Redis connection established (TTL=%ss, codec=%r, nodes=%s, cluster=%s)",
+                self.ttl,
+                self.codec,
+                len(self.router.clients),
+                self.router.cluster,
+            )
 
         except redis.ConnectionError as e:
             logger.warning("Redis connection failed: %s", e)
             logger.warning("Falling back to InMemoryConversationStore")
             raise
 
+    def _client(self, session_id: str):
+        return self.router.client_for(session_id)
+
     def _make_key(self, session_id: str) -> str:
         """Create Redis key with namespace prefix"""
-        return f"session:{session_id}"
+        if self.hash_tag_keys:
+            return f"{SESSION_KEY_PREFIX}{hash_tag(session_id)}"
+        return f"{SESSION_KEY_PREFIX}{session_id}"
 
-    def get_state(self, session_id: str) -> Optional[Dict[str, Any]]:
+    def _make_history_key(self, session_id: str) -> str:
+        """Key of the append-only conversation history list"""
+        return f"{self._make_key(session_id)}{HISTORY_KEY_SUFFIX}"
+
+    def _legacy_keys(self, session_id: str) -> Tuple[str, str]:
+        """Untagged keys written before hash tags were introduced."""
+        key = f"{SESSION_KEY_PREFIX}{session_id}"
+        return key, f"{key}{HISTORY_KEY_SUFFIX}"
+
+    def _fingerprint(self, payload: bytes) -> int:
+        return hash(payload)
+
+    def _remember_snapshot(self, session_id: str, snapshot: _PersistedSnapshot):
+        with self._snapshot_lock:
+            self._snapshots[session_id] = snapshot
+            self._snapshots.move_to_end(session_id)
+            while len(self._snapshots) > self.snapshot_cache_size:
+                self._snapshots.popitem(last=False)
+
+    def _get_snapshot(self, session_id: str) -> Optional[_PersistedSnapshot]:
+        with self._snapshot_lock:
+            return self._snapshots.get(session_id)
+
+    def _forget_snapshot(self, session_id: str):
+        with self._snapshot_lock:
+            self._snapshots.pop(session_id, None)
+
+    def _new_version(self) -> str:
+        # Unique per write, so a deleted and recreated session never reuses a stamp.
+        return f"{time.time_ns():x}-{uuid.uuid4().hex[:8]}"
+
+    def get_version(self, session_id: str) -> Optional[str]:
+        """Return the version stamp of the stored session (None if missing or legacy)."""
         try:
-            key = self._make_key(session_id)
-            data = self.redis_client.get(key)
+            version = self._client(session_id).hget(self._make_key(session_id), VERSION_FIELD)
+        except redis.ResponseError:
+            return None
+        except redis.RedisError as e:
+            logger.warning("Redis get_version error for %s: %s", session_id, e)
+            return None
+        if version is None:
+            return None
+        return version.decode("utf-8") if isinstance(version, bytes) else version
 
+    def get_state(self, session_id: str) -> Optional[Dict[str, Any]]:
+        return self.get_state_with_version(session_id)[0]
+
+    def _read_layout(
+        self, client, key: str, history_key: str
+    ) -> Tuple[bool, Optional[Dict[str, Any]], Optional[_PersistedSnapshot]]:
+        """
+        Read one session layout. Returns (found, state, snapshot); snapshot is
+        None for whole-session blobs, which are always rewritten on save.
+        """
+        pipe = client.pipeline(transaction=False)
+        pipe.hgetall(key)
+        pipe.lrange(history_key, 0, -1)
+        fields, raw_turns = pipe.execute(raise_on_error=False)
+
+        if isinstance(fields, redis.ResponseError):
+            # WRONGTYPE: the key still holds a legacy whole-session blob.
+            # The next save rewrites it in the field-level layout.
+            data = client.get(key)
             if data is None:
-                return None
+                return False, None, None
+            return True, self.codec.decode(data), None
+        if isinstance(raw_turns, Exception):
+            raise raw_turns
+        if not fields:
+            return False, None, None
+
+        state: Dict[str, Any] = {}
+        field_fingerprints: Dict[str, int] = {}
+        has_history = False
+        version: Optional[str] = None
+        for raw_name, raw_value in fields.items():
+            name = raw_name.decode("utf-8") if isinstance(raw_name, bytes) else raw_name
+            if name == HISTORY_LENGTH_FIELD:
+                has_history = True
+                continue
+            if name == VERSION_FIELD:
+                version = raw_value.decode("utf-8") if isinstance(raw_value, bytes) else raw_value
+                continue
+            state[name] = self.codec.decode(raw_value)
+            field_fingerprints[name] = self._fingerprint(raw_value)
+
+        if has_history:
+            state["conversation_history"] = [self.codec.decode(turn) for turn in raw_turns]
 
-            # Deserialize JSON
-            state = json.loads(data)
-            return state
+        snapshot = _PersistedSnapshot(
+            fields=field_fingerprints,
+            history_length=len(raw_turns) if has_history else None,
+            history_tail=self._fingerprint(raw_turns[-1]) if has_history and raw_turns else None,
+            version=version,
+        )
+        return True, state, snapshot
+
+    def get_state_with_version(self, session_id: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Load a session together with the version stamp it was read at."""
+        try:
+            client = self._client(session_id)
+            found, state, snapshot = self._read_layout(
+                client, self._make_key(session_id), self._make_history_key(session_id)
+            )
+            if not found and self.legacy_key_fallback:
+                found, state, _ = self._read_layout(client, *self._legacy_keys(session_id))
+                if found:
+                    # Rewritten under the tagged keys (and the old keys dropped) on next save.
+                    self._legacy_ids.add(session_id)
+                    snapshot = None
+
+            if not found or snapshot is None:
+                self._forget_snapshot(session_id)
+                return state, None
+
+            self._remember_snapshot(session_id, snapshot)
+            return state, snapshot.version
 
         except redis.RedisError as e:
             logger.warning("Redis get_state error for %s: %s", session_id, e)
-            return None
-        except json.JSONDecodeError as e:
-            logger.warning("JSON decode error for session %s: %s", session_id, e)
-            return None
+            return None, None
+        except SessionCodecError as e:
+            logger.warning("Session decode error for %s: %s", session_id, e)
+            return None, None
 
-    def save_state(self, session_id: str, state: Dict[str, Any]):
+    def _watch_snapshot(self, pipe, key: str, history_key: str, snapshot: _PersistedSnapshot) -> bool:
+        """
+        WATCH the session keys and check that Redis still holds what `snapshot`
+        describes. On success the pipeline is switched to MULTI.
+        """
+        pipe.watch(key, history_key)
+        try:
+            stored_version, stored_length = pipe.hmget(key, VERSION_FIELD, HISTORY_LENGTH_FIELD)
+        except redis.ResponseError:
+            return False  # no longer a hash (e.g. a legacy blob was written)
+        if isinstance(stored_version, bytes):
+            stored_version = stored_version.decode("utf-8")
+        expected_length = None if snapshot.history_length is None else str(snapshot.history_length)
+        if isinstance(stored_length, bytes):
+            stored_length = stored_length.decode("utf-8")
+        if stored_version != snapshot.version or stored_length != expected_length:
+            return False
+        pipe.multi()
+        return True
+
+    def save_state(self, session_id: str, state: Dict[str, Any]) -> Optional[str]:
+        """
+        Persist only what changed since this process last loaded or saved
+        the session: HSET for modified top-level fields and RPUSH for turns
+        appended to `conversation_history`. Without a snapshot (new session,
+        legacy blob, or history that was rewritten rather than appended to),
+        or when another process wrote the session since the snapshot was
+        taken, the session is written in full.
+
+        Returns the new version stamp, or None if the write failed.
+        """
         try:
+            client = self._client(session_id)
             key = self._make_key(session_id)
+            history_key = self._make_history_key(session_id)
+            snapshot = self._get_snapshot(session_id)
+
+            history = state.get("conversation_history")
+            encoded_fields = {
+                name: self.codec.encode(value)
+                for name, value in state.items()
+                if name != "conversation_history"
+            }
+            field_fingerprints = {
+                name: self._fingerprint(payload) for name, payload in encoded_fields.items()
+            }
+
+            # Both session keys share a slot, so this transaction is cluster-safe.
+            # A delta write is only valid on top of exactly the stored state the
+            # snapshot describes: WATCH both keys, compare the stored version and
+            # history length, and rewrite in full if another process got there first.
+            while True:
+                pipe = client.pipeline(transaction=True)
+                if snapshot is not None and not self._watch_snapshot(pipe, key, history_key, snapshot):
+                    pipe.reset()
+                    snapshot = None
+                full_rewrite = snapshot is None
+                if full_rewrite:
+                    pipe.delete(key, history_key)
+                    changed_fields = encoded_fields
+                    removed_fields: list[str] = []
+                else:
+                    changed_fields = {
+                        name: payload
+                        for name, payload in encoded_fields.items()
+                        if snapshot.fields.get(name) != field_fingerprints[name]
+                    }
+                    removed_fields = [name for name in snapshot.fields if name not in encoded_fields]
 
-            # Serialize to JSON
-            data = json.dumps(state, ensure_ascii=False)
+                history_length: Optional[int] = None
+                history_tail: Optional[int] = None
+                if history is not None:
+                    history_length = len(history)
+                    previous_length = None if full_rewrite else snapshot.history_length
+                    appendable = (
+                        previous_length is not None
+                        and history_length >= previous_length
+                        and (
+                            previous_length == 0
+                            or self._fingerprint(self.codec.encode(history[previous_length - 1]))
+                            == snapshot.history_tail
+                        )
+                    )
+                    if appendable:
+                        new_turns = [self.codec.encode(turn) for turn in history[previous_length:]]
+                        if new_turns:
+                            pipe.rpush(history_key, *new_turns)
+                            history_tail = self._fingerprint(new_turns[-1])
+                        else:
+                            history_tail = snapshot.history_tail
+                    else:
+                        encoded_turns = [self.codec.encode(turn) for turn in history]
+                        if not full_rewrite:
+                            pipe.delete(history_key)
+                        if encoded_turns:
+                            pipe.rpush(history_key, *encoded_turns)
+                            history_tail = self._fingerprint(encoded_turns[-1])
 
-            # Save with TTL
-            self.redis_client.setex(
-                name=key,
-                time=self.ttl,
-                value=data
+                    if full_rewrite or history_length != snapshot.history_length:
+                        changed_fields = {**changed_fields, HISTORY_LENGTH_FIELD: str(history_length)}
+                elif not full_rewrite and snapshot.history_length is not None:
+                    pipe.delete(history_key)
+                    removed_fields.append(HISTORY_LENGTH_FIELD)
+
+                version = self._new_version()
+                pipe.hset(key, mapping={**changed_fields, VERSION_FIELD: version})
+                if removed_fields:
+                    pipe.hdel(key, *removed_fields)
+                pipe.expire(key, self.ttl)
+                pipe.expire(history_key, self.ttl)
+
+                # The index lives on another slot in a cluster; update it outside the transaction.
+                index_pipe = client.pipeline(transaction=False) if self.router.cluster else pipe
+                index_pipe.zadd(ACTIVE_INDEX_KEY, {session_id: time.time()})
+                self._saves_since_sweep += 1
+                if self._saves_since_sweep >= self.index_sweep_every:
+                    self._saves_since_sweep = 0
+                    index_pipe.zremrangebyscore(ACTIVE_INDEX_KEY, "-inf", f"({self._active_cutoff()}")
+                try:
+                    pipe.execute()
+                except redis.WatchError:
+                    # Written concurrently; a full rewrite watches nothing and cannot fail this way.
+                    snapshot = None
+                    continue
+                if index_pipe is not pipe:
+                    index_pipe.execute()
+                break
+
+            if session_id in self._legacy_ids:
+                self._delete_legacy_keys(client, session_id)
+
+            self._remember_snapshot(
+                session_id,
+                _PersistedSnapshot(
+                    fields=field_fingerprints,
+                    history_length=history_length,
+                    history_tail=history_tail,
+                    version=version,
+                ),
             )
+            return version
 
         except redis.RedisError as e:
+            # The server-side state is unknown now; force a full write next time.
+            self._forget_snapshot(session_id)
             logger.warning("Redis save_state error for %s: %s", session_id, e)
         except (TypeError, ValueError) as e:
-            logger.warning("JSON encode error for session %s: %s", session_id, e)
+            logger.warning("Session encode error for %s: %s", session_id, e)
+        return None
+
+    def _delete_legacy_keys(self, client, session_id: str):
+        # Untagged keys may sit on different cluster slots: one DEL per key.
+        pipe = client.pipeline(transaction=False)
+        for legacy_key in self._legacy_keys(session_id):
+            pipe.delete(legacy_key)
+        pipe.execute()
+        self._legacy_ids.discard(session_id)
 
     def delete_state(self, session_id: str):
         try:
-            key = self._make_key(session_id)
-            self.redis_client.delete(key)
+            client = self._client(session_id)
+            pipe = client.pipeline(transaction=not self.router.cluster)
+            pipe.delete(self._make_key(session_id), self._make_history_key(session_id))
+            if self.legacy_key_fallback:
+                for legacy_key in self._legacy_keys(session_id):
+                    pipe.delete(legacy_key)
+            pipe.zrem(ACTIVE_INDEX_KEY, session_id)
+            pipe.execute()
+            self._forget_snapshot(session_id)
+            self._legacy_ids.discard(session_id)
 
         except redis.RedisError as e:
             logger.warning("Redis delete_state error for %s: %s", session_id, e)
@@ -178,42 +632,428 @@ class RedisConversationStore(ConversationStore):
         Useful for keeping active sessions alive.
         """
         try:
-            key = self._make_key(session_id)
-            self.redis_client.expire(key, self.ttl)
+            pipe = self._client(session_id).pipeline(transaction=False)
+            pipe.expire(self._make_key(session_id), self.ttl)
+            pipe.expire(self._make_history_key(session_id), self.ttl)
+            # XX: only refresh sessions that are already indexed.
+            pipe.zadd(ACTIVE_INDEX_KEY, {session_id: time.time()}, xx=True)
+            pipe.execute()
         except redis.RedisError as e:
             logger.warning("Redis extend_ttl error for %s: %s", session_id, e)
 
+    # --- Active-session index ---
+
+    def _active_cutoff(self) -> float:
+        """Sessions last seen before this timestamp have expired via TTL."""
+        return time.time() - self.ttl
+
+    @staticmethod
+    def _decode_member(member: Any) -> str:
+        return member.decode("utf-8") if isinstance(member, bytes) else member
+
+    def count_active_sessions(self, since: Optional[float] = None) -> int:
+        """Number of sessions with an interaction after `since` (default: within the TTL)."""
+        minimum = self._active_cutoff() if since is None else since
+        try:
+            return sum(
+                int(client.zcount(ACTIVE_INDEX_KEY, minimum, "+inf"))
+                for client in self.router.clients
+            )
+        except redis.RedisError as e:
+            logger.warning("Redis count_active_sessions error: %s", e)
+            return 0
+
+    def get_recent_session_ids(self, limit: int = 50, offset: int = 0) -> list[str]:
+        """Most recently active session IDs, newest first."""
+        cutoff = self._active_cutoff()
+        try:
+            if not self.router.sharded:
+                members = self.redis_client.zrevrangebyscore(
+                    ACTIVE_INDEX_KEY, "+inf", cutoff, start=offset, num=limit
+                )
+                return [self._decode_member(member) for member in members]
+
+            # Each shard indexes its own sessions: merge the per-shard top lists.
+            scored: list[Tuple[float, str]] = []
+            for client in self.router.clients:
+                for member, score in client.zrevrangebyscore(
+                    ACTIVE_INDEX_KEY, "+inf", cutoff, start=0, num=offset + limit, withscores=True
+                ):
+                    scored.append((score, self._decode_member(member)))
+            scored.sort(reverse=True)
+            return [member for _, member in scored[offset:offset + limit]]
+        except redis.RedisError as e:
+            logger.warning("Redis get_recent_session_ids error: %s", e)
+            return []
+
+    def sweep_expired_index(self) -> int:
+        """Drop index entries of sessions whose keys expired. Returns the number removed."""
+        try:
+            removed = sum(
+                int(client.zremrangebyscore(ACTIVE_INDEX_KEY, "-inf", f"({self._active_cutoff()}"))
+                for client in self.router.clients
+            )
+            if removed:
+                logger.debug("Removed %s expired sessions from the active index", removed)
+            return removed
+        except redis.RedisError as e:
+            logger.warning("Redis sweep_expired_index error: %s", e)
+            return 0
+
+    def _session_id_from_key(self, key: str) -> Optional[str]:
+        if key.endswith(HISTORY_KEY_SUFFIX):
+            return None
+        session_id = key[len(SESSION_KEY_PREFIX):]
+        if session_id.startswith("{") and session_id.endswith("}"):
+            session_id = session_id[1:-1]
+        return session_id
+
+    def _iter_client_session_ids(self, client, batch_size: int) -> Iterator[str]:
+        for key in client.scan_iter(match=f"{SESSION_KEY_PREFIX}*", count=batch_size):
+            session_id = self._session_id_from_key(self._decode_member(key))
+            if session_id is not None:
+                yield session_id
+
+    def iter_session_ids(self, batch_size: int = 500) -> Iterator[str]:
+        """
+        Walk every stored session key with incremental SCAN.
+
+        Unlike KEYS this never blocks Redis for the whole keyspace; use it
+        for maintenance jobs (e.g. `rebuild_active_index`), not per request.
+        """
+        for client in self.router.clients:
+            yield from self._iter_client_session_ids(client, batch_size)
+
+    def rebuild_active_index(self, batch_size: int = 500) -> int:
+        """Index sessions written before the active index existed. Returns sessions indexed."""
+        indexed = 0
+        now = time.time()
+        try:
+            for client in self.router.clients:
+                batch: Dict[str, float] = {}
+                for session_id in self._iter_client_session_ids(client, batch_size):
+                    batch[session_id] = now
+                    if len(batch) >= batch_size:
+                        # NX: keep real last-interaction scores that already exist.
+                        client.zadd(ACTIVE_INDEX_KEY, batch, nx=True)
+                        indexed += len(batch)
+                        batch = {}
+                if batch:
+                    client.zadd(ACTIVE_INDEX_KEY, batch, nx=True)
+                    indexed += len(batch)
+        except redis.RedisError as e:
+            logger.warning("Redis rebuild_active_index error: %s", e)
+        return indexed
+
     def get_all_session_ids(self) -> list[str]:
         """
-        Get all active session IDs.
-        WARNING: Use with caution in production (can be slow with many sessions).
+        Get all active session IDs from the active-session index.
+        Costs O(log n + m) instead of a KEYS walk over the whole keyspace.
         """
+        cutoff = self._active_cutoff()
         try:
-            keys = self.redis_client.keys("session:*")
-            return [key.replace("session:", "") for key in keys]
+            session_ids: list[str] = []
+            for client in self.router.clients:
+                members = client.zrangebyscore(ACTIVE_INDEX_KEY, cutoff, "+inf")
+                session_ids.extend(self._decode_member(member) for member in members)
+            return session_ids
         except redis.RedisError as e:
             logger.warning("Redis get_all_session_ids error: %s", e)
             return []
 
+    def close(self):
+        """Release Redis connection pools."""
+        self.router.close()
+
+
+@dataclass
+class _CachedSession:
+    state: Dict[str, Any]
+    version: Optional[str] = None  # backing store version this copy corresponds to
+    validated_at: float = 0.0
+
+
+class TieredConversationStore(ConversationStore):
+    """
+    Per-process LRU of hot sessions in front of a shared backing store.
+
+    - Reads are served from memory. Unless the entry was validated within
+      `revalidate_seconds`, a cheap version check (one HGET) against the
+      backing store detects writes made by other workers; only a stale
+      entry triggers a full reload.
+    - Writes update the cache immediately and are persisted by a background
+      thread after `write_behind_delay` seconds. Repeated saves of the same
+      session within that window are coalesced into one backing write.
+      A delay of 0 makes writes synchronous (write-through).
+    - `close()` flushes pending writes; it is called on application
+      shutdown and registered with atexit as a safety net.
+
+    The backing store stays the source of truth; it should provide
+    `get_version` / `get_state_with_version` (RedisConversationStore does),
+    otherwise every cache hit is revalidated with a full read.
+    """
+
+    def __init__(
+        self,
+        backing_store: ConversationStore,
+        max_sessions: int = 1000,
+        write_behind_delay: float = 0.05,
+        revalidate_seconds: float = 0.0,
+    ):
+        self.backing_store = backing_store
+        self.max_sessions = max(1, int(max_sessions))
+        self.write_behind_delay = max(0.0, float(write_behind_delay))
+        self.revalidate_seconds = max(0.0, float(revalidate_seconds))
+
+        self._cache: "OrderedDict[str, _CachedSession]" = OrderedDict()
+        self._dirty: Dict[str, Dict[str, Any]] = {}
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._closed = False
+        self.stats: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "stale": 0,
+            "writes": 0,
+            "coalesced": 0,
+            "flushed": 0,
+            "flush_errors": 0,
+        }
+
+        self._flusher: Optional[threading.Thread] = None
+        if self.write_behind_delay > 0:
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="session-write-behind", daemon=True
+            )
+            self._flusher.start()
+            atexit.register(self.close)
+
+    # --- Cache helpers (call with self._cond held) ---
+
+    def _put(self, session_id: str, state: Dict[str, Any], version: Optional[str], validated_at: float):
+        self._cache[session_id] = _CachedSession(state=state, version=version, validated_at=validated_at)
+        self._cache.move_to_end(session_id)
+        while len(self._cache) > self.max_sessions:
+            self._cache.popitem(last=False)
+
+    def _backing_version(self, session_id: str) -> Optional[str]:
+        get_version = getattr(self.backing_store, "get_version", None)
+        if get_version is None:
+            return None
+        return get_version(session_id)
+
+    def _backing_read(self, session_id: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        get_with_version = getattr(self.backing_store, "get_state_with_version", None)
+        if get_with_version is not None:
+            return get_with_version(session_id)
+        return self.backing_store.get_state(session_id), None
+
+    # --- ConversationStore API ---
+
+    def get_state(self, session_id: str) -> Optional[Dict[str, Any]]:
+        now = time.monotonic()
+        with self._cond:
+            pending = self._dirty.get(session_id)
+            if pending is not None:
+                # Not flushed yet: the local copy is newer than the backing store.
+                self.stats["hits"] += 1
+                return copy.deepcopy(pending)
+            entry = self._cache.get(session_id)
+            if entry is not None:
+                self._cache.move_to_end(session_id)
+                if now - entry.validated_at < self.revalidate_seconds:
+                    self.stats["hits"] += 1
+                    return copy.deepcopy(entry.state)
+                cached_version = entry.version
+
+        if entry is not None and cached_version is not None:
+            if self._backing_version(session_id) == cached_version:
+                with self._cond:
+                    entry.validated_at = now
+                    self.stats["hits"] += 1
+                    return copy.deepcopy(entry.state)
+            with self._cond:
+                self.stats["stale"] += 1
+
+        state, version = self._backing_read(session_id)
+        with self._cond:
+            self.stats["misses"] += 1
+            if session_id in self._dirty:
+                # A local save raced with the reload; it wins.
+                return copy.deepcopy(self._dirty[session_id])
+            if state is None:
+                self._cache.pop(session_id, None)
+                return None
+            self._put(session_id, copy.deepcopy(state), version, now)
+        return state
+
+    def save_state(self, session_id: str, state: Dict[str, Any]):
+        snapshot = copy.deepcopy(state)
+        with self._cond:
+            entry = self._cache.get(session_id)
+            self._put(session_id, snapshot, entry.version if entry else None, time.monotonic())
+            self.stats["writes"] += 1
+            if self.write_behind_delay > 0 and not self._closed:
+                if session_id in self._dirty:
+                    self.stats["coalesced"] += 1
+                self._dirty[session_id] = snapshot
+                self._cond.notify()
+                return
+
+        self._persist(session_id, snapshot)
+
+    def delete_state(self, session_id: str):
+        with self._cond:
+            self._dirty.pop(session_id, None)
+            self._cache.pop(session_id, None)
+        # Wait for an in-flight flush of this session so it cannot resurrect it.
+        with self._flush_lock:
+            self.backing_store.delete_state(session_id)
+
+    def create_new_session_id(self) -> str:
+        return self.backing_store.create_new_session_id()
+
+    def extend_ttl(self, session_id: str):
+        extend_ttl = getattr(self.backing_store, "extend_ttl", None)
+        if extend_ttl is not None:
+            extend_ttl(session_id)
+
+    def count_active_sessions(self, since: Optional[float] = None) -> int:
+        count = getattr(self.backing_store, "count_active_sessions", None)
+        if count is not None:
+            return count(since)
+        return len(self.get_all_session_ids())
+
+    def get_recent_session_ids(self, limit: int = 50, offset: int = 0) -> list[str]:
+        recent = getattr(self.backing_store, "get_recent_session_ids", None)
+        if recent is not None:
+            return recent(limit=limit, offset=offset)
+        return self.get_all_session_ids()[offset:offset + limit]
+
+    def get_all_session_ids(self) -> list[str]:
+        get_all = getattr(self.backing_store, "get_all_session_ids", None)
+        session_ids = list(get_all()) if get_all is not None else []
+        with self._cond:
+            session_ids.extend(sid for sid in self._dirty if sid not in session_ids)
+        return session_ids
+
+    # --- Write-behind ---
+
+    def _persist(self, session_id: str, state: Dict[str, Any]) -> bool:
+        version = self.backing_store.save_state(session_id, state)
+        ok = version is not None or not hasattr(self.backing_store, "get_version")
+        with self._cond:
+            if ok:
+                self.stats["flushed"] += 1
+                entry = self._cache.get(session_id)
+                if entry is not None and entry.state is state:
+                    entry.version = version
+                    entry.validated_at = time.monotonic()
+            else:
+                self.stats["flush_errors"] += 1
+                entry = self._cache.get(session_id)
+                if entry is not None and entry.state is state:
+                    # Unknown remote version: force a reload on next read.
+                    entry.version = None
+                    entry.validated_at = 0.0
+        return ok
+
+    def flush(self) -> int:
+        """Persist all pending writes now. Returns the number of sessions written."""
+        with self._flush_lock:
+            with self._cond:
+                batch = self._dirty
+                self._dirty = {}
+            written = 0
+            for session_id, state in batch.items():
+                if self._persist(session_id, state):
+                    written += 1
+                else:
+                    with self._cond:
+                        # Retry on the next flush unless a newer save superseded it.
+                        if not self._closed:
+                            self._dirty.setdefault(session_id, state)
+            return written
+
+    def _flush_loop(self):
+        while True:
+            with self._cond:
+                while not self._dirty and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+            # Coalescing window: later saves of the same session replace the pending one.
+            time.sleep(self.write_behind_delay)
+            try:
+                self.flush()
+            except Exception as e:  # keep the flusher alive
+                logger.warning("Session write-behind flush failed: %s", e)
+
+    def close(self):
+        """Stop the write-behind thread and flush pending writes."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join(timeout=max(1.0, self.write_behind_delay * 4))
+        written = self.flush()
+        if written:
+            logger.info("Flushed %s pending session writes on shutdown", written)
+
 
 def create_conversation_store() -> ConversationStore:
     """
     Factory function to create the appropriate conversation store.
 
+    `session_backend` selects the store explicitly ("memory" | "redis" |
+    "sqlite"); when empty, `use_redis_session` decides between Redis and
+    in-memory as before.
+
     Returns:
-        - RedisConversationStore if use_redis_session=True and Redis is available
+        - RedisConversationStore if Redis is selected and available,
+          wrapped in TieredConversationStore when session_local_cache=True
+        - SQLiteConversationStore if session_backend="sqlite"
         - InMemoryConversationStore otherwise (fallback for dev/testing)
     """
     settings = get_settings()
 
-    if settings.use_redis_session:
+    backend = (settings.session_backend or "").strip().lower()
+    if not backend:
+        backend = "redis" if settings.use_redis_session else "memory"
+
+    if backend == "sqlite":
+        try:
+            from .sqlite_session_store import SQLiteConversationStore
+
+            store = SQLiteConversationStore(settings)
+            logger.info("Using SQLiteConversationStore for session management")
+            return store
+        except Exception as e:
+            logger.warning("Failed to initialize SQLite session store: %s", e)
+            logger.info("Falling back to InMemoryConversationStore")
+
+    if backend == "redis":
         try:
             store = RedisConversationStore(settings)
             logger.info("Using RedisConversationStore for session management")
+            if settings.session_local_cache:
+                logger.info(
+                    "Session local cache enabled (size=%s, write_behind=%ss)",
+                    settings.session_local_cache_size,
+                    settings.session_write_behind_delay,
+                )
+                return TieredConversationStore(
+                    store,
+                    max_sessions=settings.session_local_cache_size,
+                    write_behind_delay=settings.session_write_behind_delay,
+                    revalidate_seconds=settings.session_cache_revalidate_seconds,
+                )
             return store
         except Exception as e:
             logger.warning("Failed to initialize Redis: %s", e)
             logger.info("Falling back to InMemoryConversationStore")
 
     logger.info("Using InMemoryConversationStore (development mode)")
-    return InMemoryConversationStore()
+    return InMemoryConversationStore(settings)
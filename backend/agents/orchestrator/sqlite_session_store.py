@@ -0,0 +1,376 @@
+# backend/agents/orchestrator/sqlite_session_store.py
+
+"""
+Durable single-node session store backed by SQLite in WAL mode.
+
+Saves never touch the database on the caller's thread: they are queued
+and a dedicated writer thread commits everything queued within
+`batch_interval` seconds (coalescing repeated saves of one session) in a
+single transaction. Reads consult the queue first, so a session is
+readable immediately after `save_state`, and otherwise hit SQLite through
+a per-thread read connection (WAL lets readers run alongside the writer).
+
+    sessions(session_id PK, state BLOB, version, last_interaction)
+    idx_sessions_last_interaction  -- TTL checks, expiry sweeps, recent listings
+"""
+
+import asyncio
+import atexit
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, Optional, Tuple
+
+from backend.config import get_settings
+from backend.utils.logger import get_logger
+
+from .session_codec import SessionCodec, SessionCodecError, create_session_codec
+from .session_store import ConversationStore
+
+logger = get_logger(__name__)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS sessions (
+        session_id TEXT PRIMARY KEY,
+        state BLOB NOT NULL,
+        version TEXT NOT NULL,
+        last_interaction REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_sessions_last_interaction ON sessions(last_interaction)",
+)
+
+_UPSERT = (
+    "INSERT INTO sessions (session_id, state, version, last_interaction) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT(session_id) DO UPDATE SET "
+    "state = excluded.state, version = excluded.version, last_interaction = excluded.last_interaction"
+)
+
+_SAVE = "save"
+_DELETE = "delete"
+_TOUCH = "touch"
+
+
+class SQLiteConversationStore(ConversationStore):
+    """
+    SQLite (WAL) session store with a batching writer thread and TTL expiry.
+
+    Args:
+        settings: Settings instance (defaults to get_settings()).
+        path: Database file. Defaults to `session_sqlite_path`.
+        ttl: Seconds after the last interaction before a session expires.
+        batch_interval: Seconds the writer waits to gather a batch.
+        sweep_interval: Seconds between expiry sweeps (0 disables them).
+        codec: Session codec used for the `state` column.
+    """
+
+    def __init__(
+        self,
+        settings=None,
+        path: Optional[str] = None,
+        ttl: Optional[float] = None,
+        batch_interval: Optional[float] = None,
+        sweep_interval: Optional[float] = None,
+        codec: Optional[SessionCodec] = None,
+    ):
+        if settings is None:
+            settings = get_settings()
+
+        self.path = path or settings.session_sqlite_path
+        self.ttl = float(settings.session_ttl if ttl is None else ttl)
+        self.batch_interval = max(0.0, float(
+            settings.session_sqlite_batch_interval if batch_interval is None else batch_interval
+        ))
+        self.sweep_interval = float(settings.session_sweep_interval if sweep_interval is None else sweep_interval)
+        self.codec = codec or create_session_codec(settings)
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._writer_conn = self._connect()
+        for statement in _SCHEMA:
+            self._writer_conn.execute(statement)
+        self._writer_conn.commit()
+
+        # session_id -> (op, state, version, timestamp); `_inflight` is the batch being committed.
+        self._pending: Dict[str, Tuple[str, Any, Optional[str], float]] = {}
+        self._inflight: Dict[str, Tuple[str, Any, Optional[str], float]] = {}
+        self._cond = threading.Condition()
+        self._closed = False
+        self._last_sweep = time.monotonic()
+        self.stats: Dict[str, int] = {"batches": 0, "rows_written": 0, "coalesced": 0, "expired": 0}
+
+        self._writer = threading.Thread(target=self._writer_loop, name="session-sqlite-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+        logger.info("SQLite session store ready at %s (TTL=%ss)", self.path, self.ttl)
+
+    # --- Connections ---
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=30000")
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+    # --- Helpers ---
+
+    def _cutoff(self) -> float:
+        return time.time() - self.ttl if self.ttl > 0 else float("-inf")
+
+    def _queued(self, session_id: str):
+        """Latest queued operation for a session (call with self._cond held)."""
+        return self._pending.get(session_id) or self._inflight.get(session_id)
+
+    def _enqueue(self, session_id: str, op: Tuple[str, Any, Optional[str], float]):
+        with self._cond:
+            if session_id in self._pending:
+                self.stats["coalesced"] += 1
+            if self._closed:
+                self._commit({session_id: op})
+                return
+            self._pending[session_id] = op
+            self._cond.notify_all()
+
+    # --- ConversationStore API ---
+
+    def get_state(self, session_id: str) -> Optional[Dict[str, Any]]:
+        return self.get_state_with_version(session_id)[0]
+
+    def get_state_with_version(self, session_id: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Load a session together with its version stamp."""
+        with self._cond:
+            queued = self._queued(session_id)
+        if queued is not None and queued[0] != _TOUCH:
+            op, state, version, timestamp = queued
+            if op == _DELETE or timestamp < self._cutoff():
+                return None, None
+            return self.codec.decode(state), version
+
+        try:
+            row = self._reader().execute(
+                "SELECT state, version, last_interaction FROM sessions WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("SQLite get_state error for %s: %s", session_id, e)
+            return None, None
+
+        if row is None:
+            return None, None
+        state, version, last_interaction = row
+        if queued is not None:
+            last_interaction = max(last_interaction, queued[3])
+        if last_interaction < self._cutoff():
+            return None, None
+        try:
+            return self.codec.decode(state), version
+        except SessionCodecError as e:
+            logger.warning("Session decode error for %s: %s", session_id, e)
+            return None, None
+
+    def get_version(self, session_id: str) -> Optional[str]:
+        return self.get_state_with_version(session_id)[1]
+
+    def save_state(self, session_id: str, state: Dict[str, Any]) -> Optional[str]:
+        """Queue a save; it is committed by the writer within `batch_interval`."""
+        try:
+            payload = self.codec.encode(state)
+        except (TypeError, ValueError) as e:
+            logger.warning("Session encode error for %s: %s", session_id, e)
+            return None
+        version = f"{time.time_ns():x}-{uuid.uuid4().hex[:8]}"
+        self._enqueue(session_id, (_SAVE, payload, version, time.time()))
+        return version
+
+    def delete_state(self, session_id: str):
+        self._enqueue(session_id, (_DELETE, None, None, time.time()))
+
+    def create_new_session_id(self) -> str:
+        return str(uuid.uuid4())
+
+    def extend_ttl(self, session_id: str):
+        """Mark the session as active now, restarting its TTL."""
+        now = time.time()
+        with self._cond:
+            pending = self._pending.get(session_id)
+            if pending is not None:
+                if pending[0] == _SAVE:
+                    self._pending[session_id] = (pending[0], pending[1], pending[2], now)
+                return
+        self._enqueue(session_id, (_TOUCH, None, None, now))
+
+    def get_all_session_ids(self) -> list[str]:
+        """Get all non-expired session IDs."""
+        self.flush()
+        rows = self._reader().execute(
+            "SELECT session_id FROM sessions WHERE last_interaction >= ?", (self._cutoff(),)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def count_active_sessions(self, since: Optional[float] = None) -> int:
+        self.flush()
+        row = self._reader().execute(
+            "SELECT COUNT(*) FROM sessions WHERE last_interaction >= ?",
+            (self._cutoff() if since is None else since,),
+        ).fetchone()
+        return int(row[0])
+
+    def get_recent_session_ids(self, limit: int = 50, offset: int = 0) -> list[str]:
+        """Most recently active session IDs, newest first."""
+        self.flush()
+        rows = self._reader().execute(
+            "SELECT session_id FROM sessions WHERE last_interaction >= ? "
+            "ORDER BY last_interaction DESC LIMIT ? OFFSET ?",
+            (self._cutoff(), limit, offset),
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    # --- Async front end ---
+
+    async def aget_state(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._cond:
+            queued = self._queued(session_id)
+        if queued is not None and queued[0] != _TOUCH:
+            # Served from the write queue without a database round trip.
+            return self.get_state(session_id)
+        return await asyncio.to_thread(self.get_state, session_id)
+
+    async def asave_state(self, session_id: str, state: Dict[str, Any]) -> Optional[str]:
+        # Only encodes and enqueues; never blocks on the database.
+        return self.save_state(session_id, state)
+
+    async def adelete_state(self, session_id: str):
+        self.delete_state(session_id)
+
+    async def aflush(self, timeout: Optional[float] = None) -> bool:
+        return await asyncio.to_thread(self.flush, timeout)
+
+    # --- Writer ---
+
+    def _commit(self, batch: Dict[str, Tuple[str, Any, Optional[str], float]]):
+        upserts = [
+            (session_id, payload, version, timestamp)
+            for session_id, (op, payload, version, timestamp) in batch.items()
+            if op == _SAVE
+        ]
+        deletes = [(session_id,) for session_id, (op, *_rest) in batch.items() if op == _DELETE]
+        touches = [
+            (timestamp, session_id)
+            for session_id, (op, _payload, _version, timestamp) in batch.items()
+            if op == _TOUCH
+        ]
+        with self._write_lock:
+            conn = self._writer_conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if upserts:
+                    conn.executemany(_UPSERT, upserts)
+                if deletes:
+                    conn.executemany("DELETE FROM sessions WHERE session_id = ?", deletes)
+                if touches:
+                    conn.executemany(
+                        "UPDATE sessions SET last_interaction = MAX(last_interaction, ?) WHERE session_id = ?",
+                        touches,
+                    )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        self.stats["batches"] += 1
+        self.stats["rows_written"] += len(batch)
+
+    def _commit_pending(self):
+        with self._cond:
+            if not self._pending:
+                return
+            batch = self._pending
+            self._pending = {}
+            self._inflight = batch
+        try:
+            self._commit(batch)
+        except sqlite3.Error as e:
+            logger.warning("SQLite session batch of %s failed: %s", len(batch), e)
+            with self._cond:
+                # Re-queue unless newer operations superseded them.
+                for session_id, op in batch.items():
+                    self._pending.setdefault(session_id, op)
+            time.sleep(min(1.0, max(self.batch_interval, 0.05)))
+        finally:
+            with self._cond:
+                self._inflight = {}
+                self._cond.notify_all()
+
+    def sweep_expired(self) -> int:
+        """Delete expired sessions using the last-interaction index."""
+        if self.ttl <= 0:
+            return 0
+        with self._write_lock:
+            cursor = self._writer_conn.execute(
+                "DELETE FROM sessions WHERE last_interaction < ?", (self._cutoff(),)
+            )
+        removed = cursor.rowcount or 0
+        self.stats["expired"] += removed
+        if removed:
+            logger.debug("Swept %s expired SQLite sessions", removed)
+        return removed
+
+    def _writer_loop(self):
+        while True:
+            with self._cond:
+                wait_timeout = self.sweep_interval if self.sweep_interval > 0 else None
+                if not self._pending and not self._closed:
+                    self._cond.wait(wait_timeout)
+                closed = self._closed
+            if closed:
+                return
+            if self._pending and self.batch_interval > 0:
+                # Gather saves from other sessions into the same transaction.
+                time.sleep(self.batch_interval)
+            try:
+                self._commit_pending()
+                if self.sweep_interval > 0 and time.monotonic() - self._last_sweep >= self.sweep_interval:
+                    self._last_sweep = time.monotonic()
+                    self.sweep_expired()
+            except Exception as e:  # keep the writer alive
+                logger.warning("SQLite session writer error: %s", e)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until queued writes are committed. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._pending or self._inflight:
+                if self._closed or not self._writer.is_alive():
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        if self._pending:
+            self._commit_pending()
+        return True
+
+    def close(self):
+        """Stop the writer thread after committing queued writes."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        if self._writer is not threading.current_thread():
+            self._writer.join(timeout=5)
+        self._commit_pending()
+        logger.info("SQLite session store closed (%s)", self.path)
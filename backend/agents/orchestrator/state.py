@@ -9,6 +9,9 @@ class OrchestratorGraphState(TypedDict, total=False):
     user_input: str
     context: Optional[Dict[str, Any]]
     conversation_history: List[Dict[str, str]]
+    history_summary: str # Rolling summary of turns trimmed out of conversation_history.
+    pending_summary_turns: List[Dict[str, str]] # Trimmed turns not yet folded into history_summary.
+    history_fold_pending: bool # True when a background summary fold should be scheduled.
     active_agent: Optional[str]
     agent_specific_state: Dict[str, Any]
     orchestrator_response: Optional[Dict[str, Any]] # The raw output from the selected agent, before final normalization
@@ -2,6 +2,8 @@
 
 from langgraph.graph import StateGraph, END
 
+from backend.infrastructure.request_deadline import deadline_checked
+
 # Internal imports
 from .state import QuizGraphState
 from .nodes import (
@@ -16,10 +18,10 @@ def create_quiz_agent_graph() -> StateGraph:
     workflow = StateGraph(QuizGraphState)
 
     # Define nodes
-    workflow.add_node("perform_rag_search", perform_rag_search_node)
-    workflow.add_node("prepare_llm_messages", prepare_llm_messages_node)
-    workflow.add_node("call_llm_and_parse_response", call_llm_and_parse_response_node)
-    workflow.add_node("format_output", format_quiz_output_node)
+    workflow.add_node("perform_rag_search", deadline_checked(perform_rag_search_node))
+    workflow.add_node("prepare_llm_messages", deadline_checked(prepare_llm_messages_node))
+    workflow.add_node("call_llm_and_parse_response", deadline_checked(call_llm_and_parse_response_node))
+    workflow.add_node("format_output", deadline_checked(format_quiz_output_node))
 
     # Define edges (linear workflow)
     workflow.set_entry_point("perform_rag_search")
@@ -7,7 +7,9 @@ import re
 import hashlib
 from typing import Dict, Any, List, Optional, cast
 import openai
-from openai import AsyncOpenAI
+from backend.infrastructure.llm_admission import AdmissionRejected
+from backend.infrastructure.llm_client_registry import UPSTAGE_BASE_URL, get_async_openai
+from backend.infrastructure.llm_streaming import complete_chat
 
 # Ensure backend directory is in path for imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -17,6 +19,7 @@ sys.path.append(project_root)
 # Local imports
 from backend.config import get_settings
 from backend.utils.logger import get_logger
+from backend.utils.json_stream import extract_json
 # RAG functionality now provided by tools.py
 from backend.agents.quiz_agent.state import QuizGraphState
 
@@ -34,44 +37,6 @@ MAX_QUIZ_QUESTION_COUNT = 10
 logger = get_logger(__name__)
 
 
-def _parse_json_flexible(text: str) -> Optional[Any]:
-    if not isinstance(text, str):
-        return None
-
-    stripped = text.strip()
-    if not stripped:
-        return None
-
-    candidates: List[str] = [stripped]
-
-    fenced_blocks = re.findall(r"```(?:json)?\s*([\s\S]*?)```", stripped, flags=re.IGNORECASE)
-    candidates.extend(block.strip() for block in fenced_blocks if block.strip())
-
-    array_start = stripped.find("[")
-    array_end = stripped.rfind("]")
-    if array_start >= 0 and array_end > array_start:
-        candidates.append(stripped[array_start:array_end + 1].strip())
-
-    object_start = stripped.find("{")
-    object_end = stripped.rfind("}")
-    if object_start >= 0 and object_end > object_start:
-        candidates.append(stripped[object_start:object_end + 1].strip())
-
-    seen = set()
-    unique_candidates: List[str] = []
-    for candidate in candidates:
-        if candidate not in seen:
-            seen.add(candidate)
-            unique_candidates.append(candidate)
-
-    for candidate in unique_candidates:
-        try:
-            return json.loads(candidate)
-        except json.JSONDecodeError:
-            continue
-    return None
-
-
 def _clamp_question_count(value: int) -> int:
     if value < 1:
         return 1
@@ -281,10 +246,7 @@ class QuizAgentComponents:
 
         self.llm = None
         if self.settings.upstage_api_key:
-            self.llm = AsyncOpenAI(
-                base_url="https://api.upstage.ai/v1",
-                api_key=self.settings.upstage_api_key
-            )
+            self.llm = get_async_openai(UPSTAGE_BASE_URL, self.settings.upstage_api_key)
         else:
             logger.warning("UPSTAGE_API_KEY is not set for QuizAgent. LLM calls will fail.")
         
@@ -300,12 +262,8 @@ QUIZ_AGENT_COMPONENTS = QuizAgentComponents()
 
 # --- Node Functions ---
 
-def perform_rag_search_node(state: QuizGraphState) -> Dict[str, Any]:
-    state_dict = cast(Dict[str, Any], state)
-
-    user_input = state_dict["user_input"]
-    context = state_dict.get("context") or {}
-
+def rag_search_args(user_input: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    """Arguments of the `search_trade_documents` call for this turn (also used for prefetching)."""
     # Build search query
     rag_query = user_input
     if context.get("topic"):
@@ -313,18 +271,26 @@ def perform_rag_search_node(state: QuizGraphState) -> Dict[str, Any]:
     if context.get("difficulty"):
         rag_query += f" {context['difficulty']}"
 
-    # Use tool: search_trade_documents
+    return {
+        "query": rag_query,
+        "k": 6,
+        "document_type": context.get("document_type"),
+        "category": context.get("category"),
+    }
+
+
+def perform_rag_search_node(state: QuizGraphState) -> Dict[str, Any]:
+    state_dict = cast(Dict[str, Any], state)
+
+    user_input = state_dict["user_input"]
+    context = state_dict.get("context") or {}
+
+    # Use tool: search_trade_documents (prefetched during routing when possible)
     from backend.agents.quiz_agent.tools import search_trade_documents
+    from backend.rag.prefetch import RAG_PREFETCH
 
     try:
-        retrieved_documents = search_trade_documents.invoke(
-            {
-                "query": rag_query,
-                "k": 6,
-                "document_type": context.get("document_type"),
-                "category": context.get("category"),
-            }
-        )
+        retrieved_documents = RAG_PREFETCH.invoke(search_trade_documents, rag_search_args(user_input, context))
         used_rag = len(retrieved_documents) > 0
     except Exception as e:
         logger.warning("Error during quiz RAG search: %s", e)
@@ -403,15 +369,17 @@ async def call_llm_and_parse_response_node(state: QuizGraphState) -> Dict[str, A
     
     if llm:
         try:
-            chat_completion = await llm.chat.completions.create(
+            llm_response_content = await complete_chat(
+                llm,
+                source="quiz",
+                structured=True,
                 model=model_used,
                 messages=llm_messages,
                 temperature=0.3
             )
-            llm_response_content = chat_completion.choices[0].message.content
             state_dict["llm_raw_response_content"] = llm_response_content
             
-            parsed_llm_response = _parse_json_flexible(llm_response_content)
+            parsed_llm_response = extract_json(llm_response_content)
             try:
                 if parsed_llm_response is None:
                     raise json.JSONDecodeError("Unable to parse JSON payload", llm_response_content, 0)
@@ -452,6 +420,8 @@ async def call_llm_and_parse_response_node(state: QuizGraphState) -> Dict[str, A
             logger.warning("QuizAgent Upstage API error: %s", e)
             final_response_content = f"LLM API 호출 중 오류가 발생했습니다: {e}"
             llm_output_details = {"error": str(e)}
+        except AdmissionRejected:
+            raise
         except Exception as e:
             logger.warning("QuizAgent unexpected LLM error: %s", e)
             final_response_content = f"LLM 호출 중 예상치 못한 오류가 발생했습니다: {e}"
@@ -5,6 +5,8 @@ from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 from langgraph.checkpoint.memory import MemorySaver
 import sqlite3
+from backend.infrastructure.llm_admission import AdmissionRejected
+from backend.infrastructure.request_deadline import deadline_checked
 from backend.utils.logger import get_logger
 
 # Internal imports
@@ -48,11 +50,11 @@ def create_risk_managing_graph() -> StateGraph:
     workflow = StateGraph(RiskManagingGraphState)
 
     # Define nodes
-    workflow.add_node("prepare_state", prepare_risk_state_node)
-    workflow.add_node("detect_trigger_and_similarity", detect_trigger_and_similarity_node)
-    workflow.add_node("assess_conversation", assess_conversation_progress_node)
-    workflow.add_node("perform_full_analysis", perform_full_analysis_node)
-    workflow.add_node("format_output", format_final_output_node)
+    workflow.add_node("prepare_state", deadline_checked(prepare_risk_state_node))
+    workflow.add_node("detect_trigger_and_similarity", deadline_checked(detect_trigger_and_similarity_node))
+    workflow.add_node("assess_conversation", deadline_checked(assess_conversation_progress_node))
+    workflow.add_node("perform_full_analysis", deadline_checked(perform_full_analysis_node))
+    workflow.add_node("format_output", deadline_checked(format_final_output_node))
     # Error handling can be added with workflow.add_node("error_handler", handle_risk_error_node)
     # and then workflow.add_edge("error_handler", END) etc.
     # For now, we'll let exceptions propagate to the orchestrator's error handling.
@@ -95,6 +97,11 @@ risk_managing_graph = create_risk_managing_graph()
 memory_fallback = MemorySaver()
 compiled_risk_managing_app_default = risk_managing_graph.compile(checkpointer=memory_fallback)
 
+# agent_specific_state key holding the incremental slot scan (see nodes.assess_conversation_progress_node)
+EXTRACTION_CACHE_KEY = "risk_extraction"
+# agent_specific_state key holding the latest background report job (see report_jobs)
+REPORT_JOB_KEY = "risk_report_job"
+
 class RiskManagingAgent(BaseAgent):
     """
     Risk Managing Agent wrapper for the orchestrator.
@@ -110,6 +117,8 @@ class RiskManagingAgent(BaseAgent):
             context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         if context is None:
             context = {}
+        context = dict(context)
+        agent_state = context.pop("_agent_specific_state", None) or {}
 
         # Prepare the input state for the risk managing graph
         # Only include fields that are new or updated. 
@@ -120,7 +129,8 @@ class RiskManagingAgent(BaseAgent):
             "current_user_input": user_input,
             "conversation_history": conversation_history,
             "analysis_in_progress": analysis_in_progress,
-            "user_profile": context.get("user_profile")
+            "user_profile": context.get("user_profile"),
+            "extraction_cache": agent_state.get(EXTRACTION_CACHE_KEY),
         }
 
         # Invoke the compiled graph using AsyncSqliteSaver for persistent storage
@@ -130,13 +140,16 @@ class RiskManagingAgent(BaseAgent):
                 async with AsyncSqliteSaver.from_conn_string("risk_checkpoints.db") as saver:
                     app = risk_managing_graph.compile(checkpointer=saver)
                     return await app.ainvoke(input_state, config=config)
+            except AdmissionRejected:
+                raise
             except Exception as e:
                 logger.warning(f"AsyncSqliteSaver failed: {e}. Falling back to MemorySaver.")
                 return await compiled_risk_managing_app_default.ainvoke(input_state, config=config)
 
         # Extract session_id for thread_id, or generate a new one if not present
         session_id = context.get("session_id", str(uuid.uuid4()))
-        config = {"configurable": {"thread_id": session_id}}
+        # context["report_mode"]: "job" answers with a report job id, "inline" waits for the report
+        config = {"configurable": {"thread_id": session_id, "report_mode": context.get("report_mode")}}
         logger.info(f"RiskManagingAgent running with thread_id: {session_id}")
         final_state = await _run_graph()
 
@@ -157,8 +170,13 @@ class RiskManagingAgent(BaseAgent):
                 "metadata": {}
             }
 
+        agent_specific_state = {EXTRACTION_CACHE_KEY: final_state.get("extraction_cache")}
+        if final_state.get("report_job_id"):
+            agent_specific_state[REPORT_JOB_KEY] = {"job_id": final_state["report_job_id"], "status": "queued"}
+
         return {
             "response": response_payload,
             "conversation_history": final_state.get("conversation_history", conversation_history),
-            "analysis_in_progress": final_state.get("analysis_in_progress", False)
+            "analysis_in_progress": final_state.get("analysis_in_progress", False),
+            "agent_specific_state": agent_specific_state,
         }
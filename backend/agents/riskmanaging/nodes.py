@@ -6,13 +6,15 @@ from __future__ import annotations # Added as per instruction
 import os
 import sys
 import json
+import asyncio
 import uuid
 import time
-from typing import Dict, Any, List, Optional, cast, TypedDict
+from typing import Callable, Dict, Any, List, Optional, cast, TypedDict
 from backend.utils.json_utils import safe_json_parse
 import openai
-from openai import AsyncOpenAI
+from backend.infrastructure.llm_client_registry import UPSTAGE_SOLAR_BASE_URL, get_async_openai
 from langsmith import traceable
+from langchain_core.runnables import RunnableConfig
 import numpy as np
 from numpy.linalg import norm
 
@@ -23,6 +25,9 @@ sys.path.append(project_root)
 
 # Local imports (minimal as most will be internal)
 from backend.config import get_settings
+from backend.core.response_converter import normalize_response
+from backend.infrastructure.llm_admission import AdmissionRejected, llm_caller
+from backend.infrastructure.request_deadline import budget
 from backend.utils.logger import get_logger
 # RAG functionality now provided by tools.py
 from backend.rag.embedder import get_embedding
@@ -30,6 +35,16 @@ from pydantic import BaseModel, Field
 
 # Import RiskManagingGraphState explicitly and minimally
 from backend.agents.riskmanaging.state import RiskManagingGraphState
+from backend.agents.riskmanaging.speculation import SPECULATIVE_REPORTS, speculation_key
+from backend.agents.riskmanaging.report_jobs import REPORT_JOBS
+from backend.agents.riskmanaging.slot_filling import precheck_turn, scan_history_slots
+from backend.agents.riskmanaging.report_cache import SIMILAR_REPORTS, reuse_report as reuse_cached_report
+from backend.agents.riskmanaging.risk_scoring import (
+    RISK_SCORE_CACHE,
+    merge_reasoning,
+    score_locally,
+    scoring_cache_key,
+)
 
 # Import other constants and schemas from state.py separately
 from backend.agents.riskmanaging.state import (
@@ -191,6 +206,33 @@ risk_level은 risk_score에 따라 low/medium/high/critical로 결정합니다.
 ```
 """
 
+RISK_REASONING_PROMPT = """
+당신은 '현실적인 선배/상사형 리스크 관리 에이전트'입니다.
+아래 리스크 항목별 점수(impact, likelihood, risk_score, risk_level)는 이미 확정되었습니다. 점수는 바꾸지 말고,
+각 항목의 판단 근거(reasoning)와 구체적인 완화 방안(mitigation_suggestions)을 "회사 기준", "실무 기준", "실제 발생 가능한 리스크", "내부 보고 기준" 관점에서 작성하십시오.
+
+<확정된 점수>
+{{risk_scores_json}}
+
+<이미 파악된 정보>
+{{extracted_data}}
+
+<사용자 질의>
+{{user_input}}
+
+<출력 형식>
+반드시 아래 JSON으로만 응답하십시오. name은 확정된 점수의 name과 동일해야 합니다.
+
+```json
+{{
+    "risk_factors": [
+        {{"name": "재정적 손실", "reasoning": "...", "mitigation_suggestions": ["...", "..."]}}
+    ],
+    "overall_assessment": "전반적인 리스크 평가 요약 (담백하고 직설적으로 문제점과 핵심을 짚어줌)"
+}}
+```
+"""
+
 REPORT_GENERATION_PROMPT = """
 당신은 '현실적인 선배/상사형 리스크 관리 에이전트'입니다.
 제공된 리스크 분석 결과와 모든 정보를 종합하여 최종 리스크 관리 보고서를 JSON 형식으로 생성해야 합니다.
@@ -409,10 +451,7 @@ class ConversationManager:
     """
     def __init__(self):
         self.settings = get_settings()
-        self.client = AsyncOpenAI(
-            api_key=self.settings.upstage_api_key,
-            base_url="https://api.upstage.ai/v1/solar"
-        )
+        self.client = get_async_openai(UPSTAGE_SOLAR_BASE_URL, self.settings.upstage_api_key)
     
     async def assess_conversation_progress(self, agent_input: RiskManagingAgentInput, extracted_data: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -471,6 +510,8 @@ class ConversationManager:
                 "analysis_in_progress": True
             }
         
+        except AdmissionRejected:
+            raise
         except Exception as e:
             logger.warning("Error in assess_conversation_progress: %s", e)
             return {
@@ -491,6 +532,23 @@ class RAGConnector:
     def __init__(self):
         self.settings = get_settings()
     
+    @staticmethod
+    def search_args(
+        user_input: str,
+        conversation_history: Optional[List[Dict[str, str]]] = None,
+        k: int = 10,
+    ) -> Dict[str, Any]:
+        """Arguments of the `search_risk_cases` call for this turn (also used for prefetching)."""
+        # Build full query context
+        full_query = user_input
+        if conversation_history:
+            recent_context = " ".join([
+                turn.get("content", "")
+                for turn in conversation_history[-3:]  # Last 3 turns
+            ])
+            full_query = f"{recent_context} {user_input}"
+        return {"query": full_query, "k": k, "datasets": RAG_DATASETS}
+
     def get_risk_documents(
         self, 
         user_input: str, 
@@ -508,24 +566,13 @@ class RAGConnector:
         Returns:
             List of retrieved documents with metadata
         """
-        # Build full query context
-        full_query = user_input
-        if conversation_history:
-            recent_context = " ".join([
-                turn.get("content", "")
-                for turn in conversation_history[-3:]  # Last 3 turns
-            ])
-            full_query = f"{recent_context} {user_input}"
-        
-        # Use tool: search_risk_cases
+        # Use tool: search_risk_cases (prefetched during routing when possible)
         from backend.agents.riskmanaging.tools import search_risk_cases
+        from backend.rag.prefetch import RAG_PREFETCH
 
-        filtered_documents = search_risk_cases.invoke(
-            {
-                "query": full_query,
-                "k": k,
-                "datasets": RAG_DATASETS,
-            }
+        filtered_documents = RAG_PREFETCH.invoke(
+            search_risk_cases,
+            self.search_args(user_input, conversation_history, k),
         )
 
         logger.debug(
@@ -575,20 +622,25 @@ class RAGConnector:
 class RiskEngine:
     """
     Evaluates risk factors and calculates risk scores.
+
+    Impact/likelihood are computed locally by `risk_scoring.score_locally`
+    when the extracted facts make it confident enough; the LLM then only
+    writes reasoning text ("hybrid") or is skipped ("local"). Results are
+    cached per `extracted_data`/`user_profile` hash.
     """
     def __init__(self):
         self.settings = get_settings()
-        self.client = AsyncOpenAI(
-            api_key=self.settings.upstage_api_key,
-            base_url="https://api.upstage.ai/v1/solar"
-        )
+        self.client = get_async_openai(UPSTAGE_SOLAR_BASE_URL, self.settings.upstage_api_key)
+        self.mode = getattr(self.settings, "risk_scoring_mode", "hybrid")
+        self.min_confidence = getattr(self.settings, "risk_local_scoring_min_confidence", 0.7)
     
     async def evaluate_risk(
         self,
         agent_input: RiskManagingAgentInput,
         rag_documents: List[Dict[str, Any]],
         user_profile: Optional[Dict[str, Any]] = None,
-        extracted_data: Optional[Dict[str, Any]] = None
+        extracted_data: Optional[Dict[str, Any]] = None,
+        similar_cases: Optional[List[Dict[str, Any]]] = None
     ) -> RiskScoring:
         """
         Evaluate risk based on user input and RAG documents.
@@ -597,10 +649,93 @@ class RiskEngine:
             agent_input: User input and context
             rag_documents: Retrieved documents from RAG
             extracted_data: Previously extracted info
+            similar_cases: Similar cases extracted from rag_documents
         
         Returns:
             RiskScoring object with risk factors and assessment
         """
+        cache_key = scoring_cache_key(extracted_data, user_profile, self.mode) if extracted_data else None
+        if cache_key:
+            cached = RISK_SCORE_CACHE.get(cache_key)
+            if cached is not None:
+                logger.debug("risk scoring: cache hit")
+                return cached.model_copy(deep=True)
+
+        try:
+            if self.mode != "llm":
+                local = score_locally(extracted_data, similar_cases, agent_input.user_input)
+                if local.confidence >= self.min_confidence:
+                    if self.mode == "local":
+                        risk_scoring = local.scoring
+                    else:
+                        risk_scoring = await self._write_reasoning(agent_input, local.scoring, extracted_data, user_profile)
+                        if risk_scoring is None:
+                            # Template text after a failed LLM call: serve it, but don't cache it.
+                            return local.scoring.model_copy(deep=True)
+                    if cache_key:
+                        RISK_SCORE_CACHE.set(cache_key, risk_scoring)
+                    return risk_scoring.model_copy(deep=True)
+                logger.info("risk scoring: local confidence %.2f below %.2f, using LLM", local.confidence, self.min_confidence)
+
+            risk_scoring = await self._score_with_llm(agent_input, rag_documents, user_profile, extracted_data)
+            if cache_key:
+                RISK_SCORE_CACHE.set(cache_key, risk_scoring)
+            return risk_scoring.model_copy(deep=True)
+        
+        except AdmissionRejected:
+            raise
+        except Exception as e:
+            logger.warning("Error in evaluate_risk: %s", e)
+            # Return default risk scoring
+            return RiskScoring(
+                overall_risk_level="medium",
+                risk_factors=[],
+                overall_assessment=f"리스크 평가 중 오류 발생: {str(e)}"
+            )
+
+    async def _write_reasoning(
+        self,
+        agent_input: RiskManagingAgentInput,
+        local_scoring: RiskScoring,
+        extracted_data: Optional[Dict[str, Any]],
+        user_profile: Optional[Dict[str, Any]]
+    ) -> Optional[RiskScoring]:
+        """
+        Ask the LLM for reasoning/mitigation text only; scores stay local.
+        Returns None when the call fails (the caller keeps the template text).
+        """
+        prompt = RISK_REASONING_PROMPT.replace(
+            "{{risk_scores_json}}", local_scoring.model_dump_json(indent=2)
+        ).replace(
+            "{{extracted_data}}", json.dumps(extracted_data or {}, ensure_ascii=False, indent=2)
+        ).replace(
+            "{{user_input}}", agent_input.user_input
+        )
+        try:
+            user_instruction = build_user_instruction(user_profile)
+            response = await self.client.chat.completions.create(
+                model="solar-pro",
+                messages=[
+                    {"role": "system", "content": f"{RISK_AGENT_SYSTEM_PROMPT}\n추가 지침:\n{user_instruction}"},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.3
+            )
+            llm_data = safe_json_parse(response.choices[0].message.content.strip())
+        except AdmissionRejected:
+            raise
+        except Exception as e:
+            logger.warning("risk scoring: reasoning LLM failed, keeping template text: %s", e)
+            return None
+        return merge_reasoning(local_scoring, llm_data if isinstance(llm_data, dict) else {})
+
+    async def _score_with_llm(
+        self,
+        agent_input: RiskManagingAgentInput,
+        rag_documents: List[Dict[str, Any]],
+        user_profile: Optional[Dict[str, Any]],
+        extracted_data: Optional[Dict[str, Any]]
+    ) -> RiskScoring:
         # Prepare RAG documents for prompt
         rag_docs_str = "\n\n".join([
             f"[문서 {i+1}] {doc.get('document', '')[:300]}..."
@@ -629,55 +764,70 @@ class RiskEngine:
             "{{extracted_data}}", extracted_data_str
         )
         
-        try:
-            user_instruction = build_user_instruction(user_profile)
-            system_prompt = f"{RISK_AGENT_SYSTEM_PROMPT}\n추가 지침:\n{user_instruction}"
-            
-            response = await self.client.chat.completions.create(
-                model="solar-pro",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3
-            )
-            
-            response_text = response.choices[0].message.content.strip()
-            
-            risk_data = safe_json_parse(response_text)
-            
-            # Convert to RiskScoring object
-            from backend.agents.riskmanaging.state import RiskFactor
-            risk_factors = [
-                RiskFactor(**factor) for factor in risk_data.get("risk_factors", [])
-            ]
-            
-            return RiskScoring(
-                overall_risk_level=risk_data.get("overall_risk_level", "medium"),
-                risk_factors=risk_factors,
-                overall_assessment=risk_data.get("overall_assessment", "")
-            )
+        user_instruction = build_user_instruction(user_profile)
+        system_prompt = f"{RISK_AGENT_SYSTEM_PROMPT}\n추가 지침:\n{user_instruction}"
         
-        except Exception as e:
-            logger.warning("Error in evaluate_risk: %s", e)
-            # Return default risk scoring
-            return RiskScoring(
-                overall_risk_level="medium",
-                risk_factors=[],
-                overall_assessment=f"리스크 평가 중 오류 발생: {str(e)}"
-            )
+        response = await self.client.chat.completions.create(
+            model="solar-pro",
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.3
+        )
+        
+        response_text = response.choices[0].message.content.strip()
+        
+        risk_data = safe_json_parse(response_text)
+        
+        # Convert to RiskScoring object
+        from backend.agents.riskmanaging.state import RiskFactor
+        risk_factors = [
+            RiskFactor(**factor) for factor in risk_data.get("risk_factors", [])
+        ]
+        
+        return RiskScoring(
+            overall_risk_level=risk_data.get("overall_risk_level", "medium"),
+            risk_factors=risk_factors,
+            overall_assessment=risk_data.get("overall_assessment", "")
+        )
+
+
+def _fallback_loss_simulation() -> LossSimulation:
+    return LossSimulation(
+        quantitative=None,
+        qualitative="손실 시뮬레이션 생성 중 오류 발생"
+    )
+
+
+def _fallback_control_gap_analysis() -> ControlGapAnalysis:
+    return ControlGapAnalysis(
+        identified_gaps=["분석 중 오류 발생"],
+        recommendations=[]
+    )
+
+
+def _fallback_prevention_strategy() -> PreventionStrategy:
+    return PreventionStrategy(
+        short_term=["전략 생성 중 오류 발생"],
+        long_term=[]
+    )
 
 
 class ReportGenerator:
     """
     Generates comprehensive risk analysis report.
+
+    Report sections are LLM calls arranged as a small dependency DAG:
+    input summary, loss simulation and control gap analysis run concurrently,
+    and prevention strategy starts as soon as the control gap analysis is done.
+    Each section has its own timeout and falls back to a placeholder instead
+    of failing the whole report.
     """
     def __init__(self):
         self.settings = get_settings()
-        self.client = AsyncOpenAI(
-            api_key=self.settings.upstage_api_key,
-            base_url="https://api.upstage.ai/v1/solar"
-        )
+        self.client = get_async_openai(UPSTAGE_SOLAR_BASE_URL, self.settings.upstage_api_key)
+        self.section_timeout = float(getattr(self.settings, "risk_report_section_timeout", 45.0) or 0)
     
     @traceable(name="report_generator_generate")
     async def generate_report(
@@ -687,7 +837,8 @@ class ReportGenerator:
         similar_cases: List[Dict[str, Any]],
         evidence_sources: List[str],
         rag_documents: List[Dict[str, Any]],
-        user_profile: Optional[Dict[str, Any]] = None
+        user_profile: Optional[Dict[str, Any]] = None,
+        progress: Optional[Callable[..., None]] = None,
     ) -> RiskReport:
         """
         Generate comprehensive risk report.
@@ -699,22 +850,40 @@ class ReportGenerator:
             evidence_sources: Evidence document sources
             rag_documents: All retrieved documents
             user_profile: User persona information
+            progress: Called as progress("section", name=..., status=...) when a
+                section starts and completes (status "completed" or "fallback")
         
         Returns:
             RiskReport object
         """
         self.user_profile = user_profile # Store for private methods
-        # Generate input summary
-        input_summary = await self._generate_input_summary(agent_input)
-        
-        # Generate loss simulation
-        loss_simulation = await self._generate_loss_simulation(risk_scoring)
-        
-        # Generate control gap analysis
-        control_gap_analysis = await self._generate_control_gap_analysis(risk_scoring)
-        
-        # Generate prevention strategy
-        prevention_strategy = await self._generate_prevention_strategy(risk_scoring, control_gap_analysis)
+        sections = await self._run_sections({
+            # name: (dependencies, generator(*dependency_results), fallback)
+            "input_summary": (
+                (),
+                lambda: self._generate_input_summary(agent_input),
+                lambda: agent_input.user_input,
+            ),
+            "loss_simulation": (
+                (),
+                lambda: self._generate_loss_simulation(risk_scoring),
+                _fallback_loss_simulation,
+            ),
+            "control_gap_analysis": (
+                (),
+                lambda: self._generate_control_gap_analysis(risk_scoring),
+                _fallback_control_gap_analysis,
+            ),
+            "prevention_strategy": (
+                ("control_gap_analysis",),
+                lambda gaps: self._generate_prevention_strategy(risk_scoring, gaps),
+                _fallback_prevention_strategy,
+            ),
+        }, progress)
+        input_summary = sections["input_summary"]
+        loss_simulation = sections["loss_simulation"]
+        control_gap_analysis = sections["control_gap_analysis"]
+        prevention_strategy = sections["prevention_strategy"]
         
         # Calculate confidence score
         confidence_score = self._calculate_confidence_score(risk_scoring, rag_documents)
@@ -741,6 +910,61 @@ class ReportGenerator:
             evidence_sources=evidence_sources
         )
     
+    async def reuse_report(
+        self,
+        cached_report: RiskReport,
+        agent_input: RiskManagingAgentInput,
+        user_profile: Optional[Dict[str, Any]] = None
+    ) -> RiskReport:
+        """Keep a cached report's scoring and sections; regenerate only the input summary."""
+        self.user_profile = user_profile
+        sections = await self._run_sections({
+            "input_summary": (
+                (),
+                lambda: self._generate_input_summary(agent_input),
+                lambda: agent_input.user_input,
+            ),
+        })
+        return reuse_cached_report(cached_report, sections["input_summary"])
+
+    async def _run_sections(
+        self,
+        sections: Dict[str, tuple],
+        progress: Optional[Callable[..., None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run report sections as a DAG: each section waits only for the results
+        of its dependencies, so independent sections run concurrently.
+        """
+        tasks: Dict[str, asyncio.Task] = {}
+        report = progress or (lambda *args, **kwargs: None)
+
+        async def run(name: str, deps: tuple, generate, fallback):
+            inputs = [await tasks[dep] for dep in deps]
+            report("section", name=name, status="started")
+            try:
+                timeout = budget(self.section_timeout)  # capped at the request deadline, if any
+                if timeout:
+                    result = await asyncio.wait_for(generate(*inputs), timeout=timeout)
+                else:
+                    result = await generate(*inputs)
+                report("section", name=name, status="completed")
+                return result
+            except asyncio.TimeoutError:
+                logger.warning("Report section '%s' timed out after %.1fs", name, self.section_timeout)
+            except AdmissionRejected:
+                raise
+            except Exception as e:
+                logger.warning("Report section '%s' failed: %s", name, e)
+            report("section", name=name, status="fallback")
+            return fallback()
+
+        for name, (deps, generate, fallback) in sections.items():
+            tasks[name] = asyncio.ensure_future(run(name, deps, generate, fallback))
+
+        results = await asyncio.gather(*tasks.values())
+        return dict(zip(tasks.keys(), results))
+
     async def _generate_input_summary(self, agent_input: RiskManagingAgentInput) -> str:
         """Generate concise summary of user input"""
         conversation_history_str = "\n".join([
@@ -767,6 +991,8 @@ class ReportGenerator:
                 temperature=0.2
             )
             return response.choices[0].message.content.strip()
+        except AdmissionRejected:
+            raise
         except Exception as e:
             logger.warning("Error generating input summary: %s", e)
             return agent_input.user_input
@@ -797,12 +1023,11 @@ class ReportGenerator:
                 quantitative=None,  # Can be enhanced later
                 qualitative=qualitative
             )
+        except AdmissionRejected:
+            raise
         except Exception as e:
             logger.warning("Error generating loss simulation: %s", e)
-            return LossSimulation(
-                quantitative=None,
-                qualitative="손실 시뮬레이션 생성 중 오류 발생"
-            )
+            return _fallback_loss_simulation()
     
     async def _generate_control_gap_analysis(self, risk_scoring: RiskScoring) -> ControlGapAnalysis:
         """Generate control gap analysis"""
@@ -833,12 +1058,11 @@ class ReportGenerator:
                 identified_gaps=gap_data.get("identified_gaps", []),
                 recommendations=gap_data.get("recommendations", [])
             )
+        except AdmissionRejected:
+            raise
         except Exception as e:
             logger.warning("Error generating control gap analysis: %s", e)
-            return ControlGapAnalysis(
-                identified_gaps=["분석 중 오류 발생"],
-                recommendations=[]
-            )
+            return _fallback_control_gap_analysis()
     
     async def _generate_prevention_strategy(
         self, 
@@ -879,12 +1103,11 @@ class ReportGenerator:
                 short_term=strategy_data.get("short_term", []),
                 long_term=strategy_data.get("long_term", [])
             )
+        except AdmissionRejected:
+            raise
         except Exception as e:
             logger.warning("Error generating prevention strategy: %s", e)
-            return PreventionStrategy(
-                short_term=["전략 생성 중 오류 발생"],
-                long_term=[]
-            )
+            return _fallback_prevention_strategy()
     
     def _calculate_confidence_score(
         self, 
@@ -984,6 +1207,7 @@ def prepare_risk_state_node(state: RiskManagingGraphState) -> Dict[str, Any]:
         "error_message": None,
         "analysis_in_progress": True, # Keep analysis active by default if entered
         "analysis_required": False,
+        "report_job_id": None,
         "agent_response": None, # Explicitly clear previous response
     }
 
@@ -1014,19 +1238,46 @@ def detect_trigger_and_similarity_node(state: RiskManagingGraphState) -> Dict[st
     }
 
 # Node function for assessing conversation progress
-async def assess_conversation_progress_node(state: RiskManagingGraphState) -> Dict[str, Any]:
+async def assess_conversation_progress_node(
+    state: RiskManagingGraphState,
+    config: Optional[RunnableConfig] = None,
+) -> Dict[str, Any]:
     logger.debug("risk node: assess_conversation_progress")
     agent_input = RiskManagingAgentInput(
         user_input=state["current_user_input"],
         conversation_history=state["conversation_history"]
     )
     
-    conversation_manager = ConversationManager() # Initialize here
-    assessment_result = await conversation_manager.assess_conversation_progress(agent_input, state.get("extracted_data"))
+    old_extracted_data = state.get("extracted_data") or {}
+
+    # Deterministic slot filling first: the LLM is only needed when the turn is
+    # ambiguous (all required facts present, report request/approval, questions).
+    slot_check = None
+    extraction_cache = state.get("extraction_cache")
+    if get_settings().risk_local_slot_filling:
+        # Earlier user turns are scanned incrementally (only turns added since the last risk turn).
+        extraction_cache, history_slots = scan_history_slots(extraction_cache, state["conversation_history"])
+        slot_check = precheck_turn(state["current_user_input"], old_extracted_data, history_slots)
+        old_extracted_data = slot_check.extracted_data
+
+    if slot_check is not None and slot_check.decision == "ask":
+        logger.info("risk assessment answered locally; missing slots=%s", slot_check.missing_slots)
+        assessment_result = {
+            "status": "insufficient",
+            "analysis_ready": False,
+            "report_requested": False,
+            "message": slot_check.message,
+            "follow_up_questions": slot_check.follow_up_questions,
+            "extracted_data": {},
+            "conversation_stage": "gathering_info",
+            "analysis_in_progress": True,
+        }
+    else:
+        conversation_manager = ConversationManager() # Initialize here
+        assessment_result = await conversation_manager.assess_conversation_progress(agent_input, old_extracted_data)
     
     # Update state based on assessment result
     # Merge extracted_data to prevent losing previously collected information
-    old_extracted_data = state.get("extracted_data", {})
     new_extracted_data = assessment_result.get("extracted_data", {})
     
     # Merge: if new has value, use it; otherwise keep old
@@ -1037,6 +1288,7 @@ async def assess_conversation_progress_node(state: RiskManagingGraphState) -> Di
 
     state_updates = {
         "extracted_data": merged_data,
+        "extraction_cache": extraction_cache,
         "analysis_ready": assessment_result.get("analysis_ready", False),
         "report_requested": assessment_result.get("report_requested", False),
         "conversation_stage": assessment_result.get("conversation_stage", "gathering_info"),
@@ -1052,38 +1304,189 @@ async def assess_conversation_progress_node(state: RiskManagingGraphState) -> Di
             f"추가 정보가 필요합니다:\n"
             + "\n".join([f"- {q}" for q in follow_up_questions])
         )
+
+    _maybe_speculate_report(state, state_updates, assessment_result.get("status"), config)
     
     return state_updates
 
+
+def _session_id_from_config(config: Optional[RunnableConfig]) -> Optional[str]:
+    return ((config or {}).get("configurable") or {}).get("thread_id")
+
+
+def _report_mode_from_config(config: Optional[RunnableConfig]) -> str:
+    """"job" (analyse in the background, answer with a job id) or "inline"."""
+    mode = ((config or {}).get("configurable") or {}).get("report_mode")
+    if mode in ("job", "inline"):
+        return mode
+    return "job" if getattr(get_settings(), "risk_report_jobs", False) else "inline"
+
+
+def _maybe_speculate_report(
+    state: RiskManagingGraphState,
+    state_updates: Dict[str, Any],
+    status: Optional[str],
+    config: Optional[RunnableConfig],
+) -> None:
+    """
+    Information is sufficient but the user has not approved the report yet:
+    start the full analysis in the background so the approval turn can be
+    answered from cache. On the approval turn the entry is left for
+    `perform_full_analysis_node` to take (`take` checks the inputs); any
+    other outcome drops a stale speculation.
+    """
+    session_id = _session_id_from_config(config)
+    if not session_id or not get_settings().risk_speculative_report:
+        return
+    if status != "sufficient":
+        SPECULATIVE_REPORTS.discard(session_id)
+        return
+    if state_updates["analysis_ready"]:
+        return
+
+    extracted_data = state_updates["extracted_data"]
+    user_profile = state.get("user_profile")
+    user_input = state["current_user_input"]
+    conversation_history = list(state["conversation_history"] or [])
+    SPECULATIVE_REPORTS.start(
+        session_id,
+        speculation_key(extracted_data, user_profile),
+        lambda: _run_full_analysis(user_input, conversation_history, extracted_data, user_profile),
+    )
+
 # Node function for performing full risk analysis (RAG, Risk Engine, Report Gen)
-async def perform_full_analysis_node(state: RiskManagingGraphState) -> Dict[str, Any]:
+async def perform_full_analysis_node(
+    state: RiskManagingGraphState,
+    config: Optional[RunnableConfig] = None,
+) -> Dict[str, Any]:
     logger.debug("risk node: perform_full_analysis")
-    user_input = state["current_user_input"]
-    conversation_history = state["conversation_history"]
-    
+    user_profile = state.get("user_profile")
+    extracted_data = state.get("extracted_data")
+
+    session_id = _session_id_from_config(config)
+    if _report_mode_from_config(config) == "job":
+        job = REPORT_JOBS.submit(session_id, _report_job_analysis(state, session_id))
+        if job is not None:
+            return {
+                "report_job_id": job.job_id,
+                "conversation_stage": "analysis_queued",
+                "analysis_in_progress": False,
+                "agent_response": RiskManagingAgentResponse(
+                    response="리스크 분석 보고서를 생성하고 있습니다. 완료되면 보고서가 이 대화에 저장됩니다.",
+                    metadata={"status": "report_pending", "analysis_id": None, "report_job_id": job.job_id},
+                ),
+            }
+
+    if session_id:
+        speculative = await SPECULATIVE_REPORTS.take(session_id, speculation_key(extracted_data, user_profile))
+        if speculative is not None:
+            return speculative
+
+    return await _run_full_analysis(
+        state["current_user_input"],
+        state["conversation_history"],
+        extracted_data,
+        user_profile,
+    )
+
+
+def _report_job_analysis(state: RiskManagingGraphState, session_id: Optional[str]):
+    """
+    Background body of a report job: the same analysis and formatting as the
+    inline path, returning the normalized ChatResponse of the report.
+    """
+    job_state = dict(state)
+    job_state["conversation_history"] = list(state["conversation_history"] or [])
+    user_profile = job_state.get("user_profile")
+    extracted_data = job_state.get("extracted_data")
+
+    async def analysis(progress: Callable[..., None]) -> Dict[str, Any]:
+        result = None
+        if session_id:
+            result = await SPECULATIVE_REPORTS.take(session_id, speculation_key(extracted_data, user_profile))
+            if result is not None:
+                progress("stage", name="speculative_report", status="completed")
+        if result is None:
+            result = await _run_full_analysis(
+                job_state["current_user_input"],
+                job_state["conversation_history"],
+                extracted_data,
+                user_profile,
+                progress=progress,
+            )
+        job_state.update(result)
+        formatted = format_final_output_node(cast(RiskManagingGraphState, job_state))
+        return normalize_response(formatted["agent_response"].model_dump())
+
+    return analysis
+
+
+async def _run_full_analysis(
+    user_input: str,
+    conversation_history: List[Dict[str, str]],
+    extracted_data: Optional[Dict[str, Any]],
+    user_profile: Optional[Dict[str, Any]],
+    progress: Optional[Callable[..., None]] = None,
+) -> Dict[str, Any]:
+    # Report generation yields LLM capacity to routing and interactive turns.
+    with llm_caller("riskmanaging", "batch"):
+        return await _analyse_and_report(user_input, conversation_history, extracted_data, user_profile, progress)
+
+
+async def _analyse_and_report(
+    user_input: str,
+    conversation_history: List[Dict[str, str]],
+    extracted_data: Optional[Dict[str, Any]],
+    user_profile: Optional[Dict[str, Any]],
+    progress: Optional[Callable[..., None]] = None,
+) -> Dict[str, Any]:
+    report = progress or (lambda *args, **kwargs: None)
     agent_input = RiskManagingAgentInput(
         user_input=user_input,
         conversation_history=conversation_history
     )
 
-    # 1. RAG Connector
+    # 0. Near-identical case analysed before: reuse its scoring and sections
+    reuse_reports = bool(extracted_data) and getattr(get_settings(), "risk_report_reuse", True)
+    if reuse_reports:
+        match = await asyncio.to_thread(SIMILAR_REPORTS.lookup, extracted_data, user_input, user_profile)
+        if match:
+            cached, similarity = match
+            logger.info("risk analysis: reusing report %s (similarity %.3f)", cached.report.analysis_id, similarity)
+            report("stage", name="report_reuse", status="started")
+            report_generated = await ReportGenerator().reuse_report(cached.report, agent_input, user_profile)
+            report("stage", name="report_reuse", status="completed")
+            return {
+                "rag_documents": cached.rag_documents,
+                "risk_scoring": report_generated.risk_scoring,
+                "report_generated": report_generated,
+                "conversation_stage": "analysis_completed",
+                "analysis_in_progress": False,
+                "agent_response": report_generated.model_dump_json(indent=2, exclude_none=True),
+            }
+
+    # 1. RAG Connector (sync vector search; keep it off the event loop)
+    report("stage", name="retrieval", status="started")
     rag_connector = RAGConnector()
-    rag_documents = rag_connector.get_risk_documents(user_input, conversation_history)
+    rag_documents = await asyncio.to_thread(rag_connector.get_risk_documents, user_input, conversation_history)
+    report("stage", name="retrieval", status="completed")
     extracted_info = rag_connector.extract_similar_cases_and_evidence(rag_documents)
     similar_cases = extracted_info["similar_cases"]
     evidence_sources = extracted_info["evidence_sources"]
-
-    user_profile = state.get("user_profile")
     
     # 2. Risk Engine
+    report("stage", name="risk_scoring", status="started")
     risk_engine = RiskEngine()
     risk_scoring = await risk_engine.evaluate_risk(
         agent_input, 
         rag_documents, 
         user_profile=user_profile,
-        extracted_data=state.get("extracted_data")
+        extracted_data=extracted_data,
+        similar_cases=similar_cases
     )
 
+    report("stage", name="risk_scoring", status="completed")
+
     # 3. Report Generator
     report_generator = ReportGenerator()
     report_generated = await report_generator.generate_report(
@@ -1092,8 +1495,13 @@ async def perform_full_analysis_node(state: RiskManagingGraphState) -> Dict[str,
         similar_cases=similar_cases,
         evidence_sources=evidence_sources,
         rag_documents=rag_documents,
-        user_profile=user_profile
+        user_profile=user_profile,
+        progress=progress,
     )
+    if reuse_reports:
+        await asyncio.to_thread(
+            SIMILAR_REPORTS.store, extracted_data, user_input, user_profile, report_generated, rag_documents
+        )
 
     return {
         "rag_documents": rag_documents,
@@ -1112,6 +1520,10 @@ def format_final_output_node(state: RiskManagingGraphState) -> Dict[str, Any]:
     agent_response_from_state = state.get("agent_response")
     final_metadata = {"status": "insufficient_info", "analysis_id": None}
 
+    if state.get("report_job_id") and not error_message:
+        # Report runs as a background job; keep the "generating" notice unwrapped.
+        return {"conversation_stage": "completed"}
+
     # Calculate max risk score for decision report
     max_risk_score = 0
     risk_scoring = state.get("risk_scoring")
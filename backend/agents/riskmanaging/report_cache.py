@@ -0,0 +1,144 @@
+# backend/agents/riskmanaging/report_cache.py
+
+"""
+Reuse of finished risk reports for near-identical cases.
+
+Onboarding users keep describing the same standard situations (shipment
+delay, B/L error, payment delay). After a full analysis the report is stored
+here together with an embedding of the case text: the normalized
+`extracted_data` (see `risk_scoring.fact_buckets`) plus the user's input.
+A new analysis first looks for a stored report
+
+- with the same fact buckets and user profile (so the reused scores still
+  apply to the facts and the text still fits the reader), and
+- whose case embedding has cosine similarity >= `threshold`.
+
+On a hit the agent keeps the cached scoring and report sections and only
+regenerates the user-specific input summary.
+"""
+
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from backend.agents.riskmanaging.risk_scoring import fact_buckets
+from backend.agents.riskmanaging.state import RiskReport
+from backend.utils.logger import get_logger
+from backend.utils.ttl_cache import TTLCache, stable_hash
+
+logger = get_logger(__name__)
+
+Embedder = Callable[[str], Optional[List[float]]]
+
+
+def case_text(extracted_data: Optional[Dict[str, Any]], user_input: str) -> str:
+    """Text embedded for similarity: normalized facts first, then the user's own words."""
+    buckets = fact_buckets(extracted_data)
+    facts = " ".join(f"{name}:{value}" for name, value in sorted(buckets.items()) if value is not None)
+    return f"{facts}\n{' '.join((user_input or '').split())[:500]}"
+
+
+def case_guard(extracted_data: Optional[Dict[str, Any]], user_profile: Optional[Dict[str, Any]]) -> str:
+    """Exact part of the match: fact buckets and user profile."""
+    return stable_hash(fact_buckets(extracted_data), user_profile or {})
+
+
+@dataclass
+class CachedReport:
+    guard: str
+    embedding: np.ndarray
+    report: RiskReport
+    rag_documents: List[Dict[str, Any]]
+
+
+class SimilarReportCache:
+    """
+    Finished reports searchable by case similarity.
+
+    Args:
+        embed: Text -> embedding (``backend.rag.embedder.get_embedding``).
+        threshold: Minimum cosine similarity for reuse.
+        ttl: Seconds a report stays reusable.
+        max_entries: Reports kept at once (least recently used are dropped).
+    """
+
+    def __init__(self, embed: Embedder, threshold: float = 0.9, ttl: float = 86400.0, max_entries: int = 256):
+        self.embed = embed
+        self.threshold = float(threshold)
+        self._entries = TTLCache(maxsize=max_entries, ttl=ttl)
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "stored": 0}
+
+    def _embedding(self, text: str) -> Optional[np.ndarray]:
+        vector = self.embed(text)
+        if not vector:
+            return None
+        array = np.asarray(vector, dtype=float)
+        length = np.linalg.norm(array)
+        return array / length if length > 0 else None
+
+    def lookup(
+        self,
+        extracted_data: Optional[Dict[str, Any]],
+        user_input: str,
+        user_profile: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Tuple[CachedReport, float]]:
+        """Best stored report for this case, or None. Blocking (embeds the case text)."""
+        guard = case_guard(extracted_data, user_profile)
+        candidates = [entry for _, entry in self._entries.items() if entry.guard == guard]
+        embedding = self._embedding(case_text(extracted_data, user_input)) if candidates else None
+        best: Optional[Tuple[CachedReport, float]] = None
+        if embedding is not None:
+            for entry in candidates:
+                if entry.embedding.shape != embedding.shape:
+                    continue
+                similarity = float(np.dot(entry.embedding, embedding))
+                if similarity >= self.threshold and (best is None or similarity > best[1]):
+                    best = (entry, similarity)
+        self.stats["hits" if best else "misses"] += 1
+        return best
+
+    def store(
+        self,
+        extracted_data: Optional[Dict[str, Any]],
+        user_input: str,
+        user_profile: Optional[Dict[str, Any]],
+        report: RiskReport,
+        rag_documents: List[Dict[str, Any]],
+    ) -> bool:
+        text = case_text(extracted_data, user_input)
+        embedding = self._embedding(text)
+        if embedding is None:
+            return False
+        guard = case_guard(extracted_data, user_profile)
+        self._entries.set(
+            stable_hash(guard, text),
+            CachedReport(guard=guard, embedding=embedding, report=report, rag_documents=rag_documents),
+        )
+        self.stats["stored"] += 1
+        return True
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def reuse_report(cached: RiskReport, input_summary: str) -> RiskReport:
+    """Copy of a cached report with a fresh id and the new user's summary."""
+    return cached.model_copy(deep=True, update={"analysis_id": str(uuid.uuid4()), "input_summary": input_summary})
+
+
+def _build_default_cache() -> SimilarReportCache:
+    from backend.config import get_settings
+    from backend.rag.embedder import get_embedding
+
+    settings = get_settings()
+    return SimilarReportCache(
+        embed=get_embedding,
+        threshold=getattr(settings, "risk_report_reuse_threshold", 0.9),
+        ttl=getattr(settings, "risk_report_reuse_ttl", 86400.0),
+        max_entries=getattr(settings, "risk_report_reuse_max_entries", 256),
+    )
+
+
+SIMILAR_REPORTS = _build_default_cache()
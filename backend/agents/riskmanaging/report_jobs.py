@@ -0,0 +1,224 @@
+# backend/agents/riskmanaging/report_jobs.py
+
+"""
+Background jobs for full risk analyses.
+
+A full analysis (RAG, scoring, four report sections) takes tens of seconds.
+In job mode `perform_full_analysis_node` submits it here and the chat turn
+answers at once with a job id. Jobs run as tasks on the server event loop,
+at most `max_concurrent` at a time; when `max_pending` jobs are already
+queued or running, `submit` returns None and the caller analyses inline.
+
+Every job keeps an ordered event log (status changes, pipeline stages,
+report sections) that clients poll (`GET /api/jobs/{id}`) or follow live
+(`GET /api/jobs/{id}/events`). Completion hooks, registered by the
+orchestrator, persist the finished report to the session before the
+terminal "done" event is published.
+"""
+
+import asyncio
+import contextvars
+import inspect
+import threading
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from backend.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+FINISHED_STATUSES = {JOB_SUCCEEDED, JOB_FAILED}
+
+Progress = Callable[..., None]
+
+
+@dataclass
+class ReportJob:
+    job_id: str
+    session_id: Optional[str]
+    status: str = JOB_QUEUED
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None  # normalized ChatResponse
+    error: Optional[str] = None
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    subscribers: List["asyncio.Queue[Dict[str, Any]]"] = field(default_factory=list, repr=False)
+    task: Optional["asyncio.Task"] = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "session_id": self.session_id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+            "events": list(self.events),
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class ReportJobManager:
+    """
+    Args:
+        max_concurrent: Analyses running at the same time.
+        max_pending: Jobs queued or running before `submit` refuses new ones.
+        ttl: Seconds a finished job stays queryable.
+        max_jobs: Jobs kept in memory (oldest finished ones are dropped first).
+    """
+
+    def __init__(self, max_concurrent: int = 2, max_pending: int = 32, ttl: float = 3600.0, max_jobs: int = 512):
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.max_pending = max(1, int(max_pending))
+        self.ttl = float(ttl)
+        self.max_jobs = max(1, int(max_jobs))
+        self.completion_hooks: List[Callable[[ReportJob], Any]] = []
+        self._jobs: "OrderedDict[str, ReportJob]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.stats = {"submitted": 0, "rejected": 0, "succeeded": 0, "failed": 0}
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.max_concurrent)
+                self._semaphores[loop] = semaphore
+            return semaphore
+
+    def pending(self) -> int:
+        with self._lock:
+            return sum(1 for job in self._jobs.values() if not job.finished)
+
+    def submit(
+        self,
+        session_id: Optional[str],
+        analysis: Callable[[Progress], Awaitable[Dict[str, Any]]],
+    ) -> Optional[ReportJob]:
+        """
+        Start `analysis(progress)` in the background; it returns the normalized
+        ChatResponse of the report. Must be called from a running event loop.
+        Returns None when `max_pending` jobs are already in flight.
+        """
+        if self.pending() >= self.max_pending:
+            self.stats["rejected"] += 1
+            logger.warning("Risk report job queue full (%s pending); analysing inline", self.max_pending)
+            return None
+
+        job = ReportJob(job_id=uuid.uuid4().hex, session_id=session_id)
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._prune()
+        self.stats["submitted"] += 1
+        self.publish(job, "status", status=JOB_QUEUED)
+        # Jobs outlive the request: run them outside its context (token sink etc.).
+        job.task = asyncio.get_running_loop().create_task(self._run(job, analysis), context=contextvars.Context())
+        logger.info("Risk report job %s queued for session %s", job.job_id, session_id)
+        return job
+
+    async def _run(self, job: ReportJob, analysis: Callable[[Progress], Awaitable[Dict[str, Any]]]) -> None:
+        try:
+            async with self._semaphore():
+                job.status = JOB_RUNNING
+                self.publish(job, "status", status=JOB_RUNNING)
+                job.result = await analysis(lambda event, **data: self.publish(job, event, **data))
+                job.status = JOB_SUCCEEDED
+        except asyncio.CancelledError:
+            job.status, job.error = JOB_FAILED, "cancelled"
+            raise
+        except Exception as e:
+            logger.warning("Risk report job %s failed: %s", job.job_id, e)
+            job.status, job.error = JOB_FAILED, str(e)
+        finally:
+            # runs on cancellation too: subscribers block until "done" arrives
+            job.finished_at = time.time()
+            self.stats[job.status] = self.stats.get(job.status, 0) + 1
+            await self._finish(job)
+
+    async def _finish(self, job: ReportJob) -> None:
+        """Run the completion hooks, then publish the terminal "done" event."""
+        try:
+            for hook in self.completion_hooks:
+                try:
+                    outcome = hook(job)
+                    if inspect.isawaitable(outcome):
+                        await outcome
+                except Exception as e:
+                    logger.warning("Risk report job %s completion hook failed: %s", job.job_id, e)
+        finally:
+            self.publish(job, "done", status=job.status, result=job.result, error=job.error)
+
+    def publish(self, job: ReportJob, event: str, **data: Any) -> None:
+        entry = {"event": event, "job_id": job.job_id, "at": time.time(), **data}
+        job.events.append(entry)
+        for queue in list(job.subscribers):
+            queue.put_nowait(entry)
+
+    def get(self, job_id: str) -> Optional[ReportJob]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is not None and job.finished and self._expired(job):
+            with self._lock:
+                self._jobs.pop(job_id, None)
+            return None
+        return job
+
+    async def subscribe(self, job_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """Past events of the job, then live ones, ending with "done"."""
+        job = self.get(job_id)
+        if job is None:
+            return
+        queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+        backlog = list(job.events)
+        job.subscribers.append(queue)
+        try:
+            for entry in backlog:
+                yield entry
+                if entry["event"] == "done":
+                    return
+            while True:
+                entry = await queue.get()
+                yield entry
+                if entry["event"] == "done":
+                    return
+        finally:
+            job.subscribers.remove(queue)
+
+    def _expired(self, job: ReportJob) -> bool:
+        return self.ttl > 0 and job.finished_at is not None and time.time() - job.finished_at > self.ttl
+
+    def _prune(self) -> None:
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.finished and self._expired(job)]:
+            del self._jobs[job_id]
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        while len(self._jobs) > self.max_jobs and finished:
+            del self._jobs[finished.pop(0)]
+
+
+def _build_default_manager() -> ReportJobManager:
+    from backend.config import get_settings
+
+    settings = get_settings()
+    return ReportJobManager(
+        max_concurrent=getattr(settings, "risk_report_job_workers", 2),
+        max_pending=getattr(settings, "risk_report_job_max_pending", 32),
+        ttl=getattr(settings, "risk_report_job_ttl", 3600.0),
+    )
+
+
+REPORT_JOBS = _build_default_manager()
@@ -0,0 +1,319 @@
+# backend/agents/riskmanaging/risk_scoring.py
+
+"""
+Deterministic risk scoring.
+
+`RiskEngine.evaluate_risk` used to ask the LLM for impact and likelihood of
+every `RISK_EVALUATION_ITEMS` factor. The numbers mostly follow from facts the
+slot filler already extracted (contract amount, penalty rate, delay days) and
+from the similar cases RAG returns, so they are computed here with fixed
+rules. `score_locally` also reports a confidence in [0, 1] that grows with the
+number of known inputs; the engine only falls back to LLM scoring when it is
+below `risk_local_scoring_min_confidence`.
+
+Reasoning and mitigation texts are templates; in "hybrid" mode the engine
+asks the LLM to rewrite them while keeping the scores fixed.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from backend.agents.riskmanaging.state import (
+    RISK_EVALUATION_ITEMS,
+    RISK_LEVEL_THRESHOLDS,
+    RiskFactor,
+    RiskScoring,
+)
+from backend.utils.ttl_cache import TTLCache, stable_hash
+
+# Rough conversion to KRW so amounts in different currencies share buckets.
+_KRW_PER_UNIT = {"KRW": 1.0, "USD": 1350.0, "EUR": 1450.0}
+_MULTIPLIERS = {"천만": 1e7, "백만": 1e6, "억": 1e8, "만": 1e4, "천": 1e3}
+_NUMBER = re.compile(r"\d+(?:,\d{3})*(?:\.\d+)?")
+_SUFFIX = re.compile(r"^\s*([kKmM])\b")
+# One unit group of a Korean amount; "1억 5천만원" is two of them.
+_UNIT_GROUP = re.compile(r"\s*(\d+(?:,\d{3})*(?:\.\d+)?)\s?(천만|백만|억|만|천)")
+_PERCENT = re.compile(r"(\d+(?:\.\d+)?)\s?%")
+_DAYS = re.compile(r"(\d+)\s?일")
+_COMPLIANCE = re.compile(
+    r"(통관|세관|관세|원산지|HS\s?코드|수출\s?허가|수입\s?허가|제재|규정|법규|인증|customs|sanction|regulation|license)",
+    re.IGNORECASE,
+)
+_RELATIONSHIP = re.compile(r"(클레임|claim|항의|거래\s?중단|신뢰|주요\s?고객|key\s?account)", re.IGNORECASE)
+_URGENT = re.compile(r"(긴급|급함|당장|오늘|내일|urgent|asap)", re.IGNORECASE)
+
+# (upper bound in KRW, bucket) — amounts at or above the last bound score 5.
+_AMOUNT_BUCKETS = ((1e7, 1), (5e7, 2), (2e8, 3), (1e9, 4))
+# (minimum days, bucket)
+_DELAY_BUCKETS = ((30, 5), (14, 4), (7, 3), (3, 2), (0, 1))
+# (minimum exposure in % of contract, bucket)
+_EXPOSURE_BUCKETS = ((10.0, 5), (5.0, 4), (2.0, 3), (0.0001, 2), (0.0, 1))
+
+_MITIGATIONS = {
+    "financial_loss": ["페널티 상한(cap) 조항 및 감면 가능성 확인", "손실 규모를 재무팀과 공유하고 충당 여부 결정"],
+    "delay": ["대체 선적/항공 전환 등 일정 만회 옵션 비교", "바이어에게 수정 일정 선제 통보"],
+    "relationship_risk": ["담당자 직접 연락으로 지연 사유와 대응책 설명", "재발 방지 계획을 서면으로 전달"],
+    "compliance_risk": ["관련 규정·계약 조항을 법무/관세사와 검토", "증빙 서류 보관 및 신고 기한 확인"],
+    "internal_blame_risk": ["사실관계와 대응 경과를 시간순으로 기록", "상급자에게 조기 보고하고 의사결정 근거 남기기"],
+}
+
+
+@dataclass
+class LocalScore:
+    """Scores computed without the LLM plus how much they can be trusted."""
+
+    scoring: RiskScoring
+    confidence: float
+    signals: Dict[str, Any] = field(default_factory=dict)
+
+
+def risk_level_for(score: int) -> str:
+    for level in ("critical", "high", "medium"):
+        if score >= RISK_LEVEL_THRESHOLDS[level]:
+            return level
+    return "low"
+
+
+def _clamp(value: int) -> int:
+    return max(1, min(5, int(value)))
+
+
+def parse_amount_krw(text: Optional[str]) -> Optional[float]:
+    """'5만 달러' / 'USD 100,000' / '3억원' / '1억 5천만원' -> approximate amount in KRW."""
+    if not text:
+        return None
+    match = _NUMBER.search(text)
+    if not match:
+        return None
+    value = float(match.group().replace(",", ""))
+    rest = text[match.end():]
+    suffix = _SUFFIX.match(rest)
+    if suffix:
+        value *= 1e3 if suffix.group(1).lower() == "k" else 1e6
+    else:
+        # Sum consecutive unit groups starting at the first number.
+        position, total = match.start(), 0.0
+        group = _UNIT_GROUP.match(text, position)
+        while group:
+            total += float(group.group(1).replace(",", "")) * _MULTIPLIERS[group.group(2)]
+            position = group.end()
+            group = _UNIT_GROUP.match(text, position)
+        if total:
+            value = total
+
+    upper = text.upper()
+    if any(token in upper for token in ("USD", "$", "달러", "불")):
+        currency = "USD"
+    elif any(token in upper for token in ("EUR", "€", "유로")):
+        currency = "EUR"
+    else:
+        currency = "KRW"
+    return value * _KRW_PER_UNIT[currency]
+
+
+def parse_penalty_rate(text: Optional[str]) -> Optional[float]:
+    """Daily penalty in % of the contract; 0.0 when there is no penalty clause."""
+    if not text:
+        return None
+    if text.strip() in ("없음", "없다", "none", "None"):
+        return 0.0
+    match = _PERCENT.search(text)
+    return float(match.group(1)) if match else None
+
+
+def parse_days(text: Any) -> Optional[int]:
+    if isinstance(text, (int, float)):
+        return int(text)
+    match = _DAYS.search(str(text or ""))
+    return int(match.group(1)) if match else None
+
+
+def _bucket(value: float, buckets) -> int:
+    for bound, bucket in buckets:
+        if value >= bound:
+            return bucket
+    return buckets[-1][1]
+
+
+def _amount_bucket(amount_krw: float) -> int:
+    for bound, bucket in _AMOUNT_BUCKETS:
+        if amount_krw < bound:
+            return bucket
+    return 5
+
+
+def _factor(key: str, impact: int, likelihood: int, reasons: List[str]) -> RiskFactor:
+    impact, likelihood = _clamp(impact), _clamp(likelihood)
+    score = impact * likelihood
+    return RiskFactor(
+        name=RISK_EVALUATION_ITEMS[key]["name"],
+        impact=impact,
+        likelihood=likelihood,
+        risk_score=score,
+        risk_level=risk_level_for(score),
+        reasoning=" / ".join(reasons) if reasons else "확인된 정보가 적어 통상적인 무역 관행 기준으로 평가",
+        mitigation_suggestions=list(_MITIGATIONS[key]),
+    )
+
+
+def fact_buckets(extracted_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Extracted facts reduced to the buckets the scores depend on (None = unknown)."""
+    data = extracted_data or {}
+    amount = parse_amount_krw(data.get("contract_amount"))
+    loss = parse_amount_krw(data.get("loss_estimate"))
+    rate = parse_penalty_rate(data.get("penalty_info"))
+    days = parse_days(data.get("delay_days"))
+    return {
+        "situation_type": data.get("situation_type"),
+        "amount": _amount_bucket(amount) if amount is not None else None,
+        "loss": _amount_bucket(loss) if loss is not None else None,
+        "penalty": rate if rate is None else rate > 0,
+        "exposure": _bucket(rate * days, _EXPOSURE_BUCKETS) if rate is not None and days is not None else None,
+        "delay": _bucket(days, _DELAY_BUCKETS) if days is not None else None,
+    }
+
+
+def score_locally(
+    extracted_data: Optional[Dict[str, Any]],
+    similar_cases: Optional[List[Dict[str, Any]]] = None,
+    user_input: str = "",
+) -> LocalScore:
+    """
+    Score every `RISK_EVALUATION_ITEMS` factor from extracted facts.
+
+    Args:
+        extracted_data: Slots gathered during the conversation.
+        similar_cases: Cases from `RAGConnector.extract_similar_cases_and_evidence`.
+        user_input: Latest user turn (keyword signals only).
+    """
+    data = extracted_data or {}
+    cases = similar_cases or []
+    text = " ".join([user_input or "", str(data.get("delay_risk") or ""), str(data.get("situation_type") or "")])
+
+    amount = parse_amount_krw(data.get("contract_amount"))
+    loss = parse_amount_krw(data.get("loss_estimate"))
+    rate = parse_penalty_rate(data.get("penalty_info"))
+    days = parse_days(data.get("delay_days"))
+    claim_cases = sum(1 for case in cases if "claim" in str(case.get("category", "")).lower())
+    compliance = bool(_COMPLIANCE.search(text)) or any(
+        str(case.get("category", "")).lower() in ("country_rules", "customs") for case in cases
+    )
+    relationship = bool(_RELATIONSHIP.search(text)) or claim_cases > 0
+    urgent = bool(_URGENT.search(text)) or str(data.get("urgency_level", "")).lower() in ("high", "높음", "긴급")
+
+    exposure = rate * days if rate is not None and days is not None else None
+    delay_bucket = _bucket(days, _DELAY_BUCKETS) if days is not None else 3
+
+    # Financial loss: the largest of contract size, penalty exposure, stated loss.
+    financial_reasons = []
+    financial_impacts = []
+    if amount is not None:
+        financial_impacts.append(_amount_bucket(amount))
+        financial_reasons.append(f"계약 금액 {data['contract_amount']}")
+    if exposure is not None:
+        financial_impacts.append(_bucket(exposure, _EXPOSURE_BUCKETS))
+        financial_reasons.append(f"페널티 노출 약 {exposure:g}% (일당 {rate:g}% × {days}일)")
+    elif rate == 0.0:
+        financial_reasons.append("페널티 조항 없음")
+    if loss is not None:
+        financial_impacts.append(_amount_bucket(loss))
+        financial_reasons.append(f"예상 손실 {data['loss_estimate']}")
+    financial_impact = max(financial_impacts) if financial_impacts else 3
+    financial_likelihood = 4 if (rate or 0) > 0 and days else 3 if days else 2
+    if rate == 0.0:
+        financial_likelihood -= 1
+
+    delay_reasons = [f"지연 {days}일"] if days is not None else []
+    delay_likelihood = 4 if days is not None or "지연" in text else 3
+    if urgent:
+        delay_likelihood += 1
+        delay_reasons.append("긴급 상황")
+
+    relationship_reasons = []
+    if claim_cases:
+        relationship_reasons.append(f"유사 클레임 사례 {claim_cases}건")
+    if relationship:
+        relationship_reasons.append("거래처 관계 악화 신호")
+    relationship_impact = 2 + (1 if relationship else 0) + (1 if delay_bucket >= 4 else 0)
+    relationship_likelihood = 2 + (1 if days else 0) + (1 if (rate or 0) > 0 else 0)
+
+    compliance_reasons = ["규정/통관 관련 이슈 언급"] if compliance else []
+    compliance_impact, compliance_likelihood = (4, 3) if compliance else (2, 1)
+
+    blame_reasons = []
+    if financial_impact >= 4:
+        blame_reasons.append("손실 규모가 커 내부 보고 대상")
+    if days is not None and days >= 7:
+        blame_reasons.append("1주 이상 지연으로 경위 설명 요구 가능성")
+    blame_impact = max(2, financial_impact - 1)
+    blame_likelihood = 3 if days is not None and days >= 7 else 2
+
+    factors = [
+        _factor("financial_loss", financial_impact, financial_likelihood, financial_reasons),
+        _factor("delay", delay_bucket, delay_likelihood, delay_reasons),
+        _factor("relationship_risk", relationship_impact, relationship_likelihood, relationship_reasons),
+        _factor("compliance_risk", compliance_impact, compliance_likelihood, compliance_reasons),
+        _factor("internal_blame_risk", blame_impact, blame_likelihood, blame_reasons),
+    ]
+
+    top = max(factors, key=lambda factor: factor.risk_score)
+    overall = top.risk_level
+    scoring = RiskScoring(
+        overall_risk_level=overall,
+        risk_factors=factors,
+        overall_assessment=f"전반적 리스크 수준은 {overall}입니다. 가장 큰 요인은 '{top.name}'({top.risk_score}점)입니다.",
+    )
+
+    known = [amount is not None, rate is not None, days is not None]
+    confidence = 0.3 + 0.15 * sum(known) + (0.1 if loss is not None else 0.0) + 0.05 * min(len(cases), 3)
+    signals = {
+        "amount_krw": amount,
+        "loss_krw": loss,
+        "penalty_rate": rate,
+        "delay_days": days,
+        "similar_cases": len(cases),
+        "claim_cases": claim_cases,
+        "compliance": compliance,
+    }
+    return LocalScore(scoring=scoring, confidence=round(min(1.0, confidence), 2), signals=signals)
+
+
+def merge_reasoning(local: RiskScoring, llm_data: Dict[str, Any]) -> RiskScoring:
+    """Take reasoning/mitigation texts from the LLM, keep the local numbers."""
+    texts = {item.get("name"): item for item in llm_data.get("risk_factors", []) if isinstance(item, dict)}
+    factors = []
+    for factor in local.risk_factors:
+        text = texts.get(factor.name, {})
+        mitigations = text.get("mitigation_suggestions")
+        factors.append(factor.model_copy(update={
+            "reasoning": text.get("reasoning") or factor.reasoning,
+            "mitigation_suggestions": mitigations if isinstance(mitigations, list) and mitigations
+            else factor.mitigation_suggestions,
+        }))
+    return RiskScoring(
+        overall_risk_level=local.overall_risk_level,
+        risk_factors=factors,
+        overall_assessment=llm_data.get("overall_assessment") or local.overall_assessment,
+    )
+
+
+def scoring_cache_key(
+    extracted_data: Optional[Dict[str, Any]],
+    user_profile: Optional[Dict[str, Any]] = None,
+    mode: str = "hybrid",
+) -> str:
+    return stable_hash("risk_scoring", mode, extracted_data or {}, user_profile or {})
+
+
+def _build_default_cache() -> TTLCache:
+    from backend.config import get_settings
+
+    settings = get_settings()
+    return TTLCache(
+        maxsize=getattr(settings, "risk_score_cache_size", 512),
+        ttl=getattr(settings, "risk_score_cache_ttl", 3600.0),
+    )
+
+
+RISK_SCORE_CACHE = _build_default_cache()
@@ -0,0 +1,246 @@
+# backend/agents/riskmanaging/slot_filling.py
+
+"""
+Deterministic slot filling for the risk conversation.
+
+`assess_conversation_progress_node` used to call the assessment LLM on every
+turn just to learn which facts were still missing. This module extracts the
+assessment slots (`contract_amount`, `penalty_info`, `loss_estimate`,
+`delay_days`, `delay_risk`) with regexes and a small lexicon, merges them into
+`extracted_data`, and decides whether the turn needs the LLM at all:
+
+- "ask": required slots are clearly missing and the user only stated facts;
+  the follow-up questions are produced locally
+- "llm": everything else (all required slots present, a report request or
+  approval, a question about criteria, ...) goes to the assessment LLM
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from backend.agents.riskmanaging.tools import extract_risk_information_text
+from backend.utils.incremental_scan import scan_new_turns
+
+REQUIRED_SLOTS = ("contract_amount", "penalty_info", "delay_days")
+
+SLOT_LABELS = {
+    "contract_amount": "계약 금액",
+    "penalty_info": "페널티",
+    "loss_estimate": "예상 손실",
+    "delay_days": "지연 일수",
+    "delay_risk": "지연 리스크",
+}
+
+FOLLOW_UP_QUESTIONS = {
+    "contract_amount": "계약(주문) 금액은 얼마인가요? 통화도 함께 알려주세요.",
+    "penalty_info": "계약서에 지연 페널티(지체상금/위약금) 조항이 있나요? 있다면 비율이나 금액은요?",
+    "delay_days": "예상 지연 기간은 며칠인가요?",
+}
+
+_NUMBER = r"\d+(?:,\d{3})*(?:\.\d+)?"
+# Lower unit groups of a compound Korean amount: the "5천만" of "1억 5천만원"
+_UNIT_TAIL = rf"(?:\s?{_NUMBER}\s?(?:천만|백만|만))*"
+_AMOUNT = re.compile(
+    rf"(?:(?:USD|US\$|\$|KRW|EUR|€|₩)\s?{_NUMBER}(?:\s?(?:억|만|천|[kKmM]){_UNIT_TAIL})?"
+    rf"|{_NUMBER}\s?(?:(?:억|천만|백만|만|천){_UNIT_TAIL})?\s?(?:달러|원|불|유로|USD|KRW|EUR)"
+    rf"|{_NUMBER}\s?(?:억|천만|백만|만){_UNIT_TAIL})"
+)
+_CONTRACT_CONTEXT = re.compile(r"(계약|주문|오더|order|발주|거래|인보이스|invoice|대금|물품|금액)", re.IGNORECASE)
+_LOSS_CONTEXT = re.compile(r"(손실|손해|피해|loss)", re.IGNORECASE)
+_PENALTY_CONTEXT = re.compile(r"(페널티|패널티|penalty|위약금|지체상금|지연\s*배상|LD\b|liquidated)", re.IGNORECASE)
+_PENALTY_NONE = re.compile(
+    r"(페널티|패널티|penalty|위약금|지체상금)\S*\s*(?:조항\S*\s*)?(?:은|는|이|가)?\s*(없|없음|없어|없습니다|none|no)",
+    re.IGNORECASE,
+)
+_PERCENT = re.compile(r"\d+(?:\.\d+)?\s?%")
+_DAYS_NEAR_DELAY = (
+    re.compile(r"(\d+)\s?(일|주|주일|개월|days?|weeks?)\s*(?:정도|가량|쯤|이상)?\s*(?:이\s*)?(?:지연|늦|밀|delay|late)", re.IGNORECASE),
+    re.compile(r"(?:지연|delay|늦어|밀려)\D{0,12}?(\d+)\s?(일|주|주일|개월|days?|weeks?)", re.IGNORECASE),
+)
+_DELAY_CONTEXT = re.compile(r"(지연|늦어|늦게|밀려|delay|late)", re.IGNORECASE)
+_REPORT_REQUEST = re.compile(r"(보고서|리포트|report|정리해|출력해|만들어|작성해)", re.IGNORECASE)
+_APPROVAL = re.compile(r"^\s*(응|네|예|넵|좋아|좋습니다|ok|okay|오케이|진행|그래|부탁)", re.IGNORECASE)
+_QUESTION = re.compile(r"(\?|？|기준|어떻게|왜|뭐야|무엇|설명해|알려줘|궁금|(?:나요|까요|가요|습니까)\s*$)")
+# Commas between digits are thousands separators ("USD 120,000"), not clause breaks.
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?。\n])\s+|(?:(?<!\d),|,(?!\d))\s*")
+
+
+@dataclass
+class SlotCheck:
+    """Outcome of the local pre-check for one turn."""
+
+    decision: str  # "ask" | "llm"
+    extracted_data: Dict[str, Any]
+    missing_slots: List[str] = field(default_factory=list)
+    follow_up_questions: List[str] = field(default_factory=list)
+    message: str = ""
+
+
+def _clip(text: str, limit: int = 80) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+def _normalize_days(value: str, unit: str) -> str:
+    number = int(value)
+    unit = unit.lower()
+    if unit.startswith(("주", "week")):
+        number *= 7
+    elif unit.startswith("개월"):
+        number *= 30
+    return f"{number}일"
+
+
+def _extract_delay_days(text: str) -> Optional[str]:
+    for pattern in _DAYS_NEAR_DELAY:
+        match = pattern.search(text)
+        if match:
+            return _normalize_days(match.group(1), match.group(2))
+    return None
+
+
+def _context_candidates(before: str, after: str) -> List[str]:
+    """
+    Slots whose context keyword appears around an amount, nearest first.
+    Korean puts the label before the value, so keywords after the amount
+    count as slightly farther away.
+    """
+    ranked = []
+    for slot, pattern in (
+        ("penalty_info", _PENALTY_CONTEXT),
+        ("loss_estimate", _LOSS_CONTEXT),
+        ("contract_amount", _CONTRACT_CONTEXT),
+    ):
+        distances = [len(before) - match.end() for match in pattern.finditer(before)]
+        distances += [match.start() + 5 for match in pattern.finditer(after)]
+        if distances:
+            ranked.append((min(distances), slot))
+    return [slot for _, slot in sorted(ranked)]
+
+
+def _classify_amounts(text: str, slots: Dict[str, Any]) -> None:
+    for match in _AMOUNT.finditer(text):
+        candidates = _context_candidates(
+            text[max(0, match.start() - 20): match.start()],
+            text[match.end(): match.end() + 12],
+        )
+        for slot in candidates:
+            if slot not in slots:
+                slots[slot] = match.group(0).strip()
+                break
+
+
+def _extract_penalty(text: str) -> Optional[str]:
+    if _PENALTY_NONE.search(text):
+        return "없음"
+    for sentence in _SENTENCE_SPLIT.split(text):
+        if _PENALTY_CONTEXT.search(sentence) and (_PERCENT.search(sentence) or _AMOUNT.search(sentence)):
+            return _clip(sentence)
+    return None
+
+
+def extract_risk_slots(text: str) -> Dict[str, Any]:
+    """Slots found in `text`; absent slots are simply not returned."""
+    slots: Dict[str, Any] = {}
+    if not text or not text.strip():
+        return slots
+
+    penalty = _extract_penalty(text)
+    if penalty:
+        slots["penalty_info"] = penalty
+    _classify_amounts(text, slots)
+
+    delay_days = _extract_delay_days(text)
+    if delay_days:
+        slots["delay_days"] = delay_days
+    if _DELAY_CONTEXT.search(text):
+        for sentence in _SENTENCE_SPLIT.split(text):
+            if _DELAY_CONTEXT.search(sentence):
+                slots["delay_risk"] = _clip(sentence)
+                break
+
+    info = extract_risk_information_text(text)
+    if info.get("situation_type") not in (None, "", "unknown"):
+        slots["situation_type"] = info["situation_type"]
+    if info.get("urgency_level") == "high":
+        slots["urgency_level"] = "high"
+    return slots
+
+
+def merge_slots(base: Optional[Dict[str, Any]], update: Dict[str, Any]) -> Dict[str, Any]:
+    """Same merge rule as the LLM path: non-empty new values win."""
+    merged = dict(base or {})
+    for key, value in update.items():
+        if value is not None and value != "":
+            merged[key] = value
+    return merged
+
+
+def missing_required_slots(extracted_data: Dict[str, Any], required: Iterable[str] = REQUIRED_SLOTS) -> List[str]:
+    return [slot for slot in required if not extracted_data.get(slot)]
+
+
+def needs_llm(user_input: str) -> bool:
+    """Turns the local layer must not answer on its own."""
+    return bool(
+        _REPORT_REQUEST.search(user_input)
+        or _APPROVAL.search(user_input)
+        or _QUESTION.search(user_input)
+    )
+
+
+def _empty_slots() -> Dict[str, Any]:
+    return {}
+
+
+def _fold_user_turn(facts: Dict[str, Any], turn: Dict[str, Any]) -> Dict[str, Any]:
+    if str(turn.get("role", "")).strip().lower() not in {"user", "human"}:
+        return facts
+    return merge_slots(facts, extract_risk_slots(str(turn.get("content", ""))))
+
+
+def scan_history_slots(
+    cache: Optional[Dict[str, Any]],
+    conversation_history: Optional[List[Dict[str, str]]],
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Slots from the user turns of the history, scanning only turns appended
+    since `cache` was produced. Returns (new_cache, slots).
+    """
+    new_cache, _ = scan_new_turns(cache, conversation_history or [], _fold_user_turn, _empty_slots)
+    return new_cache, new_cache["facts"]
+
+
+def precheck_turn(
+    user_input: str,
+    extracted_data: Optional[Dict[str, Any]],
+    history_slots: Optional[Dict[str, Any]] = None,
+) -> SlotCheck:
+    """
+    Update `extracted_data` from the current turn and decide whether the
+    assessment LLM is needed.
+
+    `history_slots` (from `scan_history_slots`) fills gaps from earlier user
+    messages, e.g. when the situation was described before the orchestrator
+    routed to the risk agent. Values already in `extracted_data` and values
+    from the current turn take precedence.
+    """
+    merged = merge_slots(history_slots or {}, extracted_data or {})
+    merged = merge_slots(merged, extract_risk_slots(user_input or ""))
+    missing = missing_required_slots(merged)
+
+    if not missing or needs_llm(user_input or ""):
+        return SlotCheck(decision="llm", extracted_data=merged, missing_slots=missing)
+
+    known = [f"{SLOT_LABELS[key]}: {merged[key]}" for key in REQUIRED_SLOTS if merged.get(key)]
+    message = "리스크를 판단하려면 몇 가지가 더 필요합니다."
+    if known:
+        message = f"지금까지 파악된 내용 - {' / '.join(known)}. " + message
+    return SlotCheck(
+        decision="ask",
+        extracted_data=merged,
+        missing_slots=missing,
+        follow_up_questions=[FOLLOW_UP_QUESTIONS[slot] for slot in missing],
+        message=message,
+    )
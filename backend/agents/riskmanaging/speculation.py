@@ -0,0 +1,161 @@
+# backend/agents/riskmanaging/speculation.py
+
+"""
+Speculative risk report precomputation.
+
+In collaborative mode the assessment can report `status == "sufficient"` one
+turn before the user approves the report. The risk agent starts the full
+analysis (RAG, RiskEngine, ReportGenerator) in the background at that point
+and parks the task here, keyed by session and by a hash of the inputs that
+drive the analysis (`extracted_data` and `user_profile`). When the approval
+turn reaches `perform_full_analysis_node`, a matching entry is served (awaited
+if still running); an entry whose hash no longer matches is cancelled and the
+analysis runs normally.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from backend.utils.logger import get_logger
+from backend.utils.ttl_cache import stable_hash
+
+logger = get_logger(__name__)
+
+
+def speculation_key(extracted_data: Optional[Dict[str, Any]], user_profile: Optional[Dict[str, Any]] = None) -> str:
+    """Stable hash of the inputs a speculative report depends on."""
+    return stable_hash({"extracted_data": extracted_data or {}, "user_profile": user_profile or {}})
+
+
+@dataclass
+class _Speculation:
+    key: str
+    task: "asyncio.Task[Dict[str, Any]]"
+    started_at: float
+
+
+class SpeculativeReportCache:
+    """
+    Per-session background analysis tasks.
+
+    Args:
+        ttl: Seconds a speculative result stays usable.
+        max_sessions: Sessions tracked at once; the oldest entry is cancelled
+            when the bound is exceeded.
+    """
+
+    def __init__(self, ttl: float = 600.0, max_sessions: int = 256):
+        self.ttl = float(ttl)
+        self.max_sessions = max(1, int(max_sessions))
+        self._entries: "OrderedDict[str, _Speculation]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"started": 0, "hits": 0, "discarded": 0, "failed": 0}
+
+    def start(
+        self,
+        session_id: str,
+        key: str,
+        analysis: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> bool:
+        """
+        Start `analysis()` in the background unless the same inputs are
+        already being speculated for this session. Must be called from a
+        running event loop. Returns True when a new task was started.
+        """
+        with self._lock:
+            current = self._entries.get(session_id)
+            if current is not None and current.key == key and not self._expired(current):
+                return False
+
+        # The speculation outlives this turn: run it outside the request's context (deadline, token sink).
+        task = asyncio.get_running_loop().create_task(analysis(), context=contextvars.Context())
+        task.add_done_callback(self._log_failure)
+        evicted = []
+        with self._lock:
+            previous = self._entries.pop(session_id, None)
+            if previous is not None:
+                evicted.append(previous)
+            self._entries[session_id] = _Speculation(key=key, task=task, started_at=time.monotonic())
+            while len(self._entries) > self.max_sessions:
+                evicted.append(self._entries.popitem(last=False)[1])
+            self.stats["started"] += 1
+
+        for entry in evicted:
+            self._cancel(entry)
+        logger.info("Speculative risk report started: session=%s", session_id)
+        return True
+
+    async def take(self, session_id: str, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the speculative result for matching inputs (awaiting it if it
+        is still running), or None. The entry is consumed either way.
+        """
+        with self._lock:
+            entry = self._entries.pop(session_id, None)
+        if entry is None:
+            return None
+
+        if entry.key != key or self._expired(entry) or entry.task.get_loop() is not asyncio.get_running_loop():
+            self._cancel(entry)
+            return None
+
+        try:
+            result = await entry.task
+        except asyncio.CancelledError:
+            if entry.task.cancelled():
+                return None
+            raise
+        except Exception:
+            return None
+
+        self.stats["hits"] += 1
+        logger.info(
+            "Speculative risk report served: session=%s age=%.2fs",
+            session_id,
+            time.monotonic() - entry.started_at,
+        )
+        return result
+
+    def discard(self, session_id: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(session_id, None)
+        if entry is not None:
+            self._cancel(entry)
+
+    def __contains__(self, session_id: str) -> bool:
+        with self._lock:
+            return session_id in self._entries
+
+    def _expired(self, entry: _Speculation) -> bool:
+        return self.ttl > 0 and time.monotonic() - entry.started_at > self.ttl
+
+    def _cancel(self, entry: _Speculation) -> None:
+        self.stats["discarded"] += 1
+        if not entry.task.done():
+            entry.task.cancel()
+
+    def _log_failure(self, task: "asyncio.Task") -> None:
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self.stats["failed"] += 1
+            logger.warning("Speculative risk report failed: %s", error)
+
+
+def _build_default_cache() -> SpeculativeReportCache:
+    from backend.config import get_settings
+
+    settings = get_settings()
+    return SpeculativeReportCache(
+        ttl=getattr(settings, "risk_speculative_report_ttl", 600.0),
+        max_sessions=getattr(settings, "risk_speculative_report_max_sessions", 256),
+    )
+
+
+SPECULATIVE_REPORTS = _build_default_cache()
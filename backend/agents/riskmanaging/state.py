@@ -111,6 +111,7 @@ class RiskManagingGraphState(TypedDict):
     report_requested: bool  # Whether user has explicitly requested or approved report generation
     conversation_stage: str  # Current stage of conversation
     extracted_data: Dict[str, Any]  # Data extracted from conversation
+    extraction_cache: Optional[Dict[str, Any]]  # Incremental slot scan of history + turn cursor (agent_specific_state)
     user_profile: Optional[Dict[str, Any]]  # User persona information
     
     # RAG results
@@ -121,6 +122,7 @@ class RiskManagingGraphState(TypedDict):
     
     # Final report
     report_generated: Optional[RiskReport]  # Generated risk report
+    report_job_id: Optional[str]  # Background report job started this turn (report_jobs.REPORT_JOBS)
     
     # Output
     agent_response: str  # Final response to user
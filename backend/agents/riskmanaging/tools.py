@@ -10,6 +10,7 @@ Tools exposed for risk analysis workflow:
 """
 
 import json
+import re
 from typing import List, Dict, Any, Optional
 from langchain.tools import tool
 from backend.rag.retriever import search as rag_search
@@ -304,8 +305,11 @@ def extract_risk_information(conversation_text: str) -> Dict[str, Any]:
         >>> print(info['situation_type'])
         "선적 지연"
     """
-    import re
+    return extract_risk_information_text(conversation_text)
 
+
+def extract_risk_information_text(conversation_text: str) -> Dict[str, Any]:
+    """Plain-function form of `extract_risk_information` for in-process callers."""
     try:
         extracted = {
             "situation_type": "unknown",
@@ -435,6 +439,7 @@ __all__ = [
     "search_risk_cases",
     "evaluate_risk_factors",
     "extract_risk_information",
+    "extract_risk_information_text",
     "generate_prevention_strategies",
     "RAG_DATASETS"
 ]
@@ -1,20 +1,35 @@
 """
 API Routes
 """
-from fastapi import APIRouter
+import asyncio
+import json
+from fastapi import APIRouter, BackgroundTasks, Header, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator, Awaitable
 
 from backend.schemas.agent_response import ChatResponse # Import the new ChatResponse schema
 from backend.agents.orchestrator.graph import orchestrator_graph # Import the orchestrator graph
 from backend.agents.orchestrator.state import OrchestratorGraphState # Import the state definition
+from backend.agents.orchestrator.nodes import fold_conversation_history
+from backend.agents.riskmanaging.report_jobs import REPORT_JOBS
+from backend.api.single_flight import CHAT_SINGLE_FLIGHT, request_key
+from backend.config import get_settings
 from backend.core.response_converter import normalize_response
+from backend.infrastructure.llm_admission import LLM_ADMISSION, AdmissionRejected
+from backend.infrastructure.llm_streaming import TokenSink, stream_tokens_to
+from backend.infrastructure.request_deadline import DeadlineExceeded, remaining, request_deadline
+from backend.utils.logger import get_logger
 
 router = APIRouter()
+logger = get_logger(__name__)
 
 # Compile the orchestrator graph globally
 compiled_orchestrator_app = orchestrator_graph.compile()
 
+# How often a running turn checks whether its client is still connected
+_DISCONNECT_POLL_SECONDS = 0.5
+
 
 class ChatRequest(BaseModel):
     """Chat request model"""
@@ -23,13 +38,8 @@ class ChatRequest(BaseModel):
     context: Optional[Dict[str, Any]] = None
 
 
-@router.post("/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest):
-    """
-    Main chat endpoint - routes to appropriate agent based on intent
-    """
-    # Initial state for the graph
-    initial_state: OrchestratorGraphState = {
+def _initial_state(request: ChatRequest) -> OrchestratorGraphState:
+    return {
         "session_id": request.session_id,
         "user_input": request.message,
         "context": request.context if request.context is not None else {},
@@ -40,10 +50,9 @@ async def chat(request: ChatRequest):
         "llm_intent_classification": None,
         "selected_agent_name": None
     }
-    
-    # Invoke the compiled graph
-    orchestrator_result = await compiled_orchestrator_app.ainvoke(initial_state)
-    
+
+
+def _to_chat_response(orchestrator_result: Any) -> ChatResponse:
     # The orchestrator_result is the final output of the graph (normalize_response_node)
     if (
         isinstance(orchestrator_result, dict)
@@ -60,3 +69,212 @@ async def chat(request: ChatRequest):
         else orchestrator_result
     )
     return ChatResponse(**normalized)
+
+
+class _ClientDisconnected(Exception):
+    pass
+
+
+def _overloaded(retry_after: int) -> HTTPException:
+    return HTTPException(
+        status_code=429,
+        detail="요청이 많아 잠시 후 다시 시도해 주세요.",
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
+def _reject_if_overloaded() -> None:
+    """Fail fast while the LLM wait queue is full instead of queueing another turn."""
+    if LLM_ADMISSION.saturated():
+        raise _overloaded(LLM_ADMISSION.retry_after())
+
+
+async def _await_turn(http_request: Request, turn: Awaitable[Any]) -> Any:
+    """
+    Await a graph run, cancelling it (and every LLM call in flight) when the
+    request deadline passes or the client disconnects.
+    """
+    task = asyncio.ensure_future(turn)
+    try:
+        while True:
+            left = remaining()
+            wait = _DISCONNECT_POLL_SECONDS if left is None else max(0.0, min(_DISCONNECT_POLL_SECONDS, left))
+            done, _ = await asyncio.wait({task}, timeout=wait)
+            if done:
+                return task.result()
+            left = remaining()
+            if left is not None and left <= 0:
+                raise DeadlineExceeded("request deadline exceeded")
+            if await http_request.is_disconnected():
+                raise _ClientDisconnected()
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+@router.post("/chat", response_model=ChatResponse)
+async def chat(
+    request: ChatRequest,
+    background_tasks: BackgroundTasks,
+    http_request: Request,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
+):
+    """
+    Main chat endpoint - routes to appropriate agent based on intent
+
+    Retries with the same `Idempotency-Key` get the first request's response
+    without running the turn again; without a key, only a duplicate that
+    arrives while the first is still running shares its execution.
+    The turn runs under a deadline of `request_timeout` seconds and is
+    cancelled when it passes (504) or when the client disconnects. While
+    the LLM wait queue is full the request is refused with 429 and
+    Retry-After.
+    """
+    key = request_key(request.session_id, request.message, request.context, idempotency_key)
+    if not CHAT_SINGLE_FLIGHT.is_known(key):  # replays and joined retries need no LLM capacity
+        _reject_if_overloaded()
+    fold_pending = []
+
+    async def execute() -> ChatResponse:
+        # Invoke the compiled graph
+        orchestrator_result = await compiled_orchestrator_app.ainvoke(_initial_state(request))
+        if isinstance(orchestrator_result, dict) and orchestrator_result.get("history_fold_pending"):
+            fold_pending.append(True)
+        return _to_chat_response(orchestrator_result)
+
+    try:
+        with request_deadline(get_settings().request_timeout):
+            response = await _await_turn(http_request, CHAT_SINGLE_FLIGHT.run(key, request.session_id, execute))
+    except asyncio.TimeoutError:  # DeadlineExceeded, or an LLM call that ran out of budget
+        logger.warning("Chat turn exceeded its deadline: session=%s", request.session_id)
+        raise HTTPException(status_code=504, detail="요청 처리 시간이 초과되었습니다.")
+    except _ClientDisconnected:
+        logger.info("Client disconnected; chat turn cancelled: session=%s", request.session_id)
+        return Response(status_code=499)
+    except AdmissionRejected as e:  # the LLM queue filled up while the turn was running
+        logger.warning("Chat turn rejected by LLM admission: session=%s", request.session_id)
+        raise _overloaded(e.retry_after)
+
+    # Summarize trimmed history after the response has been sent.
+    if fold_pending:
+        background_tasks.add_task(
+            fold_conversation_history, request.session_id, serialized=CHAT_SINGLE_FLIGHT.serialized
+        )
+
+    return response
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.post("/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """
+    Streaming variant of /chat (Server-Sent Events).
+
+    Events, in order:
+    - `start`: sent immediately
+    - `token`: `{"source": agent, "text": delta}` for every LLM content delta
+      (default chat text, raw email/quiz JSON output)
+    - `done`: the normalized ChatResponse, after the session has been saved
+    - `error`: `{"message": ...}` if the graph failed
+    """
+    _reject_if_overloaded()
+
+    async def events() -> AsyncIterator[str]:
+        sink = TokenSink()
+        request_timeout = get_settings().request_timeout
+        with stream_tokens_to(sink), request_deadline(request_timeout):
+            run = asyncio.ensure_future(
+                asyncio.wait_for(
+                    CHAT_SINGLE_FLIGHT.serialized(
+                        request.session_id, lambda: compiled_orchestrator_app.ainvoke(_initial_state(request))
+                    ),
+                    timeout=request_timeout if request_timeout > 0 else None,
+                )
+            )
+        yield _sse("start", {"session_id": request.session_id})
+
+        try:
+            while True:
+                next_event = asyncio.ensure_future(sink.queue.get())
+                await asyncio.wait({run, next_event}, return_when=asyncio.FIRST_COMPLETED)
+                if not next_event.done():
+                    next_event.cancel()
+                    break
+                item = next_event.result()
+                yield _sse(item.pop("event"), item)
+            while not sink.queue.empty():
+                item = sink.queue.get_nowait()
+                yield _sse(item.pop("event"), item)
+
+            orchestrator_result = run.result()
+        except asyncio.TimeoutError:
+            logger.warning("Streaming chat exceeded its deadline: session=%s", request.session_id)
+            yield _sse("error", {"message": "요청 처리 시간이 초과되었습니다."})
+            return
+        except AdmissionRejected as e:
+            yield _sse("error", {"message": "요청이 많아 잠시 후 다시 시도해 주세요.", "retry_after": e.retry_after})
+            return
+        except Exception as e:
+            logger.exception("Streaming chat failed: session=%s", request.session_id)
+            yield _sse("error", {"message": str(e)})
+            return
+        finally:
+            if not run.done():  # client went away mid-stream
+                run.cancel()
+
+        yield _sse("done", _to_chat_response(orchestrator_result).model_dump(mode="json"))
+
+        if isinstance(orchestrator_result, dict) and orchestrator_result.get("history_fold_pending"):
+            await fold_conversation_history(request.session_id, serialized=CHAT_SINGLE_FLIGHT.serialized)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/jobs/{job_id}")
+async def get_report_job(job_id: str):
+    """
+    Snapshot of a background risk report job: status (queued, running,
+    succeeded, failed), progress events so far and, once succeeded, the
+    report as a ChatResponse in `result`.
+    """
+    job = REPORT_JOBS.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.snapshot()
+
+
+@router.get("/jobs/{job_id}/events")
+async def report_job_events(job_id: str):
+    """
+    Progress of a background risk report job (Server-Sent Events).
+
+    Past events are replayed first, then live ones: `status`, `stage`
+    (retrieval, risk_scoring, ...), `section` (one per report section, with
+    status started/completed/fallback) and finally `done` with the result.
+    """
+    if REPORT_JOBS.get(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def events() -> AsyncIterator[str]:
+        async for entry in REPORT_JOBS.subscribe(job_id):
+            entry = dict(entry)
+            yield _sse(entry.pop("event"), entry)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/metrics/llm")
+async def llm_metrics():
+    """LLM admission control: in-flight calls per agent, queue depth per priority class, wait times."""
+    return LLM_ADMISSION.metrics()
@@ -0,0 +1,158 @@
+# backend/api/single_flight.py
+
+"""
+Duplicate suppression and per-session ordering for chat turns.
+
+Double-submits and client retries used to start a second graph run for the
+same turn, paying for every LLM call twice and interleaving session writes.
+`ChatSingleFlight.run(key, session_id, execute)`:
+
+- serves a finished result from a short-lived cache when the key repeats
+- attaches concurrent identical requests to the one in-flight execution
+- runs executions of one session one at a time (`serialized`), so two turns
+  never read and write the same session state concurrently
+
+Keys come from the client's `Idempotency-Key` header (results kept for
+`idempotency_ttl`) or, without one, from the session, message and context.
+Only explicit keys replay finished results. A derived key only joins an
+execution that is still running (a double-submit): the same text sent after
+the turn finished (a second "1" to the next quiz question) is a new turn.
+
+An execution is cancelled when every request waiting on it has gone away.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from backend.utils.logger import get_logger
+from backend.utils.ttl_cache import TTLCache, stable_hash
+
+logger = get_logger(__name__)
+
+_MISSING = object()
+
+
+@dataclass
+class _Flight:
+    task: "asyncio.Task"
+    waiters: int = 0
+
+
+@dataclass
+class _SessionLock:
+    lock: asyncio.Lock
+    users: int = 0
+
+
+def request_key(session_id: str, message: str, context: Optional[Dict[str, Any]] = None, idempotency_key: Optional[str] = None) -> str:
+    """Dedupe key of a chat request; explicit idempotency keys are scoped to the session."""
+    if idempotency_key:
+        return "key:" + stable_hash(session_id, idempotency_key)
+    return "auto:" + stable_hash(session_id, message, context or {})
+
+
+class ChatSingleFlight:
+    """
+    Args:
+        enabled: Coalesce and cache by key (sessions are serialized regardless).
+        idempotency_ttl: Seconds a result is replayed for an explicit idempotency key.
+        max_results: Cached results kept.
+        serialize_sessions: Run at most one execution per session at a time.
+        clock: Time source, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        idempotency_ttl: float = 300.0,
+        max_results: int = 1024,
+        serialize_sessions: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.enabled = enabled
+        self.idempotency_ttl = float(idempotency_ttl)
+        self.serialize_sessions = serialize_sessions
+        self._results = TTLCache(max_results, self.idempotency_ttl, clock=clock)  # explicit keys only
+        self._inflight: Dict[str, _Flight] = {}
+        self._session_locks: Dict[str, _SessionLock] = {}
+        self.stats = {"executed": 0, "coalesced": 0, "replayed": 0, "cancelled": 0}
+
+    async def run(self, key: str, session_id: str, execute: Callable[[], Awaitable[Any]]) -> Any:
+        """Result of `execute()` for `key`, reusing a cached or in-flight execution when possible."""
+        if not self.enabled:
+            return await self.serialized(session_id, execute)
+
+        cached = self._results.get(key, _MISSING)
+        if cached is not _MISSING:
+            self.stats["replayed"] += 1
+            logger.debug("Replaying cached chat result for session %s", session_id)
+            return cached
+
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(self._execute(key, session_id, execute)))
+            self._inflight[key] = flight
+            self.stats["executed"] += 1
+        else:
+            self.stats["coalesced"] += 1
+            logger.info("Coalescing duplicate chat request for session %s", session_id)
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                self.stats["cancelled"] += 1
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    async def serialized(self, session_id: str, execute: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `execute()` once no other execution of the session is running."""
+        if not self.serialize_sessions:
+            return await execute()
+        entry = self._session_locks.get(session_id)
+        if entry is None:
+            entry = self._session_locks[session_id] = _SessionLock(asyncio.Lock())
+        entry.users += 1
+        try:
+            async with entry.lock:
+                return await execute()
+        finally:
+            entry.users -= 1
+            if entry.users == 0:
+                self._session_locks.pop(session_id, None)
+
+    def clear(self) -> None:
+        self._results.clear()
+
+    async def _execute(self, key: str, session_id: str, execute: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            result = await self.serialized(session_id, execute)
+            if key.startswith("key:"):
+                self._results.set(key, result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    def is_known(self, key: str) -> bool:
+        """True when `run(key, ...)` would replay a result or join a running execution."""
+        return self.enabled and (key in self._inflight or key in self._results)
+
+
+def _build_default_single_flight() -> ChatSingleFlight:
+    from backend.config import get_settings
+
+    settings = get_settings()
+    return ChatSingleFlight(
+        enabled=getattr(settings, "chat_single_flight", True),
+        idempotency_ttl=getattr(settings, "chat_idempotency_ttl", 300.0),
+        max_results=getattr(settings, "chat_result_cache_size", 1024),
+        serialize_sessions=getattr(settings, "chat_serialize_sessions", True),
+    )
+
+
+CHAT_SINGLE_FLIGHT = _build_default_single_flight()
@@ -29,8 +29,88 @@ class Settings(BaseSettings):
     redis_password: str = ""
     redis_db: int = 0
     redis_ssl: bool = False
+    redis_max_connections: int = 50  # Connection pool size per Redis node
+    redis_cluster: bool = False  # Connect to Redis Cluster (redis_url/host is a startup node)
+    redis_shard_urls: str = ""  # Comma-separated URLs for client-side consistent-hash sharding
+    redis_hash_tag_keys: bool = True  # session:{<id>} keys so a session stays on one cluster slot
+    redis_legacy_key_fallback: bool = True  # Also read untagged session:<id> keys from older versions
     session_ttl: int = 3600  # Session TTL in seconds (1 hour)
     use_redis_session: bool = False  # True for production, False for development
+    session_backend: str = ""  # memory | redis | sqlite (empty: decided by use_redis_session)
+    session_sqlite_path: str = "sessions.db"  # SQLite session database file
+    session_sqlite_batch_interval: float = 0.01  # Seconds the SQLite writer gathers saves per transaction
+    session_memory_max_sessions: int = 10000  # In-memory store: LRU cap on sessions (0 = unlimited)
+    session_memory_max_bytes: int = 0  # In-memory store: LRU cap on encoded state size (0 = unlimited)
+    session_sweep_interval: float = 60.0  # In-memory store: seconds between expired-session sweeps
+    session_codec: str = "orjson"  # orjson | json
+    session_compression: str = "zstd"  # zstd | zlib | none
+    session_compression_threshold: int = 4096  # Compress payloads at or above this many bytes
+    session_local_cache: bool = True  # In-process LRU in front of Redis
+    session_local_cache_size: int = 1000  # Hot sessions kept per process
+    session_write_behind_delay: float = 0.05  # Seconds to coalesce writes (0 = write-through)
+    session_cache_revalidate_seconds: float = 0.0  # Skip the Redis version check within this window
+
+    # Conversation history
+    history_max_turns: int = 20  # Raw history entries kept verbatim (0 disables trimming)
+    history_summary_batch: int = 10  # Overflow entries collected before folding into the summary
+    history_summary_max_chars: int = 2000  # Upper bound for the rolling summary text
+
+    # LLM HTTP clients (shared per endpoint, see infrastructure/llm_client_registry.py)
+    llm_max_connections: int = 100  # Connection pool size per LLM endpoint
+    llm_max_keepalive_connections: int = 20  # Idle keep-alive connections kept per endpoint
+    llm_keepalive_expiry: float = 30.0  # Seconds an idle keep-alive connection stays open
+    llm_timeout: float = 60.0  # Read/write timeout for LLM calls in seconds
+    llm_connect_timeout: float = 5.0  # TCP/TLS connect timeout in seconds
+    llm_max_retries: int = 2  # OpenAI-client retries on connection errors / 429 / 5xx
+
+    # LLM admission control (see infrastructure/llm_admission.py)
+    llm_admission: bool = True  # Queue LLM calls by priority once the limits below are reached
+    llm_max_concurrent: int = 16  # Upstream LLM calls in flight across all agents
+    llm_agent_limits: dict = {"riskmanaging": 6, "quiz": 4, "email": 6, "default_chat": 8, "history": 2}  # Per-agent bulkheads
+    llm_max_queue: int = 64  # Calls waiting for a slot; beyond this /api/chat answers 429
+
+    # Chat request handling (see api/single_flight.py)
+    chat_single_flight: bool = True  # Coalesce duplicate /api/chat requests and replay retries
+    chat_idempotency_ttl: float = 300.0  # Seconds a response is replayed for the same Idempotency-Key
+    chat_result_cache_size: int = 1024  # Responses kept for replay
+    chat_serialize_sessions: bool = True  # Run one turn per session at a time
+    request_timeout: float = 120.0  # Deadline for one chat turn in seconds; LLM/embedding calls get what is left (0 = none)
+
+    # Intent routing (after keyword routing, before the routing LLM)
+    intent_local_classifier: bool = True  # Nearest-centroid classifier over local embeddings
+    intent_local_min_confidence: float = 0.8  # Route locally at or above this confidence, else ask the LLM
+    intent_local_min_similarity: float = 0.25  # Cosine to the nearest intent centroid below this = unknown
+    intent_model_path: str = "backend/models/intent_model.json"  # Built by scripts/train_intent_classifier.py
+    intent_cache: bool = True  # Cache routing-LLM labels (exact text + embedding similarity)
+    intent_cache_semantic: bool = True  # Also reuse labels of near-identical messages
+    intent_cache_semantic_threshold: float = 0.95  # Min cosine similarity for a semantic cache hit
+    intent_cache_ttl: float = 3600.0  # Seconds a cached intent label stays valid
+    intent_cache_max_entries: int = 2048  # Entries per cache layer
+
+    # Retrieval prefetch (runs while the routing LLM classifies the message)
+    rag_prefetch: bool = True  # Start candidate agents' RAG searches before the routing LLM call
+    rag_prefetch_agents: list = ["riskmanaging", "quiz", "email"]  # Agents whose retrieval is prefetched
+    rag_prefetch_ttl: float = 30.0  # Seconds an unused prefetched result is kept
+    rag_prefetch_workers: int = 4  # Threads running prefetched searches
+
+    # Risk analysis
+    risk_report_section_timeout: float = 45.0  # Per-section LLM timeout for risk reports (0 = none)
+    risk_local_slot_filling: bool = True  # Regex slot filling; skip the assessment LLM when facts are clearly missing
+    risk_speculative_report: bool = True  # Precompute the report once info is sufficient, before approval
+    risk_speculative_report_ttl: float = 600.0  # Seconds a speculative report stays usable
+    risk_speculative_report_max_sessions: int = 256  # Sessions with a speculative report in flight/cached
+    risk_scoring_mode: str = "hybrid"  # local: rule-based scores only | hybrid: + LLM reasoning text | llm: LLM scores
+    risk_local_scoring_min_confidence: float = 0.7  # Below this, local scores are discarded and the LLM scores
+    risk_score_cache_ttl: float = 3600.0  # Seconds a risk scoring result is reused for the same extracted data
+    risk_score_cache_size: int = 512  # Max cached risk scoring results
+    risk_report_reuse: bool = True  # Reuse a finished report for a near-identical case (new summary only)
+    risk_report_reuse_threshold: float = 0.9  # Min cosine similarity of case embeddings for reuse
+    risk_report_reuse_ttl: float = 86400.0  # Seconds a finished report stays reusable
+    risk_report_reuse_max_entries: int = 256  # Max reports kept for reuse
+    risk_report_jobs: bool = False  # Run full analyses as background jobs; the chat turn returns a job id
+    risk_report_job_workers: int = 2  # Report jobs analysed concurrently
+    risk_report_job_max_pending: int = 32  # Queued/running jobs before new analyses run inline
+    risk_report_job_ttl: float = 3600.0  # Seconds a finished job stays queryable
 
     # Application
     environment: str = "development"
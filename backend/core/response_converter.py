@@ -2,6 +2,8 @@ import json
 import re
 from typing import Any, Dict, Iterable, List, Optional
 
+from backend.utils.json_stream import extract_json
+
 
 def _first_non_empty_str(*values: Any) -> Optional[str]:
     for value in values:
@@ -86,16 +88,6 @@ def _normalize_risk_factors(raw_factors: Any) -> Dict[str, Dict[str, Any]]:
     return normalized
 
 
-def _parse_json_flexible(text: str) -> Optional[Any]:
-    if not isinstance(text, str):
-        return None
-    from backend.utils.json_utils import safe_json_parse
-    try:
-        return safe_json_parse(text)
-    except:
-        return None
-
-
 def _format_quiz_chat_message(payload: Any) -> Optional[str]:
     questions: List[Dict[str, Any]] = []
 
@@ -179,6 +171,10 @@ def normalize_response(raw: Any) -> Dict[str, Any]:
                 questions = _extract_quiz_questions(llm_output_details)
                 if questions:
                     chat_meta["quiz_questions"] = questions
+            if metadata.get("report_job_id"):
+                # Risk report running in the background: poll /api/jobs/{report_job_id}
+                chat_meta["report_job_id"] = metadata["report_job_id"]
+                chat_meta["status"] = metadata.get("status")
 
         if "type" in raw: # Already normalized ChatResponse
             return raw
@@ -193,7 +189,7 @@ def normalize_response(raw: Any) -> Dict[str, Any]:
             elif isinstance(raw.get("response"), str):
                 chat_message_content = raw.get("response")
                 try: # Try to parse 'response' string as JSON report
-                    parsed_str = _parse_json_flexible(chat_message_content)
+                    parsed_str = extract_json(chat_message_content)
                     if isinstance(parsed_str, dict) and "analysis_id" in parsed_str:
                         extracted_report_dict = parsed_str
                     elif parsed_str is not None:
@@ -216,7 +212,7 @@ def normalize_response(raw: Any) -> Dict[str, Any]:
         elif isinstance(raw.get("message"), str):
             chat_message_content = raw.get("message")
             try: # Try to parse 'message' string as JSON report
-                parsed_str = _parse_json_flexible(chat_message_content)
+                parsed_str = extract_json(chat_message_content)
                 if isinstance(parsed_str, dict) and "analysis_id" in parsed_str:
                     extracted_report_dict = parsed_str
                 elif parsed_str is not None:
@@ -234,7 +230,7 @@ def normalize_response(raw: Any) -> Dict[str, Any]:
     elif isinstance(raw, str): # Raw is a string
         chat_message_content = raw
         try: # Try to parse raw string as JSON report
-            parsed_str = _parse_json_flexible(raw)
+            parsed_str = extract_json(raw)
             if isinstance(parsed_str, dict) and "analysis_id" in parsed_str:
                 extracted_report_dict = parsed_str
             elif parsed_str is not None:
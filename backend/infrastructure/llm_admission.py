@@ -0,0 +1,307 @@
+# backend/infrastructure/llm_admission.py
+
+"""
+Admission control for upstream LLM calls.
+
+Every async LLM request goes through the shared HTTP pool of
+`llm_client_registry`, whose transport asks `LLM_ADMISSION` for a slot first:
+
+- a global limit on concurrent upstream calls (`llm_max_concurrent`)
+- per-agent bulkheads (`llm_agent_limits`), so a burst of risk reports
+  cannot take every slot
+- priority classes: "routing" (intent LLM) before "interactive" (short chat,
+  email, risk conversation) before "batch" (report generation, quiz
+  generation, history summaries); equal priorities are served FIFO
+- a bounded wait queue (`llm_max_queue`); a call arriving at a full queue
+  fails with `AdmissionRejected`, which the OpenAI client passes through
+  unchanged and agents re-raise instead of degrading the turn. `/api/chat`
+  answers 429 with Retry-After for it, and checks `saturated()` up front so
+  it does not start a turn while the queue is full
+
+The calling agent and priority class come from a context variable set with
+`llm_caller(agent, priority)` (the orchestrator sets it per agent run), so
+agent code does not change. Queue depth, in-flight counts and wait times are
+exposed by `metrics()` (`GET /api/metrics/llm`).
+"""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import math
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from backend.infrastructure.request_deadline import DeadlineExceeded, budget
+from backend.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PRIORITY_CLASSES = {"routing": 0, "interactive": 1, "batch": 2}
+DEFAULT_PRIORITY = "interactive"
+# Priority class of an agent's calls unless the caller names one
+AGENT_PRIORITIES = {
+    "orchestrator": "routing",
+    "default_chat": "interactive",
+    "email": "interactive",
+    "riskmanaging": "interactive",
+    "quiz": "batch",
+}
+
+_CALLER: contextvars.ContextVar[Optional[Tuple[str, str]]] = contextvars.ContextVar("llm_caller", default=None)
+
+
+@contextmanager
+def llm_caller(agent: str, priority: Optional[str] = None) -> Iterator[None]:
+    """Attribute LLM calls made in this context (and tasks/threads started from it) to `agent`."""
+    priority = priority or AGENT_PRIORITIES.get(agent, DEFAULT_PRIORITY)
+    token = _CALLER.set((agent, priority))
+    try:
+        yield
+    finally:
+        _CALLER.reset(token)
+
+
+def current_caller() -> Tuple[str, str]:
+    return _CALLER.get() or ("unknown", DEFAULT_PRIORITY)
+
+
+class AdmissionRejected(Exception):
+    """The LLM wait queue is full; retry after `retry_after` seconds."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"LLM admission queue full; retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    agent: str = field(compare=False)
+    priority_class: str = field(compare=False)
+    future: "asyncio.Future[AdmissionTicket]" = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    ticket: Optional["AdmissionTicket"] = field(default=None, compare=False)
+
+
+@dataclass
+class AdmissionTicket:
+    agent: str
+    priority_class: str
+    admitted_at: float
+    released: bool = False
+
+
+class LLMAdmissionController:
+    """
+    Args:
+        max_concurrent: Upstream calls in flight across all agents.
+        agent_limits: Calls in flight per agent; agents not listed share only the global limit.
+        max_queue: Calls allowed to wait for a slot.
+        enabled: When False, `acquire` admits everything (metrics still count calls).
+        clock: Time source, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 16,
+        agent_limits: Optional[Dict[str, int]] = None,
+        max_queue: int = 64,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.agent_limits = {agent: max(1, int(limit)) for agent, limit in (agent_limits or {}).items()}
+        self.max_queue = max(0, int(max_queue))
+        self.enabled = enabled
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._waiters: List[_Waiter] = []
+        self._seq = itertools.count()
+        self._in_flight = 0
+        self._agent_in_flight: Dict[str, int] = {}
+        self._wait_stats: Dict[str, Dict[str, float]] = {
+            name: {"admitted": 0, "total_wait": 0.0, "max_wait": 0.0} for name in PRIORITY_CLASSES
+        }
+        self._service_time = 0.0  # moving average of call duration, for Retry-After
+        self.stats = {"admitted": 0, "queued": 0, "rejected": 0, "cancelled": 0}
+
+    # --- admission -----------------------------------------------------
+
+    async def acquire(self, agent: Optional[str] = None, priority: Optional[str] = None) -> AdmissionTicket:
+        """
+        Wait for a slot for `agent` (default: the current `llm_caller`). Waits
+        at most the request's remaining deadline; raises `AdmissionRejected`
+        when the wait queue is full.
+        """
+        caller_agent, caller_priority = current_caller()
+        agent = agent or caller_agent
+        priority = priority if priority in PRIORITY_CLASSES else caller_priority
+
+        with self._lock:
+            if not self.enabled or self._has_capacity(agent):
+                return self._admit(agent, priority, waited=0.0)
+            if len(self._waiters) >= self.max_queue:
+                self.stats["rejected"] += 1
+                raise AdmissionRejected(self._retry_after())
+            waiter = _Waiter(
+                priority=PRIORITY_CLASSES[priority],
+                seq=next(self._seq),
+                agent=agent,
+                priority_class=priority,
+                future=asyncio.get_running_loop().create_future(),
+                enqueued_at=self._clock(),
+            )
+            heapq.heappush(self._waiters, waiter)
+            self.stats["queued"] += 1
+
+        try:
+            try:
+                return await asyncio.wait_for(asyncio.shield(waiter.future), timeout=budget(None))
+            except asyncio.TimeoutError as e:
+                raise DeadlineExceeded("request deadline exceeded while waiting for an LLM slot") from e
+        except BaseException:  # deadline, cancellation
+            with self._lock:
+                self.stats["cancelled"] += 1
+                ticket = waiter.ticket
+                if ticket is None:
+                    waiter.future.cancel()
+                    if waiter in self._waiters:
+                        self._waiters.remove(waiter)
+                        heapq.heapify(self._waiters)
+            if ticket is not None:
+                self.release(ticket)  # admitted while we were being cancelled
+            raise
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        with self._lock:
+            if ticket.released:
+                return
+            ticket.released = True
+            self._in_flight -= 1
+            self._agent_in_flight[ticket.agent] -= 1
+            duration = self._clock() - ticket.admitted_at
+            self._service_time = duration if not self._service_time else 0.9 * self._service_time + 0.1 * duration
+            self._dispatch()
+
+    def saturated(self, agent: Optional[str] = None) -> bool:
+        """
+        True while `acquire(agent)` would be rejected: the wait queue is full
+        and the agent has no free slot. Without an agent, true when that
+        holds for any agent (the global limit or a full bulkhead).
+        """
+        with self._lock:
+            if not self.enabled or len(self._waiters) < self.max_queue:
+                return False
+            if agent is not None:
+                return not self._has_capacity(agent)
+            return self._in_flight >= self.max_concurrent or any(
+                not self._has_capacity(name) for name in self.agent_limits
+            )
+
+    def retry_after(self) -> int:
+        with self._lock:
+            return self._retry_after()
+
+    # --- internals (self._lock held) -------------------------------------
+
+    def _has_capacity(self, agent: str) -> bool:
+        if self._in_flight >= self.max_concurrent:
+            return False
+        limit = self.agent_limits.get(agent)
+        return limit is None or self._agent_in_flight.get(agent, 0) < limit
+
+    def _admit(self, agent: str, priority: str, waited: float) -> AdmissionTicket:
+        self._in_flight += 1
+        self._agent_in_flight[agent] = self._agent_in_flight.get(agent, 0) + 1
+        self.stats["admitted"] += 1
+        stats = self._wait_stats[priority]
+        stats["admitted"] += 1
+        stats["total_wait"] += waited
+        stats["max_wait"] = max(stats["max_wait"], waited)
+        return AdmissionTicket(agent=agent, priority_class=priority, admitted_at=self._clock())
+
+    def _dispatch(self) -> None:
+        """Hand free slots to the highest-priority waiters whose bulkhead has room."""
+        if not self._waiters or self._in_flight >= self.max_concurrent:
+            return
+        blocked = []
+        while self._waiters and self._in_flight < self.max_concurrent:
+            waiter = heapq.heappop(self._waiters)
+            if waiter.future.done():
+                continue
+            if not self._has_capacity(waiter.agent):
+                blocked.append(waiter)
+                continue
+            waiter.ticket = self._admit(waiter.agent, waiter.priority_class, waited=self._clock() - waiter.enqueued_at)
+            _resolve(waiter.future, waiter.ticket)
+        for waiter in blocked:
+            heapq.heappush(self._waiters, waiter)
+
+    def _retry_after(self) -> int:
+        service_time = self._service_time or 1.0
+        backlog = len(self._waiters) + 1
+        return int(min(60, max(1, math.ceil(service_time * backlog / self.max_concurrent))))
+
+    # --- metrics -----------------------------------------------------------
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            queue_depth = {name: 0 for name in PRIORITY_CLASSES}
+            for waiter in self._waiters:
+                if not waiter.future.done():
+                    queue_depth[waiter.priority_class] += 1
+            now = self._clock()
+            oldest = max((now - waiter.enqueued_at for waiter in self._waiters), default=0.0)
+            return {
+                "enabled": self.enabled,
+                "max_concurrent": self.max_concurrent,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                "in_flight_by_agent": {agent: count for agent, count in self._agent_in_flight.items() if count},
+                "agent_limits": dict(self.agent_limits),
+                "queue_depth": sum(queue_depth.values()),
+                "queue_depth_by_priority": queue_depth,
+                "oldest_wait_seconds": oldest,
+                "wait_seconds_by_priority": {
+                    name: {
+                        "admitted": int(stats["admitted"]),
+                        "avg": stats["total_wait"] / stats["admitted"] if stats["admitted"] else 0.0,
+                        "max": stats["max_wait"],
+                    }
+                    for name, stats in self._wait_stats.items()
+                },
+                **self.stats,
+            }
+
+
+def _resolve(future: "asyncio.Future[AdmissionTicket]", ticket: AdmissionTicket) -> None:
+    """Hand `ticket` to a waiter, from its own loop's thread."""
+    loop = future.get_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        future.set_result(ticket)
+    else:
+        loop.call_soon_threadsafe(lambda: future.done() or future.set_result(ticket))
+
+
+def _build_default_controller() -> LLMAdmissionController:
+    from backend.config import get_settings
+
+    settings = get_settings()
+    return LLMAdmissionController(
+        max_concurrent=getattr(settings, "llm_max_concurrent", 16),
+        agent_limits=getattr(settings, "llm_agent_limits", None),
+        max_queue=getattr(settings, "llm_max_queue", 64),
+        enabled=getattr(settings, "llm_admission", True),
+    )
+
+
+LLM_ADMISSION = _build_default_controller()
@@ -0,0 +1,280 @@
+# backend/infrastructure/llm_client_registry.py
+
+"""
+Process-wide registry of LLM HTTP clients.
+
+Every agent used to build its own `AsyncOpenAI` (some per node call), so each
+turn paid for fresh connection pools and TLS handshakes. The registry hands out
+shared clients instead:
+
+- one `httpx.AsyncClient` / `httpx.Client` per endpoint origin
+  (scheme://host:port), so `/v1` and `/v1/solar` share one keep-alive pool
+- one `AsyncOpenAI` per (base_url, api_key) on top of that pool
+- per-endpoint pool limits and timeouts from Settings (`llm_*`)
+- every request's timeouts capped at the remaining request deadline
+  (`request_deadline.py`), so no call outlives the HTTP request it serves
+- every async request admitted by `LLM_ADMISSION` (`llm_admission.py`);
+  the slot is held until the response body is closed, so streamed
+  completions count for their whole duration
+
+httpx async connections belong to the event loop that opened them, so the
+async pool keeps one transport per running loop. The FastAPI server only ever
+uses one loop; tests and scripts that call `asyncio.run()` repeatedly get a
+fresh pool per loop instead of "Event loop is closed" errors.
+
+Usage:
+    from backend.infrastructure.llm_client_registry import get_async_openai
+
+    client = get_async_openai("https://api.upstage.ai/v1", api_key)
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+from openai import AsyncOpenAI
+
+from backend.infrastructure.llm_admission import LLM_ADMISSION, AdmissionTicket, LLMAdmissionController
+from backend.infrastructure.request_deadline import DeadlineExceeded, remaining
+from backend.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+UPSTAGE_BASE_URL = "https://api.upstage.ai/v1"
+UPSTAGE_SOLAR_BASE_URL = "https://api.upstage.ai/v1/solar"
+
+
+def endpoint_key(base_url: str) -> str:
+    """Origin (scheme://host[:port]) that identifies one connection pool."""
+    parts = urlsplit(base_url)
+    if not parts.scheme or not parts.netloc:
+        raise ValueError(f"LLM base_url must be absolute: {base_url!r}")
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def _cap_timeout_to_deadline(request: httpx.Request) -> None:
+    left = remaining()
+    if left is None:
+        return
+    if left <= 0:
+        raise DeadlineExceeded(f"request deadline exceeded before calling {request.url.host}")
+    timeout = request.extensions.get("timeout") or dict.fromkeys(("connect", "read", "write", "pool"))
+    request.extensions["timeout"] = {
+        name: left if value is None else min(value, left) for name, value in timeout.items()
+    }
+
+
+async def _cap_timeout_to_deadline_async(request: httpx.Request) -> None:
+    _cap_timeout_to_deadline(request)
+
+
+class _AdmittedStream(httpx.AsyncByteStream):
+    """Response body that gives the admission slot back when it is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, admission: LLMAdmissionController, ticket: AdmissionTicket):
+        self._stream = stream
+        self._admission = admission
+        self._ticket = ticket
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._admission.release(self._ticket)
+
+
+class _PerLoopTransport(httpx.AsyncBaseTransport):
+    """Async transport that keeps a separate connection pool per event loop."""
+
+    def __init__(self, admission: Optional[LLMAdmissionController] = None, **transport_kwargs: Any):
+        self._admission = admission
+        self._transport_kwargs = transport_kwargs
+        self._transports: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def _current(self) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            transport = self._transports.get(loop)
+            if transport is None:
+                transport = httpx.AsyncHTTPTransport(**self._transport_kwargs)
+                self._transports[loop] = transport
+            return transport
+
+    @property
+    def pool_count(self) -> int:
+        return len(self._transports)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._admission is None:
+            return await self._current().handle_async_request(request)
+        ticket = await self._admission.acquire()
+        try:
+            response = await self._current().handle_async_request(request)
+        except BaseException:
+            self._admission.release(ticket)
+            raise
+        response.stream = _AdmittedStream(response.stream, self._admission, ticket)
+        return response
+
+    async def aclose(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            current = self._transports.pop(loop, None)
+            # Pools of other (usually finished) loops cannot be closed from
+            # here; dropping the reference lets their sockets be collected.
+            self._transports.clear()
+        if current is not None:
+            await current.aclose()
+
+
+class LLMClientRegistry:
+    """
+    Shares HTTP connection pools and OpenAI-compatible clients across agents.
+
+    Args:
+        settings: Settings instance (defaults to get_settings()).
+        admission: Admission controller for async LLM requests (None = unlimited).
+    """
+
+    def __init__(self, settings=None, admission: Optional[LLMAdmissionController] = LLM_ADMISSION):
+        if settings is None:
+            from backend.config import get_settings
+            settings = get_settings()
+        self.admission = admission
+
+        self.limits = httpx.Limits(
+            max_connections=max(1, int(getattr(settings, "llm_max_connections", 100))),
+            max_keepalive_connections=max(0, int(getattr(settings, "llm_max_keepalive_connections", 20))),
+            keepalive_expiry=float(getattr(settings, "llm_keepalive_expiry", 30.0)),
+        )
+        self.timeout = httpx.Timeout(
+            float(getattr(settings, "llm_timeout", 60.0)),
+            connect=float(getattr(settings, "llm_connect_timeout", 5.0)),
+        )
+        self.max_retries = max(0, int(getattr(settings, "llm_max_retries", 2)))
+
+        self._lock = threading.Lock()
+        self._async_http: Dict[str, httpx.AsyncClient] = {}
+        self._sync_http: Dict[str, httpx.Client] = {}
+        self._openai: Dict[Tuple[str, str], AsyncOpenAI] = {}
+
+    def get_async_http_client(self, base_url: str) -> httpx.AsyncClient:
+        """Shared async HTTP client for the endpoint serving `base_url`."""
+        key = endpoint_key(base_url)
+        with self._lock:
+            client = self._async_http.get(key)
+            if client is None:
+                client = httpx.AsyncClient(
+                    transport=_PerLoopTransport(admission=self.admission, limits=self.limits),
+                    timeout=self.timeout,
+                    follow_redirects=True,
+                    event_hooks={"request": [_cap_timeout_to_deadline_async]},
+                )
+                self._async_http[key] = client
+                logger.info("LLM async HTTP pool created: %s", key)
+            return client
+
+    def get_http_client(self, base_url: str) -> httpx.Client:
+        """Shared sync HTTP client (for ChatUpstage.invoke and other sync callers)."""
+        key = endpoint_key(base_url)
+        with self._lock:
+            client = self._sync_http.get(key)
+            if client is None:
+                client = httpx.Client(
+                    limits=self.limits,
+                    timeout=self.timeout,
+                    follow_redirects=True,
+                    event_hooks={"request": [_cap_timeout_to_deadline]},
+                )
+                self._sync_http[key] = client
+                logger.info("LLM sync HTTP pool created: %s", key)
+            return client
+
+    def get_async_openai(self, base_url: str, api_key: Optional[str]) -> AsyncOpenAI:
+        """Shared AsyncOpenAI client for (base_url, api_key)."""
+        base_url = base_url.rstrip("/")
+        cache_key = (base_url, api_key or "")
+        with self._lock:
+            client = self._openai.get(cache_key)
+        if client is not None:
+            return client
+
+        http_client = self.get_async_http_client(base_url)
+        client = AsyncOpenAI(
+            base_url=base_url,
+            api_key=api_key,
+            timeout=self.timeout,
+            max_retries=self.max_retries,
+            http_client=http_client,
+        )
+        with self._lock:
+            return self._openai.setdefault(cache_key, client)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "endpoints": len(set(self._async_http) | set(self._sync_http)),
+                "openai_clients": len(self._openai),
+                "async_pools": sum(
+                    client._transport.pool_count  # type: ignore[attr-defined]
+                    for client in self._async_http.values()
+                ),
+            }
+
+    async def aclose(self) -> None:
+        """Close every pool. Clients handed out earlier must not be used afterwards."""
+        with self._lock:
+            async_clients = list(self._async_http.values())
+            sync_clients = list(self._sync_http.values())
+            self._async_http.clear()
+            self._sync_http.clear()
+            self._openai.clear()
+
+        for client in async_clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug("LLM async HTTP client close failed: %s", e)
+        for client in sync_clients:
+            try:
+                client.close()
+            except Exception as e:
+                logger.debug("LLM sync HTTP client close failed: %s", e)
+
+
+_registry: Optional[LLMClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_llm_client_registry() -> LLMClientRegistry:
+    """Process-wide registry, created on first use."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = LLMClientRegistry()
+    return _registry
+
+
+def get_async_openai(base_url: str, api_key: Optional[str]) -> AsyncOpenAI:
+    """Shortcut for `get_llm_client_registry().get_async_openai(...)`."""
+    return get_llm_client_registry().get_async_openai(base_url, api_key)
+
+
+async def close_llm_clients() -> None:
+    """Close the process-wide registry (server shutdown)."""
+    global _registry
+    with _registry_lock:
+        registry, _registry = _registry, None
+    if registry is not None:
+        await registry.aclose()
@@ -0,0 +1,106 @@
+# backend/infrastructure/llm_streaming.py
+
+"""
+Token streaming for chat completions.
+
+Agents call `complete_chat(client, source=..., **create_kwargs)` instead of
+`client.chat.completions.create(...)`. Outside a streaming request it makes
+the usual single completion call. Inside one (`/api/chat/stream` installs a
+`TokenSink` with `stream_tokens_to`), it requests `stream=True`, forwards
+every content delta to the sink as it arrives and still returns the full
+text, so the calling node parses and post-processes it exactly as before.
+
+The sink lives in a context variable. LangGraph runs nodes in tasks (and
+sync nodes in executor threads) that copy the caller's context, so nodes
+deep inside agent graphs see the sink without any state plumbing.
+"""
+
+import asyncio
+import contextvars
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from backend.utils.json_stream import JSONStreamExtractor
+from backend.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class TokenSink:
+    """
+    Queue of streaming events for one request, consumed by the HTTP handler.
+
+    Events are dicts with an "event" name ("token", ...) and a payload;
+    `emit` may be called from the event loop or from worker threads.
+    """
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.loop = loop or asyncio.get_running_loop()
+        self.queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+        self.token_count = 0
+
+    def emit(self, event: str, **payload: Any) -> None:
+        item = {"event": event, **payload}
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            self.queue.put_nowait(item)
+        else:
+            self.loop.call_soon_threadsafe(self.queue.put_nowait, item)
+
+    def token(self, source: str, text: str) -> None:
+        self.token_count += 1
+        self.emit("token", source=source, text=text)
+
+
+_TOKEN_SINK: contextvars.ContextVar[Optional[TokenSink]] = contextvars.ContextVar("token_sink", default=None)
+
+
+def current_token_sink() -> Optional[TokenSink]:
+    return _TOKEN_SINK.get()
+
+
+@contextmanager
+def stream_tokens_to(sink: TokenSink) -> Iterator[TokenSink]:
+    """Route `complete_chat` deltas of code running in this context (and tasks created in it) to `sink`."""
+    token = _TOKEN_SINK.set(sink)
+    try:
+        yield sink
+    finally:
+        _TOKEN_SINK.reset(token)
+
+
+async def complete_chat(client: Any, source: str, structured: bool = False, **create_kwargs: Any) -> str:
+    """
+    Text of one chat completion, streamed to the current `TokenSink` if any.
+
+    Args:
+        client: AsyncOpenAI-compatible client.
+        source: Label attached to streamed tokens (usually the agent type).
+        structured: The completion is JSON; while streaming, also emit an
+            "item" event for each array element (e.g. a quiz question) as
+            soon as it is complete.
+        **create_kwargs: Passed to `client.chat.completions.create`.
+    """
+    sink = _TOKEN_SINK.get()
+    if sink is None:
+        completion = await client.chat.completions.create(**create_kwargs)
+        return completion.choices[0].message.content
+
+    extractor = JSONStreamExtractor() if structured else None
+    stream = await client.chat.completions.create(stream=True, **create_kwargs)
+    parts = []
+    async for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = getattr(chunk.choices[0].delta, "content", None)
+        if delta:
+            parts.append(delta)
+            sink.token(source, delta)
+            if extractor is not None:
+                for item in extractor.feed(delta):
+                    sink.emit("item", source=source, path=list(item.path), index=item.index, value=item.value)
+    logger.debug("Streamed %s completion: %s chunks", source, len(parts))
+    return "".join(parts)
@@ -0,0 +1,177 @@
+# backend/infrastructure/redis_router.py
+
+"""
+Redis connection routing for session storage and other Redis-backed caches.
+
+Three topologies are supported, selected from Settings:
+
+- single node (default): one `redis.Redis` client (`redis_url` or host/port)
+- Redis Cluster (`redis_cluster=true`): one `RedisCluster` client; callers use
+  hash-tagged keys (`session:{<id>}`) so all keys of a session share a slot
+- client-side sharding (`redis_shard_urls=url1,url2,...`): one client per
+  node, with a consistent-hash ring mapping each routing key to a node so
+  adding a node only moves ~1/N of the sessions
+
+Connection pool sizes come from `redis_max_connections`.
+"""
+
+import bisect
+import hashlib
+from typing import Any, Dict, List, Optional, Sequence
+
+import redis
+
+from backend.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def hash_tag(value: str) -> str:
+    """Wrap a routing key in a Redis Cluster hash tag."""
+    return "{" + value + "}"
+
+
+class HashRing:
+    """
+    Consistent-hash ring with virtual nodes.
+
+    Args:
+        nodes: Node names (e.g. shard URLs). Order does not matter.
+        replicas: Virtual nodes per physical node; more gives a smoother spread.
+    """
+
+    def __init__(self, nodes: Sequence[str], replicas: int = 160):
+        if not nodes:
+            raise ValueError("HashRing needs at least one node")
+        self.nodes = list(nodes)
+        self.replicas = max(1, int(replicas))
+        ring: List[tuple] = []
+        for node in self.nodes:
+            for idx in range(self.replicas):
+                ring.append((self._hash(f"{node}#{idx}"), node))
+        ring.sort()
+        self._points = [point for point, _ in ring]
+        self._owners = [owner for _, owner in ring]
+
+    @staticmethod
+    def _hash(value: str) -> int:
+        return int.from_bytes(hashlib.md5(value.encode("utf-8")).digest()[:8], "big")
+
+    def get_node(self, key: str) -> str:
+        idx = bisect.bisect(self._points, self._hash(key))
+        if idx == len(self._points):
+            idx = 0
+        return self._owners[idx]
+
+
+def _parse_urls(value: Any) -> List[str]:
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.split(",")
+    return [url.strip() for url in value if url and url.strip()]
+
+
+class RedisRouter:
+    """
+    Maps routing keys (session IDs) to Redis clients.
+
+    `primary` is the client for keys that are not sharded (single node and
+    cluster: the only client; sharding: the first node).
+    """
+
+    def __init__(self, clients: Dict[str, Any], cluster: bool = False, replicas: int = 160):
+        if not clients:
+            raise ValueError("RedisRouter needs at least one client")
+        self._clients = dict(clients)
+        self.cluster = cluster
+        self.names = list(self._clients)
+        self.primary = self._clients[self.names[0]]
+        self._ring = HashRing(self.names, replicas=replicas) if len(self._clients) > 1 else None
+
+    @property
+    def sharded(self) -> bool:
+        return self._ring is not None
+
+    @property
+    def clients(self) -> List[Any]:
+        return list(self._clients.values())
+
+    def client_for(self, routing_key: str) -> Any:
+        if self._ring is None:
+            return self.primary
+        return self._clients[self._ring.get_node(routing_key)]
+
+    def ping(self):
+        for client in self._clients.values():
+            client.ping()
+
+    def close(self):
+        for client in self._clients.values():
+            try:
+                client.close()
+            except Exception as e:
+                logger.debug("Redis client close failed: %s", e)
+
+
+def _single_node_client(settings, max_connections: int):
+    if settings.redis_url:
+        # Values are binary codec payloads, so responses stay as bytes.
+        return redis.from_url(
+            settings.redis_url,
+            decode_responses=False,
+            max_connections=max_connections,
+        )
+
+    # NOTE:
+    # Passing `ssl` to low-level ConnectionPool can break on 일부 redis-py
+    # connection classes. Construct Redis client directly for compatibility.
+    redis_kwargs = {
+        "host": settings.redis_host,
+        "port": settings.redis_port,
+        "db": settings.redis_db,
+        "decode_responses": False,
+        "max_connections": max_connections,
+    }
+    if settings.redis_password:
+        redis_kwargs["password"] = settings.redis_password
+    if settings.redis_ssl:
+        redis_kwargs["ssl"] = True
+    return redis.Redis(**redis_kwargs)
+
+
+def build_redis_router(settings=None, max_connections: Optional[int] = None) -> RedisRouter:
+    """Create the router for the topology configured in Settings (does not ping)."""
+    if settings is None:
+        from backend.config import get_settings
+        settings = get_settings()
+
+    if max_connections is None:
+        max_connections = getattr(settings, "redis_max_connections", 50)
+
+    if getattr(settings, "redis_cluster", False):
+        from redis.cluster import RedisCluster
+
+        cluster_kwargs: Dict[str, Any] = {
+            "decode_responses": False,
+            "max_connections": max_connections,
+        }
+        if settings.redis_url:
+            client = RedisCluster.from_url(settings.redis_url, **cluster_kwargs)
+        else:
+            if settings.redis_password:
+                cluster_kwargs["password"] = settings.redis_password
+            if settings.redis_ssl:
+                cluster_kwargs["ssl"] = True
+            client = RedisCluster(host=settings.redis_host, port=settings.redis_port, **cluster_kwargs)
+        return RedisRouter({"cluster": client}, cluster=True)
+
+    shard_urls = _parse_urls(getattr(settings, "redis_shard_urls", ""))
+    if shard_urls:
+        clients = {
+            url: redis.from_url(url, decode_responses=False, max_connections=max_connections)
+            for url in shard_urls
+        }
+        return RedisRouter(clients)
+
+    return RedisRouter({"default": _single_node_client(settings, max_connections)})
@@ -0,0 +1,96 @@
+# backend/infrastructure/request_deadline.py
+
+"""
+Request-scoped deadlines.
+
+`routes.chat` opens `request_deadline(seconds)` around the graph run. The
+deadline lives in a context variable, so every graph node, agent sub-graph
+and `asyncio.to_thread` call made for the request sees it without state
+plumbing (the same mechanism as the token sink in `llm_streaming.py`).
+
+- `check_deadline()` raises `DeadlineExceeded` once the budget is spent;
+  graph nodes call it on entry (see `deadline_checked`)
+- `budget(timeout)` shortens a per-call timeout to what is left of the request
+- LLM HTTP clients apply the remaining budget to every request
+  (`llm_client_registry`), embedding calls pass `budget(...)` to requests
+
+Work that deliberately outlives the turn (speculative reports, report jobs)
+runs in a fresh context and has no deadline.
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+_DEADLINE: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceeded(asyncio.TimeoutError):
+    """The request's time budget is spent."""
+
+
+@contextmanager
+def request_deadline(seconds: Optional[float]) -> Iterator[Optional[float]]:
+    """
+    Give code running in this context (and tasks/threads started from it)
+    `seconds` from now. An enclosing, earlier deadline is kept; None or a
+    non-positive value adds no deadline.
+    """
+    deadline = _DEADLINE.get()
+    if seconds is not None and seconds > 0:
+        candidate = time.monotonic() + seconds
+        deadline = candidate if deadline is None else min(deadline, candidate)
+    token = _DEADLINE.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _DEADLINE.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left for the current request, or None without a deadline."""
+    deadline = _DEADLINE.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def check_deadline() -> None:
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceeded("request deadline exceeded")
+
+
+def budget(timeout: Optional[float]) -> Optional[float]:
+    """
+    `timeout` capped at the request's remaining time (None/0 = no own limit).
+    Raises `DeadlineExceeded` when nothing is left.
+    """
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise DeadlineExceeded("request deadline exceeded")
+    if timeout is None or timeout <= 0:
+        return left
+    return min(timeout, left)
+
+
+def deadline_checked(node: Callable[..., Any]) -> Callable[..., Any]:
+    """Graph node wrapper: fail fast instead of starting a node after the deadline."""
+    if inspect.iscoroutinefunction(node):
+        @functools.wraps(node)
+        async def async_node(*args: Any, **kwargs: Any) -> Any:
+            check_deadline()
+            return await node(*args, **kwargs)
+        return async_node
+
+    @functools.wraps(node)
+    def sync_node(*args: Any, **kwargs: Any) -> Any:
+        check_deadline()
+        return node(*args, **kwargs)
+    return sync_node
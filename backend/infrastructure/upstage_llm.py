@@ -15,6 +15,7 @@ from tenacity import (
 )
 
 from backend.ports.llm_gateway import LLMGateway, LLMAPIError, LLMTimeoutError
+from backend.infrastructure.llm_client_registry import UPSTAGE_BASE_URL, get_llm_client_registry
 
 
 logger = logging.getLogger(__name__)
@@ -51,10 +52,14 @@ class UpstageLLMGateway(LLMGateway):
         self._timeout = timeout
 
         try:
+            # HTTP 커넥션 풀은 프로세스 전역 레지스트리와 공유한다.
+            registry = get_llm_client_registry()
             self._llm = ChatUpstage(
                 api_key=api_key,
                 model=model,
-                timeout=timeout
+                timeout=timeout,
+                http_client=registry.get_http_client(UPSTAGE_BASE_URL),
+                http_async_client=registry.get_async_http_client(UPSTAGE_BASE_URL),
             )
             logger.info(f"UpstageLLMGateway initialized: model={model}, timeout={timeout}s")
         except Exception as e:
@@ -85,15 +90,9 @@ class UpstageLLMGateway(LLMGateway):
         try:
             logger.debug(f"Invoking LLM: prompt_length={len(prompt)}, temperature={temperature}")
 
-            # Temperature 설정이 있으면 임시로 LLM 재생성
+            # Temperature는 호출 단위로 바인딩 (클라이언트/커넥션 풀 재사용)
             if temperature is not None:
-                llm = ChatUpstage(
-                    api_key=self._api_key,
-                    model=self._model,
-                    timeout=self._timeout,
-                    temperature=temperature
-                )
-                response = llm.invoke(prompt)
+                response = self._llm.bind(temperature=temperature).invoke(prompt)
             else:
                 response = self._llm.invoke(prompt)
 
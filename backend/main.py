@@ -115,10 +115,35 @@ async def run_startup_tasks() -> None:
     logger.info("🎉 서버 시작 완료!")
 
 
+async def run_shutdown_tasks() -> None:
+    """
+    서버 종료 시 정리 작업
+    - 세션 저장소의 write-behind 대기 중인 쓰기를 flush
+    - 공유 LLM HTTP 커넥션 풀 종료
+    """
+    from backend.agents.orchestrator.nodes import ORCHESTRATOR_COMPONENTS
+    from backend.infrastructure.llm_client_registry import close_llm_clients
+
+    close_store = getattr(ORCHESTRATOR_COMPONENTS.conversation_store, "close", None)
+    if callable(close_store):
+        try:
+            close_store()
+        except Exception as e:
+            logger.error(f"❌ 세션 저장소 종료 중 오류 발생: {e}")
+
+    try:
+        await close_llm_clients()
+    except Exception as e:
+        logger.error(f"❌ LLM 클라이언트 종료 중 오류 발생: {e}")
+
+    logger.info("👋 서버 종료 완료")
+
+
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     await run_startup_tasks()
     yield
+    await run_shutdown_tasks()
 
 
 app = FastAPI(
@@ -12,6 +12,7 @@ import requests
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
 
 from backend.config import get_settings
+from backend.infrastructure.request_deadline import budget, remaining
 
 # Upstage API interaction
 UPSTAGE_API_URL = "https://api.upstage.ai/v1/embeddings"
@@ -61,12 +62,16 @@ def _request_upstage_embedding(text: str, api_key: str, retries: int) -> Optiona
     }
 
     for attempt in range(retries):
+        left = remaining()
+        if left is not None and left <= 0:
+            print("Request deadline reached; skipping embedding API call.")
+            return None
         try:
             response = requests.post(
                 UPSTAGE_API_URL,
                 headers=headers,
                 json=payload,
-                timeout=10,
+                timeout=budget(10),  # capped at the request's remaining time
             )
             response.raise_for_status()
             data = response.json()
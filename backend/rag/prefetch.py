@@ -0,0 +1,111 @@
+# backend/rag/prefetch.py
+
+"""
+Speculative retrieval while the orchestrator is still routing.
+
+When keyword routing and the local intent classifier cannot decide, the
+orchestrator waits on the routing LLM. `detect_intent_and_route_node` starts
+the retrievals each candidate agent would run (risk cases, quiz documents,
+email references) on a small thread pool before that call, so vector search
+overlaps the LLM round trip instead of following it.
+
+Entries are keyed by the search tool and its exact arguments. The selected
+agent calls `RAG_PREFETCH.invoke(tool, args)` where it used to call
+`tool.invoke(args)`: a matching entry is served (waited on if still running),
+anything else falls through to a normal search. Unused entries expire after
+`ttl` seconds.
+"""
+
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from backend.utils.logger import get_logger
+from backend.utils.ttl_cache import TTLCache, stable_hash
+
+logger = get_logger(__name__)
+
+
+def prefetch_key(tool: Any, args: Dict[str, Any]) -> str:
+    return stable_hash(getattr(tool, "name", repr(tool)), args)
+
+
+class RetrievalPrefetcher:
+    """
+    Args:
+        ttl: Seconds a prefetched result stays usable.
+        max_entries: Prefetched searches kept at once.
+        max_workers: Threads running prefetched searches.
+        enabled: False turns `start` into a no-op; `invoke` then always searches.
+        clock: Time source, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 30.0,
+        max_entries: int = 256,
+        max_workers: int = 4,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.enabled = enabled
+        self.max_workers = max(1, int(max_workers))
+        self._entries = TTLCache(maxsize=max_entries, ttl=ttl, clock=clock)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.stats: Dict[str, int] = {"started": 0, "hits": 0, "misses": 0, "failed": 0}
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="rag-prefetch")
+        return self._executor
+
+    def start(self, tool: Any, args: Dict[str, Any]) -> bool:
+        """Run `tool.invoke(args)` in the background unless it is already prefetched."""
+        if not self.enabled:
+            return False
+        key = prefetch_key(tool, args)
+        if key in self._entries:
+            return False
+        self._entries.set(key, self._pool().submit(tool.invoke, dict(args)))
+        self.stats["started"] += 1
+        return True
+
+    def take(self, tool: Any, args: Dict[str, Any], timeout: Optional[float] = None) -> Optional[Any]:
+        """Prefetched result for exactly these arguments, or None (no entry, failed or timed out)."""
+        future: Optional[Future] = self._entries.pop(prefetch_key(tool, args))
+        if future is None:
+            self.stats["misses"] += 1
+            return None
+        try:
+            result = future.result(timeout=timeout)
+        except Exception as e:
+            self.stats["failed"] += 1
+            logger.warning("Prefetched %s failed (%s); searching again.", getattr(tool, "name", tool), e)
+            return None
+        self.stats["hits"] += 1
+        return result
+
+    def invoke(self, tool: Any, args: Dict[str, Any]) -> Any:
+        """`tool.invoke(args)`, served from a matching prefetch when there is one."""
+        result = self.take(tool, args)
+        if result is not None:
+            logger.debug("Serving prefetched %s", getattr(tool, "name", tool))
+            return result
+        return tool.invoke(args)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def _build_default_prefetcher() -> RetrievalPrefetcher:
+    from backend.config import get_settings
+
+    settings = get_settings()
+    return RetrievalPrefetcher(
+        ttl=getattr(settings, "rag_prefetch_ttl", 30.0),
+        max_workers=getattr(settings, "rag_prefetch_workers", 4),
+        enabled=getattr(settings, "rag_prefetch", True),
+    )
+
+
+RAG_PREFETCH = _build_default_prefetcher()
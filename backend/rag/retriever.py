@@ -10,9 +10,24 @@ from backend.rag.chroma_client import get_or_create_collection
 from backend.rag.embedder import get_embedding
 from backend.config import get_settings
 from backend.utils.logger import get_logger
+from backend.utils.ttl_cache import TTLCache
 
 logger = get_logger(__name__)
 
+# One query is often searched several times in a row (once per document type,
+# and again by a prefetched search), so its embedding is computed once.
+_QUERY_EMBEDDINGS = TTLCache(maxsize=256, ttl=300.0)
+
+
+def embed_query(query: str) -> Optional[List[float]]:
+    """`get_embedding(query)`, memoized for a few minutes; failures are not cached."""
+    embedding = _QUERY_EMBEDDINGS.get(query)
+    if embedding is None:
+        embedding = get_embedding(query)
+        if embedding is not None:
+            _QUERY_EMBEDDINGS.set(query, embedding)
+    return embedding
+
 def search(query: str, k: int = 5) -> List[Dict[str, Any]]:
     """
     Performs a similarity search against the Chroma vector store.
@@ -26,7 +41,7 @@ def search(query: str, k: int = 5) -> List[Dict[str, Any]]:
                                with its content and metadata.
     """
     collection = get_or_create_collection()
-    query_embedding = get_embedding(query)
+    query_embedding = embed_query(query)
 
     if query_embedding is None:
         logger.warning("Could not generate embedding for query in search()")
@@ -79,7 +94,7 @@ def search_with_filter(
                                with its content and metadata.
     """
     collection = get_or_create_collection()
-    query_embedding = get_embedding(query)
+    query_embedding = embed_query(query)
 
     if query_embedding is None:
         logger.warning("Could not generate embedding for query in search_with_filter()")
@@ -0,0 +1,84 @@
+"""
+Incremental scanning of conversation history.
+
+Agents used to rescan the whole history on every turn to re-derive facts
+(pasted email bodies, output language, risk slots). `scan_new_turns` keeps a
+turn cursor next to the derived facts in a plain dict (stored in
+`agent_specific_state`), so each turn only folds the newly appended messages
+into the cached facts.
+
+The history an agent sees is not strictly append-only: the orchestrator
+trims old turns into a rolling summary. The cursor therefore remembers a
+fingerprint of the last scanned turns and locates them again in the new
+history; only when it cannot be found (history reset or rewritten) are the
+facts rebuilt from scratch.
+"""
+
+import hashlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+Turn = Dict[str, Any]
+Facts = Dict[str, Any]
+
+
+def turn_fingerprint(turn: Turn) -> str:
+    payload = f"{turn.get('role', '')}\x00{turn.get('content', '')}"
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _tail_fingerprint(history: List[Turn], end: int) -> str:
+    """Fingerprint of the two turns before `end` (pairs make repeats like "네" unambiguous)."""
+    return "".join(turn_fingerprint(turn) for turn in history[max(0, end - 2): end])
+
+
+def _resume_index(history: List[Turn], cursor: Optional[Dict[str, Any]]) -> Optional[int]:
+    """Index of the first unscanned turn, or None when the cursor is lost."""
+    if not cursor or not cursor.get("fingerprint"):
+        return None
+    fingerprint = cursor["fingerprint"]
+    count = int(cursor.get("count", 0))
+
+    # Fast path: pure append, the last scanned turns did not move.
+    if 0 < count <= len(history) and _tail_fingerprint(history, count) == fingerprint:
+        return count
+    # Trimmed or re-framed history: the turns moved, search from the end.
+    for end in range(len(history), 0, -1):
+        if _tail_fingerprint(history, end) == fingerprint:
+            return end
+    return None
+
+
+def scan_new_turns(
+    cache: Optional[Dict[str, Any]],
+    history: List[Turn],
+    fold: Callable[[Facts, Turn], Facts],
+    initial: Callable[[], Facts],
+) -> Tuple[Dict[str, Any], int]:
+    """
+    Fold the turns appended since the last call into the cached facts.
+
+    Args:
+        cache: Previous return value (or None on the first turn).
+        history: Current conversation history as seen by the agent.
+        fold: `fold(facts, turn) -> facts` applied to each new turn in order.
+        initial: Factory for empty facts (used on first scan and on reset).
+
+    Returns:
+        (new_cache, scanned_turns). `new_cache["facts"]` holds the facts;
+        the whole dict is JSON-serializable if the facts are.
+    """
+    history = history or []
+    cache = cache if isinstance(cache, dict) else {}
+    start = _resume_index(history, cache.get("cursor"))
+
+    if start is None:
+        facts = initial()
+        start = 0
+    else:
+        facts = dict(cache.get("facts") or initial())
+
+    for turn in history[start:]:
+        facts = fold(facts, turn)
+
+    cursor = {"count": len(history), "fingerprint": _tail_fingerprint(history, len(history))}
+    return {"cursor": cursor, "facts": facts}, len(history) - start
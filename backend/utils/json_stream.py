@@ -0,0 +1,239 @@
+# backend/utils/json_stream.py
+
+"""
+Incremental JSON extraction from LLM output.
+
+LLM replies wrap their JSON in prose or markdown fences, and when streamed
+they arrive a few characters at a time. `JSONStreamExtractor` scans the text
+once, left to right, keeping only a bracket stack and string/fence state:
+
+- every balanced top-level object or array is parsed once, when it closes
+- values inside a ```fenced``` block are preferred over ones in prose
+- objects/arrays that are elements of a shallow array (a top-level array, or
+  an array directly under a top-level key such as `"questions"`) are emitted
+  as `ExtractedItem`s as soon as they close, before the reply is complete
+
+Candidates that turn out not to be JSON ("[참고]", "{회사명}") are dropped and
+scanning resumes just after their opening bracket.
+
+`extract_json(text)` is the one-shot form used by the agents' parsers.
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+
+# Characters that change scanner state outside / inside JSON strings.
+_SPECIAL = re.compile(r'[{}\[\]",:`\\]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+_FENCE = "```"
+
+
+@dataclass
+class ExtractedValue:
+    value: Any
+    start: int
+    end: int
+    fenced: bool
+
+
+@dataclass
+class ExtractedItem:
+    """Element `index` of the array found at `path` (keys/indices from the top-level value)."""
+
+    path: Tuple[Any, ...]
+    index: int
+    value: Any
+
+
+@dataclass
+class _Container:
+    kind: str  # "{" or "["
+    start: int
+    key: Any  # key or index in the parent container
+    index: int = 0
+    expect_key: bool = True
+    pending_key: Any = None
+
+
+class JSONStreamExtractor:
+    """
+    Args:
+        max_item_depth: Arrays nested at most this deep (1 = top-level array)
+            emit their elements as `ExtractedItem`s.
+    """
+
+    def __init__(self, max_item_depth: int = 2):
+        self.max_item_depth = max_item_depth
+        self.values: List[ExtractedValue] = []
+        self.items: List[ExtractedItem] = []
+        self._buf = ""
+        self._pos = 0
+        self._stack: List[_Container] = []
+        self._in_string = False
+        self._string_start = 0
+        self._in_fence = False
+        self._emit_items = True
+
+    @property
+    def text(self) -> str:
+        return self._buf
+
+    def feed(self, chunk: str) -> List[ExtractedItem]:
+        """Consume more text; returns the items completed by this chunk."""
+        if not chunk:
+            return []
+        before = len(self.items)
+        self._buf += chunk
+        self._scan(final=False)
+        return self.items[before:]
+
+    def finish(self) -> Optional[Any]:
+        """End of input: drop unclosed candidates, rescan after them, return `result()`."""
+        self._scan(final=True)
+        self._emit_items = False
+        while self._stack:
+            self._abandon()
+            self._scan(final=True)
+        return self.result()
+
+    def result(self) -> Optional[Any]:
+        """First fenced value, else the longest top-level value, else the whole text as JSON."""
+        for extracted in self.values:
+            if extracted.fenced:
+                return extracted.value
+        if self.values:
+            return max(self.values, key=lambda extracted: extracted.end - extracted.start).value
+        stripped = self._buf.strip()
+        if stripped:
+            try:
+                return json.loads(stripped, strict=False)
+            except json.JSONDecodeError:
+                pass
+        return None
+
+    # --- scanner -------------------------------------------------------
+
+    def _scan(self, final: bool) -> None:
+        buf = self._buf
+        pos = self._pos
+        end = len(buf)
+        while pos < end:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buf, pos)
+                if match is None:
+                    pos = end
+                    break
+                i = match.start()
+                if buf[i] == "\\":
+                    if i + 1 >= end and not final:
+                        pos = i  # escaped character not received yet
+                        break
+                    pos = i + 2
+                    continue
+                self._in_string = False
+                top = self._stack[-1]
+                if top.kind == "{" and top.expect_key:
+                    top.pending_key = buf[self._string_start:i + 1]
+                pos = i + 1
+                continue
+
+            match = _SPECIAL.search(buf, pos)
+            if match is None:
+                pos = end
+                break
+            i = match.start()
+            char = buf[i]
+            pos = i + 1
+
+            if not self._stack:
+                if char in "{[":
+                    self._open(char, i)
+                elif char == "`":
+                    if end - i < len(_FENCE) and not final:
+                        pos = i  # might be the start of a fence
+                        break
+                    if buf.startswith(_FENCE, i):
+                        self._in_fence = not self._in_fence
+                        pos = i + len(_FENCE)
+                continue
+
+            top = self._stack[-1]
+            if char == '"':
+                self._in_string = True
+                self._string_start = i
+            elif char in "{[":
+                self._open(char, i)
+            elif char in "}]":
+                if (char == "}") != (top.kind == "{"):
+                    pos = self._abandon()
+                else:
+                    resume = self._close(i)
+                    if resume is not None:
+                        pos = resume
+            elif char == ",":
+                if top.kind == "[":
+                    top.index += 1
+                else:
+                    top.expect_key = True
+                    top.pending_key = None
+            elif char == ":" and top.kind == "{":
+                top.expect_key = False
+        self._pos = pos
+
+    def _open(self, kind: str, start: int) -> None:
+        key: Any = None
+        if self._stack:
+            parent = self._stack[-1]
+            if parent.kind == "[":
+                key = parent.index
+            elif parent.pending_key is not None:
+                key = _decode_key(parent.pending_key)
+        self._stack.append(_Container(kind=kind, start=start, key=key))
+
+    def _close(self, end: int) -> Optional[int]:
+        """Pop the container closed at `end`; returns a resume position when it is dropped."""
+        container = self._stack.pop()
+        if not self._stack:
+            try:
+                value = json.loads(self._buf[container.start:end + 1], strict=False)
+            except json.JSONDecodeError:
+                self._stack.append(container)
+                return self._abandon()
+            self.values.append(ExtractedValue(value, container.start, end + 1, self._in_fence))
+            return None
+
+        parent = self._stack[-1]
+        if self._emit_items and parent.kind == "[" and len(self._stack) <= self.max_item_depth:
+            try:
+                value = json.loads(self._buf[container.start:end + 1], strict=False)
+            except json.JSONDecodeError:
+                return None
+            path = tuple(open_container.key for open_container in self._stack[1:])
+            self.items.append(ExtractedItem(path=path, index=container.key, value=value))
+        return None
+
+    def _abandon(self) -> int:
+        """Drop the current top-level candidate; scanning resumes after its opening bracket."""
+        resume = self._stack[0].start + 1
+        self._stack.clear()
+        self._in_string = False
+        self._pos = resume
+        return resume
+
+
+def _decode_key(raw: str) -> Any:
+    try:
+        return json.loads(raw, strict=False)
+    except json.JSONDecodeError:
+        return raw.strip('"')
+
+
+def extract_json(text: Any) -> Optional[Any]:
+    """JSON value embedded in LLM output (fenced, bare or surrounded by prose), or None."""
+    if not isinstance(text, str) or not text.strip():
+        return None
+    extractor = JSONStreamExtractor()
+    extractor.feed(text)
+    return extractor.finish()
@@ -24,6 +24,7 @@ from langchain_upstage import ChatUpstage  # Upstage Solar 모델 전용 LangCha
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from backend.config import get_settings
+from backend.infrastructure.llm_client_registry import UPSTAGE_BASE_URL, get_llm_client_registry
 
 
 @lru_cache()
@@ -34,12 +35,17 @@ def get_llm(model: str = "solar-pro", temperature: float = 0.7) -> ChatUpstage:
     → 매번 새 인스턴스를 만드는 오버헤드를 방지.
 
     예: get_llm("solar-pro", 0.7) 을 여러 번 호출해도 실제 생성은 1번만 된다.
+    HTTP 커넥션 풀은 llm_client_registry의 것을 공유하므로 조합이 달라도
+    keep-alive 연결은 함께 재사용된다.
     """
     settings = get_settings()
+    registry = get_llm_client_registry()
     return ChatUpstage(
         api_key=settings.upstage_api_key,
         model=model,
         temperature=temperature,
+        http_client=registry.get_http_client(UPSTAGE_BASE_URL),
+        http_async_client=registry.get_async_http_client(UPSTAGE_BASE_URL),
     )
 
 
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+세션 코덱 인코딩/디코딩 벤치마크.
+
+대화 턴 수가 다른 현실적인 세션(리스크 보고서 JSON 문자열 포함)을 만들어
+기존 json.dumps 방식과 SessionCodec 조합별 크기/속도를 비교한다.
+
+Usage:
+  .venv/bin/python scripts/benchmark_session_codec.py
+  .venv/bin/python scripts/benchmark_session_codec.py --turns 4 20 60 --iterations 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+# Ensure project root is importable when run as a script.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.agents.orchestrator.session_codec import SessionCodec
+
+
+def _sample_risk_report(turn: int) -> str:
+    factors = [
+        {
+            "name": name,
+            "impact": 4,
+            "likelihood": 3,
+            "risk_score": 12,
+            "risk_level": "high",
+            "reasoning": f"{name} 관련 계약 조항과 선적 일정상 실제 손실 가능성이 높습니다. (turn {turn})",
+            "mitigation_suggestions": ["바이어에게 즉시 지연 사유 통보", "대체 선사 견적 확보"],
+        }
+        for name in ["재정적 손실", "일정 지연", "관계 리스크", "규제/법률 준수 리스크", "내부 책임/비난 리스크"]
+    ]
+    report = {
+        "analysis_id": f"00000000-0000-0000-0000-{turn:012d}",
+        "input_summary": "A사와 10만 달러 계약, 선적 5일 지연 예상, 지연 시 일당 1% 페널티 조항 존재.",
+        "risk_factors": {
+            factor["name"]: {
+                "name_kr": factor["name"],
+                "impact": factor["impact"],
+                "likelihood": factor["likelihood"],
+                "score": factor["risk_score"],
+            }
+            for factor in factors
+        },
+        "risk_scoring": {
+            "overall_risk_level": "high",
+            "risk_factors": factors,
+            "overall_assessment": "페널티 조항으로 직접 손실이 확정적이며 바이어 관계 악화가 우려됩니다.",
+        },
+        "loss_simulation": {
+            "quantitative": "$5,000 ~ $15,000",
+            "qualitative": "이대로 진행 시 최소 5일 지연으로 페널티 5%가 발생하며 재계약에 부정적 영향을 줍니다.",
+        },
+        "control_gap_analysis": {
+            "identified_gaps": ["선사 부킹 확정 전 납기 약속", "페널티 조항 검토 누락"],
+            "recommendations": ["부킹 확정 후 납기 회신", "계약 검토 체크리스트 도입"],
+        },
+        "prevention_strategy": {
+            "short_term": ["바이어에게 지연 통보 및 협의", "대체 선적 일정 확보"],
+            "long_term": ["복수 선사 계약", "납기 버퍼 정책 수립"],
+        },
+        "similar_cases": [
+            {"content": "납기 지연으로 클레임 발생 사례 " * 8, "source": "claims.json", "distance": 0.21}
+            for _ in range(3)
+        ],
+        "confidence_score": 0.85,
+        "evidence_sources": ["claims.json", "mistakes.json"],
+    }
+    return json.dumps(report, ensure_ascii=False, indent=2)
+
+
+def build_session(turns: int) -> Dict[str, Any]:
+    history: List[Dict[str, str]] = []
+    for turn in range(turns):
+        history.append({
+            "role": "User",
+            "content": f"선적이 {turn + 1}일 지연될 것 같은데 페널티 조항이 걱정됩니다. 계약 금액은 10만 달러입니다.",
+        })
+        if turn % 4 == 3:
+            history.append({"role": "Agent", "content": _sample_risk_report(turn)})
+        else:
+            history.append({
+                "role": "Agent",
+                "content": "페널티 조항의 정확한 비율과 지연 예상 일수를 알려주시면 리스크를 정리해 드리겠습니다.",
+            })
+
+    return {
+        "active_agent": "riskmanaging",
+        "conversation_history": history,
+        "agent_specific_state": {
+            "analysis_in_progress": True,
+            "awaiting_follow_up": False,
+            "pending_quiz": None,
+        },
+        "last_interaction_timestamp": time.time(),
+    }
+
+
+def _time_per_op(fn: Callable[[], Any], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def _legacy_codec() -> Tuple[Callable[[Dict[str, Any]], bytes], Callable[[bytes], Any]]:
+    return (
+        lambda state: json.dumps(state, ensure_ascii=False).encode("utf-8"),
+        lambda data: json.loads(data),
+    )
+
+
+def run(turn_counts: List[int], iterations: int) -> None:
+    codecs: List[Tuple[str, Callable[[Dict[str, Any]], bytes], Callable[[bytes], Any]]] = []
+    legacy_encode, legacy_decode = _legacy_codec()
+    codecs.append(("legacy json", legacy_encode, legacy_decode))
+    for serializer, compression in [
+        ("json", "none"),
+        ("orjson", "none"),
+        ("orjson", "zlib"),
+        ("orjson", "zstd"),
+    ]:
+        codec = SessionCodec(serializer=serializer, compression=compression)
+        codecs.append((f"{codec.serializer}+{codec.compression}", codec.encode, codec.decode))
+
+    print(f"{'turns':>5} {'codec':<14} {'bytes':>9} {'ratio':>6} {'encode(us)':>11} {'decode(us)':>11}")
+    for turns in turn_counts:
+        state = build_session(turns)
+        baseline_size = len(legacy_encode(state))
+        for name, encode, decode in codecs:
+            payload = encode(state)
+            encode_us = _time_per_op(lambda: encode(state), iterations)
+            decode_us = _time_per_op(lambda: decode(payload), iterations)
+            print(
+                f"{turns:>5} {name:<14} {len(payload):>9} {len(payload) / baseline_size:>6.2f} "
+                f"{encode_us:>11.1f} {decode_us:>11.1f}"
+            )
+        print()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark session codecs")
+    parser.add_argument("--turns", type=int, nargs="+", default=[2, 10, 40, 120])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    run(args.turns, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+세션 저장소 샤딩 처리량 벤치마크.
+
+주어진 Redis 노드 URL을 1개, 2개, ... N개까지 늘려가며 클라이언트 측
+consistent-hash 샤딩(RedisConversationStore + RedisRouter)으로 턴 단위
+load/save 처리량(ops/s)을 측정한다. 노드별로 별도 redis-server 프로세스를
+띄워야 샤딩 효과가 보인다.
+
+Usage:
+  redis-server --port 6380 & redis-server --port 6381 & redis-server --port 6382 &
+  .venv/bin/python scripts/benchmark_session_store_sharding.py \
+      --urls redis://localhost:6380/0 redis://localhost:6381/0 redis://localhost:6382/0
+  .venv/bin/python scripts/benchmark_session_store_sharding.py --urls ... --threads 32 --seconds 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import threading
+import time
+from typing import List
+
+import redis
+
+# Ensure project root is importable when run as a script.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.config import Settings
+from backend.infrastructure.redis_router import RedisRouter
+from backend.agents.orchestrator.session_store import RedisConversationStore
+
+
+def _make_store(urls: List[str], max_connections: int) -> RedisConversationStore:
+    clients = {
+        url: redis.from_url(url, decode_responses=False, max_connections=max_connections)
+        for url in urls
+    }
+    return RedisConversationStore(Settings(session_ttl=600), router=RedisRouter(clients))
+
+
+def _worker(store: RedisConversationStore, worker_id: int, sessions: int, deadline: float, counts: List[int]):
+    session_ids = [f"bench-{worker_id}-{idx}" for idx in range(sessions)]
+    ops = 0
+    turn = 0
+    while time.perf_counter() < deadline:
+        session_id = session_ids[turn % sessions]
+        state = store.get_state(session_id) or {
+            "active_agent": "riskmanaging",
+            "conversation_history": [],
+            "agent_specific_state": {"analysis_in_progress": True},
+        }
+        state["conversation_history"] = state.get("conversation_history", [])[-18:] + [
+            {"role": "User", "content": f"선적 지연 {turn}일, 페널티 일당 1%"},
+            {"role": "Agent", "content": "계약 금액과 지연 일수를 알려주시면 리스크를 정리해 드리겠습니다."},
+        ]
+        state["last_interaction_timestamp"] = time.time()
+        store.save_state(session_id, state)
+        ops += 1
+        turn += 1
+    counts[worker_id] = ops
+
+
+def run(urls: List[str], threads: int, sessions: int, seconds: float, max_connections: int) -> None:
+    print(f"{'nodes':>5} {'turns/s':>10} {'speedup':>8}")
+    baseline = None
+    for node_count in range(1, len(urls) + 1):
+        store = _make_store(urls[:node_count], max_connections)
+        counts = [0] * threads
+        deadline = time.perf_counter() + seconds
+        workers = [
+            threading.Thread(target=_worker, args=(store, idx, sessions, deadline, counts))
+            for idx in range(threads)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        throughput = sum(counts) / seconds
+        baseline = baseline or throughput
+        print(f"{node_count:>5} {throughput:>10.0f} {throughput / baseline:>7.2f}x")
+
+        for session_id in (f"bench-{w}-{i}" for w in range(threads) for i in range(sessions)):
+            store.delete_state(session_id)
+        store.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark sharded session store throughput")
+    parser.add_argument("--urls", nargs="+", required=True, help="Redis node URLs, one per shard")
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--sessions", type=int, default=50, help="Sessions per thread")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--max-connections", type=int, default=64)
+    args = parser.parse_args()
+    run(args.urls, args.threads, args.sessions, args.seconds, args.max_connections)
+
+
+if __name__ == "__main__":
+    main()
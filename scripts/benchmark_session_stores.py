@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+세션 저장소 백엔드 비교 벤치마크 (InMemory / SQLite / Redis).
+
+턴마다 세션을 읽고 대화 두 줄을 덧붙여 다시 저장하는 오케스트레이터 패턴을
+여러 스레드로 반복해 처리량(turns/s)과 저장 지연(p50/p99)을 비교한다.
+Redis는 --redis-url을 주었을 때만 측정한다.
+
+Usage:
+  .venv/bin/python scripts/benchmark_session_stores.py
+  .venv/bin/python scripts/benchmark_session_stores.py --threads 8 --seconds 5 --redis-url redis://localhost:6379/1
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List
+
+# Ensure project root is importable when run as a script.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.config import Settings
+from backend.agents.orchestrator.session_store import (
+    ConversationStore,
+    InMemoryConversationStore,
+    RedisConversationStore,
+)
+from backend.agents.orchestrator.sqlite_session_store import SQLiteConversationStore
+
+
+def _worker(
+    store: ConversationStore,
+    worker_id: int,
+    sessions: int,
+    deadline: float,
+    latencies: Dict[int, List[float]],
+):
+    session_ids = [f"bench-{worker_id}-{idx}" for idx in range(sessions)]
+    samples: List[float] = []
+    turn = 0
+    while time.perf_counter() < deadline:
+        session_id = session_ids[turn % sessions]
+        state = store.get_state(session_id) or {
+            "active_agent": "riskmanaging",
+            "conversation_history": [],
+            "agent_specific_state": {"analysis_in_progress": True},
+        }
+        state = dict(state)
+        state["conversation_history"] = list(state.get("conversation_history", []))[-18:] + [
+            {"role": "User", "content": f"선적 지연 {turn}일, 페널티 일당 1%"},
+            {"role": "Agent", "content": "계약 금액과 지연 일수를 알려주시면 리스크를 정리해 드리겠습니다."},
+        ]
+        state["last_interaction_timestamp"] = time.time()
+        start = time.perf_counter()
+        store.save_state(session_id, state)
+        samples.append(time.perf_counter() - start)
+        turn += 1
+    latencies[worker_id] = samples
+
+
+def _run_one(name: str, store: ConversationStore, threads: int, sessions: int, seconds: float) -> None:
+    latencies: Dict[int, List[float]] = {}
+    deadline = time.perf_counter() + seconds
+    workers = [
+        threading.Thread(target=_worker, args=(store, idx, sessions, deadline, latencies))
+        for idx in range(threads)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    flush = getattr(store, "flush", None)
+    if flush is not None:
+        flush()
+
+    samples = sorted(sample for values in latencies.values() for sample in values)
+    p50 = statistics.median(samples) * 1_000_000
+    p99 = samples[int(len(samples) * 0.99) - 1] * 1_000_000
+    print(f"{name:<10} {len(samples) / seconds:>10.0f} {p50:>10.1f} {p99:>10.1f}")
+
+
+def run(threads: int, sessions: int, seconds: float, redis_url: str) -> None:
+    print(f"{'store':<10} {'turns/s':>10} {'p50(us)':>10} {'p99(us)':>10}")
+
+    _run_one("memory", InMemoryConversationStore(Settings(), sweep_interval=0), threads, sessions, seconds)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        sqlite_store = SQLiteConversationStore(Settings(), path=os.path.join(tmp_dir, "bench.db"))
+        _run_one("sqlite", sqlite_store, threads, sessions, seconds)
+        print(f"{'':<10} sqlite batches={sqlite_store.stats['batches']} rows={sqlite_store.stats['rows_written']}")
+        sqlite_store.close()
+
+    if redis_url:
+        redis_store = RedisConversationStore(Settings(redis_url=redis_url, session_ttl=600))
+        _run_one("redis", redis_store, threads, sessions, seconds)
+        for worker_id in range(threads):
+            for idx in range(sessions):
+                redis_store.delete_state(f"bench-{worker_id}-{idx}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark session store backends")
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--sessions", type=int, default=50, help="Sessions per thread")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--redis-url", default="", help="Also benchmark Redis at this URL")
+    args = parser.parse_args()
+    run(args.threads, args.sessions, args.seconds, args.redis_url)
+
+
+if __name__ == "__main__":
+    main()
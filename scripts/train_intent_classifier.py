@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+로컬 의도 분류기(nearest-centroid) 학습 및 평가 스크립트.
+
+학습 데이터(오케스트레이터 프롬프트 few-shot + dataset/scenarios_master.json +
+시드 예시)로 centroid를 만들고 INTENT_MODEL_PATH에 저장한 뒤,
+leave-one-out 정확도/커버리지/지연 시간 리포트를 JSON으로 출력합니다.
+
+Usage:
+  .venv/bin/python scripts/train_intent_classifier.py
+  .venv/bin/python scripts/train_intent_classifier.py --output /tmp/intent_model.json --min-confidence 0.7
+  .venv/bin/python scripts/train_intent_classifier.py --report-only
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+
+# Ensure project root is importable when run as a script.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.agents.orchestrator.intent_model import (
+    PROJECT_ROOT,
+    NearestCentroidIntentModel,
+    current_embedding_info,
+    evaluate,
+    load_training_examples,
+)
+from backend.config import get_settings
+from backend.rag.embedder import get_embedding
+
+
+def main() -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default=settings.intent_model_path, help="model artifact path")
+    parser.add_argument("--min-confidence", type=float, default=settings.intent_local_min_confidence)
+    parser.add_argument("--min-similarity", type=float, default=settings.intent_local_min_similarity)
+    parser.add_argument("--temperature", type=float, default=0.05, help="softmax temperature")
+    parser.add_argument("--report-only", action="store_true", help="evaluate without writing the artifact")
+    args = parser.parse_args()
+
+    examples = load_training_examples()
+    report = evaluate(
+        examples,
+        get_embedding,
+        min_confidence=args.min_confidence,
+        temperature=args.temperature,
+        min_similarity=args.min_similarity,
+    )
+    report["embedding"] = current_embedding_info(settings)
+
+    if not args.report_only:
+        model = NearestCentroidIntentModel.fit(
+            examples,
+            get_embedding,
+            temperature=args.temperature,
+            embedding_info=report["embedding"],
+        )
+        model.metrics = report
+        output = args.output if os.path.isabs(args.output) else os.path.join(PROJECT_ROOT, args.output)
+        model.save(output)
+        report["artifact"] = output
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+# tests/test_chat_single_flight.py
+
+import asyncio
+
+from fastapi.testclient import TestClient
+
+import backend.api.routes as routes_module
+import backend.main as main_module
+from backend.api.single_flight import ChatSingleFlight, request_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _counting(result, calls, delay=0.02):
+    async def execute():
+        calls.append(result)
+        await asyncio.sleep(delay)
+        return result
+    return execute
+
+
+async def test_concurrent_identical_requests_share_one_execution():
+    flight = ChatSingleFlight()
+    calls = []
+    key = request_key("s1", "FOB가 뭐야")
+
+    results = await asyncio.gather(*(flight.run(key, "s1", _counting("answer", calls)) for _ in range(3)))
+
+    assert results == ["answer"] * 3
+    assert calls == ["answer"]
+    assert flight.stats["executed"] == 1
+    assert flight.stats["coalesced"] == 2
+
+
+async def test_same_message_after_the_turn_finished_is_a_new_turn():
+    flight = ChatSingleFlight()
+    calls = []
+    answer = request_key("s1", "1")
+
+    assert await flight.run(answer, "s1", _counting("q1 graded", calls)) == "q1 graded"
+    assert not flight.is_known(answer)
+    assert await flight.run(answer, "s1", _counting("q2 graded", calls)) == "q2 graded"  # next question
+    assert calls == ["q1 graded", "q2 graded"]
+    assert flight.stats["replayed"] == 0
+
+
+async def test_idempotency_key_is_replayed_until_its_ttl():
+    clock = FakeClock()
+    flight = ChatSingleFlight(idempotency_ttl=300.0, clock=clock)
+    calls = []
+    key = request_key("s1", "메일 써줘", idempotency_key="req-1")
+
+    await flight.run(key, "s1", _counting("draft", calls))
+    await flight.run(request_key("s1", "다른 질문"), "s1", _counting("other", calls))
+    clock.now = 120.0
+
+    assert flight.is_known(key)
+    assert await flight.run(key, "s1", _counting("draft-2", calls)) == "draft"
+    assert request_key("s2", "메일 써줘", idempotency_key="req-1") != key  # scoped to the session
+
+    clock.now = 400.0
+    assert await flight.run(key, "s1", _counting("draft-3", calls)) == "draft-3"
+
+
+async def test_turns_of_one_session_run_one_at_a_time():
+    flight = ChatSingleFlight()
+    active = {"s1": 0, "s2": 0}
+    peak = {"s1": 0, "s2": 0}
+    overlapped = []
+
+    def turn(session_id, name):
+        async def execute():
+            active[session_id] += 1
+            peak[session_id] = max(peak[session_id], active[session_id])
+            overlapped.append(sum(active.values()) > 1)
+            await asyncio.sleep(0.01)
+            active[session_id] -= 1
+            return name
+        return execute
+
+    results = await asyncio.gather(
+        flight.run(request_key("s1", "a"), "s1", turn("s1", "a")),
+        flight.run(request_key("s1", "b"), "s1", turn("s1", "b")),
+        flight.run(request_key("s2", "c"), "s2", turn("s2", "c")),
+    )
+
+    assert results == ["a", "b", "c"]
+    assert peak == {"s1": 1, "s2": 1}  # s1's turns never overlap each other
+    assert any(overlapped)  # ...while s2 runs alongside s1
+    assert flight._session_locks == {}
+
+
+async def test_execution_is_cancelled_when_all_waiters_leave():
+    flight = ChatSingleFlight()
+    started = asyncio.Event()
+
+    async def slow():
+        started.set()
+        await asyncio.sleep(10)
+
+    waiter = asyncio.ensure_future(flight.run(request_key("s1", "x"), "s1", slow))
+    await started.wait()
+    task = next(iter(flight._inflight.values())).task
+    waiter.cancel()
+    await asyncio.sleep(0)
+
+    assert task.cancelled() or task.cancelling()
+    assert flight.stats["cancelled"] == 1
+
+
+def test_chat_endpoint_replays_retries(monkeypatch):
+    calls = []
+
+    class FakeApp:
+        async def ainvoke(self, state):
+            calls.append(state["user_input"])
+            return {"type": "chat", "message": f"응답 {len(calls)}", "report": None, "meta": {}}
+
+    monkeypatch.setattr(routes_module, "compiled_orchestrator_app", FakeApp())
+    monkeypatch.setattr(routes_module, "CHAT_SINGLE_FLIGHT", ChatSingleFlight())
+
+    with TestClient(main_module.app) as client:
+        body = {"session_id": "s-idem", "message": "안녕"}
+        first = client.post("/api/chat", json=body, headers={"Idempotency-Key": "k1"}).json()
+        retry = client.post("/api/chat", json=body, headers={"Idempotency-Key": "k1"}).json()
+        fresh = client.post("/api/chat", json=body, headers={"Idempotency-Key": "k2"}).json()
+
+    assert first == retry
+    assert first["message"] == "응답 1"
+    assert fresh["message"] == "응답 2"
+    assert calls == ["안녕", "안녕"]
+
+
+def test_replayed_retry_is_not_refused_while_llm_queue_is_full(monkeypatch):
+    class FakeApp:
+        async def ainvoke(self, state):
+            return {"type": "chat", "message": "응답", "report": None, "meta": {}}
+
+    class FullQueue:
+        def saturated(self):
+            return True
+
+        def retry_after(self):
+            return 5
+
+    monkeypatch.setattr(routes_module, "compiled_orchestrator_app", FakeApp())
+    monkeypatch.setattr(routes_module, "CHAT_SINGLE_FLIGHT", ChatSingleFlight())
+
+    with TestClient(main_module.app) as client:
+        body = {"session_id": "s-replay", "message": "안녕"}
+        first = client.post("/api/chat", json=body, headers={"Idempotency-Key": "k1"})
+        monkeypatch.setattr(routes_module, "LLM_ADMISSION", FullQueue())
+        retry = client.post("/api/chat", json=body, headers={"Idempotency-Key": "k1"})
+        fresh = client.post("/api/chat", json=body, headers={"Idempotency-Key": "k2"})
+
+    assert retry.status_code == 200 and retry.json() == first.json()
+    assert fresh.status_code == 429
@@ -0,0 +1,109 @@
+# tests/test_chat_streaming.py
+
+import json
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+import backend.main as main_module
+from backend.agents.default_chat.default_chat_agent import DefaultChatAgent
+from backend.agents.orchestrator import nodes as orchestrator_nodes
+from backend.agents.orchestrator.session_store import InMemoryConversationStore
+from backend.infrastructure.llm_streaming import TokenSink, complete_chat, stream_tokens_to
+
+
+class _FakeStream:
+    def __init__(self, pieces):
+        self.pieces = list(pieces)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.pieces:
+            raise StopAsyncIteration
+        piece = self.pieces.pop(0)
+        return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))])
+
+
+class FakeClient:
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.calls = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        self.calls.append(kwargs)
+        if kwargs.get("stream"):
+            return _FakeStream(self.pieces)
+        message = SimpleNamespace(content="".join(self.pieces))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+async def test_complete_chat_streams_only_inside_a_sink():
+    client = FakeClient(["FOB는 ", "본선 인도", " 조건입니다."])
+
+    assert await complete_chat(client, source="default_chat", model="solar-pro", messages=[]) == "FOB는 본선 인도 조건입니다."
+    assert "stream" not in client.calls[-1]
+
+    sink = TokenSink()
+    with stream_tokens_to(sink):
+        text = await complete_chat(client, source="default_chat", model="solar-pro", messages=[])
+    assert text == "FOB는 본선 인도 조건입니다."
+    assert client.calls[-1]["stream"] is True
+    events = [sink.queue.get_nowait() for _ in range(sink.queue.qsize())]
+    assert [event["text"] for event in events] == ["FOB는 ", "본선 인도", " 조건입니다."]
+    assert {event["source"] for event in events} == {"default_chat"}
+
+
+def _parse_sse(body):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_stream_endpoint_sends_tokens_then_final_response(monkeypatch):
+    store = InMemoryConversationStore()
+    agent = DefaultChatAgent()
+    agent.client = FakeClient(["인코텀즈는 ", "무역 조건 ", "규칙입니다."])
+    monkeypatch.setattr(orchestrator_nodes.ORCHESTRATOR_COMPONENTS, "conversation_store", store)
+    monkeypatch.setattr(
+        orchestrator_nodes.ORCHESTRATOR_COMPONENTS,
+        "agents_instances",
+        {**orchestrator_nodes.ORCHESTRATOR_COMPONENTS.agents_instances, "default_chat": agent},
+    )
+
+    with TestClient(main_module.app) as client:
+        response = client.post(
+            "/api/chat/stream",
+            json={"session_id": "session-stream-1", "message": "인코텀즈가 뭐야", "context": {"mode": "default_chat"}},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _parse_sse(response.text)
+    names = [name for name, _ in events]
+    assert names[0] == "start"
+    assert names[1:-1] == ["token"] * 3
+    assert names[-1] == "done"
+
+    final = events[-1][1]
+    assert final["type"] == "chat"
+    assert final["message"] == "인코텀즈는 무역 조건 규칙입니다."
+
+    saved = store.get_state("session-stream-1")
+    assert saved["conversation_history"][-1] == {"role": "Agent", "content": "인코텀즈는 무역 조건 규칙입니다."}
+
+
+async def test_structured_completion_emits_items():
+    client = FakeClient(['{"questions": [{"question": "FOB?"}', ', {"question": "CIF?"}', "]}"])
+
+    sink = TokenSink()
+    with stream_tokens_to(sink):
+        await complete_chat(client, source="quiz", structured=True, model="solar-pro2", messages=[])
+    events = [sink.queue.get_nowait() for _ in range(sink.queue.qsize())]
+
+    assert [event["event"] for event in events] == ["token", "item", "token", "item", "token"]
+    assert events[1] == {"event": "item", "source": "quiz", "path": ["questions"], "index": 0, "value": {"question": "FOB?"}}
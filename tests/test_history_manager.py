@@ -0,0 +1,209 @@
+"""
+Bounded conversation history and rolling summary tests.
+"""
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+
+from backend.agents.orchestrator import nodes as orchestrator_nodes
+from backend.agents.orchestrator.history_manager import (
+    SUMMARY_PREFIX,
+    SUMMARY_ROLE,
+    ConversationHistoryManager,
+)
+from backend.agents.orchestrator.session_store import InMemoryConversationStore
+from backend.api.single_flight import ChatSingleFlight
+
+
+def make_turns(count: int, start: int = 0) -> List[Dict[str, str]]:
+    return [
+        {"role": "User" if idx % 2 == 0 else "Agent", "content": f"turn {idx}"}
+        for idx in range(start, start + count)
+    ]
+
+
+class FakeLLM:
+    def __init__(self, text: str = "- 요약됨", fail: bool = False):
+        self.calls: List[Dict[str, Any]] = []
+        self.text = text
+        self.fail = fail
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.fail:
+            raise RuntimeError("upstream down")
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=self.text))])
+
+
+def test_trim_waits_for_a_full_batch():
+    manager = ConversationHistoryManager(max_turns=4, summary_batch=4)
+    state = {"conversation_history": make_turns(8)}
+
+    assert manager.trim(state) is False
+    assert len(state["conversation_history"]) == 8
+    assert state["pending_summary_turns"] == []
+
+
+def test_trim_moves_overflow_into_pending_turns():
+    manager = ConversationHistoryManager(max_turns=4, summary_batch=4)
+    state = {"conversation_history": make_turns(10), "pending_summary_turns": make_turns(2, start=100)}
+
+    assert manager.trim(state) is True
+    assert state["conversation_history"] == make_turns(4, start=6)
+    assert state["pending_summary_turns"] == make_turns(2, start=100) + make_turns(6)
+    assert state["history_summary"] == ""
+
+
+def test_trim_disabled_when_max_turns_is_zero():
+    manager = ConversationHistoryManager(max_turns=0)
+    state = {"conversation_history": make_turns(200)}
+
+    assert manager.trim(state) is False
+    assert len(state["conversation_history"]) == 200
+
+
+def test_agent_view_and_merge_only_append_new_turns():
+    manager = ConversationHistoryManager(max_turns=4, summary_batch=2)
+    history = make_turns(4, start=10)
+    pending = make_turns(2)
+
+    view = manager.build_agent_history(history, "- 계약 금액 10만 달러", pending)
+
+    assert view[0]["role"] == SUMMARY_ROLE
+    assert view[0]["content"].startswith(SUMMARY_PREFIX)
+    assert view[1:] == pending + history
+
+    new_turns = [{"role": "User", "content": "q"}, {"role": "Agent", "content": "a"}]
+    merged = manager.merge_agent_history(history, view, view + new_turns)
+    assert merged == history + new_turns
+
+    # Agents that return nothing usable leave stored history untouched.
+    assert manager.merge_agent_history(history, view, None) == history
+    assert manager.merge_agent_history(history, view, []) == history
+
+
+async def test_summarize_uses_llm_and_falls_back_on_error():
+    llm = FakeLLM(text="- 선적 5일 지연, 페널티 일당 1%")
+    manager = ConversationHistoryManager(llm=llm)
+
+    summary = await manager.summarize("", make_turns(2))
+    assert summary == "- 선적 5일 지연, 페널티 일당 1%"
+    assert "turn 0" in llm.calls[0]["messages"][1]["content"]
+
+    failing = ConversationHistoryManager(llm=FakeLLM(fail=True))
+    fallback = await failing.summarize("- 이전 요약", make_turns(2))
+    assert fallback.startswith("- 이전 요약")
+    assert "- User: turn 0" in fallback
+    assert "- Agent: turn 1" in fallback
+
+
+async def test_fallback_summary_is_bounded():
+    manager = ConversationHistoryManager(llm=None, summary_max_chars=300)
+    summary = ""
+    for batch in range(20):
+        summary = await manager.summarize(summary, make_turns(10, start=batch * 10))
+
+    assert len(summary) <= 300
+    assert "turn 199" in summary
+
+
+async def test_fold_pending_persists_summary_and_clears_pending():
+    store = InMemoryConversationStore()
+    store.save_state("s1", {
+        "active_agent": None,
+        "conversation_history": make_turns(4, start=6),
+        "agent_specific_state": {},
+        "history_summary": "",
+        "pending_summary_turns": make_turns(6),
+    })
+    manager = ConversationHistoryManager(llm=FakeLLM(text="- 요약"))
+
+    assert await manager.fold_pending("s1", store) is True
+
+    saved = store.get_state("s1")
+    assert saved["history_summary"] == "- 요약"
+    assert saved["pending_summary_turns"] == []
+    assert saved["conversation_history"] == make_turns(4, start=6)
+    assert await manager.fold_pending("s1", store) is False
+
+
+async def test_fold_pending_skips_when_turns_were_consumed_concurrently():
+    store = InMemoryConversationStore()
+    store.save_state("s1", {"conversation_history": [], "pending_summary_turns": make_turns(2)})
+
+    class RacingLLM(FakeLLM):
+        async def _create(self, **kwargs):
+            store.save_state("s1", {"conversation_history": [], "pending_summary_turns": [], "history_summary": "x"})
+            return await super()._create(**kwargs)
+
+    manager = ConversationHistoryManager(llm=RacingLLM())
+
+    assert await manager.fold_pending("s1", store) is False
+    assert store.get_state("s1")["history_summary"] == "x"
+
+
+async def test_fold_waits_for_a_running_turn_of_the_session():
+    store = InMemoryConversationStore()
+    store.save_state("s1", {"conversation_history": make_turns(2, start=2), "pending_summary_turns": make_turns(2)})
+    flight = ChatSingleFlight()
+    turn_loaded = asyncio.Event()
+    finish_turn = asyncio.Event()
+
+    async def turn():
+        state = store.get_state("s1")
+        turn_loaded.set()
+        await finish_turn.wait()
+        state["conversation_history"].append({"role": "User", "content": "새 질문"})
+        store.save_state("s1", state)
+
+    manager = ConversationHistoryManager(llm=FakeLLM(text="- 요약"))
+    running = asyncio.ensure_future(flight.serialized("s1", turn))
+    await turn_loaded.wait()
+    fold = asyncio.ensure_future(manager.fold_pending("s1", store, serialized=flight.serialized))
+    await asyncio.sleep(0.01)
+    assert not fold.done()  # summary computed, save waits for the turn
+
+    finish_turn.set()
+    await running
+    assert await fold is True
+
+    saved = store.get_state("s1")
+    assert saved["history_summary"] == "- 요약"
+    assert saved["conversation_history"][-1]["content"] == "새 질문"
+
+
+@pytest.fixture
+def bounded_components(monkeypatch):
+    store = InMemoryConversationStore()
+    manager = ConversationHistoryManager(llm=None, max_turns=4, summary_batch=2)
+    monkeypatch.setattr(orchestrator_nodes.ORCHESTRATOR_COMPONENTS, "conversation_store", store)
+    monkeypatch.setattr(orchestrator_nodes.ORCHESTRATOR_COMPONENTS, "history_manager", manager)
+    return store
+
+
+async def test_stored_history_stays_bounded_across_many_turns(bounded_components):
+    store = bounded_components
+
+    for idx in range(30):
+        state = orchestrator_nodes.load_session_state_node({"session_id": "long"})
+        state["conversation_history"] = state["conversation_history"] + [
+            {"role": "User", "content": f"질문 {idx}"},
+            {"role": "Agent", "content": f"답변 {idx}"},
+        ]
+        state["active_agent"] = "default_chat"
+        saved = orchestrator_nodes.finalize_and_save_state_node(state)
+        if saved["history_fold_pending"]:
+            await orchestrator_nodes.fold_conversation_history("long")
+
+        persisted = store.get_state("long")
+        assert len(persisted["conversation_history"]) <= 6
+        assert persisted["pending_summary_turns"] == []
+
+    persisted = store.get_state("long")
+    assert persisted["conversation_history"][-1]["content"] == "답변 29"
+    assert "질문 0" in persisted["history_summary"] or persisted["history_summary"].startswith("…")
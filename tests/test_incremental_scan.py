@@ -0,0 +1,119 @@
+# tests/test_incremental_scan.py
+
+from backend.agents.email_agent import nodes as email_nodes
+from backend.agents.riskmanaging.slot_filling import scan_history_slots
+from backend.utils.incremental_scan import scan_new_turns
+
+
+def _count_fold(facts, turn):
+    facts = dict(facts)
+    facts["seen"] = facts.get("seen", []) + [turn["content"]]
+    return facts
+
+
+def _scan(cache, history):
+    return scan_new_turns(cache, history, _count_fold, dict)
+
+
+def _turns(*contents):
+    return [{"role": "User" if idx % 2 == 0 else "Agent", "content": c} for idx, c in enumerate(contents)]
+
+
+def test_only_new_turns_are_folded():
+    history = _turns("a", "b")
+    cache, scanned = _scan(None, history)
+    assert scanned == 2
+
+    history = history + _turns("c", "d")
+    cache, scanned = _scan(cache, history)
+
+    assert scanned == 2
+    assert cache["facts"]["seen"] == ["a", "b", "c", "d"]
+
+
+def test_cursor_survives_history_trimming():
+    history = _turns("a", "b", "c", "d")
+    cache, _ = _scan(None, history)
+
+    # Orchestrator folded the oldest turns into a summary turn.
+    trimmed = [{"role": "System", "content": "[이전 대화 요약]\na b"}] + history[2:] + _turns("e")
+    cache, scanned = _scan(cache, trimmed)
+
+    assert scanned == 1
+    assert cache["facts"]["seen"] == ["a", "b", "c", "d", "e"]
+
+
+def test_repeated_short_answers_do_not_confuse_cursor():
+    history = _turns("네", "확인", "네", "확인")
+    cache, _ = _scan(None, history[:2])
+
+    cache, scanned = _scan(cache, history)
+
+    assert scanned == 2
+    assert cache["facts"]["seen"] == ["네", "확인", "네", "확인"]
+
+
+def test_rewritten_history_rebuilds_facts():
+    cache, _ = _scan(None, _turns("a", "b"))
+
+    cache, scanned = _scan(cache, _turns("x", "y", "z"))
+
+    assert scanned == 3
+    assert cache["facts"]["seen"] == ["x", "y", "z"]
+
+
+EMAIL = (
+    "Dear Mr. Kim,\n"
+    "We would like to confirm the shipment schedule for PO 1234.\n"
+    "Payment: T/T 30 days\n"
+    "Best regards,\nJane"
+)
+
+
+def test_email_facts_match_full_scan():
+    history = [
+        {"role": "User", "content": f"이 메일 검토해줘\n{EMAIL}"},
+        {"role": "Agent", "content": "검토 결과입니다."},
+    ]
+    cache, _ = scan_new_turns(None, history, email_nodes._fold_history_turn, email_nodes._empty_history_facts)
+    facts = cache["facts"]
+
+    for task_type in ("review", "draft"):
+        assert email_nodes._extract_email_content("다시 봐줘", history, task_type, facts) == (
+            email_nodes._extract_email_content("다시 봐줘", history, task_type)
+        )
+    assert email_nodes._detect_output_language("please", {}, history, facts) == "ko"
+
+
+def test_prepare_node_reuses_cached_facts(monkeypatch):
+    history = [{"role": "User", "content": f"검토해줘\n{EMAIL}"}, {"role": "Agent", "content": "검토 완료"}]
+    state = {"user_input": "이메일 다시 검토해줘", "context": {}, "conversation_history": history}
+    first = email_nodes.prepare_llm_messages_node(dict(state))
+
+    calls = []
+    original = email_nodes._fold_history_turn
+    monkeypatch.setattr(
+        email_nodes, "_fold_history_turn", lambda facts, turn: calls.append(turn) or original(facts, turn)
+    )
+    history = history + [{"role": "User", "content": "이메일 다시 검토해줘"}, {"role": "Agent", "content": "완료"}]
+    second = email_nodes.prepare_llm_messages_node(
+        dict(state, conversation_history=history, extraction_cache=first["extraction_cache"])
+    )
+
+    assert len(calls) == 2
+    assert second["extracted_email_content"] == first["extracted_email_content"]
+
+
+def test_risk_history_slots_accumulate_from_user_turns():
+    history = [
+        {"role": "User", "content": "선적이 10일 지연될 것 같아요"},
+        {"role": "Agent", "content": "계약 금액은요? 5만 달러 이상인가요?"},
+    ]
+    cache, slots = scan_history_slots(None, history)
+    assert slots == {"delay_days": "10일", "delay_risk": "선적이 10일 지연될 것 같아요", "situation_type": "선적 지연"}
+
+    history = history + [{"role": "User", "content": "계약 금액은 3억원입니다"}]
+    cache, slots = scan_history_slots(cache, history)
+
+    assert slots["contract_amount"] == "3억원"
+    assert slots["delay_days"] == "10일"
@@ -0,0 +1,120 @@
+# tests/test_intent_cache.py
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from backend.agents.orchestrator import nodes as orchestrator_nodes
+from backend.agents.orchestrator.intent_cache import IntentCache, normalize_intent_text
+from backend.rag.embedder import _local_hash_embedding
+
+
+def _embed(text):
+    return _local_hash_embedding(text, 256)
+
+
+def test_normalization_collapses_trivial_variants():
+    assert normalize_intent_text("  FOB가   뭐야?? ") == normalize_intent_text("fob가 뭐야")
+
+
+def test_exact_then_semantic_layers():
+    cache = IntentCache(embed=_embed, semantic_threshold=0.9)
+    first = cache.lookup("이메일 검토해줘")
+    assert first.label is None
+    cache.store(first, "email")
+
+    assert cache.lookup("이메일 검토해줘!").layer == "exact"
+    # Same words, different order: not an exact match, but embeds identically.
+    semantic = cache.lookup("검토해줘 이메일")
+    assert (semantic.layer, semantic.label) == ("semantic", "email")
+    assert cache.lookup("인코텀즈 퀴즈 내줘").label is None
+
+    metrics = cache.metrics()
+    assert metrics["exact_hits"] == 1 and metrics["semantic_hits"] == 1 and metrics["misses"] == 2
+    assert metrics["hit_rate"] == 0.5
+
+
+def test_entries_expire_and_are_bounded():
+    now = [0.0]
+    cache = IntentCache(embed=None, ttl=10, max_entries=2, clock=lambda: now[0])
+    for text in ("a", "b", "c"):
+        cache.store(cache.lookup(text), "default_chat")
+
+    assert cache.lookup("a").label is None  # evicted
+    assert cache.lookup("c").label == "default_chat"
+    now[0] = 11.0
+    assert cache.lookup("c").label is None
+
+
+def test_semantic_rows_are_appended_not_restacked():
+    now = [0.0]
+    cache = IntentCache(embed=_embed, ttl=10, max_entries=4, semantic_threshold=0.9, clock=lambda: now[0])
+    cache.store(cache.lookup("이메일 검토해줘"), "email")
+    matrix = cache._matrix
+    cache.store(cache.lookup("인코텀즈 퀴즈 내줘"), "quiz")
+
+    assert cache._matrix is matrix  # written in place
+    assert cache.lookup("검토해줘 이메일").label == "email"
+
+    for idx in range(20):  # evictions are reclaimed, the matrix stays bounded
+        cache.store(cache.lookup(f"질문 {idx} 번"), "default_chat")
+    assert cache._matrix.shape[0] <= cache._max_rows
+    assert cache.lookup("검토해줘 이메일").label is None  # evicted from the semantic layer
+    assert cache.lookup("번 19 질문").label == "default_chat"
+
+    now[0] = 11.0
+    assert cache.lookup("번 19 질문").label is None  # expired
+
+
+class _Completions:
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("llm down")
+        message = SimpleNamespace(content='{"agent_type": "default_chat", "reason": "concept"}')
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    completions = _Completions()
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    components = orchestrator_nodes.ORCHESTRATOR_COMPONENTS
+    monkeypatch.setattr(components, "llm", client)
+    monkeypatch.setattr(components, "intent_cache", IntentCache(embed=_embed))
+    return completions
+
+
+async def test_repeated_request_skips_routing_llm(llm):
+    assert await orchestrator_nodes._classify_intent_with_llm("FOB가 뭐야") == "default_chat"
+    assert await orchestrator_nodes._classify_intent_with_llm("fob가 뭐야?") == "default_chat"
+
+    assert llm.calls == 1
+
+
+async def test_llm_errors_are_not_cached(llm):
+    llm.fail = True
+    await orchestrator_nodes._classify_intent_with_llm("CIF 뜻")
+    llm.fail = False
+    await orchestrator_nodes._classify_intent_with_llm("CIF 뜻")
+
+    assert llm.calls == 2
+
+
+async def test_cache_embeds_off_the_event_loop(llm, monkeypatch):
+    loop_thread = threading.get_ident()
+    threads = []
+
+    def embed(text):
+        threads.append(threading.get_ident())
+        return _embed(text)
+
+    monkeypatch.setattr(orchestrator_nodes.ORCHESTRATOR_COMPONENTS, "intent_cache", IntentCache(embed=embed))
+    await orchestrator_nodes._classify_intent_with_llm("FOB가 뭐야")
+
+    assert threads and loop_thread not in threads
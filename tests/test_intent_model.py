@@ -0,0 +1,113 @@
+# tests/test_intent_model.py
+
+from types import SimpleNamespace
+
+import pytest
+
+from backend.agents.orchestrator import nodes as orchestrator_nodes
+from backend.agents.orchestrator.intent_model import (
+    NearestCentroidIntentModel,
+    load_intent_model,
+    load_training_examples,
+)
+from backend.rag.embedder import _local_hash_embedding
+
+
+def _embed(text):
+    return _local_hash_embedding(text, 256)
+
+
+EXAMPLES = [
+    ("선적 지연 클레임 대응", "riskmanaging"),
+    ("결제 지연 손실 대응", "riskmanaging"),
+    ("무역 퀴즈 문제 내줘", "quiz"),
+    ("객관식 문제 내줘", "quiz"),
+]
+
+
+def test_training_examples_cover_prompt_and_scenarios():
+    examples = load_training_examples()
+    labels = {label for _, label in examples}
+
+    assert {"riskmanaging", "quiz", "email", "default_chat", "out_of_scope"} <= labels
+    assert ("오늘 날씨 어때?", "out_of_scope") in examples  # prompt few-shot
+    assert ("FOB가 뭐야", "default_chat") in examples  # inline prompt example
+    assert sum(label == "riskmanaging" for _, label in examples) >= 60  # scenarios_master.json
+
+
+def test_predicts_nearest_centroid_with_confidence():
+    model = NearestCentroidIntentModel.fit(EXAMPLES, _embed)
+
+    label, confidence = model.predict("퀴즈 문제 내줘", _embed)
+    assert label == "quiz"
+    assert confidence > 0.9
+
+    model.min_similarity = 0.5
+    assert model.predict("점심 메뉴 추천", _embed)[1] == 0.0
+
+
+def test_artifact_roundtrip_and_embedding_mismatch(tmp_path):
+    path = tmp_path / "intent_model.json"
+    info = {"provider": "local", "dim": 256}
+    NearestCentroidIntentModel.fit(EXAMPLES, _embed, embedding_info=info).save(str(path))
+
+    settings = SimpleNamespace(
+        intent_local_classifier=True,
+        intent_model_path=str(path),
+        embedding_provider="local",
+        local_embedding_dim=256,
+        intent_local_min_similarity=0.3,
+    )
+    loaded = load_intent_model(settings, embed=_embed)
+    assert loaded.labels == ["quiz", "riskmanaging"]
+    assert loaded.min_similarity == 0.3
+
+    # Artifact built for another embedding: ignored, retrained from bundled examples.
+    settings.local_embedding_dim = 512
+    retrained = load_intent_model(settings, embed=lambda text: _local_hash_embedding(text, 512))
+    assert retrained.centroids.shape[1] == 512
+    assert "email" in retrained.labels
+
+    settings.embedding_provider = "upstage"
+    assert load_intent_model(settings, embed=_embed) is None
+
+
+@pytest.fixture
+def local_model(monkeypatch):
+    model = NearestCentroidIntentModel.fit(EXAMPLES, _embed)
+    model.min_similarity = 0.25
+    monkeypatch.setattr(orchestrator_nodes.ORCHESTRATOR_COMPONENTS, "intent_model", model)
+    monkeypatch.setattr("backend.rag.embedder.get_embedding", _embed)
+    calls = []
+
+    async def fake_llm(user_input):
+        calls.append(user_input)
+        return "email"
+
+    monkeypatch.setattr(orchestrator_nodes, "_classify_intent_with_llm", fake_llm)
+    return calls
+
+
+def _state(user_input):
+    return {
+        "user_input": user_input,
+        "context": {},
+        "conversation_history": [],
+        "active_agent": None,
+        "agent_specific_state": {},
+    }
+
+
+async def test_confident_message_skips_routing_llm(local_model):
+    updated = await orchestrator_nodes.detect_intent_and_route_node(_state("객관식 문제 풀래"))
+
+    assert updated["selected_agent_name"] == "quiz"
+    assert updated["llm_intent_classification"]["source"] == "local"
+    assert local_model == []
+
+
+async def test_unconfident_message_goes_to_llm(local_model):
+    updated = await orchestrator_nodes.detect_intent_and_route_node(_state("오늘 뭐부터 하면 좋을까"))
+
+    assert updated["selected_agent_name"] == "email"
+    assert local_model == ["오늘 뭐부터 하면 좋을까"]
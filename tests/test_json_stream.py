@@ -0,0 +1,55 @@
+# tests/test_json_stream.py
+
+import json
+
+import pytest
+
+from backend.utils.json_stream import JSONStreamExtractor, extract_json
+from backend.utils.json_utils import safe_json_parse
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('{"agent_type": "quiz"}', {"agent_type": "quiz"}),
+        ('결과입니다:\n```json\n{"a": [1, 2]}\n```\n감사합니다', {"a": [1, 2]}),
+        ('참고 [1] 아래를 보세요\n```\n{"b": 2}\n```', {"b": 2}),
+        ('[참고] 다음과 같습니다 {"email_response": "Dear {name}, ..."}', {"email_response": "Dear {name}, ..."}),
+        ('text { broken ] {"ok": true}', {"ok": True}),
+        ('[{"question": "FOB?"}, {"question": "CIF?"}]', [{"question": "FOB?"}, {"question": "CIF?"}]),
+        ('{"message": "줄바꿈\n포함"}', {"message": "줄바꿈\n포함"}),  # raw control character
+        ("Dear {회사명}, 안녕하세요", None),
+        ('{"a": "unterminated', None),
+        ("", None),
+    ],
+)
+def test_extract_json(text, expected):
+    assert extract_json(text) == expected
+
+
+def test_streamed_items_are_emitted_before_completion():
+    payload = {
+        "questions": [
+            {"question": "FOB의 위험 이전 시점은?", "choices": ["선적", "도착", "계약", "통관"], "answer": 0},
+            {"question": "L/C는 무엇인가?", "choices": ["신용장", "선하증권", "송장", "보험증권"], "answer": 0},
+        ]
+    }
+    text = "```json\n" + json.dumps(payload, ensure_ascii=False) + "\n```"
+    extractor = JSONStreamExtractor()
+
+    seen_at = []
+    for position in range(0, len(text), 4):
+        for item in extractor.feed(text[position:position + 4]):
+            seen_at.append((position, item.path, item.index, item.value))
+
+    assert [(path, index) for _, path, index, _ in seen_at] == [(("questions",), 0), (("questions",), 1)]
+    assert seen_at[0][3] == payload["questions"][0]
+    assert seen_at[0][0] < text.index("L/C")  # first question surfaced before the second streamed in
+    assert extractor.finish() == payload
+
+
+def test_safe_json_parse_contract():
+    assert safe_json_parse("") == {}
+    assert safe_json_parse('```json\n{"risk": "high"}\n```') == {"risk": "high"}
+    with pytest.raises(json.JSONDecodeError):
+        safe_json_parse("JSON이 아닙니다")
@@ -0,0 +1,29 @@
+# tests/test_keyword_router.py
+
+from backend.agents.orchestrator.keyword_router import KEYWORD_ROUTER, FollowUpRule, KeywordRouter
+
+
+def test_scan_reports_every_category_and_position():
+    matches = KEYWORD_ROUTER.scan("추가 퀴즈 말고 이메일 다음 문제 더")
+
+    assert matches["quiz_followup"] == [(0, "추가 퀴즈"), (13, "다음 문제"), (16, "문제 더")]
+    assert matches["quiz"] == [(3, "퀴즈")]  # inside a longer keyword
+    assert matches["email"] == [(9, "이메일"), (10, "메일")]
+
+
+def test_prefix_keywords_share_a_position():
+    matches = KEYWORD_ROUTER.scan("뭐가 필요한지")
+
+    assert matches["clarification"] == [(0, "뭐가 필요"), (0, "뭐가 필요한")]
+
+
+def test_priorities_are_data():
+    router = KeywordRouter(
+        keyword_sets={"a": ("사과",), "b": ("배",)},
+        routes=(("b", "agent_b"), ("a", "agent_a")),
+        follow_up_rules=(FollowUpRule(agents=("agent_a",), reason="always"),),
+    )
+
+    assert router.route("사과 배").agent == "agent_b"
+    assert router.route("포도", active_agent="agent_a").reason == "always"
+    assert router.route("포도", active_agent="agent_c") is None
@@ -0,0 +1,199 @@
+# tests/test_llm_admission.py
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import backend.api.routes as routes_module
+import backend.main as main_module
+from backend.agents.orchestrator import nodes as orchestrator_nodes
+from backend.api.single_flight import ChatSingleFlight
+from backend.infrastructure.llm_admission import AdmissionRejected, LLMAdmissionController, llm_caller
+from backend.infrastructure.llm_client_registry import LLMClientRegistry, _PerLoopTransport
+from backend.infrastructure.request_deadline import DeadlineExceeded, request_deadline
+
+
+async def _queued(controller, order, agent, priority):
+    ticket = await controller.acquire(agent, priority)
+    order.append(priority)
+    return ticket
+
+
+async def test_waiters_are_served_by_priority_class():
+    controller = LLMAdmissionController(max_concurrent=1)
+    holder = await controller.acquire("riskmanaging", "batch")
+    order = []
+
+    batch = asyncio.ensure_future(_queued(controller, order, "quiz", "batch"))
+    interactive = asyncio.ensure_future(_queued(controller, order, "default_chat", "interactive"))
+    routing = asyncio.ensure_future(_queued(controller, order, "orchestrator", "routing"))
+    await asyncio.sleep(0)
+    assert controller.metrics()["queue_depth_by_priority"] == {"routing": 1, "interactive": 1, "batch": 1}
+
+    controller.release(holder)
+    for task in (routing, interactive, batch):
+        controller.release(await task)
+
+    assert order == ["routing", "interactive", "batch"]
+    metrics = controller.metrics()
+    assert metrics["queue_depth"] == 0 and metrics["in_flight"] == 0
+    assert metrics["wait_seconds_by_priority"]["batch"]["admitted"] == 2
+
+
+async def test_agent_bulkhead_does_not_block_other_agents():
+    controller = LLMAdmissionController(max_concurrent=4, agent_limits={"riskmanaging": 1})
+    first = await controller.acquire("riskmanaging", "batch")
+
+    second = asyncio.ensure_future(controller.acquire("riskmanaging", "batch"))
+    chat = await asyncio.wait_for(controller.acquire("default_chat", "interactive"), timeout=1)
+    await asyncio.sleep(0)
+    assert not second.done()
+    assert controller.metrics()["in_flight_by_agent"] == {"riskmanaging": 1, "default_chat": 1}
+
+    controller.release(first)
+    controller.release(await asyncio.wait_for(second, timeout=1))
+    controller.release(chat)
+
+
+async def test_full_queue_rejects_with_retry_after():
+    controller = LLMAdmissionController(max_concurrent=1, max_queue=1)
+    holder = await controller.acquire("email")
+    waiter = asyncio.ensure_future(controller.acquire("email"))
+    await asyncio.sleep(0)
+
+    assert controller.saturated()
+    with pytest.raises(AdmissionRejected) as rejected:
+        await controller.acquire("default_chat")
+    assert rejected.value.retry_after >= 1
+    assert controller.stats["rejected"] == 1
+
+    controller.release(holder)
+    controller.release(await waiter)
+    assert not controller.saturated()
+
+
+async def test_saturated_matches_acquire_behind_a_full_bulkhead():
+    controller = LLMAdmissionController(max_concurrent=8, agent_limits={"riskmanaging": 1}, max_queue=1)
+    holder = await controller.acquire("riskmanaging", "batch")
+    waiter = asyncio.ensure_future(controller.acquire("riskmanaging", "batch"))
+    await asyncio.sleep(0)
+
+    assert controller.saturated()  # global slots are free, but acquire("riskmanaging") rejects
+    assert controller.saturated("riskmanaging")
+    assert not controller.saturated("default_chat")
+    with pytest.raises(AdmissionRejected):
+        await controller.acquire("riskmanaging")
+
+    controller.release(holder)
+    controller.release(await waiter)
+    assert not controller.saturated()
+
+
+async def test_waiting_respects_deadline_and_cancellation():
+    controller = LLMAdmissionController(max_concurrent=1)
+    holder = await controller.acquire("quiz")
+
+    with request_deadline(0.05):
+        with pytest.raises(DeadlineExceeded):
+            await controller.acquire("quiz")
+
+    waiter = asyncio.ensure_future(controller.acquire("quiz"))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.sleep(0)
+
+    assert controller.metrics()["queue_depth"] == 0
+    controller.release(holder)
+    assert controller.metrics()["in_flight"] == 0
+
+
+async def test_caller_context_sets_agent_and_priority():
+    controller = LLMAdmissionController()
+    with llm_caller("riskmanaging", "batch"):
+        ticket = await controller.acquire()
+    assert (ticket.agent, ticket.priority_class) == ("riskmanaging", "batch")
+    with llm_caller("orchestrator"):
+        assert (await controller.acquire()).priority_class == "routing"
+
+
+async def test_transport_holds_slot_until_response_is_closed():
+    controller = LLMAdmissionController(max_concurrent=2)
+    seen = []
+
+    async def body():
+        yield b'{"ok": '
+        yield b"true}"
+
+    def handler(request):
+        seen.append(controller.metrics()["in_flight"])
+        return httpx.Response(200, content=body())  # unread body, like a real upstream response
+
+    transport = _PerLoopTransport(admission=controller)
+    transport._current = lambda: httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        with llm_caller("default_chat"):
+            response = await client.post("https://api.upstage.ai/v1/chat/completions", json={})
+
+    assert response.json() == {"ok": True}
+    assert seen == [1]
+    assert controller.metrics()["in_flight"] == 0
+    assert controller.metrics()["wait_seconds_by_priority"]["interactive"]["admitted"] == 1
+
+
+def test_chat_returns_429_while_llm_queue_is_full(monkeypatch):
+    controller = LLMAdmissionController(max_concurrent=1, max_queue=0)
+
+    async def hold_slot():
+        await controller.acquire("riskmanaging")
+
+    asyncio.run(hold_slot())
+    monkeypatch.setattr(routes_module, "LLM_ADMISSION", controller)
+
+    with TestClient(main_module.app) as client:
+        response = client.post("/api/chat", json={"session_id": "s-busy", "message": "안녕"})
+        metrics = client.get("/api/metrics/llm").json()
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    assert metrics["in_flight"] == 1
+
+
+async def test_openai_client_passes_rejection_through_without_retrying():
+    controller = LLMAdmissionController(max_concurrent=1, max_queue=0)
+    await controller.acquire("riskmanaging")
+    client = LLMClientRegistry(admission=controller).get_async_openai("https://api.upstage.ai/v1", "test-key")
+
+    with pytest.raises(AdmissionRejected):
+        await client.chat.completions.create(model="solar-pro2", messages=[{"role": "user", "content": "hi"}])
+    assert controller.stats["rejected"] == 1
+
+
+async def test_rejection_is_not_swallowed_by_intent_routing(monkeypatch):
+    class FullQueue:
+        async def create(self, **kwargs):
+            raise AdmissionRejected(3)
+
+    components = orchestrator_nodes.ORCHESTRATOR_COMPONENTS
+    monkeypatch.setattr(components, "llm", SimpleNamespace(chat=SimpleNamespace(completions=FullQueue())))
+    monkeypatch.setattr(components, "intent_cache", None)
+
+    with pytest.raises(AdmissionRejected):
+        await orchestrator_nodes._classify_intent_with_llm("FOB가 뭐야")
+
+
+def test_chat_returns_429_when_rejected_mid_turn(monkeypatch):
+    class RejectingApp:
+        async def ainvoke(self, state):
+            raise AdmissionRejected(7)
+
+    monkeypatch.setattr(routes_module, "compiled_orchestrator_app", RejectingApp())
+    monkeypatch.setattr(routes_module, "CHAT_SINGLE_FLIGHT", ChatSingleFlight())
+
+    with TestClient(main_module.app) as client:
+        response = client.post("/api/chat", json={"session_id": "s-rejected", "message": "안녕"})
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "7"
@@ -0,0 +1,90 @@
+# tests/test_llm_client_registry.py
+
+import asyncio
+
+import httpx
+import pytest
+
+from backend.config import Settings
+from backend.infrastructure.llm_client_registry import (
+    LLMClientRegistry,
+    UPSTAGE_BASE_URL,
+    UPSTAGE_SOLAR_BASE_URL,
+    endpoint_key,
+)
+
+
+def test_endpoint_key_groups_paths_by_origin():
+    assert endpoint_key(UPSTAGE_BASE_URL) == endpoint_key(UPSTAGE_SOLAR_BASE_URL)
+    assert endpoint_key("http://localhost:8080/v1") == "http://localhost:8080"
+    with pytest.raises(ValueError):
+        endpoint_key("api.upstage.ai/v1")
+
+
+def test_clients_are_shared_per_endpoint():
+    registry = LLMClientRegistry(Settings())
+
+    first = registry.get_async_openai(UPSTAGE_BASE_URL, "key")
+    assert registry.get_async_openai(UPSTAGE_BASE_URL + "/", "key") is first
+    solar = registry.get_async_openai(UPSTAGE_SOLAR_BASE_URL, "key")
+
+    assert solar is not first
+    assert registry.get_async_http_client(UPSTAGE_BASE_URL) is registry.get_async_http_client(
+        UPSTAGE_SOLAR_BASE_URL
+    )
+    assert registry.stats()["endpoints"] == 1
+    assert registry.stats()["openai_clients"] == 2
+
+
+def test_limits_and_timeouts_come_from_settings():
+    registry = LLMClientRegistry(
+        Settings(llm_max_connections=7, llm_max_keepalive_connections=3, llm_timeout=12, llm_connect_timeout=2)
+    )
+
+    assert registry.limits.max_connections == 7
+    assert registry.limits.max_keepalive_connections == 3
+    assert registry.timeout.read == 12
+    assert registry.timeout.connect == 2
+    client = registry.get_async_openai("http://llm.local/v1", "key")
+    assert client.timeout == registry.timeout
+
+
+def test_async_pool_is_reused_within_a_loop_and_split_across_loops(monkeypatch):
+    registry = LLMClientRegistry(Settings())
+    http_client = registry.get_async_http_client("http://llm.local")
+    transport = http_client._transport
+    seen = []
+
+    async def handler(request):
+        seen.append(asyncio.get_running_loop())
+        return httpx.Response(200, json={"ok": True})
+
+    class _Mock(httpx.MockTransport):
+        def __init__(self, **_):
+            super().__init__(handler)
+
+    # Route the per-loop pools through a mock transport instead of the network.
+    monkeypatch.setattr(httpx, "AsyncHTTPTransport", _Mock)
+
+    async def call_twice():
+        await http_client.get("http://llm.local/a")
+        await http_client.get("http://llm.local/b")
+
+    asyncio.run(call_twice())
+    assert transport.pool_count == 1
+    asyncio.run(call_twice())
+
+    assert len(seen) == 4
+    assert seen[0] is seen[1] and seen[2] is seen[3]
+    assert seen[0] is not seen[2]
+
+
+async def test_aclose_resets_registry():
+    registry = LLMClientRegistry(Settings())
+    first = registry.get_async_openai(UPSTAGE_BASE_URL, "key")
+    registry.get_http_client(UPSTAGE_BASE_URL)
+
+    await registry.aclose()
+
+    assert registry.stats()["endpoints"] == 0
+    assert registry.get_async_openai(UPSTAGE_BASE_URL, "key") is not first
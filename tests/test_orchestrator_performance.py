@@ -5,10 +5,13 @@ These tests avoid external network/API dependencies.
 """
 from __future__ import annotations
 
+import random
+import re
 import time
 from typing import Any, Dict
 
 from backend.agents.orchestrator import nodes as orchestrator_nodes
+from backend.agents.orchestrator.keyword_router import KEYWORD_ROUTER
 
 
 def make_state(**overrides) -> Dict[str, Any]:
@@ -65,3 +68,76 @@ def test_response_normalization_speed():
     elapsed = time.perf_counter() - start
 
     assert elapsed < 2.0
+
+
+def _legacy_keyword_route(user_input: str, active_agent=None, agent_state=None):
+    """Keyword fast path as it was before the compiled router (list literals + `in` scans)."""
+    agent_state = agent_state or {}
+    if any(k in user_input for k in ["클레임", "선적 지연", "리스크", "손해배상", "대처 방안", "유사 사례", "패널티", "지연"]):
+        return "riskmanaging"
+    if any(k in user_input for k in ["퀴즈", "학습"]):
+        return "quiz"
+    if any(k in user_input for k in ["이메일", "메일", "회신", "답장", "초안", "mail", "리뷰", "검토", "첨삭", "교정"]):
+        return "email"
+    if active_agent == "riskmanaging" and agent_state.get("analysis_in_progress"):
+        return active_agent
+    if active_agent in {"quiz", "email"}:
+        clarification = ["어떤정보", "어떤 정보", "무슨정보", "무슨 정보", "뭐가 필요", "뭐가 필요한", "필요한 정보", "추가 정보"]
+        email_followup = ["한국어", "영어", "번역", "다시", "수정", "고쳐", "톤", "제목", "간단", "짧게", "길게", "공손"]
+        quiz_followup = [
+            "정답", "해설", "힌트", "다음 문제", "다음문제", "한문제", "난이도", "쉽게", "어렵게", "더 문제",
+            "문제 더", "퀴즈 더", "더 내줘", "더줘", "더 달라고", "더 만들어", "추가 문제", "추가 퀴즈",
+        ]
+        if agent_state.get("awaiting_follow_up") and (
+            any(k in user_input for k in clarification) or ("\n" in user_input and len(user_input.strip()) > 40)
+        ):
+            return active_agent
+        short = len(user_input.strip()) <= 80
+        if active_agent == "email" and short and any(k in user_input for k in email_followup):
+            return active_agent
+        if active_agent == "quiz" and short and (
+            any(k in user_input for k in quiz_followup)
+            or (agent_state.get("pending_quiz") and re.fullmatch(r"\s*([1-4])\s*번?\s*", user_input))
+        ):
+            return active_agent
+    return None
+
+
+def _long_input(length: int = 20000) -> str:
+    rng = random.Random(7)
+    alphabet = "가나다라마바사아자차카타파하 abcdefg.,\n"
+    return "".join(rng.choice(alphabet) for _ in range(length))
+
+
+def test_compiled_keyword_router_matches_legacy_routing():
+    cases = [
+        ("선적 지연 리스크를 검토해줘", None, {}),
+        ("고객사에 보낼 메일 초안 작성해줘", "quiz", {}),
+        ("퀴즈 내줘", "email", {}),
+        ("한국어로 바꿔줄래?", "email", {}),
+        ("2번", "quiz", {"pending_quiz": {"q": 1}}),
+        ("문제 더 내줘", "quiz", {}),
+        ("어떤 정보가 필요해?", "quiz", {"awaiting_follow_up": True}),
+        ("좋아요 계속", "riskmanaging", {"analysis_in_progress": True}),
+        ("안녕하세요", "email", {}),
+        (_long_input(), "quiz", {"awaiting_follow_up": True}),
+    ]
+    for text, active, agent_state in cases:
+        decision = KEYWORD_ROUTER.route(text, active, agent_state)
+        assert (decision.agent if decision else None) == _legacy_keyword_route(text, active, agent_state), text
+
+
+def test_keyword_routing_speed_on_long_inputs():
+    # Worst case for routing: long input with no keyword, so every set is scanned.
+    text = _long_input()
+    active, agent_state = "quiz", {"pending_quiz": None}
+    assert KEYWORD_ROUTER.route(text, active, agent_state) is None
+    assert _legacy_keyword_route(text, active, agent_state) is None
+
+    start = time.perf_counter()
+    for _ in range(100):
+        KEYWORD_ROUTER.route(text, active, agent_state)
+    elapsed = time.perf_counter() - start
+
+    # Very generous threshold to avoid flaky CI failures.
+    assert elapsed < 2.0
@@ -0,0 +1,130 @@
+# tests/test_rag_prefetch.py
+
+import threading
+
+import pytest
+
+import backend.agents.email_agent.tools as email_tools
+from backend.agents.email_agent import nodes as email_nodes
+from backend.agents.orchestrator import nodes as orchestrator_nodes
+from backend.rag import retriever
+from backend.rag.prefetch import RetrievalPrefetcher
+
+
+class FakeTool:
+    def __init__(self, name, result=None, error=None):
+        self.name = name
+        self.result = result if result is not None else [{"document": name}]
+        self.error = error
+        self.calls = []
+
+    def invoke(self, args):
+        self.calls.append(dict(args))
+        if self.error:
+            raise self.error
+        return self.result
+
+
+def test_prefetched_result_is_served_once():
+    prefetcher = RetrievalPrefetcher(ttl=30)
+    tool = FakeTool("search_email_references")
+    args = {"query": "클레임 회신", "k": 3, "search_type": "all"}
+
+    assert prefetcher.start(tool, args)
+    assert not prefetcher.start(tool, dict(args))  # already in flight
+    assert prefetcher.invoke(tool, args) == tool.result
+    assert len(tool.calls) == 1
+
+    # Consumed; other arguments are never served from the prefetch.
+    prefetcher.invoke(tool, args)
+    prefetcher.invoke(tool, {**args, "search_type": "mistakes"})
+    assert len(tool.calls) == 3
+    assert prefetcher.stats["hits"] == 1
+
+
+def test_failed_or_disabled_prefetch_falls_back_to_search():
+    prefetcher = RetrievalPrefetcher(ttl=30)
+    failing = FakeTool("search_risk_cases", error=RuntimeError("chroma down"))
+    prefetcher.start(failing, {"query": "q"})
+    with pytest.raises(RuntimeError):
+        prefetcher.invoke(failing, {"query": "q"})  # retried directly, error surfaces as before
+    assert prefetcher.stats["failed"] == 1
+
+    disabled = RetrievalPrefetcher(enabled=False)
+    tool = FakeTool("search_trade_documents")
+    assert not disabled.start(tool, {"query": "q"})
+    assert disabled.invoke(tool, {"query": "q"}) == tool.result
+
+
+def test_query_embedding_is_computed_once(monkeypatch):
+    calls = []
+
+    def fake_embedding(text):
+        calls.append(text)
+        return [1.0, 0.0]
+
+    monkeypatch.setattr(retriever, "get_embedding", fake_embedding)
+    retriever._QUERY_EMBEDDINGS.clear()
+
+    assert retriever.embed_query("선적 지연") == [1.0, 0.0]
+    assert retriever.embed_query("선적 지연") == [1.0, 0.0]
+    assert calls == ["선적 지연"]
+
+    monkeypatch.setattr(retriever, "get_embedding", lambda text: None)
+    assert retriever.embed_query("실패") is None
+    assert "실패" not in retriever._QUERY_EMBEDDINGS
+
+
+async def test_retrieval_overlaps_routing_llm_and_is_consumed(monkeypatch):
+    prefetcher = RetrievalPrefetcher(ttl=30)
+    tools = {name: FakeTool(name) for name in ("search_risk_cases", "search_trade_documents", "search_email_references")}
+    searched = threading.Event()
+    email_tool = tools["search_email_references"]
+    original_invoke = email_tool.invoke
+
+    def signalling_invoke(args):
+        searched.set()
+        return original_invoke(args)
+
+    email_tool.invoke = signalling_invoke
+
+    monkeypatch.setattr(orchestrator_nodes, "RAG_PREFETCH", prefetcher)
+    monkeypatch.setattr("backend.rag.prefetch.RAG_PREFETCH", prefetcher)
+    for name, tool in tools.items():
+        monkeypatch.setattr(orchestrator_nodes, name, tool)
+    monkeypatch.setattr(email_tools, "search_email_references", email_tool)
+    monkeypatch.setattr(orchestrator_nodes.ORCHESTRATOR_COMPONENTS, "llm", object())
+    monkeypatch.setattr(orchestrator_nodes.ORCHESTRATOR_COMPONENTS, "intent_model", None)
+
+    async def fake_llm(user_input):
+        # The retrievals are already running while the routing LLM is "called".
+        assert searched.wait(timeout=5)
+        return "email"
+
+    monkeypatch.setattr(orchestrator_nodes, "_classify_intent_with_llm", fake_llm)
+
+    state = {
+        "user_input": "바이어에게 보낼 결제 조건 안내문",
+        "context": {},
+        "conversation_history": [],
+        "active_agent": None,
+        "agent_specific_state": {},
+    }
+    updated = await orchestrator_nodes.detect_intent_and_route_node(state)
+
+    assert updated["selected_agent_name"] == "email"
+    assert prefetcher.stats["started"] == 3
+
+    email_state = email_nodes.perform_rag_search_node({"user_input": state["user_input"], "context": {}})
+    assert email_state["retrieved_documents"] == email_tool.result
+    assert len(email_tool.calls) == 1  # served from the prefetch
+    assert prefetcher.stats["hits"] == 1
+
+
+def test_prefetch_skipped_without_routing_llm(monkeypatch):
+    prefetcher = RetrievalPrefetcher(ttl=30)
+    monkeypatch.setattr(orchestrator_nodes, "RAG_PREFETCH", prefetcher)
+    monkeypatch.setattr(orchestrator_nodes.ORCHESTRATOR_COMPONENTS, "llm", None)
+
+    assert orchestrator_nodes._prefetch_agent_retrievals({"user_input": "안녕"}) == []
+    assert prefetcher.stats["started"] == 0
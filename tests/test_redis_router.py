@@ -0,0 +1,78 @@
+# tests/test_redis_router.py
+
+from collections import Counter
+
+import pytest
+
+from backend.config import Settings
+from backend.infrastructure.redis_router import (
+    HashRing,
+    RedisRouter,
+    build_redis_router,
+    hash_tag,
+)
+
+
+def test_hash_tag_wraps_routing_key():
+    assert hash_tag("abc") == "{abc}"
+
+
+def test_hash_ring_spreads_keys_evenly():
+    nodes = ["redis://a", "redis://b", "redis://c", "redis://d"]
+    ring = HashRing(nodes)
+    counts = Counter(ring.get_node(f"session-{idx}") for idx in range(20000))
+
+    assert set(counts) == set(nodes)
+    for node in nodes:
+        assert 0.15 < counts[node] / 20000 < 0.35
+
+
+def test_adding_a_node_moves_only_a_fraction_of_keys():
+    keys = [f"session-{idx}" for idx in range(10000)]
+    before = HashRing(["a", "b", "c"])
+    after = HashRing(["a", "b", "c", "d"])
+
+    moved = sum(1 for key in keys if before.get_node(key) != after.get_node(key))
+
+    # Ideal is 1/4; every moved key must land on the new node.
+    assert moved / len(keys) < 0.35
+    assert all(after.get_node(key) == "d" for key in keys if before.get_node(key) != after.get_node(key))
+
+
+def test_router_is_stable_for_a_session():
+    router = RedisRouter({"a": object(), "b": object(), "c": object()})
+
+    assert router.sharded
+    assert router.client_for("session-1") is router.client_for("session-1")
+
+
+def test_single_client_router_always_returns_primary():
+    client = object()
+    router = RedisRouter({"default": client})
+
+    assert not router.sharded
+    assert router.client_for("anything") is client
+
+
+def test_build_router_from_shard_urls():
+    settings = Settings(
+        redis_shard_urls="redis://localhost:6379/1, redis://localhost:6380/1",
+        redis_max_connections=7,
+    )
+    router = build_redis_router(settings)
+
+    assert router.sharded
+    assert len(router.clients) == 2
+    assert router.clients[0].connection_pool.max_connections == 7
+
+
+def test_build_router_single_node_uses_configured_pool_size():
+    router = build_redis_router(Settings(redis_max_connections=64))
+
+    assert not router.sharded
+    assert router.primary.connection_pool.max_connections == 64
+
+
+def test_empty_router_is_rejected():
+    with pytest.raises(ValueError):
+        RedisRouter({})
@@ -0,0 +1,105 @@
+# tests/test_request_deadline.py
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import backend.api.routes as routes_module
+import backend.main as main_module
+from backend.api.single_flight import ChatSingleFlight
+from backend.config import get_settings
+from backend.infrastructure.llm_client_registry import _cap_timeout_to_deadline
+from backend.infrastructure.request_deadline import (
+    DeadlineExceeded,
+    budget,
+    check_deadline,
+    deadline_checked,
+    remaining,
+    request_deadline,
+)
+
+
+def test_budget_is_capped_by_the_request_deadline():
+    assert remaining() is None
+    assert budget(45.0) == 45.0
+
+    with request_deadline(5.0):
+        assert 4.0 < remaining() <= 5.0
+        assert budget(45.0) <= 5.0
+        assert budget(1.0) == 1.0
+        assert 4.0 < budget(0) <= 5.0  # no own limit: whatever is left
+        with request_deadline(60.0):
+            assert remaining() <= 5.0  # an enclosing, earlier deadline wins
+    assert remaining() is None
+
+
+def test_expired_deadline_fails_fast():
+    with request_deadline(0.001):
+        time.sleep(0.005)
+        with pytest.raises(DeadlineExceeded):
+            check_deadline()
+        with pytest.raises(DeadlineExceeded):
+            budget(10.0)
+
+
+async def test_nodes_are_checked_on_entry():
+    calls = []
+
+    @deadline_checked
+    async def node(state):
+        calls.append(state)
+        return {}
+
+    await node({"n": 1})
+    with request_deadline(0.001):
+        await asyncio.sleep(0.005)
+        with pytest.raises(DeadlineExceeded):
+            await node({"n": 2})
+    assert calls == [{"n": 1}]
+
+
+async def test_deadline_reaches_tasks_and_threads():
+    with request_deadline(5.0):
+        in_task = await asyncio.ensure_future(asyncio.sleep(0, result=remaining()))
+        in_thread = await asyncio.to_thread(remaining)
+    assert in_task is not None and in_thread is not None
+
+
+def test_llm_request_timeouts_use_remaining_budget():
+    request = httpx.Request("POST", "https://api.upstage.ai/v1/chat/completions")
+    request.extensions["timeout"] = {"connect": 5.0, "read": 60.0, "write": 60.0, "pool": None}
+
+    with request_deadline(2.0):
+        _cap_timeout_to_deadline(request)
+
+    timeout = request.extensions["timeout"]
+    assert timeout["connect"] <= 2.0 and timeout["read"] <= 2.0 and timeout["pool"] <= 2.0
+
+
+def test_chat_endpoint_cancels_turn_at_deadline(monkeypatch):
+    seen = {}
+
+    class SlowApp:
+        async def ainvoke(self, state):
+            seen["remaining"] = remaining()
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                seen["cancelled"] = True
+                raise
+
+    monkeypatch.setattr(routes_module, "compiled_orchestrator_app", SlowApp())
+    monkeypatch.setattr(routes_module, "CHAT_SINGLE_FLIGHT", ChatSingleFlight())
+    monkeypatch.setattr(get_settings(), "request_timeout", 0.2)
+
+    with TestClient(main_module.app) as client:
+        started = time.monotonic()
+        response = client.post("/api/chat", json={"session_id": "s-deadline", "message": "보고서 작성해줘"})
+
+    assert response.status_code == 504
+    assert time.monotonic() - started < 2.0
+    assert 0 < seen["remaining"] <= 0.2
+    assert seen.get("cancelled") is True
@@ -0,0 +1,108 @@
+# tests/test_risk_report_cache.py
+
+import pytest
+
+from backend.agents.riskmanaging import nodes as risk_nodes
+from backend.agents.riskmanaging.report_cache import SimilarReportCache
+from backend.agents.riskmanaging.state import (
+    ControlGapAnalysis,
+    LossSimulation,
+    PreventionStrategy,
+    RiskReport,
+    RiskScoring,
+)
+from backend.rag.embedder import _local_hash_embedding
+
+FACTS = {"contract_amount": "5만 달러", "penalty_info": "페널티 일당 1%", "delay_days": "10일", "situation_type": "선적 지연"}
+INPUT = "A사 선적이 10일 지연될 것 같아요. 일당 1% 페널티가 있고 계약 금액은 5만 달러입니다"
+
+
+def _embed(text):
+    return _local_hash_embedding(text, 512)
+
+
+def _report(summary="요약"):
+    return RiskReport(
+        input_summary=summary,
+        risk_factors={},
+        risk_scoring=RiskScoring(overall_risk_level="high", risk_factors=[], overall_assessment="지체상금 위험"),
+        loss_simulation=LossSimulation(qualitative="손실"),
+        control_gap_analysis=ControlGapAnalysis(),
+        prevention_strategy=PreventionStrategy(),
+        confidence_score=0.8,
+    )
+
+
+def test_near_identical_case_matches():
+    cache = SimilarReportCache(_embed, threshold=0.8)
+    cache.store(FACTS, INPUT, None, _report(), [])
+
+    facts = dict(FACTS, contract_amount="USD 52,000")  # same amount bucket
+    match = cache.lookup(facts, INPUT.replace("A사", "B사").replace("5만 달러", "USD 52,000"))
+
+    assert match is not None
+    assert match[1] >= 0.8
+
+
+@pytest.mark.parametrize(
+    "facts,profile",
+    [
+        (dict(FACTS, delay_days="40일"), None),  # different delay bucket -> scores differ
+        (FACTS, {"role": "팀장"}),  # report was written for another reader
+    ],
+)
+def test_guard_mismatch_is_not_reused(facts, profile):
+    cache = SimilarReportCache(_embed, threshold=0.5)
+    cache.store(FACTS, INPUT, None, _report(), [])
+
+    assert cache.lookup(facts, INPUT, profile) is None
+
+
+def test_dissimilar_text_is_not_reused():
+    cache = SimilarReportCache(_embed, threshold=0.95)
+    cache.store(FACTS, INPUT, None, _report(), [])
+
+    assert cache.lookup(FACTS, "바이어가 품질 문제로 전량 반품을 요구하고 거래를 끊겠다고 합니다") is None
+
+
+async def test_full_analysis_reuses_sections_and_regenerates_summary(monkeypatch):
+    cache = SimilarReportCache(_embed, threshold=0.8)
+    pipeline = []
+
+    class FakeRAG:
+        def get_risk_documents(self, *args):
+            pipeline.append("rag")
+            return [{"document": "doc", "metadata": {}}]
+
+        def extract_similar_cases_and_evidence(self, docs):
+            return {"similar_cases": [], "evidence_sources": []}
+
+    class FakeEngine:
+        async def evaluate_risk(self, *args, **kwargs):
+            pipeline.append("score")
+            return _report().risk_scoring
+
+    class FakeGenerator(risk_nodes.ReportGenerator):
+        def __init__(self):
+            self.section_timeout = 5.0
+
+        async def generate_report(self, agent_input, **kwargs):
+            pipeline.append("report")
+            return _report(summary=agent_input.user_input)
+
+        async def _generate_input_summary(self, agent_input):
+            pipeline.append("summary")
+            return f"요약:{agent_input.user_input}"
+
+    monkeypatch.setattr(risk_nodes, "SIMILAR_REPORTS", cache)
+    monkeypatch.setattr(risk_nodes, "RAGConnector", FakeRAG)
+    monkeypatch.setattr(risk_nodes, "RiskEngine", FakeEngine)
+    monkeypatch.setattr(risk_nodes, "ReportGenerator", FakeGenerator)
+
+    first = await risk_nodes._run_full_analysis(INPUT, [], FACTS, None)
+    second = await risk_nodes._run_full_analysis(INPUT.replace("A사", "B사"), [], FACTS, None)
+
+    assert pipeline == ["rag", "score", "report", "summary"]
+    assert second["report_generated"].input_summary.startswith("요약:B사")
+    assert second["report_generated"].analysis_id != first["report_generated"].analysis_id
+    assert second["risk_scoring"] == first["risk_scoring"]
@@ -0,0 +1,91 @@
+# tests/test_risk_report_generator.py
+
+import asyncio
+import time
+
+import pytest
+
+from backend.agents.riskmanaging import nodes as risk_nodes
+from backend.agents.riskmanaging.nodes import ReportGenerator
+from backend.agents.riskmanaging.state import (
+    ControlGapAnalysis,
+    LossSimulation,
+    PreventionStrategy,
+    RiskFactor,
+    RiskManagingAgentInput,
+    RiskScoring,
+)
+
+
+@pytest.fixture(autouse=True)
+def _no_llm_client(monkeypatch):
+    monkeypatch.setattr(risk_nodes, "get_async_openai", lambda *args, **kwargs: None)
+
+
+def _scoring():
+    return RiskScoring(
+        overall_risk_level="high",
+        overall_assessment="선적 지연으로 인한 지체상금 위험",
+        risk_factors=[
+            RiskFactor(
+                name="재정적 손실",
+                impact=4,
+                likelihood=3,
+                risk_score=12,
+                risk_level="high",
+                reasoning="일당 1% 페널티",
+            )
+        ],
+    )
+
+
+def _generator(delays, timeout=5.0):
+    generator = ReportGenerator()
+    generator.section_timeout = timeout
+    calls = []
+
+    def section(name, result):
+        async def _run(*args):
+            calls.append((name, time.perf_counter()))
+            await asyncio.sleep(delays.get(name, 0.1))
+            return result(*args) if callable(result) else result
+        return _run
+
+    generator._generate_input_summary = section("input_summary", "요약")
+    generator._generate_loss_simulation = section("loss", LossSimulation(qualitative="손실"))
+    generator._generate_control_gap_analysis = section(
+        "gaps", ControlGapAnalysis(identified_gaps=["검수 절차 없음"])
+    )
+    generator._generate_prevention_strategy = section(
+        "prevention",
+        lambda _scoring, gaps: PreventionStrategy(short_term=[f"보완: {gaps.identified_gaps[0]}"]),
+    )
+    return generator, calls
+
+
+async def test_independent_sections_run_concurrently():
+    generator, calls = _generator({})
+    agent_input = RiskManagingAgentInput(user_input="선적이 10일 지연됐어요")
+
+    start = time.perf_counter()
+    report = await generator.generate_report(agent_input, _scoring(), [], [], [])
+    elapsed = time.perf_counter() - start
+
+    # Three parallel calls, then prevention: ~2 round trips instead of 4.
+    assert elapsed < 0.35
+    starts = dict(calls)
+    assert starts["prevention"] >= starts["gaps"] + 0.09
+    assert report.input_summary == "요약"
+    assert report.prevention_strategy.short_term == ["보완: 검수 절차 없음"]
+
+
+async def test_section_timeout_falls_back_without_failing_report():
+    generator, _ = _generator({"loss": 1.0}, timeout=0.2)
+    agent_input = RiskManagingAgentInput(user_input="선적이 10일 지연됐어요")
+
+    start = time.perf_counter()
+    report = await generator.generate_report(agent_input, _scoring(), [], [], [])
+
+    assert time.perf_counter() - start < 0.6
+    assert report.loss_simulation.qualitative == "손실 시뮬레이션 생성 중 오류 발생"
+    assert report.control_gap_analysis.identified_gaps == ["검수 절차 없음"]
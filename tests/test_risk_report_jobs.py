@@ -0,0 +1,210 @@
+# tests/test_risk_report_jobs.py
+
+import asyncio
+
+import pytest
+
+from backend.agents.orchestrator import nodes as orchestrator_nodes
+from backend.agents.orchestrator.session_store import InMemoryConversationStore
+from backend.agents.riskmanaging import nodes as risk_nodes
+from backend.agents.riskmanaging.graph import REPORT_JOB_KEY
+from backend.agents.riskmanaging.report_jobs import ReportJobManager
+from backend.agents.riskmanaging.speculation import SpeculativeReportCache
+from backend.agents.riskmanaging.state import (
+    ControlGapAnalysis,
+    LossSimulation,
+    PreventionStrategy,
+    RiskReport,
+    RiskScoring,
+)
+
+
+def _analysis(result, delay=0.01, sections=("input_summary",)):
+    async def run(progress):
+        for name in sections:
+            progress("section", name=name, status="started")
+            await asyncio.sleep(delay)
+            progress("section", name=name, status="completed")
+        return result
+    return run
+
+
+async def test_job_publishes_progress_and_result():
+    manager = ReportJobManager()
+    job = manager.submit("s1", _analysis({"type": "report"}, sections=("loss_simulation", "prevention_strategy")))
+
+    assert job.status == "queued"
+    await job.task
+
+    assert job.status == "succeeded"
+    assert job.result == {"type": "report"}
+    assert [(event["event"], event.get("name"), event.get("status")) for event in job.events] == [
+        ("status", None, "queued"),
+        ("status", None, "running"),
+        ("section", "loss_simulation", "started"),
+        ("section", "loss_simulation", "completed"),
+        ("section", "prevention_strategy", "started"),
+        ("section", "prevention_strategy", "completed"),
+        ("done", None, "succeeded"),
+    ]
+    assert manager.get(job.job_id) is job
+    assert manager.get("missing") is None
+
+
+async def test_subscribe_replays_then_follows_until_done():
+    manager = ReportJobManager()
+    job = manager.submit("s1", _analysis({"type": "report"}, delay=0.02))
+    await asyncio.sleep(0.01)  # subscribe mid-run
+
+    events = [event async for event in manager.subscribe(job.job_id)]
+
+    assert events[0] == job.events[0]
+    assert events[-1]["event"] == "done"
+    assert events == job.events
+
+    replayed = [event async for event in manager.subscribe(job.job_id)]
+    assert replayed == job.events
+
+
+async def test_concurrency_and_pending_limits():
+    manager = ReportJobManager(max_concurrent=1, max_pending=2)
+    running = []
+    peak = []
+
+    async def analysis(progress):
+        running.append(1)
+        peak.append(len(running))
+        await asyncio.sleep(0.02)
+        running.pop()
+        return {}
+
+    first = manager.submit("s1", analysis)
+    second = manager.submit("s2", analysis)
+    assert manager.submit("s3", analysis) is None  # queue full: caller analyses inline
+    assert manager.stats["rejected"] == 1
+
+    await asyncio.gather(first.task, second.task)
+    assert max(peak) == 1
+    assert manager.submit("s3", analysis) is not None
+
+
+async def test_failed_job_reports_error_and_runs_hooks():
+    manager = ReportJobManager()
+    finished = []
+    manager.completion_hooks.append(lambda job: finished.append((job.job_id, job.status)))
+
+    async def analysis(progress):
+        raise RuntimeError("LLM unavailable")
+
+    job = manager.submit("s1", analysis)
+    await job.task
+
+    assert job.status == "failed"
+    assert job.error == "LLM unavailable"
+    assert finished == [(job.job_id, "failed")]
+    assert job.events[-1]["event"] == "done"
+
+
+async def test_cancelled_jobs_still_finish_for_subscribers_and_hooks():
+    manager = ReportJobManager(max_concurrent=1)
+    finished = []
+    manager.completion_hooks.append(lambda job: finished.append((job.job_id, job.status)))
+    running = manager.submit("s1", _analysis({"type": "report"}, delay=10))
+    queued = manager.submit("s2", _analysis({"type": "report"}))
+    await asyncio.sleep(0.01)
+
+    subscriber = asyncio.create_task(_collect(manager.subscribe(running.job_id)))
+    await asyncio.sleep(0)
+    running.task.cancel()
+    queued.task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await running.task
+    with pytest.raises(asyncio.CancelledError):
+        await queued.task
+
+    events = await asyncio.wait_for(subscriber, timeout=1)
+    assert events[-1]["event"] == "done"
+    assert events[-1]["status"] == "failed" and events[-1]["error"] == "cancelled"
+    assert finished == [(running.job_id, "failed"), (queued.job_id, "failed")]
+    assert queued.error == "cancelled" and queued.finished_at is not None
+
+
+async def _collect(events):
+    return [event async for event in events]
+
+
+def _report():
+    return RiskReport(
+        input_summary="선적 지연에 따른 지체상금 위험",
+        risk_factors={},
+        risk_scoring=RiskScoring(overall_risk_level="high", risk_factors=[], overall_assessment="지체상금 위험"),
+        loss_simulation=LossSimulation(qualitative="손실"),
+        control_gap_analysis=ControlGapAnalysis(),
+        prevention_strategy=PreventionStrategy(),
+        confidence_score=0.8,
+    )
+
+
+@pytest.fixture
+def job_env(monkeypatch):
+    manager = ReportJobManager()
+    manager.completion_hooks.append(orchestrator_nodes.persist_report_job)
+    store = InMemoryConversationStore()
+
+    async def fake_full_analysis(user_input, conversation_history, extracted_data, user_profile, progress=None):
+        if progress is not None:
+            progress("stage", name="retrieval", status="started")
+        await asyncio.sleep(0.01)
+        report = _report()
+        return {
+            "report_generated": report,
+            "analysis_in_progress": False,
+            "conversation_stage": "analysis_completed",
+            "agent_response": report.model_dump_json(),
+        }
+
+    monkeypatch.setattr(risk_nodes, "REPORT_JOBS", manager)
+    monkeypatch.setattr(risk_nodes, "SPECULATIVE_REPORTS", SpeculativeReportCache())
+    monkeypatch.setattr(risk_nodes, "_run_full_analysis", fake_full_analysis)
+    monkeypatch.setattr(orchestrator_nodes.ORCHESTRATOR_COMPONENTS, "conversation_store", store)
+    return manager, store
+
+
+async def test_job_mode_answers_immediately_and_persists_report(job_env):
+    manager, store = job_env
+    state = {
+        "current_user_input": "보고서 작성해줘",
+        "conversation_history": [],
+        "extracted_data": {"amount": "1억"},
+        "user_profile": None,
+    }
+    config = {"configurable": {"thread_id": "s-job", "report_mode": "job"}}
+
+    updates = await risk_nodes.perform_full_analysis_node(state, config)
+
+    job_id = updates["report_job_id"]
+    assert updates["analysis_in_progress"] is False
+    assert updates["agent_response"].metadata["status"] == "report_pending"
+    formatted = risk_nodes.format_final_output_node({**state, **updates})
+    assert "agent_response" not in formatted  # pending notice is not wrapped as a decision report
+
+    store.save_state("s-job", {"agent_specific_state": {REPORT_JOB_KEY: {"job_id": job_id, "status": "queued"}}})
+    job = manager.get(job_id)
+    await job.task
+
+    assert job.status == "succeeded"
+    assert job.result["type"] in ("report", "chat")
+    assert any(event["event"] == "stage" for event in job.events)
+    saved = store.get_state("s-job")["agent_specific_state"][REPORT_JOB_KEY]
+    assert saved["status"] == "succeeded"
+    assert saved["result"] == job.result
+
+
+async def test_inline_mode_runs_analysis_in_the_turn(job_env):
+    manager, _ = job_env
+    state = {"current_user_input": "보고서", "conversation_history": [], "extracted_data": {}, "user_profile": None}
+
+    updates = await risk_nodes.perform_full_analysis_node(state, {"configurable": {"thread_id": "s-inline"}})
+
+    assert updates["conversation_stage"] == "analysis_completed"
+    assert manager.stats["submitted"] == 0
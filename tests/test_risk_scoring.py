@@ -0,0 +1,118 @@
+# tests/test_risk_scoring.py
+
+import pytest
+
+from backend.agents.riskmanaging import nodes as risk_nodes
+from backend.agents.riskmanaging.risk_scoring import parse_amount_krw, score_locally
+from backend.agents.riskmanaging.state import RiskManagingAgentInput
+from backend.utils.ttl_cache import TTLCache
+
+FULL_DATA = {"contract_amount": "5만 달러", "penalty_info": "페널티 일당 1%", "delay_days": "10일"}
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [("3억원", 3e8), ("USD 100,000", 1.35e8), ("5만 달러", 6.75e7), ("$50k", 6.75e7), ("2천만원", 2e7),
+     ("1억 5천만원", 1.5e8), ("1억5000만원", 1.5e8)],
+)
+def test_parse_amount_krw(text, expected):
+    assert parse_amount_krw(text) == pytest.approx(expected)
+
+
+def test_local_scores_follow_extracted_facts():
+    local = score_locally(FULL_DATA)
+    factors = {factor.name: factor for factor in local.scoring.risk_factors}
+
+    assert len(factors) == 5
+    assert factors["재정적 손실"].impact == 5  # 10% penalty exposure
+    assert factors["일정 지연"].impact == 3
+    assert factors["재정적 손실"].risk_score == factors["재정적 손실"].impact * factors["재정적 손실"].likelihood
+    assert local.scoring.overall_risk_level == "critical"
+    assert local.confidence >= 0.7
+
+
+def test_missing_facts_lower_confidence():
+    assert score_locally({"delay_days": "3일"}).confidence < 0.7
+    assert score_locally({}, [{"category": "claims"}] * 3).confidence < score_locally(FULL_DATA).confidence
+
+
+class _FakeCompletions:
+    def __init__(self, content):
+        self.content = content
+        self.calls = []
+
+    async def create(self, **kwargs):
+        from types import SimpleNamespace
+
+        self.calls.append(kwargs)
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    completions = _FakeCompletions(
+        '{"risk_factors": [{"name": "재정적 손실", "reasoning": "LLM 근거", "impact": 1}],'
+        ' "overall_assessment": "LLM 요약"}'
+    )
+    client = type("Client", (), {})()
+    client.chat = type("Chat", (), {})()
+    client.chat.completions = completions
+    monkeypatch.setattr(risk_nodes, "get_async_openai", lambda *args, **kwargs: client)
+    monkeypatch.setattr(risk_nodes, "RISK_SCORE_CACHE", TTLCache())
+    return risk_nodes.RiskEngine(), completions
+
+
+async def test_hybrid_uses_llm_for_text_only(engine):
+    risk_engine, completions = engine
+    agent_input = RiskManagingAgentInput(user_input="보고서 작성해줘")
+
+    scoring = await risk_engine.evaluate_risk(agent_input, [], extracted_data=FULL_DATA)
+    financial = scoring.risk_factors[0]
+
+    assert financial.reasoning == "LLM 근거"
+    assert financial.impact == 5  # LLM cannot change the score
+    assert scoring.overall_assessment == "LLM 요약"
+    assert "확정된 점수" in completions.calls[0]["messages"][1]["content"]
+
+    again = await risk_engine.evaluate_risk(agent_input, [], extracted_data=dict(FULL_DATA))
+    assert again == scoring
+    assert len(completions.calls) == 1
+
+
+async def test_failed_reasoning_call_is_not_cached(engine):
+    risk_engine, completions = engine
+    agent_input = RiskManagingAgentInput(user_input="보고서 작성해줘")
+    completions.content = None  # .strip() fails: a transient LLM error
+
+    degraded = await risk_engine.evaluate_risk(agent_input, [], extracted_data=FULL_DATA)
+    assert degraded.risk_factors[0].reasoning != "LLM 근거"
+
+    completions.content = '{"risk_factors": [{"name": "재정적 손실", "reasoning": "LLM 근거"}]}'
+    recovered = await risk_engine.evaluate_risk(agent_input, [], extracted_data=FULL_DATA)
+
+    assert recovered.risk_factors[0].reasoning == "LLM 근거"
+    assert len(completions.calls) == 2
+
+
+async def test_low_confidence_falls_back_to_llm_scoring(engine):
+    risk_engine, completions = engine
+    completions.content = (
+        '{"overall_risk_level": "high", "risk_factors": [{"name": "재정적 손실", "impact": 3, "likelihood": 4,'
+        ' "risk_score": 12, "risk_level": "high", "reasoning": "r"}], "overall_assessment": "a"}'
+    )
+
+    scoring = await risk_engine.evaluate_risk(RiskManagingAgentInput(user_input="문제가 생겼어요"), [], extracted_data={})
+
+    assert scoring.overall_risk_level == "high"
+    assert "<평가 항목>" in completions.calls[0]["messages"][1]["content"]
+
+
+async def test_local_mode_makes_no_llm_call(engine):
+    risk_engine, completions = engine
+    risk_engine.mode = "local"
+
+    scoring = await risk_engine.evaluate_risk(RiskManagingAgentInput(user_input="x"), [], extracted_data=FULL_DATA)
+
+    assert completions.calls == []
+    assert len(scoring.risk_factors) == 5
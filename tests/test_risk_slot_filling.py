@@ -0,0 +1,81 @@
+# tests/test_risk_slot_filling.py
+
+import pytest
+
+from backend.agents.riskmanaging import nodes as risk_nodes
+from backend.agents.riskmanaging.slot_filling import extract_risk_slots, precheck_turn
+
+
+def test_extracts_assessment_slots():
+    slots = extract_risk_slots("선적 5일 지연, 페널티 일당 1%, 계약금액 USD 100,000, 손실은 2천만원 예상")
+
+    assert slots["delay_days"] == "5일"
+    assert slots["penalty_info"] == "페널티 일당 1%"
+    assert slots["contract_amount"] == "USD 100,000"
+    assert slots["loss_estimate"] == "2천만원"
+    assert slots["situation_type"] == "선적 지연"
+
+
+def test_normalizes_weeks_and_no_penalty():
+    slots = extract_risk_slots("2주 정도 늦어질 듯, 위약금 조항은 없어요. 주문 금액 3억원")
+
+    assert slots["delay_days"] == "14일"
+    assert slots["penalty_info"] == "없음"
+    assert slots["contract_amount"] == "3억원"
+
+
+def test_thousands_separator_is_not_a_clause_break():
+    slots = extract_risk_slots("USD 120,000 인데 3일 정도 늦어질듯")
+
+    assert slots["delay_risk"] == "USD 120,000 인데 3일 정도 늦어질듯"
+    assert slots["delay_days"] == "3일"
+
+
+def test_compound_korean_amount_is_kept_whole():
+    slots = extract_risk_slots("1억 5천만원짜리 주문, 2주 지연")
+
+    assert slots["contract_amount"] == "1억 5천만원"
+    assert slots["delay_risk"] == "2주 지연"
+
+
+def test_missing_slots_are_asked_locally():
+    check = precheck_turn("A사 선적이 10일 지연될 것 같아요. 일당 1% 페널티가 있어요", {})
+
+    assert check.decision == "ask"
+    assert check.missing_slots == ["contract_amount"]
+    assert check.extracted_data["delay_days"] == "10일"
+    assert len(check.follow_up_questions) == 1
+
+
+def test_slots_accumulate_across_turns():
+    first = precheck_turn("선적이 10일 지연됩니다", {})
+    second = precheck_turn("계약 금액은 5만 달러, 지체상금은 일 0.5%입니다", first.extracted_data)
+
+    assert second.extracted_data["delay_days"] == "10일"
+    assert second.extracted_data["contract_amount"] == "5만 달러"
+    assert second.decision == "llm"  # all required slots present
+
+
+@pytest.mark.parametrize("text", ["보고서로 정리해줘", "네 진행해 주세요", "평가 기준이 뭐야?", "지연 리스크가 큰가요"])
+def test_ambiguous_turns_go_to_llm(text):
+    assert precheck_turn(text, {}).decision == "llm"
+
+
+async def test_assess_node_skips_llm_when_slots_missing(monkeypatch):
+    class NoLLM:
+        async def assess_conversation_progress(self, *args, **kwargs):
+            raise AssertionError("assessment LLM should not be called")
+
+    monkeypatch.setattr(risk_nodes, "ConversationManager", NoLLM)
+    state = {
+        "current_user_input": "선적이 10일 지연될 것 같아요",
+        "conversation_history": [],
+        "extracted_data": {},
+        "user_profile": None,
+    }
+
+    updates = await risk_nodes.assess_conversation_progress_node(state)
+
+    assert updates["analysis_ready"] is False
+    assert updates["extracted_data"]["delay_days"] == "10일"
+    assert "계약(주문) 금액" in updates["agent_response"]
@@ -0,0 +1,153 @@
+# tests/test_risk_speculation.py
+
+import asyncio
+
+import pytest
+
+from backend.agents.riskmanaging import nodes as risk_nodes
+from backend.agents.riskmanaging.speculation import SpeculativeReportCache, speculation_key
+
+
+def _analysis(result, calls, delay=0.05):
+    async def _run():
+        calls.append(result)
+        await asyncio.sleep(delay)
+        return {"agent_response": result}
+    return _run
+
+
+async def test_take_returns_result_for_matching_inputs():
+    cache = SpeculativeReportCache()
+    calls = []
+    key = speculation_key({"amount": "1억", "delay_days": 10})
+
+    assert cache.start("s1", key, _analysis("report", calls))
+    assert not cache.start("s1", key, _analysis("report", calls))  # already running
+
+    assert await cache.take("s1", key) == {"agent_response": "report"}
+    assert calls == ["report"]
+    assert "s1" not in cache
+    assert cache.stats["hits"] == 1
+
+
+async def test_changed_inputs_discard_speculation():
+    cache = SpeculativeReportCache()
+    calls = []
+    old_key = speculation_key({"amount": "1억"})
+    new_key = speculation_key({"amount": "2억"})
+
+    cache.start("s1", old_key, _analysis("old", calls, delay=1.0))
+    assert await cache.take("s1", new_key) is None
+    assert cache.stats["discarded"] == 1
+
+    cache.start("s1", old_key, _analysis("old", calls, delay=1.0))
+    task = cache._entries["s1"].task
+    cache.start("s1", new_key, _analysis("new", calls))
+    await asyncio.sleep(0)
+    assert task.cancelled()
+    assert await cache.take("s1", new_key) == {"agent_response": "new"}
+
+
+def test_speculation_key_is_order_independent():
+    assert speculation_key({"a": 1, "b": 2}) == speculation_key({"b": 2, "a": 1})
+    assert speculation_key({"a": 1}) != speculation_key({"a": 1}, {"role": "신입"})
+
+
+@pytest.fixture
+def risk_env(monkeypatch):
+    cache = SpeculativeReportCache()
+    runs = []
+
+    async def fake_full_analysis(user_input, conversation_history, extracted_data, user_profile):
+        runs.append(dict(extracted_data or {}))
+        await asyncio.sleep(0.05)
+        return {"agent_response": f"report:{extracted_data['amount']}", "conversation_stage": "analysis_completed"}
+
+    assessments = []
+
+    class FakeConversationManager:
+        async def assess_conversation_progress(self, agent_input, extracted_data=None):
+            return assessments.pop(0)
+
+    monkeypatch.setattr(risk_nodes, "SPECULATIVE_REPORTS", cache)
+    monkeypatch.setattr(risk_nodes, "_run_full_analysis", fake_full_analysis)
+    monkeypatch.setattr(risk_nodes, "ConversationManager", FakeConversationManager)
+    return cache, runs, assessments
+
+
+def _assessment(status, report_requested, amount):
+    return {
+        "status": status,
+        "analysis_ready": status == "sufficient" and report_requested,
+        "report_requested": report_requested,
+        "message": "보고서를 작성할까요?",
+        "extracted_data": {"amount": amount},
+        "conversation_stage": "gathering_info",
+    }
+
+
+def _state(extracted_data=None):
+    return {
+        "current_user_input": "선적 10일 지연, 페널티 일당 1%, 계약 금액 5만 달러",
+        "conversation_history": [],
+        "extracted_data": extracted_data or {},
+        "user_profile": None,
+    }
+
+
+CONFIG = {"configurable": {"thread_id": "risk-session"}}
+
+
+async def test_approval_turn_is_served_from_speculation(risk_env):
+    cache, runs, assessments = risk_env
+    assessments.append(_assessment("sufficient", False, "1억"))
+
+    updates = await risk_nodes.assess_conversation_progress_node(_state(), CONFIG)
+    assert updates["analysis_ready"] is False
+    assert "risk-session" in cache
+
+    result = await risk_nodes.perform_full_analysis_node(_state(updates["extracted_data"]), CONFIG)
+
+    assert result["agent_response"] == "report:1억"
+    assert len(runs) == 1
+    assert cache.stats["hits"] == 1
+
+
+async def test_approval_flow_through_assess_is_a_speculation_hit(risk_env):
+    cache, runs, assessments = risk_env
+    assessments.append(_assessment("sufficient", False, "1억"))
+    assessments.append(_assessment("sufficient", True, "1억"))
+
+    await risk_nodes.assess_conversation_progress_node(_state(), CONFIG)
+    updates = await risk_nodes.assess_conversation_progress_node(_state(), CONFIG)
+    assert updates["analysis_ready"] is True
+    assert "risk-session" in cache
+
+    result = await risk_nodes.perform_full_analysis_node(_state(updates["extracted_data"]), CONFIG)
+
+    assert result["agent_response"] == "report:1억"
+    assert len(runs) == 1
+    assert cache.stats["hits"] == 1
+    assert cache.stats["discarded"] == 0
+
+
+async def test_changed_inputs_recompute_report(risk_env):
+    cache, runs, assessments = risk_env
+    assessments.append(_assessment("sufficient", False, "1억"))
+    await risk_nodes.assess_conversation_progress_node(_state(), CONFIG)
+
+    result = await risk_nodes.perform_full_analysis_node(_state({"amount": "3억"}), CONFIG)
+
+    assert result["agent_response"] == "report:3억"
+    assert cache.stats["hits"] == 0
+
+
+async def test_insufficient_turn_drops_speculation(risk_env):
+    cache, _, assessments = risk_env
+    assessments.append(_assessment("sufficient", False, "1억"))
+    assessments.append(_assessment("insufficient", False, "1억"))
+
+    await risk_nodes.assess_conversation_progress_node(_state(), CONFIG)
+    await risk_nodes.assess_conversation_progress_node(_state(), CONFIG)
+
+    assert "risk-session" not in cache
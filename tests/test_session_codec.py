@@ -0,0 +1,114 @@
+# tests/test_session_codec.py
+
+import json
+import time
+
+import pytest
+
+from backend.agents.orchestrator.session_codec import (
+    MAGIC,
+    SessionCodec,
+    SessionCodecError,
+    create_session_codec,
+)
+from backend.config import Settings
+
+
+def make_session(turns: int = 2):
+    history = []
+    for idx in range(turns):
+        history.append({"role": "User", "content": f"선적 지연 {idx}일, 페널티는 일당 1%입니다."})
+        history.append({
+            "role": "Agent",
+            "content": json.dumps(
+                {"analysis_id": f"a-{idx}", "input_summary": "선적 지연 리스크 " * 20},
+                ensure_ascii=False,
+                indent=2,
+            ),
+        })
+    return {
+        "active_agent": "riskmanaging",
+        "conversation_history": history,
+        "agent_specific_state": {"analysis_in_progress": True, "pending_quiz": None},
+        "last_interaction_timestamp": 1234567890.123,
+    }
+
+
+@pytest.mark.parametrize(
+    "serializer,compression",
+    [("json", "none"), ("orjson", "none"), ("orjson", "zlib"), ("orjson", "zstd"), ("json", "zstd")],
+)
+def test_round_trip_preserves_state(serializer, compression):
+    codec = SessionCodec(serializer=serializer, compression=compression, compression_threshold=0)
+    state = make_session(turns=5)
+
+    payload = codec.encode(state)
+
+    assert payload.startswith(MAGIC)
+    assert codec.decode(payload) == state
+
+
+def test_decodes_legacy_json_bytes_and_str():
+    codec = SessionCodec()
+    state = make_session()
+    legacy = json.dumps(state, ensure_ascii=False)
+
+    assert codec.decode(legacy) == state
+    assert codec.decode(legacy.encode("utf-8")) == state
+
+
+def test_small_payloads_are_not_compressed():
+    codec = SessionCodec(serializer="orjson", compression="zstd", compression_threshold=4096)
+    payload = codec.encode({"active_agent": None, "conversation_history": []})
+
+    assert payload[3] & 0xF0 == 0x00
+
+
+def test_large_sessions_shrink_versus_legacy_json():
+    codec = SessionCodec(serializer="orjson", compression="zstd", compression_threshold=1024)
+    state = make_session(turns=40)
+
+    legacy_size = len(json.dumps(state, ensure_ascii=False).encode("utf-8"))
+    payload = codec.encode(state)
+
+    assert payload[3] & 0xF0 == 0x20
+    assert len(payload) < legacy_size / 2
+
+
+def test_payloads_are_readable_across_codec_configurations():
+    writer = SessionCodec(serializer="orjson", compression="zlib", compression_threshold=0)
+    reader = SessionCodec(serializer="json", compression="none")
+    state = make_session()
+
+    assert reader.decode(writer.encode(state)) == state
+
+
+def test_rejects_unknown_version_and_garbage():
+    codec = SessionCodec()
+
+    with pytest.raises(SessionCodecError):
+        codec.decode(MAGIC + bytes((99, 0x01)) + b"{}")
+    with pytest.raises(SessionCodecError):
+        codec.decode(b"not json at all")
+
+
+def test_factory_reads_settings():
+    settings = Settings(session_codec="json", session_compression="zlib", session_compression_threshold=10)
+    codec = create_session_codec(settings)
+
+    assert codec.serializer == "json"
+    assert codec.compression == "zlib"
+    assert codec.compression_threshold == 10
+
+
+def test_encode_decode_speed_for_long_session():
+    codec = SessionCodec()
+    state = make_session(turns=60)
+
+    start = time.perf_counter()
+    for _ in range(200):
+        codec.decode(codec.encode(state))
+    elapsed = time.perf_counter() - start
+
+    # Very generous threshold to avoid flaky CI failures.
+    assert elapsed < 2.0
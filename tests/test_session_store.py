@@ -8,6 +8,7 @@ from typing import Dict, Any
 from backend.agents.orchestrator.session_store import (
     InMemoryConversationStore,
     RedisConversationStore,
+    TieredConversationStore,
     create_conversation_store,
 )
 from backend.config import Settings
@@ -70,6 +71,69 @@ class TestInMemoryConversationStore:
         store = InMemoryConversationStore()
         assert store.get_state("nonexistent-id") is None
 
+    def test_session_ttl(self):
+        store = InMemoryConversationStore(ttl=0.2, sweep_interval=0)
+        store.save_state("s1", {"active_agent": "quiz"})
+        assert store.get_state("s1") is not None
+
+        time.sleep(0.3)
+
+        assert store.get_state("s1") is None
+        assert store.get_all_session_ids() == []
+
+    def test_extend_ttl(self):
+        store = InMemoryConversationStore(ttl=0.3, sweep_interval=0)
+        store.save_state("s1", {"active_agent": "quiz"})
+
+        time.sleep(0.2)
+        store.extend_ttl("s1")
+        time.sleep(0.2)
+
+        assert store.get_state("s1") is not None
+
+    def test_lru_eviction_by_session_count(self):
+        store = InMemoryConversationStore(max_sessions=2, sweep_interval=0)
+        store.save_state("a", {"id": "a"})
+        store.save_state("b", {"id": "b"})
+        store.get_state("a")  # "b" becomes least recently used
+        store.save_state("c", {"id": "c"})
+
+        assert store.get_state("b") is None
+        assert sorted(store.get_all_session_ids()) == ["a", "c"]
+        assert store.stats["evicted"] == 1
+
+    def test_lru_eviction_by_byte_budget(self):
+        store = InMemoryConversationStore(max_sessions=0, max_bytes=2000, sweep_interval=0)
+        payload = {"conversation_history": [{"role": "User", "content": "x" * 500}]}
+        for idx in range(10):
+            store.save_state(f"s{idx}", dict(payload))
+
+        assert store.total_bytes <= 2000
+        assert len(store) < 10
+        assert store.get_state("s9") is not None
+
+    def test_background_sweeper_removes_expired_sessions(self):
+        store = InMemoryConversationStore(ttl=0.1, sweep_interval=0.05)
+        try:
+            for idx in range(20):
+                store.save_state(f"s{idx}", {"turn": idx})
+
+            deadline = time.time() + 3
+            while len(store) and time.time() < deadline:
+                time.sleep(0.05)
+
+            assert len(store) == 0
+            assert store.stats["expired"] == 20
+        finally:
+            store.close()
+
+    def test_memory_stays_flat_under_sustained_traffic(self):
+        store = InMemoryConversationStore(max_sessions=100, sweep_interval=0)
+        for idx in range(5000):
+            store.save_state(store.create_new_session_id(), {"turn": idx})
+
+        assert len(store) == 100
+
 
 class TestRedisConversationStore:
     """Test cases for RedisConversationStore"""
@@ -188,6 +252,331 @@ class TestRedisConversationStore:
         # Cleanup
         redis_store.delete_state(session_id)
 
+    def test_field_level_layout_appends_history(self, redis_store):
+        """Turns live in an append-only list next to the session hash"""
+        session_id = redis_store.create_new_session_id()
+        history_key = redis_store._make_history_key(session_id)
+
+        state = {
+            "active_agent": "email",
+            "conversation_history": [{"role": "User", "content": "메일 초안"}],
+            "agent_specific_state": {"awaiting_follow_up": False},
+        }
+        redis_store.save_state(session_id, state)
+        assert history_key == f"session:{{{session_id}}}:history"  # hash-tagged: one cluster slot
+        assert redis_store.redis_client.type(redis_store._make_key(session_id)) == b"hash"
+        assert redis_store.redis_client.llen(history_key) == 1
+
+        loaded = redis_store.get_state(session_id)
+        loaded["conversation_history"].append({"role": "Agent", "content": "초안입니다"})
+        loaded["agent_specific_state"]["awaiting_follow_up"] = True
+        redis_store.save_state(session_id, loaded)
+
+        assert redis_store.redis_client.llen(history_key) == 2
+        assert redis_store.get_state(session_id) == loaded
+
+        # A rewritten (not appended) history replaces the list.
+        loaded["conversation_history"] = [{"role": "User", "content": "새 대화"}]
+        redis_store.save_state(session_id, loaded)
+        assert redis_store.get_state(session_id)["conversation_history"] == loaded["conversation_history"]
+
+        # Cleanup
+        redis_store.delete_state(session_id)
+        assert redis_store.redis_client.exists(history_key) == 0
+
+    def test_reads_legacy_json_session(self, redis_store):
+        """Sessions written as plain JSON before the binary codec still load"""
+        session_id = redis_store.create_new_session_id()
+        legacy_state = {"active_agent": "email", "conversation_history": [{"role": "User", "content": "메일"}]}
+
+        redis_store.redis_client.setex(
+            f"session:{session_id}", 10, json.dumps(legacy_state, ensure_ascii=False)
+        )
+
+        assert redis_store.get_state(session_id) == legacy_state
+
+        # Saving migrates the blob to the field-level layout under the tagged keys.
+        legacy_state["conversation_history"].append({"role": "Agent", "content": "네"})
+        redis_store.save_state(session_id, legacy_state)
+        assert redis_store.get_state(session_id) == legacy_state
+        assert redis_store.redis_client.exists(f"session:{session_id}") == 0
+
+        # Cleanup
+        redis_store.delete_state(session_id)
+
+    def test_active_session_index(self, redis_store):
+        """Saves maintain a sorted-set index used for counts and listings"""
+        session_ids = [redis_store.create_new_session_id() for _ in range(3)]
+        for session_id in session_ids:
+            redis_store.save_state(session_id, {"active_agent": "quiz"})
+            time.sleep(0.01)
+
+        assert redis_store.get_recent_session_ids(limit=2) == session_ids[::-1][:2]
+        assert set(session_ids) <= set(redis_store.get_all_session_ids())
+        assert set(session_ids) <= set(redis_store.iter_session_ids(batch_size=2))
+        assert redis_store.count_active_sessions() >= 3
+
+        # An index entry older than the TTL is swept even though nobody deleted it.
+        stale_id = redis_store.create_new_session_id()
+        redis_store.redis_client.zadd("sessions:active", {stale_id: time.time() - 3600})
+        assert stale_id not in redis_store.get_all_session_ids()
+        assert redis_store.sweep_expired_index() >= 1
+        assert redis_store.redis_client.zscore("sessions:active", stale_id) is None
+
+        for session_id in session_ids:
+            redis_store.delete_state(session_id)
+            assert redis_store.redis_client.zscore("sessions:active", session_id) is None
+
+    def test_rebuild_active_index_from_scan(self, redis_store):
+        """Sessions stored before the index existed can be indexed via SCAN"""
+        session_id = redis_store.create_new_session_id()
+        redis_store.save_state(session_id, {"active_agent": "email"})
+        redis_store.redis_client.zrem("sessions:active", session_id)
+
+        assert session_id not in redis_store.get_all_session_ids()
+        assert redis_store.rebuild_active_index(batch_size=10) >= 1
+        assert session_id in redis_store.get_all_session_ids()
+
+        # Cleanup
+        redis_store.delete_state(session_id)
+
+
+class TestRedisConcurrentWriters:
+    """Two processes (stores) sharing one Redis"""
+
+    @pytest.fixture
+    def stores(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        from backend.infrastructure.redis_router import RedisRouter
+
+        server = fakeredis.FakeServer()
+        settings = Settings(use_redis_session=True, session_ttl=60)
+        return [
+            RedisConversationStore(settings, router=RedisRouter({"node": fakeredis.FakeRedis(server=server)}))
+            for _ in range(2)
+        ]
+
+    def test_stale_snapshot_does_not_append_onto_newer_history(self, stores):
+        worker_a, worker_b = stores
+        session_id = "shared"
+        worker_a.save_state(session_id, {"active_agent": "quiz", "conversation_history": [{"content": "t1"}]})
+
+        stale = worker_b.get_state(session_id)
+        fresh = worker_a.get_state(session_id)
+        fresh["conversation_history"].append({"content": "a2"})
+        worker_a.save_state(session_id, fresh)
+
+        # B's snapshot still says one turn; a blind RPUSH would give [t1, a2, b2] with length 2.
+        stale["conversation_history"].append({"content": "b2"})
+        stale["active_agent"] = "email"
+        assert worker_b.save_state(session_id, stale) is not None
+
+        stored = worker_a.get_state(session_id)
+        assert stored == stale
+        history_key = worker_a._make_history_key(session_id)
+        client = worker_a.redis_client
+        assert client.llen(history_key) == int(client.hget(worker_a._make_key(session_id), "__history_len__"))
+
+    def test_write_between_check_and_exec_forces_full_rewrite(self, stores, monkeypatch):
+        worker_a, worker_b = stores
+        session_id = "shared"
+        worker_a.save_state(session_id, {"conversation_history": [{"content": "t1"}]})
+        state = worker_b.get_state(session_id)
+        other = worker_a.get_state(session_id)
+        check = worker_b._watch_snapshot
+
+        def racing_check(*args):
+            matched = check(*args)
+            other["conversation_history"].append({"content": "a2"})
+            worker_a.save_state(session_id, other)  # lands after WATCH, before EXEC
+            return matched
+
+        monkeypatch.setattr(worker_b, "_watch_snapshot", racing_check)
+        state["conversation_history"].append({"content": "b2"})
+        worker_b.save_state(session_id, state)
+
+        assert worker_a.get_state(session_id) == state
+
+    def test_delta_write_still_appends_when_snapshot_is_current(self, stores):
+        worker_a, worker_b = stores
+        session_id = "shared"
+        worker_a.save_state(session_id, {"conversation_history": [{"content": "t1"}]})
+        state = worker_b.get_state(session_id)
+        state["conversation_history"].append({"content": "b2"})
+        worker_b.save_state(session_id, state)
+
+        client = worker_b.redis_client
+        history_key = worker_b._make_history_key(session_id)
+        state["conversation_history"].append({"content": "b3"})
+        worker_b.save_state(session_id, state)
+
+        assert worker_a.get_state(session_id) == state
+        assert client.llen(history_key) == 3
+
+    def test_empty_state_round_trips(self, stores):
+        worker_a, worker_b = stores
+        worker_a.save_state("empty", {})
+
+        assert worker_b.get_state("empty") == {}
+        assert worker_a.get_state("empty") == {}
+        assert not worker_a.redis_client.hexists(worker_a._make_key("empty"), "__history_len__")
+
+        worker_b.save_state("empty", {"conversation_history": []})
+        assert worker_a.get_state("empty") == {"conversation_history": []}
+
+
+class VersionedStore(InMemoryConversationStore):
+    """In-memory stand-in for Redis that stamps versions and counts calls"""
+
+    def __init__(self):
+        super().__init__()
+        self.versions: Dict[str, str] = {}
+        self.calls = {"get": 0, "get_version": 0, "save": 0}
+        self._counter = 0
+
+    def get_version(self, session_id):
+        self.calls["get_version"] += 1
+        return self.versions.get(session_id)
+
+    def get_state_with_version(self, session_id):
+        self.calls["get"] += 1
+        state = self._store.get(session_id)
+        return (json.loads(json.dumps(state)) if state is not None else None), self.versions.get(session_id)
+
+    def save_state(self, session_id, state):
+        self.calls["save"] += 1
+        self._counter += 1
+        self._store[session_id] = json.loads(json.dumps(state))
+        self.versions[session_id] = f"v{self._counter}"
+        return self.versions[session_id]
+
+    def delete_state(self, session_id):
+        super().delete_state(session_id)
+        self.versions.pop(session_id, None)
+
+
+class TestTieredConversationStore:
+    """Test cases for TieredConversationStore"""
+
+    def test_reads_are_served_from_memory_after_first_load(self):
+        backing = VersionedStore()
+        backing.save_state("s1", {"active_agent": "quiz", "conversation_history": []})
+        store = TieredConversationStore(backing, write_behind_delay=0)
+
+        assert store.get_state("s1")["active_agent"] == "quiz"
+        assert store.get_state("s1")["active_agent"] == "quiz"
+
+        assert backing.calls["get"] == 1
+        assert store.stats["hits"] == 1
+
+    def test_revalidation_window_skips_version_check(self):
+        backing = VersionedStore()
+        backing.save_state("s1", {"active_agent": "quiz"})
+        store = TieredConversationStore(backing, write_behind_delay=0, revalidate_seconds=60)
+
+        store.get_state("s1")
+        store.get_state("s1")
+
+        assert backing.calls["get_version"] == 0
+
+    def test_detects_writes_from_other_workers(self):
+        backing = VersionedStore()
+        backing.save_state("s1", {"active_agent": "quiz"})
+        store = TieredConversationStore(backing, write_behind_delay=0)
+        assert store.get_state("s1")["active_agent"] == "quiz"
+
+        # Another process writes through its own store.
+        backing.save_state("s1", {"active_agent": "email"})
+
+        assert store.get_state("s1")["active_agent"] == "email"
+        assert store.stats["stale"] == 1
+
+    def test_returned_state_is_isolated_from_cache(self):
+        backing = VersionedStore()
+        store = TieredConversationStore(backing, write_behind_delay=0)
+        store.save_state("s1", {"agent_specific_state": {"analysis_in_progress": True}})
+
+        loaded = store.get_state("s1")
+        loaded["agent_specific_state"]["analysis_in_progress"] = False
+
+        assert store.get_state("s1")["agent_specific_state"]["analysis_in_progress"] is True
+
+    def test_write_behind_coalesces_and_flushes(self):
+        backing = VersionedStore()
+        store = TieredConversationStore(backing, write_behind_delay=0.2)
+        try:
+            for idx in range(5):
+                store.save_state("s1", {"turn": idx})
+
+            # Reads see the latest local write before it reaches the backing store.
+            assert store.get_state("s1") == {"turn": 4}
+            assert backing.get_state("s1") is None
+
+            deadline = time.time() + 3
+            while backing.get_state("s1") is None and time.time() < deadline:
+                time.sleep(0.05)
+
+            assert backing.get_state("s1") == {"turn": 4}
+            assert backing.calls["save"] == 1
+            assert store.stats["coalesced"] == 4
+        finally:
+            store.close()
+
+    def test_close_flushes_pending_writes(self):
+        backing = VersionedStore()
+        store = TieredConversationStore(backing, write_behind_delay=30)
+
+        store.save_state("s1", {"active_agent": "email"})
+        store.close()
+
+        assert backing.get_state("s1") == {"active_agent": "email"}
+        # After close, saves are written through.
+        store.save_state("s2", {"active_agent": "quiz"})
+        assert backing.get_state("s2") == {"active_agent": "quiz"}
+
+    def test_delete_drops_pending_write(self):
+        backing = VersionedStore()
+        store = TieredConversationStore(backing, write_behind_delay=30)
+        try:
+            store.save_state("s1", {"active_agent": "email"})
+            store.delete_state("s1")
+            store.flush()
+
+            assert store.get_state("s1") is None
+            assert backing.get_state("s1") is None
+        finally:
+            store.close()
+
+    def test_lru_evicts_least_recently_used(self):
+        backing = VersionedStore()
+        store = TieredConversationStore(backing, max_sessions=2, write_behind_delay=0)
+        for sid in ("a", "b", "c"):
+            store.save_state(sid, {"id": sid})
+
+        backing.calls["get"] = 0
+        assert store.get_state("a") == {"id": "a"}
+        assert backing.calls["get"] == 1
+        assert store.get_state("c") == {"id": "c"}
+        assert backing.calls["get"] == 1
+
+    def test_works_in_front_of_redis(self):
+        settings = Settings(use_redis_session=True, redis_db=1, session_ttl=10)
+        try:
+            redis_store = RedisConversationStore(settings)
+        except Exception as e:
+            pytest.skip(f"Redis not available: {e}")
+
+        store = TieredConversationStore(redis_store, write_behind_delay=0)
+        session_id = store.create_new_session_id()
+        state = {"active_agent": "quiz", "conversation_history": [{"role": "User", "content": "퀴즈"}]}
+        store.save_state(session_id, state)
+
+        assert redis_store.get_version(session_id) is not None
+        assert store.get_state(session_id) == state
+        assert redis_store.get_state(session_id) == state
+
+        store.delete_state(session_id)
+
 
 class TestConversationStoreFactory:
     """Test factory function"""
@@ -0,0 +1,122 @@
+# tests/test_sqlite_session_store.py
+
+import sqlite3
+import time
+
+import pytest
+
+from backend.agents.orchestrator.sqlite_session_store import SQLiteConversationStore
+from backend.config import Settings
+
+
+@pytest.fixture
+def make_store(tmp_path):
+    stores = []
+
+    def _make(**kwargs):
+        kwargs.setdefault("path", str(tmp_path / "sessions.db"))
+        kwargs.setdefault("sweep_interval", 0)
+        store = SQLiteConversationStore(Settings(), **kwargs)
+        stores.append(store)
+        return store
+
+    yield _make
+    for store in stores:
+        store.close()
+
+
+def test_save_is_readable_before_and_after_commit(make_store):
+    store = make_store(batch_interval=0.2)
+    state = {"active_agent": "quiz", "conversation_history": [{"role": "User", "content": "퀴즈"}]}
+
+    store.save_state("s1", state)
+    assert store.get_state("s1") == state  # served from the write queue
+
+    assert store.flush(timeout=5)
+    assert store.get_state("s1") == state
+
+
+def test_sessions_survive_restart(make_store, tmp_path):
+    path = str(tmp_path / "durable.db")
+    first = make_store(path=path)
+    first.save_state("s1", {"active_agent": "email"})
+    first.close()
+
+    second = make_store(path=path)
+    assert second.get_state("s1") == {"active_agent": "email"}
+
+
+def test_uses_wal_and_last_interaction_index(make_store, tmp_path):
+    path = str(tmp_path / "wal.db")
+    make_store(path=path)
+
+    conn = sqlite3.connect(path)
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(sessions)")}
+        assert "idx_sessions_last_interaction" in indexes
+    finally:
+        conn.close()
+
+
+def test_batches_saves_from_many_sessions(make_store):
+    store = make_store(batch_interval=0.2)
+
+    for idx in range(50):
+        store.save_state(f"s{idx}", {"turn": idx})
+        store.save_state(f"s{idx}", {"turn": idx + 1})
+    store.flush(timeout=5)
+
+    assert store.stats["batches"] <= 3
+    assert store.stats["coalesced"] == 50
+    assert store.get_state("s49") == {"turn": 50}
+
+
+def test_delete_state(make_store):
+    store = make_store()
+    store.save_state("s1", {"active_agent": "quiz"})
+    store.flush()
+
+    store.delete_state("s1")
+    assert store.get_state("s1") is None
+    store.flush()
+    assert store.get_state("s1") is None
+
+
+def test_ttl_expiry_extend_and_sweep(make_store):
+    store = make_store(ttl=0.3)
+    store.save_state("keep", {"id": "keep"})
+    store.save_state("drop", {"id": "drop"})
+    store.flush()
+
+    time.sleep(0.2)
+    store.extend_ttl("keep")
+    store.flush()
+    time.sleep(0.2)
+
+    assert store.get_state("drop") is None
+    assert store.get_state("keep") == {"id": "keep"}
+    assert store.sweep_expired() == 1
+    assert store.get_all_session_ids() == ["keep"]
+
+
+def test_recent_listing_and_count(make_store):
+    store = make_store()
+    for idx in range(5):
+        store.save_state(f"s{idx}", {"turn": idx})
+        time.sleep(0.01)
+
+    assert store.count_active_sessions() == 5
+    assert store.get_recent_session_ids(limit=2) == ["s4", "s3"]
+
+
+async def test_async_front_end(make_store):
+    store = make_store()
+
+    await store.asave_state("s1", {"active_agent": "quiz"})
+    assert await store.aget_state("s1") == {"active_agent": "quiz"}
+    assert await store.aflush(timeout=5)
+    assert await store.aget_state("s1") == {"active_agent": "quiz"}
+
+    await store.adelete_state("s1")
+    assert await store.aget_state("s1") is None
@@ -0,0 +1,24 @@
+# tests/test_ttl_cache.py
+
+from backend.utils.ttl_cache import TTLCache, stable_hash
+
+
+def test_entries_expire_and_evict_lru():
+    now = [0.0]
+    cache = TTLCache(maxsize=2, ttl=10, clock=lambda: now[0])
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.stats["evicted"] == 1
+
+    now[0] = 11.0
+    assert cache.get("a") is None
+    assert cache.stats["expired"] == 1
+
+
+def test_stable_hash_ignores_key_order():
+    assert stable_hash({"a": 1, "b": [1, 2]}) == stable_hash({"b": [1, 2], "a": 1})
+    assert stable_hash({"a": 1}) != stable_hash({"a": 2})